@@ -2,10 +2,13 @@
 """
 Deep Research tab for Streamlit UI.
 Integrates v2 RecursiveResearchAgent with live progress display.
+
+Research runs as a background job (core/job_runner.py) so reruns and browser
+refreshes neither block nor kill it; the tab attaches to the job by id
+(?job=<id> in the URL) and shows progress and partial results while it runs.
 """
 
 import streamlit as st
-import asyncio
 import logging
 import os
 import sys
@@ -16,7 +19,8 @@ import json
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from research.recursive_agent import RecursiveResearchAgent, Constraints, GoalStatus
+from apps.jobs import DEEP_RESEARCH
+from core.job_runner import JobRunner
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -25,6 +29,15 @@ load_dotenv()
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+PROGRESS_REFRESH_SECONDS = 2
+PROGRESS_EVENTS_SHOWN = 25
+
+
+@st.cache_resource
+def _job_runner() -> JobRunner:
+    """One runner per Streamlit server; job state lives in its SQLite table."""
+    return JobRunner.from_config()
+
 
 def render_deep_research_tab(openai_api_key_from_ui):
     """Render the Deep Research tab in Streamlit UI."""
@@ -171,284 +184,371 @@ def render_deep_research_tab(openai_api_key_from_ui):
         output_dir = Path("data/research_v2") / f"{timestamp}_{clean_question}"
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create empty placeholders for live updates
-        st.markdown("### Research Progress")
+        try:
+            job_id = _job_runner().submit(DEEP_RESEARCH, {
+                "question": research_question,
+                "constraints": {
+                    "max_depth": max_depth,
+                    "max_time_seconds": max_time_minutes * 60,
+                    "max_goals": max_goals,
+                    "max_cost_dollars": max_cost,
+                    "max_concurrent_tasks": max_concurrent
+                },
+                "configuration": {
+                    "max_depth": max_depth,
+                    "max_time_minutes": max_time_minutes,
+                    "max_goals": max_goals,
+                    "max_cost": max_cost,
+                    "max_concurrent": max_concurrent
+                },
+                "output_dir": str(output_dir)
+            }, label=research_question)
+        except Exception as e:
+            logger.error(f"Could not start deep research job: {e}", exc_info=True)
+            st.error(f"Could not start deep research: {str(e)}")
+            return
+        st.session_state["deep_research_job"] = job_id
+        st.query_params["job"] = job_id
 
-        # Live progress indicators
-        progress_status = st.empty()
-        progress_metrics = st.empty()
+    elif research_btn and not research_question:
+        st.warning("Please enter a research question")
 
-        # Final result containers
-        synthesis_container = st.container()
-        evidence_container = st.container()
-        subgoals_container = st.container()
-        stats_container = st.container()
+    _render_recent_jobs()
 
-        try:
-            progress_status.info("Initializing v2 recursive research agent...")
-
-            # Build constraints
-            constraints = Constraints(
-                max_depth=max_depth,
-                max_time_seconds=max_time_minutes * 60,
-                max_goals=max_goals,
-                max_cost_dollars=max_cost,
-                max_concurrent_tasks=max_concurrent
-            )
+    # Attach to the current job: this session's, or the one in the URL after a refresh
+    job_id = st.session_state.get("deep_research_job") or st.query_params.get("job")
+    if job_id:
+        _render_job(job_id)
 
-            # Create agent
-            agent = RecursiveResearchAgent(
-                constraints=constraints,
-                output_dir=str(output_dir)
-            )
 
-            progress_status.info("Research in progress... (check terminal for detailed logs)")
-
-            # Run research
-            result = asyncio.run(agent.research(research_question))
-
-            # Update status based on result
-            if result.status == GoalStatus.COMPLETED:
-                progress_status.success(f"Research complete! Found {len(result.evidence)} pieces of evidence")
-            elif result.status == GoalStatus.PARTIAL:
-                progress_status.warning(f"Research partially complete ({len(result.evidence)} evidence pieces)")
-            else:
-                progress_status.error(f"Research failed: {result.status.value}")
-
-            # Show metrics
-            with progress_metrics.container():
-                col_m1, col_m2, col_m3, col_m4 = st.columns(4)
-                with col_m1:
-                    st.metric("Evidence", len(result.evidence))
-                with col_m2:
-                    st.metric("Sub-goals", len(result.sub_results))
-                with col_m3:
-                    st.metric("Duration", f"{result.duration_seconds:.1f}s")
-                with col_m4:
-                    st.metric("Cost", f"${result.cost_dollars:.4f}")
-
-            # Display synthesis
-            with synthesis_container:
-                st.markdown("---")
-                st.markdown("### Research Synthesis")
-                if result.synthesis:
-                    st.markdown(result.synthesis)
-                else:
-                    st.info("No synthesis generated")
-
-            # Display evidence by source
-            with evidence_container:
-                st.markdown("---")
-                st.markdown("### Evidence Sources")
-
-                # Group evidence by source
-                evidence_by_source = {}
-                for e in result.evidence:
-                    source = e.source or "Unknown"
-                    if source not in evidence_by_source:
-                        evidence_by_source[source] = []
-                    evidence_by_source[source].append(e)
-
-                if evidence_by_source:
-                    for source, evidence_list in evidence_by_source.items():
-                        with st.expander(f"{source} ({len(evidence_list)} results)", expanded=False):
-                            for e in evidence_list[:15]:  # Limit display
-                                st.markdown(f"**{e.title}**")
-                                if e.url:
-                                    st.markdown(f"[Link]({e.url})")
-                                if e.content:
-                                    st.caption(e.content[:300] + "..." if len(e.content) > 300 else e.content)
-                                st.markdown("---")
-                else:
-                    st.info("No evidence collected")
-
-            # Display sub-goals
-            with subgoals_container:
-                st.markdown("---")
-                st.markdown("### Sub-Goals Explored")
-
-                if result.sub_results:
-                    for i, sub in enumerate(result.sub_results, 1):
-                        status_icon = {
-                            GoalStatus.COMPLETED: "Done",
-                            GoalStatus.PARTIAL: "Partial",
-                            GoalStatus.FAILED: "Failed",
-                            GoalStatus.SKIPPED: "Skipped"
-                        }.get(sub.status, "?")
-
-                        with st.expander(f"Sub-goal {i}: {sub.goal[:80]}... [{status_icon}]", expanded=False):
-                            st.write(f"**Goal:** {sub.goal}")
-                            st.write(f"**Status:** {sub.status.value}")
-                            st.write(f"**Confidence:** {int(sub.confidence * 100)}%")
-                            st.write(f"**Evidence:** {len(sub.evidence)} pieces")
-                            st.write(f"**Depth:** {sub.depth}")
-
-                            if sub.synthesis:
-                                st.markdown("**Synthesis:**")
-                                st.caption(sub.synthesis[:500] + "..." if len(sub.synthesis) > 500 else sub.synthesis)
-                else:
-                    st.info("No sub-goals generated (query may have been directly executable)")
-
-            # Statistics and export
-            with stats_container:
-                st.markdown("---")
-                st.markdown("### Statistics & Export")
-
-                col_s1, col_s2, col_s3, col_s4 = st.columns(4)
-                with col_s1:
-                    st.metric("Status", result.status.value)
-                with col_s2:
-                    st.metric("Confidence", f"{int(result.confidence * 100)}%")
-                with col_s3:
-                    st.metric("Max Depth Reached", result.depth)
-                with col_s4:
-                    sources_count = len(evidence_by_source) if evidence_by_source else 0
-                    st.metric("Sources Used", sources_count)
-
-                st.markdown(f"**Output saved to:** `{output_dir}`")
-
-                # Export buttons
-                col_e1, col_e2, col_e3, col_e4 = st.columns(4)
-
-                with col_e1:
-                    # Export as markdown report
-                    report_lines = [
-                        "# Research Report",
-                        "",
-                        f"**Question:** {research_question}",
-                        f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                        f"**Status:** {result.status.value}",
-                        f"**Confidence:** {int(result.confidence * 100)}%",
-                        f"**Evidence:** {len(result.evidence)} pieces",
-                        f"**Duration:** {result.duration_seconds:.1f}s",
-                        f"**Cost:** ${result.cost_dollars:.4f}",
-                        "",
-                        "---",
-                        "",
-                        "## Synthesis",
-                        "",
-                        result.synthesis or "No synthesis generated",
-                        "",
-                        "---",
-                        "",
-                        "## Evidence Summary",
-                        ""
-                    ]
-
-                    for source, evidence_list in evidence_by_source.items():
-                        report_lines.append(f"### {source} ({len(evidence_list)} results)")
-                        report_lines.append("")
-                        for e in evidence_list[:10]:
-                            report_lines.append(f"- **{e.title}**")
-                            if e.url:
-                                report_lines.append(f"  - {e.url}")
-                        report_lines.append("")
-
-                    report_md = "\n".join(report_lines)
-
-                    st.download_button(
-                        "Download Report (Markdown)",
-                        report_md,
-                        f"research_report_{timestamp}.md",
-                        "text/markdown",
-                        key="download_report_md"
-                    )
-
-                with col_e2:
-                    # Export as JSON
-                    export_data = {
-                        "question": research_question,
-                        "timestamp": datetime.now().isoformat(),
-                        "status": result.status.value,
-                        "confidence": result.confidence,
-                        "evidence_count": len(result.evidence),
-                        "sub_goals_count": len(result.sub_results),
-                        "duration_seconds": result.duration_seconds,
-                        "cost_dollars": result.cost_dollars,
-                        "synthesis": result.synthesis,
-                        "configuration": {
-                            "max_depth": max_depth,
-                            "max_time_minutes": max_time_minutes,
-                            "max_goals": max_goals,
-                            "max_cost": max_cost,
-                            "max_concurrent": max_concurrent
-                        },
-                        "evidence": [
-                            {
-                                "title": e.title,
-                                "url": e.url,
-                                "source": e.source,
-                                "content": e.content[:500] if e.content else None
-                            }
-                            for e in result.evidence
-                        ]
-                    }
+def _render_recent_jobs():
+    """Let the user re-attach to earlier or still-running research jobs."""
+    jobs = _job_runner().list_jobs(limit=10, target=DEEP_RESEARCH)
+    if not jobs:
+        return
+    with st.expander("Recent Research Jobs", expanded=False):
+        for job in jobs:
+            col_j1, col_j2 = st.columns([5, 1])
+            with col_j1:
+                created = datetime.fromtimestamp(job.created_at).strftime("%Y-%m-%d %H:%M")
+                st.write(f"`{job.id}` {created} — **{job.status}** — {job.label[:80]}")
+            with col_j2:
+                if st.button("Open", key=f"deep_research_open_{job.id}"):
+                    st.session_state["deep_research_job"] = job.id
+                    st.query_params["job"] = job.id
+
+
+def _render_job(job_id: str):
+    """Live progress while the job runs; the full result once it is done."""
+    job = _job_runner().get(job_id)
+    if job is None:
+        st.warning(f"Research job `{job_id}` not found")
+        return
 
-                    st.download_button(
-                        "Download Full Data (JSON)",
-                        json.dumps(export_data, indent=2),
-                        f"research_data_{timestamp}.json",
-                        "application/json",
-                        key="download_full_json"
-                    )
-
-                with col_e3:
-                    # Export as PDF
-                    try:
-                        from core.report_exporter import ReportExporter
-                        import io
-
-                        exporter = ReportExporter()
-                        # Generate PDF to bytes buffer
-                        pdf_buffer = io.BytesIO()
-                        html_content = exporter._markdown_to_html(report_md)
-                        HTML, CSS = exporter._ensure_weasyprint()
-                        html_doc = HTML(string=html_content)
-                        from core.report_exporter import PDF_STYLESHEET
-                        css = CSS(string=PDF_STYLESHEET)
-                        html_doc.write_pdf(pdf_buffer, stylesheets=[css])
-                        pdf_buffer.seek(0)
-
-                        st.download_button(
-                            "Download Report (PDF)",
-                            pdf_buffer.getvalue(),
-                            f"research_report_{timestamp}.pdf",
-                            "application/pdf",
-                            key="download_report_pdf"
-                        )
-                    except Exception as pdf_err:
-                        st.button("PDF Export Failed", disabled=True, help=str(pdf_err))
-
-                with col_e4:
-                    # Export as Word
-                    try:
-                        from core.report_exporter import ReportExporter
-                        import io
-
-                        exporter = ReportExporter()
-                        # Generate Word doc to bytes buffer
-                        docx_buffer = io.BytesIO()
-                        docx_lib = exporter._ensure_docx()
-                        doc = docx_lib['Document']()
-                        exporter._parse_markdown_to_docx(doc, report_md)
-                        doc.save(docx_buffer)
-                        docx_buffer.seek(0)
-
-                        st.download_button(
-                            "Download Report (Word)",
-                            docx_buffer.getvalue(),
-                            f"research_report_{timestamp}.docx",
-                            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            key="download_report_docx"
-                        )
-                    except Exception as docx_err:
-                        st.button("Word Export Failed", disabled=True, help=str(docx_err))
+    st.markdown("### Research Progress")
+    st.caption(f"Job `{job.id}`: {job.label}")
+
+    if not job.done:
+        _render_live_progress(job_id)
+    elif job.status == "succeeded":
+        result = job.result
+        if result["status"] == "completed":
+            st.success(f"Research complete! Found {len(result['evidence'])} pieces of evidence")
+        elif result["status"] == "partial":
+            st.warning(f"Research partially complete ({len(result['evidence'])} evidence pieces)")
+        else:
+            st.error(f"Research failed: {result['status']}")
+        _render_result(result, job)
+    else:
+        if job.status == "cancelled":
+            st.warning("Research cancelled")
+        else:
+            st.error("Deep research failed")
+            if job.error:
+                with st.expander("Error details", expanded=False):
+                    st.code(job.error)
+        _render_partial(job.partial)
+
+
+@st.fragment(run_every=PROGRESS_REFRESH_SECONDS)
+def _render_live_progress(job_id: str):
+    """Re-polls the job table every few seconds without rerunning the whole app."""
+    runner = _job_runner()
+    job = runner.get(job_id)
+    if job is None or job.done:
+        st.rerun()  # Full rerun renders the final result
+
+    elapsed = datetime.now().timestamp() - (job.started_at or job.created_at)
+    col_p1, col_p2 = st.columns([4, 1])
+    with col_p1:
+        if job.status == "queued":
+            st.info("Waiting for a worker...")
+        elif job.cancel_requested:
+            st.info(f"Cancelling... ({elapsed:.0f}s)")
+        else:
+            st.info(f"Research in progress... ({elapsed:.0f}s, attempt {job.attempts}/{job.max_attempts})")
+    with col_p2:
+        if st.button("Cancel", key=f"deep_research_cancel_{job_id}", disabled=job.cancel_requested):
+            runner.cancel(job_id)
+
+    progress = [e.message for e in runner.events(job_id) if e.kind == "progress"]
+    if progress:
+        st.code("\n".join(progress[-PROGRESS_EVENTS_SHOWN:]), language=None)
+    _render_partial(job.partial)
+
+
+def _render_partial(partial):
+    """Goals completed so far (partial result published by the job)."""
+    goals = (partial or {}).get("completed_goals", [])
+    if not goals:
+        return
+    st.markdown(f"**Goals completed so far:** {len(goals)}")
+    st.dataframe(
+        [
+            {
+                "Goal": g["goal"],
+                "Depth": g["depth"],
+                "Status": g["status"],
+                "Evidence": g["evidence_count"],
+                "Confidence": f"{int(g['confidence'] * 100)}%"
+            }
+            for g in goals
+        ],
+        use_container_width=True
+    )
 
-        except Exception as e:
-            # Deep research failed
-            logger.error(f"Deep research failed: {e}", exc_info=True)
-            st.error(f"Deep research failed: {str(e)}")
-            st.exception(e)
 
-    elif research_btn and not research_question:
-        st.warning("Please enter a research question")
+def _render_result(result, job):
+    """Render a finished job's result dict (see apps/jobs.summarize_result)."""
+    research_question = job.params["question"]
+    output_dir = result["output_dir"]
+    timestamp = datetime.fromtimestamp(job.created_at).strftime("%Y-%m-%d_%H-%M-%S")
+
+    progress_metrics = st.empty()
+    synthesis_container = st.container()
+    evidence_container = st.container()
+    subgoals_container = st.container()
+    stats_container = st.container()
+
+    # Show metrics
+    with progress_metrics.container():
+        col_m1, col_m2, col_m3, col_m4 = st.columns(4)
+        with col_m1:
+            st.metric("Evidence", len(result['evidence']))
+        with col_m2:
+            st.metric("Sub-goals", len(result['sub_results']))
+        with col_m3:
+            st.metric("Duration", f"{result['duration_seconds']:.1f}s")
+        with col_m4:
+            st.metric("Cost", f"${result['cost_dollars']:.4f}")
+
+    # Display synthesis
+    with synthesis_container:
+        st.markdown("---")
+        st.markdown("### Research Synthesis")
+        if result['synthesis']:
+            st.markdown(result['synthesis'])
+        else:
+            st.info("No synthesis generated")
+
+    # Display evidence by source
+    with evidence_container:
+        st.markdown("---")
+        st.markdown("### Evidence Sources")
+
+        # Group evidence by source
+        evidence_by_source = {}
+        for e in result['evidence']:
+            source = e["source"] or "Unknown"
+            if source not in evidence_by_source:
+                evidence_by_source[source] = []
+            evidence_by_source[source].append(e)
+
+        if evidence_by_source:
+            for source, evidence_list in evidence_by_source.items():
+                with st.expander(f"{source} ({len(evidence_list)} results)", expanded=False):
+                    for e in evidence_list[:15]:  # Limit display
+                        st.markdown(f"**{e['title']}**")
+                        if e['url']:
+                            st.markdown(f"[Link]({e['url']})")
+                        if e['content']:
+                            st.caption(e['content'][:300] + "..." if len(e['content']) > 300 else e['content'])
+                        st.markdown("---")
+        else:
+            st.info("No evidence collected")
+
+    # Display sub-goals
+    with subgoals_container:
+        st.markdown("---")
+        st.markdown("### Sub-Goals Explored")
+
+        if result['sub_results']:
+            for i, sub in enumerate(result['sub_results'], 1):
+                status_icon = {
+                    "completed": "Done",
+                    "partial": "Partial",
+                    "failed": "Failed",
+                    "skipped": "Skipped"
+                }.get(sub['status'], "?")
+
+                with st.expander(f"Sub-goal {i}: {sub['goal'][:80]}... [{status_icon}]", expanded=False):
+                    st.write(f"**Goal:** {sub['goal']}")
+                    st.write(f"**Status:** {sub['status']}")
+                    st.write(f"**Confidence:** {int(sub['confidence'] * 100)}%")
+                    st.write(f"**Evidence:** {sub['evidence_count']} pieces")
+                    st.write(f"**Depth:** {sub['depth']}")
+
+                    if sub['synthesis']:
+                        st.markdown("**Synthesis:**")
+                        st.caption(sub['synthesis'][:500] + "..." if len(sub['synthesis']) > 500 else sub['synthesis'])
+        else:
+            st.info("No sub-goals generated (query may have been directly executable)")
+
+    # Statistics and export
+    with stats_container:
+        st.markdown("---")
+        st.markdown("### Statistics & Export")
+
+        col_s1, col_s2, col_s3, col_s4 = st.columns(4)
+        with col_s1:
+            st.metric("Status", result['status'])
+        with col_s2:
+            st.metric("Confidence", f"{int(result['confidence'] * 100)}%")
+        with col_s3:
+            st.metric("Max Depth Reached", result['depth'])
+        with col_s4:
+            sources_count = len(evidence_by_source) if evidence_by_source else 0
+            st.metric("Sources Used", sources_count)
+
+        st.markdown(f"**Output saved to:** `{output_dir}`")
+
+        # Export buttons
+        col_e1, col_e2, col_e3, col_e4 = st.columns(4)
+
+        with col_e1:
+            # Export as markdown report
+            report_lines = [
+                "# Research Report",
+                "",
+                f"**Question:** {research_question}",
+                f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                f"**Status:** {result['status']}",
+                f"**Confidence:** {int(result['confidence'] * 100)}%",
+                f"**Evidence:** {len(result['evidence'])} pieces",
+                f"**Duration:** {result['duration_seconds']:.1f}s",
+                f"**Cost:** ${result['cost_dollars']:.4f}",
+                "",
+                "---",
+                "",
+                "## Synthesis",
+                "",
+                result['synthesis'] or "No synthesis generated",
+                "",
+                "---",
+                "",
+                "## Evidence Summary",
+                ""
+            ]
+
+            for source, evidence_list in evidence_by_source.items():
+                report_lines.append(f"### {source} ({len(evidence_list)} results)")
+                report_lines.append("")
+                for e in evidence_list[:10]:
+                    report_lines.append(f"- **{e['title']}**")
+                    if e['url']:
+                        report_lines.append(f"  - {e['url']}")
+                report_lines.append("")
+
+            report_md = "\n".join(report_lines)
+
+            st.download_button(
+                "Download Report (Markdown)",
+                report_md,
+                f"research_report_{timestamp}.md",
+                "text/markdown",
+                key="download_report_md"
+            )
+
+        with col_e2:
+            # Export as JSON
+            export_data = {
+                "question": research_question,
+                "timestamp": datetime.now().isoformat(),
+                "status": result['status'],
+                "confidence": result['confidence'],
+                "evidence_count": len(result['evidence']),
+                "sub_goals_count": len(result['sub_results']),
+                "duration_seconds": result['duration_seconds'],
+                "cost_dollars": result['cost_dollars'],
+                "synthesis": result['synthesis'],
+                "configuration": job.params.get("configuration", {}),
+                "evidence": [
+                    {
+                        "title": e['title'],
+                        "url": e['url'],
+                        "source": e["source"],
+                        "content": e['content'][:500] if e['content'] else None
+                    }
+                    for e in result['evidence']
+                ]
+            }
+
+            st.download_button(
+                "Download Full Data (JSON)",
+                json.dumps(export_data, indent=2),
+                f"research_data_{timestamp}.json",
+                "application/json",
+                key="download_full_json"
+            )
+
+        with col_e3:
+            # Export as PDF
+            try:
+                from core.report_exporter import ReportExporter
+                import io
+
+                exporter = ReportExporter()
+                # Generate PDF to bytes buffer
+                pdf_buffer = io.BytesIO()
+                html_content = exporter._markdown_to_html(report_md)
+                HTML, CSS = exporter._ensure_weasyprint()
+                html_doc = HTML(string=html_content)
+                from core.report_exporter import PDF_STYLESHEET
+                css = CSS(string=PDF_STYLESHEET)
+                html_doc.write_pdf(pdf_buffer, stylesheets=[css])
+                pdf_buffer.seek(0)
+
+                st.download_button(
+                    "Download Report (PDF)",
+                    pdf_buffer.getvalue(),
+                    f"research_report_{timestamp}.pdf",
+                    "application/pdf",
+                    key="download_report_pdf"
+                )
+            except Exception as pdf_err:
+                st.button("PDF Export Failed", disabled=True, help=str(pdf_err))
+
+        with col_e4:
+            # Export as Word
+            try:
+                from core.report_exporter import ReportExporter
+                import io
+
+                exporter = ReportExporter()
+                # Generate Word doc to bytes buffer
+                docx_buffer = io.BytesIO()
+                docx_lib = exporter._ensure_docx()
+                doc = docx_lib['Document']()
+                exporter._parse_markdown_to_docx(doc, report_md)
+                doc.save(docx_buffer)
+                docx_buffer.seek(0)
+
+                st.download_button(
+                    "Download Report (Word)",
+                    docx_buffer.getvalue(),
+                    f"research_report_{timestamp}.docx",
+                    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    key="download_report_docx"
+                )
+            except Exception as docx_err:
+                st.button("Word Export Failed", disabled=True, help=str(docx_err))
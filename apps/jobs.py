@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Background job targets for the Streamlit apps (run by core/job_runner.py workers).
+
+Each target takes (params, job) and returns a JSON-serializable dict, which the
+UI renders after attaching to the job by id. Progress and partial results are
+reported through the JobContext while the job runs.
+
+Usage:
+    from core.job_runner import JobRunner
+
+    job_id = JobRunner.from_config().submit(DEEP_RESEARCH, {
+        "question": "Investigate Palantir government contracts",
+        "constraints": {"max_depth": 8, "max_time_seconds": 900},
+        "output_dir": "data/research_v2/...",
+    }, label="Investigate Palantir government contracts")
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.job_runner import JobContext
+
+logger = logging.getLogger(__name__)
+
+DEEP_RESEARCH = "apps.jobs:deep_research"
+
+MAX_CONTENT_CHARS = 500  # Evidence content kept in the job result
+
+
+def summarize_result(result, output_dir: str) -> Dict[str, Any]:
+    """GoalResult -> plain dict rendered by the Deep Research tab."""
+    return {
+        "status": result.status.value,
+        "confidence": result.confidence,
+        "synthesis": result.synthesis,
+        "duration_seconds": result.duration_seconds,
+        "cost_dollars": result.cost_dollars,
+        "depth": result.depth,
+        "output_dir": output_dir,
+        "evidence": [
+            {
+                "title": e.title,
+                "url": e.url,
+                "source": e.source,
+                "content": e.content[:MAX_CONTENT_CHARS] if e.content else None,
+            }
+            for e in result.evidence
+        ],
+        "sub_results": [
+            {
+                "goal": sub.goal,
+                "status": sub.status.value,
+                "confidence": sub.confidence,
+                "evidence_count": len(sub.evidence),
+                "depth": sub.depth,
+                "synthesis": sub.synthesis,
+            }
+            for sub in result.sub_results
+        ],
+    }
+
+
+async def deep_research(params: Dict[str, Any], job: JobContext) -> Dict[str, Any]:
+    """
+    Run RecursiveResearchAgent.research() as a background job.
+
+    Goal start/completion events from the execution log become progress
+    events; completed goals are published as the partial result. A retry
+    after the worker died resumes from the run's checkpoint instead of
+    starting over.
+
+    Args:
+        params: {"question": str, "constraints": Constraints kwargs, "output_dir": str}
+    """
+    from research.checkpoint import RunCheckpoint
+    from research.recursive_agent import Constraints, RecursiveResearchAgent
+
+    output_dir = params["output_dir"]
+    agent = RecursiveResearchAgent(
+        constraints=Constraints(**params.get("constraints", {})),
+        output_dir=output_dir
+    )
+
+    completed = []
+
+    def on_event(event):
+        if event.event_type == "goal_started":
+            job.progress(f"{'  ' * event.depth}Started: {event.goal}", depth=event.depth)
+        elif event.event_type in ("goal_completed", "goal_restored"):
+            data = event.data
+            outcome = "Restored" if event.event_type == "goal_restored" else data["status"].capitalize()
+            job.progress(
+                f"{'  ' * event.depth}{outcome}: {event.goal} ({data['evidence_count']} evidence)",
+                depth=event.depth
+            )
+            completed.append({
+                "goal": event.goal,
+                "depth": event.depth,
+                "status": data["status"],
+                "evidence_count": data["evidence_count"],
+                "confidence": data["confidence"],
+                "cost_dollars": data["cost_dollars"],
+            })
+            job.partial({"completed_goals": completed})
+
+    agent.logger.listeners.append(on_event)
+    resume = job.attempt > 1 and RunCheckpoint.exists(output_dir)
+    job.progress(f"{'Resuming' if resume else 'Researching'}: {params['question']}")
+    result = await agent.research(params["question"], resume=resume)
+    return summarize_result(result, output_dir)
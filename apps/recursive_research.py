@@ -5,6 +5,7 @@ CLI for v2 recursive research agent.
 Usage:
     python3 apps/recursive_research.py "Research question here"
     python3 apps/recursive_research.py "Research question" --max-depth 5 --max-time 10
+    python3 apps/recursive_research.py --resume data/research_v2/<run_dir>
 
 See docs/V2_RECURSIVE_AGENT_MIGRATION_PLAN.md for architecture details.
 """
@@ -22,6 +23,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dotenv import load_dotenv
+from research.checkpoint import RunCheckpoint
 from research.recursive_agent import RecursiveResearchAgent, Constraints, GoalStatus
 from config_loader import config
 
@@ -164,11 +166,15 @@ Examples:
     python3 apps/recursive_research.py "Find federal AI contracts awarded in 2024"
     python3 apps/recursive_research.py "Investigate company X" --max-depth 5 --max-time 10
     python3 apps/recursive_research.py "Complex topic" --max-goals 30 --max-cost 1.0
+
+    # Continue a run that crashed or was interrupted (question and constraints
+    # come from its checkpoint; completed goals are not re-run)
+    python3 apps/recursive_research.py --resume data/research_v2/2025-11-20_14-00-00_Complex_topic
         """
     )
 
     # Required argument
-    parser.add_argument('question', help='Research question to investigate')
+    parser.add_argument('question', nargs='?', help='Research question to investigate')
 
     # v2-specific arguments
     parser.add_argument('--max-depth', type=int, default=10,
@@ -187,8 +193,14 @@ Examples:
                         help='Custom output directory (default: auto-generated)')
     parser.add_argument('--quiet', action='store_true',
                         help='Suppress progress output')
+    parser.add_argument('--resume', type=str, default=None, metavar='RUN_DIR',
+                        help='Resume the checkpointed run in RUN_DIR (skips completed goals)')
 
     args = parser.parse_args()
+    if args.resume:
+        return await resume(Path(args.resume), args.quiet)
+    if not args.question:
+        parser.error("question is required unless --resume is given")
 
     # Load any config overrides from config.yaml
     raw_config = config.get_raw_config()
@@ -229,11 +241,43 @@ Examples:
         output_dir=str(output_dir)
     )
 
+    return await run_research(agent, args.question, output_dir)
+
+
+async def resume(run_dir: Path, quiet: bool = False) -> int:
+    """Resume a checkpointed run with its original question and constraints."""
+    if not RunCheckpoint.exists(run_dir):
+        print(f"ERROR: No checkpoint found in {run_dir}")
+        return 1
+    checkpoint = RunCheckpoint.read(run_dir)  # research(resume=True) loads it for real
+    known_fields = Constraints.__dataclass_fields__
+    constraints = Constraints(**{k: v for k, v in checkpoint.constraints.items() if k in known_fields})
+
+    if not quiet:
+        summary = checkpoint.summary()
+        print(f"v2 Recursive Research Agent (resuming)")
+        print(f"=" * 50)
+        print(f"Question: {checkpoint.question}")
+        print(f"Output: {run_dir}")
+        print(f"Completed goals: {summary['completed_goals']} (restored, not re-run)")
+        print(f"In-flight goals: {summary['in_flight_goals']} (re-queued)")
+        print(f"\nResuming research...\n")
+
+    agent = RecursiveResearchAgent(
+        constraints=constraints,
+        output_dir=str(run_dir)
+    )
+    return await run_research(agent, checkpoint.question, run_dir, resume=True)
+
+
+async def run_research(agent: RecursiveResearchAgent, question: str, output_dir: Path,
+                       resume: bool = False) -> int:
+    """Run (or resume) research, save results and print a summary. Returns the exit code."""
     try:
-        result = await agent.research(args.question)
+        result = await agent.research(question, resume=resume)
 
         # Save results
-        metadata = save_results(result, output_dir, args.question)
+        metadata = save_results(result, output_dir, question)
 
         # Print summary
         print(f"\n{'=' * 50}")
@@ -260,6 +304,7 @@ Examples:
 
     except KeyboardInterrupt:
         print("\n\nResearch interrupted by user")
+        print(f"Resume with: python3 apps/recursive_research.py --resume {output_dir}")
         return 130
     except Exception as e:
         logger.exception("Research failed with error")
@@ -30,6 +30,15 @@ class OperationModelConfig(BaseModel):
     max_tokens: int = Field(default=500, gt=0, description="Maximum tokens for response")
 
 
+class PromptPackingConfig(BaseModel):
+    """Token-budget prompt packing (core/prompt_packer.py)."""
+    enabled: bool = Field(default=True, description="Pack evidence-heavy prompts to a token budget")
+    default_context_window: int = Field(default=128000, ge=1024, description="Context window for unlisted models")
+    reserve_output_tokens: int = Field(default=4000, ge=0, description="Tokens left free for the answer")
+    context_windows: Dict[str, int] = Field(default_factory=dict, description="Context window per model")
+    max_content_tokens: Dict[str, int] = Field(default_factory=dict, description="Packed-content cap per call site")
+
+
 class LLMConfig(BaseModel):
     """LLM configuration section."""
     default_model: str = Field(
@@ -45,6 +54,8 @@ class LLMConfig(BaseModel):
     synthesis: Optional[OperationModelConfig] = None
     code_generation: Optional[OperationModelConfig] = None
 
+    prompt_packing: PromptPackingConfig = Field(default_factory=PromptPackingConfig)
+
 
 # ============================================================================
 # Execution Configuration
@@ -92,6 +103,7 @@ class DatabaseConfig(BaseModel):
     rate_limit_daily: Optional[int] = Field(default=None, ge=1, le=10000)
     max_age_days: Optional[int] = Field(default=None, ge=1, le=365)
     max_snapshots_per_url: Optional[int] = Field(default=None, ge=1, le=100)
+    hedge: Optional[bool] = Field(default=None, description="Hedge idempotent requests after the source's p95 latency")
 
     # Credential placeholders (actual values from .env)
     user_email: Optional[str] = Field(default=None)
@@ -249,6 +261,25 @@ class LoggingConfig(BaseModel):
     log_to_stdout: bool = Field(default=True, description="Print to console")
 
 
+# ============================================================================
+# Metrics Configuration
+# ============================================================================
+
+class MetricsConfig(BaseModel):
+    """Prometheus/OpenMetrics endpoint (core/metrics.py)."""
+    enabled: bool = Field(default=False, description="Serve GET /metrics")
+    host: str = Field(default="127.0.0.1", description="Interface to bind")
+    port: int = Field(default=9464, ge=1, le=65535, description="Port to bind")
+
+
+class JobsConfig(BaseModel):
+    """Background job runner (core/job_runner.py)."""
+    db_path: str = Field(default="data/jobs/jobs.sqlite", description="SQLite job table")
+    max_workers: int = Field(default=2, ge=1, le=32, description="Concurrent worker processes")
+    heartbeat_timeout_seconds: float = Field(default=60, gt=0, description="Seconds before a silent job is recovered")
+    poll_interval_seconds: float = Field(default=0.5, gt=0, description="Worker heartbeat/cancel-check interval")
+
+
 # ============================================================================
 # Root Configuration Model
 # ============================================================================
@@ -276,6 +307,8 @@ class AppConfig(BaseModel):
     provider_fallback: ProviderFallbackConfig = Field(default_factory=ProviderFallbackConfig)
     cost_management: CostManagementConfig = Field(default_factory=CostManagementConfig)
     research: ResearchConfig = Field(default_factory=ResearchConfig)
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig)
+    jobs: JobsConfig = Field(default_factory=JobsConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
     @field_validator("integration_limits")
@@ -15,6 +15,8 @@ from core.http_client import (
     http_post_json,
     HttpResponse,
     HttpClientError,
+    get_shared_session,
+    close_shared_session,
 )
 from core.rate_limiter import (
     RateLimiter,
@@ -31,6 +33,8 @@ __all__ = [
     "http_post_json",
     "HttpResponse",
     "HttpClientError",
+    "get_shared_session",
+    "close_shared_session",
     # Rate Limiter
     "RateLimiter",
     "RateLimitExceeded",
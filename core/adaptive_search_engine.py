@@ -5,13 +5,21 @@ This module implements iterative, autonomous search that refines itself:
 2. Analyze top results for entities
 3. Targeted follow-up searches
 4. Quality check & iterate if needed
+
+Several related queries (e.g. a monitor's keywords) can run concurrently
+against one SharedSearchState so that URLs are reported once, identical
+entity analyses run once, and entities found for one query seed the
+follow-up searches of the others.
 """
 
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field
+import asyncio
 import logging
+import time
 from llm_utils import acompletion
 import json
+from core.content_dedup import ContentDeduplicator
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +32,7 @@ class SearchPhase:
     results: List[Dict]
     entities_extracted: List[str]
     quality_score: float
+    duration_seconds: float = 0.0
 
 
 @dataclass
@@ -37,12 +46,54 @@ class AdaptiveSearchResult:
     quality_metrics: Dict
     iterations: int
     results: List[Dict] = None  # NEW: Actual result objects for synthesis
+    duration_seconds: float = 0.0
 
     def __post_init__(self):
         if self.results is None:
             self.results = []
 
 
+def _normalize_term(term: str) -> str:
+    return " ".join(term.split()).casefold()
+
+
+@dataclass
+class SharedSearchState:
+    """
+    State shared by adaptive searches running concurrently for related queries.
+
+    - seen_urls: URLs already returned by any of the searches
+    - dedup: URL-variant / near-identical content detection across the searches
+    - entity_cache: entity extraction per analyzed result set (keyed by URLs),
+      holding the in-flight task so concurrent identical analyses run once
+    - searched_pairs: (query, entity) follow-ups already issued, order-insensitive,
+      so "FISA AND Section 702" and "Section 702 AND FISA" run once
+    - discovered_by: normalized entity -> queries that discovered it
+    """
+    seen_urls: Set[str] = field(default_factory=set)
+    dedup: ContentDeduplicator = field(default_factory=ContentDeduplicator)
+    entity_cache: Dict[Tuple[str, ...], "asyncio.Future"] = field(default_factory=dict)
+    searched_pairs: Set[frozenset] = field(default_factory=set)
+    entity_names: Dict[str, str] = field(default_factory=dict)
+    discovered_by: Dict[str, Set[str]] = field(default_factory=dict)
+
+    def record_entities(self, query: str, entities: List[str]) -> None:
+        """Publish entities discovered for query so other queries can use them."""
+        for entity in entities:
+            key = _normalize_term(entity)
+            self.entity_names.setdefault(key, entity)
+            self.discovered_by.setdefault(key, set()).add(_normalize_term(query))
+
+    def seed_entities(self, query: str) -> List[str]:
+        """Entities discovered by other queries, most widely discovered first."""
+        own = _normalize_term(query)
+        ranked = sorted(
+            (key for key, queries in self.discovered_by.items() if queries - {own}),
+            key=lambda key: -len(self.discovered_by[key])
+        )
+        return [self.entity_names[key] for key in ranked]
+
+
 class AdaptiveSearchEngine:
     """
     Autonomous search that iterates and refines itself.
@@ -102,7 +153,8 @@ class AdaptiveSearchEngine:
         self,
         initial_query: str,
         databases: List = None,
-        api_keys: Dict[str, str] = None
+        api_keys: Dict[str, str] = None,
+        shared_state: Optional[SharedSearchState] = None
     ) -> AdaptiveSearchResult:
         """
         Execute adaptive search with iterative refinement.
@@ -111,6 +163,8 @@ class AdaptiveSearchEngine:
             initial_query: Starting search query (e.g., "FISA Section 702")
             databases: List of database integrations to search (defaults to all)
             api_keys: API keys dict for databases
+            shared_state: State shared with concurrent searches for related
+                queries (seen URLs, entity cache, cross-query entity seeding)
 
         Returns:
             Complete search results with all phases
@@ -124,7 +178,11 @@ class AdaptiveSearchEngine:
         """
         phases = []
         all_results = []
-        seen_urls = set()
+        seen_urls = shared_state.seen_urls if shared_state else set()
+        dedup = shared_state.dedup if shared_state else ContentDeduplicator()
+        dedup_before = dict(dedup.stats)
+        search_start = time.monotonic()
+        phase_start = search_start
 
         logger.info(f"Starting adaptive search: '{initial_query}'")
 
@@ -137,13 +195,14 @@ class AdaptiveSearchEngine:
             api_keys=api_keys
         )
 
-        phase1_unique = self._deduplicate(phase1_results, seen_urls)
+        phase1_unique = self._deduplicate(phase1_results, seen_urls, dedup)
         all_results.extend(phase1_unique)
 
         # Analyze top results for entities
-        entities = await self._extract_entities(
+        entities = await self._extract_entities_shared(
             phase1_unique[:self.analyze_top_n],
-            initial_query
+            initial_query,
+            shared_state
         )
 
         phases.append(SearchPhase(
@@ -151,7 +210,8 @@ class AdaptiveSearchEngine:
             query=initial_query,
             results=phase1_unique,
             entities_extracted=entities,
-            quality_score=self._calculate_quality(phase1_unique)
+            quality_score=self._calculate_quality(phase1_unique),
+            duration_seconds=time.monotonic() - phase_start
         ))
 
         logger.info(f"Phase 1 complete: {len(phase1_unique)} results, extracted {len(entities)} entities")
@@ -159,14 +219,17 @@ class AdaptiveSearchEngine:
         # Phase 2+: Iterative refinement
         iteration = 1
         current_entities = entities
+        tried_entities: Set[str] = set()
 
         while iteration <= self.max_iterations:
-            logger.info(f"Iteration {iteration}: Targeted searches for {len(current_entities[:self.phase2_queries])} entities")
+            phase_start = time.monotonic()
+            targets = self._select_phase2_entities(initial_query, current_entities, tried_entities, shared_state)
+            logger.info(f"Iteration {iteration}: Targeted searches for {len(targets)} entities")
 
             iteration_results = []
 
             # Search for each extracted entity
-            for entity in current_entities[:self.phase2_queries]:
+            for entity in targets:
                 refined_query = f"{initial_query} AND {entity}"
                 logger.info(f"  Searching: {refined_query}")
 
@@ -177,16 +240,17 @@ class AdaptiveSearchEngine:
                     api_keys=api_keys
                 )
 
-                unique_entity_results = self._deduplicate(entity_results, seen_urls)
+                unique_entity_results = self._deduplicate(entity_results, seen_urls, dedup)
                 iteration_results.extend(unique_entity_results)
 
             all_results.extend(iteration_results)
 
             # Analyze new results for more entities
             if iteration_results:
-                new_entities = await self._extract_entities(
+                new_entities = await self._extract_entities_shared(
                     iteration_results[:self.analyze_top_n],
-                    initial_query
+                    initial_query,
+                    shared_state
                 )
             else:
                 new_entities = []
@@ -198,7 +262,8 @@ class AdaptiveSearchEngine:
                 query=f"{initial_query} (targeted)",
                 results=iteration_results,
                 entities_extracted=new_entities,
-                quality_score=quality
+                quality_score=quality,
+                duration_seconds=time.monotonic() - phase_start
             ))
 
             logger.info(f"Iteration {iteration} complete: {len(iteration_results)} new results, quality: {quality:.2f}")
@@ -228,6 +293,11 @@ class AdaptiveSearchEngine:
 
         # Calculate final quality metrics
         quality_metrics = self._comprehensive_quality_check(all_results, all_entities)
+        # This search's share of the (possibly shared) deduplicator's work
+        dedup_stats = {key: value - dedup_before[key] for key, value in dedup.stats.items()}
+        collapsed = dedup_stats["url_duplicates"] + dedup_stats["content_duplicates"]
+        dedup_stats["dedup_ratio"] = round(collapsed / dedup_stats["seen"], 3) if dedup_stats["seen"] else 0.0
+        quality_metrics["dedup"] = dedup_stats
 
         result = AdaptiveSearchResult(
             initial_query=initial_query,
@@ -237,7 +307,8 @@ class AdaptiveSearchEngine:
             entities_discovered=all_entities,
             quality_metrics=quality_metrics,
             iterations=len(phases),
-            results=all_results  # NEW: Pass actual result objects for synthesis
+            results=all_results,  # NEW: Pass actual result objects for synthesis
+            duration_seconds=time.monotonic() - search_start
         )
 
         logger.info(f"Adaptive search complete: {result.total_results} results, {result.iterations} phases, quality: {quality_metrics['overall_quality']:.2f}")
@@ -280,27 +351,98 @@ class AdaptiveSearchEngine:
 
         return all_results
 
+    def _select_phase2_entities(
+        self,
+        initial_query: str,
+        own_entities: List[str],
+        tried: Set[str],
+        shared_state: Optional[SharedSearchState]
+    ) -> List[str]:
+        """
+        Pick the entities for one round of targeted searches.
+
+        Without shared state this is simply the first phase2_queries entities.
+        With it, this query's own entities come first and entities discovered
+        by the other queries fill the remaining slots; entities already tried
+        here, and (query, entity) pairs another query already searched, are skipped.
+
+        Args:
+            initial_query: The query being refined
+            own_entities: Entities extracted from this query's latest results
+            tried: Normalized entities already searched for this query (updated)
+            shared_state: Shared state, if searches run concurrently
+
+        Returns:
+            Entities to search, at most phase2_queries
+        """
+        if shared_state is None:
+            return own_entities[:self.phase2_queries]
+
+        query_key = _normalize_term(initial_query)
+        selected = []
+        for entity in own_entities + shared_state.seed_entities(initial_query):
+            entity_key = _normalize_term(entity)
+            pair = frozenset((query_key, entity_key))
+            if entity_key in tried or entity_key == query_key or pair in shared_state.searched_pairs:
+                continue
+            tried.add(entity_key)
+            shared_state.searched_pairs.add(pair)
+            selected.append(entity)
+            if len(selected) >= self.phase2_queries:
+                break
+        return selected
+
+    async def _extract_entities_shared(
+        self,
+        results: List[Dict],
+        original_query: str,
+        shared_state: Optional[SharedSearchState]
+    ) -> List[str]:
+        """
+        _extract_entities() through the shared entity cache, publishing the entities.
+
+        The cache is keyed by the analyzed URLs, so the same result set is only
+        sent to the LLM once even when several queries analyze it concurrently.
+        """
+        if shared_state is None:
+            return await self._extract_entities(results, original_query)
+
+        key = tuple(sorted(r.get('url', '') for r in results))
+        task = shared_state.entity_cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._extract_entities(results, original_query))
+            shared_state.entity_cache[key] = task
+        else:
+            logger.info(f"Reusing entity extraction for {len(results)} results")
+        entities = list(await asyncio.shield(task))
+        shared_state.record_entities(original_query, entities)
+        return entities
+
     def _deduplicate(
         self,
         results: List[Dict],
-        seen_urls: set
+        seen_urls: set,
+        dedup: Optional[ContentDeduplicator] = None
     ) -> List[Dict]:
         """
-        Remove duplicate URLs, update seen set.
+        Remove duplicates (URL variants, near-identical content), update seen set.
+
+        Results without a URL are dropped.
 
         Args:
             results: List of result dictionaries
             seen_urls: Set of URLs already seen (modified in place)
+            dedup: Deduplicator holding everything seen so far in this search
 
         Returns:
             List of unique results
         """
-        unique = []
-        for result in results:
-            url = result.get('url', '')
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique.append(result)
+        dedup = dedup or ContentDeduplicator()
+        unique = dedup.deduplicate(
+            result for result in results
+            if result.get('url') and result['url'] not in seen_urls
+        )
+        seen_urls.update(result['url'] for result in unique)
         return unique
 
     async def _extract_entities(
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
-"""API Request Tracker - Track API calls and rate limit hits to understand limits."""
+"""API Request Tracker - Track API calls and rate limit hits to understand limits.
+
+Every logged request also feeds the integration metrics in core.metrics.
+"""
 
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 
+from core import metrics
+
 # Log file location
 LOG_FILE = Path(__file__).parent / "api_requests.jsonl"
 
@@ -43,6 +48,10 @@ def log_request(api_name, endpoint, status_code, response_time_ms=None, error_me
     with open(LOG_FILE, "a") as f:
         f.write(json.dumps(log_entry) + "\n")
 
+    metrics.record_integration_request(
+        api_name, status_code, response_time_ms / 1000 if response_time_ms is not None else None
+    )
+
 
 def sanitize_params(params):
     """Remove sensitive data like API keys from parameters before logging."""
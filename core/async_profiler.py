@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Asyncio-aware profiler for research runs.
+
+cProfile attributes time per function and mixes every coroutine together, so
+it cannot show what research runs actually suffer from: event-loop stalls,
+e.g. a synchronous `requests` call inside an integration that freezes every
+other task for its whole round trip. AsyncProfiler records, for one loop:
+
+- Event-loop lag: a heartbeat task sleeps for `heartbeat_interval` and
+  measures how late it wakes up.
+- Per-task busy (wall time holding the loop) vs on-CPU time, plus lifetime.
+  Busy >> CPU means the task blocked the loop without computing (sync I/O).
+- Slow callbacks: every loop callback (task step) running longer than
+  `slow_callback_duration`, with the stack sampled while it was blocking
+  and the innermost project frame as the culprit. It hooks Handle._run, the
+  same point asyncio's debug mode uses for its slow-callback warnings.
+- Semaphore waits: time spent in contended asyncio.Semaphore.acquire(),
+  grouped by the `async with` site (or a name from name_semaphore()).
+- Stack samples every `sample_interval` from a watcher thread, rooted at the
+  running task's name, written in collapsed format for flamegraph.pl,
+  speedscope or inferno.
+
+Usage:
+    from core.async_profiler import AsyncProfiler
+
+    profiler = AsyncProfiler(slow_callback_duration=0.1)
+    async with profiler:
+        await agent.research(question)
+    profiler.write_collapsed("profile.folded")   # flamegraph.pl profile.folded > profile.svg
+    print(profiler.summary_table())
+"""
+
+import asyncio
+import asyncio.events
+import asyncio.locks
+import logging
+import os
+import statistics
+import sys
+import sysconfig
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_ASYNCIO_DIR = os.path.dirname(asyncio.__file__)
+_THIS_FILE = os.path.abspath(__file__)
+_LIBRARY_DIRS = tuple({
+    os.path.abspath(p) for p in (sysconfig.get_paths().get(k) for k in ("stdlib", "platstdlib", "purelib", "platlib")) if p
+})
+
+_original_handle_run = asyncio.events.Handle._run
+_original_semaphore_acquire = asyncio.locks.Semaphore.acquire
+_active: Optional["AsyncProfiler"] = None  # At most one profiler patches asyncio at a time
+
+
+@dataclass
+class TaskStats:
+    """Time one task spent holding the loop."""
+    name: str
+    coro: str
+    steps: int = 0
+    busy: float = 0.0  # Wall seconds inside task steps
+    cpu: float = 0.0  # Thread CPU seconds inside task steps
+    started: float = 0.0
+    finished: Optional[float] = None
+    ref: Any = field(default=None, repr=False)
+
+    @property
+    def wall(self) -> float:
+        """Lifetime from first step to completion (or now)."""
+        return (self.finished if self.finished is not None else time.perf_counter()) - self.started
+
+
+@dataclass
+class SlowCallback:
+    """One loop callback that ran longer than slow_callback_duration."""
+    task: str
+    callback: str
+    duration: float
+    cpu: float
+    stack: List[str]  # Outermost first, "function (file:line)"
+    culprit: str
+
+
+@dataclass
+class SemaphoreStats:
+    acquires: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+    max_wait: float = 0.0
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def _is_internal(filename: str) -> bool:
+    path = os.path.abspath(filename)
+    return path.startswith(_ASYNCIO_DIR) or path == _THIS_FILE or filename.startswith("<")
+
+
+def _is_library(filename: str) -> bool:
+    return os.path.abspath(filename).startswith(_LIBRARY_DIRS)
+
+
+class AsyncProfiler:
+    """Profiles one event loop; use as `async with AsyncProfiler(): ...` inside it."""
+
+    def __init__(
+        self,
+        slow_callback_duration: float = 0.1,
+        heartbeat_interval: float = 0.05,
+        sample_interval: float = 0.005,
+        asyncio_debug: bool = False,
+    ):
+        """
+        Args:
+            slow_callback_duration: Callbacks holding the loop longer than this are reported
+            heartbeat_interval: Sleep of the lag-measuring heartbeat task
+            sample_interval: Stack sampling period of the watcher thread
+            asyncio_debug: Also enable asyncio debug mode (its own warnings; slower)
+        """
+        self.slow_callback_duration = slow_callback_duration
+        self.heartbeat_interval = heartbeat_interval
+        self.sample_interval = sample_interval
+        self.asyncio_debug = asyncio_debug
+
+        self.lag_samples: List[float] = []
+        self.tasks: Dict[int, TaskStats] = {}
+        self.slow_callbacks: List[SlowCallback] = []
+        self.semaphores: Dict[str, SemaphoreStats] = {}
+        self.stacks: Dict[str, int] = {}  # Collapsed stack -> sample count
+        self.idle_samples = 0
+        self.started = 0.0
+        self.elapsed = 0.0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._semaphore_names: "weakref.WeakKeyDictionary[asyncio.Semaphore, str]" = weakref.WeakKeyDictionary()
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Written by the loop thread, read by the sampler: (callback seq, start time)
+        self._running: Optional[Tuple[int, float]] = None
+        self._callback_seq = 0
+        self._blocking_stack: Optional[Tuple[int, List[FrameType]]] = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def __aenter__(self) -> "AsyncProfiler":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Start profiling the running loop (call from inside it)."""
+        global _active
+        if _active is not None:
+            raise RuntimeError("Another AsyncProfiler is already active")
+        _active = self
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._previous_debug = self._loop.get_debug()
+        if self.asyncio_debug:
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self.slow_callback_duration
+        asyncio.events.Handle._run = _profiled_handle_run
+        asyncio.locks.Semaphore.acquire = _profiled_semaphore_acquire
+
+        self.started = time.perf_counter()
+        self._stop.clear()
+        self._heartbeat = self._loop.create_task(self._heartbeat_loop(), name="async-profiler-heartbeat")
+        self._sampler = threading.Thread(target=self._sample_loop, name="async-profiler-sampler", daemon=True)
+        self._sampler.start()
+
+    async def stop(self) -> None:
+        """Stop profiling and restore asyncio."""
+        global _active
+        self.elapsed = time.perf_counter() - self.started
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+        if self._sampler is not None:
+            self._sampler.join()
+        asyncio.events.Handle._run = _original_handle_run
+        asyncio.locks.Semaphore.acquire = _original_semaphore_acquire
+        if self.asyncio_debug:
+            self._loop.set_debug(self._previous_debug)
+        _active = None
+
+    def name_semaphore(self, semaphore: asyncio.Semaphore, name: str) -> None:
+        """Report waits on `semaphore` under `name` instead of its acquire site."""
+        self._semaphore_names[semaphore] = name
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            before = time.perf_counter()
+            await asyncio.sleep(self.heartbeat_interval)
+            self.lag_samples.append(max(0.0, time.perf_counter() - before - self.heartbeat_interval))
+
+    def _task_stats(self, task: asyncio.Task, now: float) -> TaskStats:
+        stats = self.tasks.get(id(task))
+        if stats is None or stats.ref() is not task:  # New task (or a recycled id)
+            coro = task.get_coro()
+            stats = TaskStats(
+                name=task.get_name(),
+                coro=getattr(coro, "__qualname__", type(coro).__name__),
+                started=now,
+                ref=weakref.ref(task),
+            )
+            self.tasks[id(task)] = stats
+        return stats
+
+    def _run_callback(self, handle: asyncio.Handle) -> None:
+        callback = handle._callback
+        owner = getattr(callback, "__self__", None)
+        task = owner if isinstance(owner, asyncio.Task) else None
+        if task is self._heartbeat:
+            return _original_handle_run(handle)
+
+        self._callback_seq += 1
+        seq = self._callback_seq
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        self._running = (seq, start)
+        try:
+            return _original_handle_run(handle)
+        finally:
+            self._running = None
+            end = time.perf_counter()
+            duration = end - start
+            cpu = time.thread_time() - cpu_start
+            if task is not None:
+                stats = self._task_stats(task, start)
+                stats.steps += 1
+                stats.busy += duration
+                stats.cpu += cpu
+                if task.done():
+                    stats.finished = end
+            if duration >= self.slow_callback_duration:
+                self._record_slow_callback(seq, handle, task, duration, cpu)
+
+    def _record_slow_callback(self, seq: int, handle: asyncio.Handle, task: Optional[asyncio.Task],
+                              duration: float, cpu: float) -> None:
+        captured = self._blocking_stack
+        frames = captured[1] if captured and captured[0] == seq else []
+        stack = [_frame_label(f) for f in frames]
+        project = [f for f in frames if not _is_library(f.f_code.co_filename)]
+        if project:
+            culprit = _frame_label(project[-1])
+        elif task is not None:
+            culprit = getattr(task.get_coro(), "__qualname__", "?")
+        else:
+            culprit = repr(handle)
+        record = SlowCallback(
+            task=task.get_name() if task is not None else "<loop callback>",
+            callback=repr(handle)[:200],
+            duration=duration,
+            cpu=cpu,
+            stack=stack,
+            culprit=culprit,
+        )
+        self.slow_callbacks.append(record)
+        logger.warning(
+            f"Event loop blocked {duration * 1000:.0f}ms (cpu {cpu * 1000:.0f}ms) "
+            f"by {record.task} at {culprit}"
+        )
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            running = self._running
+            frames = []
+            while frame is not None:
+                if not _is_internal(frame.f_code.co_filename):
+                    frames.append(frame)
+                frame = frame.f_back
+            frames.reverse()
+
+            if running is None or not frames:
+                self.idle_samples += 1  # Waiting in select(), nothing holds the loop
+                continue
+            if time.perf_counter() - running[1] >= self.slow_callback_duration / 2:
+                self._blocking_stack = (running[0], frames)
+
+            task = asyncio.current_task(self._loop)
+            root = task.get_name() if task is not None else "<loop callback>"
+            key = ";".join(part.replace(";", ":") for part in [root] + [_frame_label(f) for f in frames])
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    async def _acquire(self, semaphore: asyncio.Semaphore, caller: Optional[FrameType]) -> Any:
+        label = self._semaphore_names.get(semaphore)
+        if label is None:
+            while caller is not None and _is_internal(caller.f_code.co_filename):
+                caller = caller.f_back
+            label = f"Semaphore at {_frame_label(caller)}" if caller is not None else repr(semaphore)
+        stats = self.semaphores.setdefault(label, SemaphoreStats())
+        stats.acquires += 1
+        if not semaphore.locked():
+            return await _original_semaphore_acquire(semaphore)
+        start = time.perf_counter()
+        try:
+            return await _original_semaphore_acquire(semaphore)
+        finally:
+            waited = time.perf_counter() - start
+            stats.waits += 1
+            stats.wait_time += waited
+            stats.max_wait = max(stats.max_wait, waited)
+
+    # -------------------------------------------------------------------------
+    # Output
+    # -------------------------------------------------------------------------
+
+    def lag_stats(self) -> Dict[str, float]:
+        samples = sorted(self.lag_samples)
+        if not samples:
+            return {"samples": 0, "p50": 0.0, "p95": 0.0, "max": 0.0, "stalls": 0}
+        return {
+            "samples": len(samples),
+            "p50": statistics.median(samples),
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max": samples[-1],
+            "stalls": sum(1 for s in samples if s >= self.slow_callback_duration),
+        }
+
+    def collapsed_stacks(self) -> str:
+        """Samples in collapsed ("folded") format: `task;frame;frame count` per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+    def write_collapsed(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        path.write_text(self.collapsed_stacks(), encoding="utf-8")
+        return path
+
+    def summary_table(self, top: int = 15) -> str:
+        lines = []
+        lag = self.lag_stats()
+        lines.append(f"ASYNC PROFILE ({self.elapsed:.2f}s)")
+        lines.append("=" * 80)
+        lines.append(
+            f"Event loop lag: p50 {lag['p50'] * 1000:.1f}ms  p95 {lag['p95'] * 1000:.1f}ms  "
+            f"max {lag['max'] * 1000:.1f}ms  stalls>={self.slow_callback_duration * 1000:.0f}ms: "
+            f"{lag['stalls']}/{lag['samples']}"
+        )
+
+        lines.append("")
+        lines.append(f"{'Task':<36} {'Wall':>8} {'Busy':>8} {'CPU':>8} {'Steps':>6}")
+        lines.append("-" * 80)
+        for stats in sorted(self.tasks.values(), key=lambda s: -s.busy)[:top]:
+            lines.append(
+                f"{(stats.name + ' ' + stats.coro)[:36]:<36} {stats.wall:>7.2f}s {stats.busy:>7.2f}s "
+                f"{stats.cpu:>7.2f}s {stats.steps:>6}"
+            )
+
+        lines.append("")
+        lines.append(f"Slow callbacks (>= {self.slow_callback_duration * 1000:.0f}ms): {len(self.slow_callbacks)}")
+        lines.append("-" * 80)
+        for record in sorted(self.slow_callbacks, key=lambda r: -r.duration)[:top]:
+            lines.append(
+                f"{record.duration * 1000:>7.0f}ms cpu {record.cpu * 1000:>5.0f}ms  {record.task[:24]:<24} {record.culprit}"
+            )
+
+        lines.append("")
+        lines.append(f"{'Semaphore':<50} {'Acq':>6} {'Waits':>6} {'Wait':>8} {'Max':>8}")
+        lines.append("-" * 80)
+        for label, stats in sorted(self.semaphores.items(), key=lambda kv: -kv[1].wait_time)[:top]:
+            lines.append(
+                f"{label[:50]:<50} {stats.acquires:>6} {stats.waits:>6} "
+                f"{stats.wait_time:>7.2f}s {stats.max_wait:>7.2f}s"
+            )
+        return "\n".join(lines)
+
+
+def _profiled_handle_run(handle: asyncio.Handle) -> None:
+    profiler = _active
+    if profiler is None or handle._loop is not profiler._loop:
+        return _original_handle_run(handle)
+    return profiler._run_callback(handle)
+
+
+def _profiled_semaphore_acquire(semaphore: asyncio.Semaphore):
+    profiler = _active
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if profiler is None or running is not profiler._loop:
+        return _original_semaphore_acquire(semaphore)
+    return profiler._acquire(semaphore, sys._getframe(1))
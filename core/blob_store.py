@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Content-addressed, compressed blob store for raw API payloads.
+
+Full raw content (SearchResultBuilder.build_with_raw, Evidence.raw_content)
+otherwise stays in process memory for a whole research run. With a store
+active, large payloads are written once to disk - one file per SHA-256
+digest, so identical payloads are stored once - and results carry a short
+reference string (raw_content_ref) instead. Evidence.content / full_content
+and EvidenceRecord load the payload on demand (enrichment, export).
+
+Blobs are zstd-compressed when the optional `zstandard` package is
+installed, zlib otherwise; each file is self-describing, so stores can be
+read regardless of which codec wrote them.
+
+The active store lives in a context variable (like core.deadline), so
+integrations building results inside blob_store_scope() offload without
+threading a store through every call.
+
+Usage:
+    from core.blob_store import BlobStore, blob_store_scope, load_blob_text
+
+    store = BlobStore(output_dir / "blobs")
+    with blob_store_scope(store):
+        result = await integration.execute_search(params)   # build_with_raw() offloads
+    ref = result.results[0]["raw_content_ref"]              # "blob:/.../blobs/ab/ab12..."
+    text = load_blob_text(ref)                              # byte-identical payload (LRU-cached)
+
+    refs = await offload_async(store, texts)                # compress + write off the event loop
+    await preload_blob_texts(refs)                          # warm the cache before sync reads
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import logging
+import os
+import tempfile
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+BLOB_REF_PREFIX = "blob:"
+DEFAULT_MIN_OFFLOAD_BYTES = 4096  # Smaller payloads stay inline (a file per snippet costs more than it saves)
+TEXT_CACHE_SIZE = 32  # Decoded payloads kept by load_blob_text() (blobs are immutable, so never stale)
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+_current_store: contextvars.ContextVar[Optional["BlobStore"]] = contextvars.ContextVar(
+    "current_blob_store", default=None
+)
+
+
+def _zstd():
+    """The zstandard module, or None if the optional dependency is missing."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _decompress(blob: bytes) -> bytes:
+    if blob.startswith(_ZSTD_MAGIC):
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError("Blob is zstd-compressed but zstandard is not installed: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    return zlib.decompress(blob)
+
+
+class BlobStore:
+    """One directory of compressed blobs named by the SHA-256 of their content."""
+
+    def __init__(self, root: Union[str, Path], min_offload_bytes: int = DEFAULT_MIN_OFFLOAD_BYTES, level: int = 3):
+        """
+        Args:
+            root: Directory for blobs (created on first write)
+            min_offload_bytes: offload() keeps payloads smaller than this inline
+            level: Compression level (zstd or zlib)
+        """
+        self.root = Path(root).resolve()
+        self.min_offload_bytes = min_offload_bytes
+        self.level = level
+        zstandard = _zstd()
+        self._compressor = zstandard.ZstdCompressor(level=level) if zstandard else None
+        self.codec = "zstd" if zstandard else "zlib"
+        self.stats = {"puts": 0, "writes": 0, "bytes_in": 0, "bytes_stored": 0}
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compressor is not None:
+            return self._compressor.compress(data)
+        return zlib.compress(data, self.level)
+
+    def put(self, data: Union[str, bytes]) -> str:
+        """
+        Store `data` (str is UTF-8 encoded) and return its reference.
+
+        Writing is atomic (temp file + rename); an existing blob with the same
+        digest is reused.
+        """
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._path(digest)
+        self.stats["puts"] += 1
+        self.stats["bytes_in"] += len(raw)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            compressed = self._compress(raw)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(compressed)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            self.stats["writes"] += 1
+            self.stats["bytes_stored"] += len(compressed)
+        return f"{BLOB_REF_PREFIX}{path}"
+
+    def offload(self, text: Optional[str]) -> Optional[str]:
+        """Reference for `text` if it is large enough to store, else None (keep inline)."""
+        if not text or len(text) < self.min_offload_bytes:
+            return None
+        return self.put(text)
+
+    def get(self, ref: str) -> bytes:
+        """Payload bytes for a reference from this (or any) store."""
+        return load_blob(ref)
+
+    def get_stats(self) -> Dict[str, Any]:
+        ratio = self.stats["bytes_in"] / self.stats["bytes_stored"] if self.stats["bytes_stored"] else 0.0
+        return {**self.stats, "codec": self.codec, "compression_ratio": round(ratio, 2)}
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith(BLOB_REF_PREFIX)
+
+
+def load_blob(ref: str) -> bytes:
+    """
+    Load and decompress the payload behind a blob reference.
+
+    Raises:
+        ValueError: If `ref` is not a blob reference
+        FileNotFoundError: If the blob file is gone (e.g. output dir deleted)
+    """
+    if not is_blob_ref(ref):
+        raise ValueError(f"Not a blob reference: {ref!r}")
+    path = Path(ref[len(BLOB_REF_PREFIX):])
+    return _decompress(path.read_bytes())
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def load_blob_text(ref: str) -> str:
+    """load_blob() decoded as UTF-8 (recently loaded payloads are cached)."""
+    return load_blob(ref).decode("utf-8")
+
+
+async def offload_async(store: "BlobStore", texts: Iterable[Optional[str]]) -> List[Optional[str]]:
+    """store.offload() for each text, compressed and written in a worker thread."""
+    texts = list(texts)
+    return await asyncio.to_thread(lambda: [store.offload(text) for text in texts])
+
+
+async def preload_blob_texts(refs: Iterable[Optional[str]]) -> None:
+    """
+    Load blob references into the load_blob_text() cache in a worker thread.
+
+    Call before code that reads full content synchronously (Evidence.content)
+    so the read and decompression happen off the event loop. Loads at most
+    TEXT_CACHE_SIZE references; missing blobs are left for the reader to report.
+    """
+    pending = list(dict.fromkeys(ref for ref in refs if is_blob_ref(ref)))[:TEXT_CACHE_SIZE]
+    if not pending:
+        return
+
+    def load_all() -> None:
+        for ref in pending:
+            try:
+                load_blob_text(ref)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Blob preload failed for {ref}: {e}")
+
+    await asyncio.to_thread(load_all)
+
+
+def current_blob_store() -> Optional[BlobStore]:
+    """The blob store active in this task, or None if payloads stay in memory."""
+    return _current_store.get()
+
+
+@contextmanager
+def blob_store_scope(store: Optional[BlobStore]) -> Iterator[Optional[BlobStore]]:
+    """Make `store` the active blob store for the block (and tasks created in it)."""
+    token = _current_store.set(store)
+    try:
+        yield store
+    finally:
+        _current_store.reset(token)
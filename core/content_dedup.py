@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Content-level duplicate detection for search results and evidence.
+
+The same document routinely arrives from several sources under different
+URLs (tracking parameters, mobile/AMP variants, web.archive.org snapshots)
+or as syndicated copies with a different headline suffix. Deduplicating on
+the raw URL string lets all of them through, and each copy is then filtered,
+summarized and entity-extracted by the LLM separately.
+
+ContentDeduplicator collapses such items in two steps:
+    1. URL key: canonicalize_url() plus unwrapping of archive/AMP-cache
+       wrappers and folding of mobile/AMP host, path and query variants
+    2. SimHash: 64-bit fingerprint of title + leading content; items within
+       max_distance bits of an earlier item are near-duplicates (looked up
+       through a pigeonhole block index, so no pairwise scan)
+
+The first item seen survives. Later duplicates are dropped and their
+source/URL is appended to the survivor's provenance list (dict results:
+result["provenance"]; Evidence: evidence.metadata["provenance"]).
+partition() looks a batch up without registering it, for callers that
+filter first and register only the items they keep.
+
+Usage:
+    from core.content_dedup import ContentDeduplicator
+
+    dedup = ContentDeduplicator()
+    unique = dedup.deduplicate(results)
+    new, known = dedup.partition(batch)   # Filter `new`, then dedup.deduplicate(kept)
+    dedup.summary()
+    # -> {"seen": 40, "unique": 31, "url_duplicates": 6, "content_duplicates": 3, "dedup_ratio": 0.225}
+"""
+
+import hashlib
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from core.url_utils import canonicalize_url
+
+# web.archive.org/web/20240101000000/https://example.com/a (also ...id_/, ...if_/)
+_ARCHIVE_WRAPPER = re.compile(r"^https?://web\.archive\.org/web/\d+[a-z_]*/(.+)$", re.IGNORECASE)
+# example-com.cdn.ampproject.org/c/s/example.com/a ("s/" = https)
+_AMP_CACHE_WRAPPER = re.compile(r"^https?://[^/]+\.cdn\.ampproject\.org/[a-z]/(s/)?(.+)$", re.IGNORECASE)
+# www.google.com/amp/s/example.com/a
+_GOOGLE_AMP_WRAPPER = re.compile(r"^https?://(?:www\.)?google\.[a-z.]+/amp/(s/)?(.+)$", re.IGNORECASE)
+
+MOBILE_HOST_PREFIXES = ("m.", "mobile.", "amp.")
+AMP_QUERY_PARAMS = {"amp", "outputtype", "output", "view"}
+AMP_QUERY_VALUES = {"", "1", "true", "amp"}
+
+# Fields read for the content fingerprint, in order of preference
+CONTENT_FIELDS = ("snippet", "description", "content", "raw_content", "abstract")
+SOURCE_FIELDS = ("source_id", "source", "database")
+FINGERPRINT_CONTENT_CHARS = 500
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# "Headline - Reuters" / "Headline | AP News": site suffixes differ between syndicated copies
+_TITLE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+
+
+def _unwrap(url: str) -> str:
+    """Strip archive.org and AMP-cache wrappers (repeatedly, they can nest)."""
+    for _ in range(3):
+        match = _ARCHIVE_WRAPPER.match(url)
+        if match:
+            inner = match.group(1)
+            url = inner if "://" in inner else f"http://{inner}"
+            continue
+        match = _AMP_CACHE_WRAPPER.match(url) or _GOOGLE_AMP_WRAPPER.match(url)
+        if match:
+            url = ("https://" if match.group(1) else "http://") + match.group(2)
+            continue
+        break
+    return url
+
+
+def dedup_url_key(url: Optional[str]) -> Optional[str]:
+    """
+    Key under which URL variants of the same document collide.
+
+    Builds on canonicalize_url() and additionally unwraps web.archive.org /
+    AMP-cache URLs, drops m./mobile./amp. host prefixes, /amp path segments
+    and amp query flags, and ignores the scheme.
+
+    Args:
+        url: URL (may be None or empty)
+
+    Returns:
+        Dedup key, or None if there is no usable URL
+    """
+    if not url or not url.strip():
+        return None
+    canonical = canonicalize_url(_unwrap(url.strip()))
+    parts = urlsplit(canonical)
+    if not parts.netloc:
+        return canonical
+
+    host = parts.netloc
+    for prefix in MOBILE_HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+
+    segments = [s for s in parts.path.split("/") if s]
+    if segments and segments[0].lower() == "amp":
+        segments = segments[1:]
+    if segments and segments[-1].lower() in ("amp", "amp.html"):
+        segments = segments[:-1]
+    path = "/" + "/".join(segments)
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not (key.lower() in AMP_QUERY_PARAMS and value.lower() in AMP_QUERY_VALUES)
+    ]
+    key = host + path
+    return f"{key}?{urlencode(query)}" if query else key
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def simhash(tokens: Iterable[str], bits: int = 64) -> int:
+    """
+    Charikar SimHash over token counts.
+
+    Args:
+        tokens: Word tokens (repeats add weight)
+        bits: Fingerprint width
+
+    Returns:
+        Fingerprint as an int
+    """
+    weights = [0] * bits
+    counts: Dict[str, int] = {}
+    for token in tokens:
+        counts[token] = counts.get(token, 0) + 1
+    for token, count in counts.items():
+        h = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=bits // 8).digest(), "big")
+        for bit in range(bits):
+            weights[bit] += count if (h >> bit) & 1 else -count
+    return sum(1 << bit for bit in range(bits) if weights[bit] > 0)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _field(item: Any, name: str) -> Any:
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+class ContentDeduplicator:
+    """
+    Incremental URL + SimHash deduplicator over dict results or Evidence objects.
+
+    One instance can be fed several batches (e.g. one per source or per
+    hypothesis); duplicates are detected against everything seen so far.
+    """
+
+    def __init__(self, max_distance: int = 6, min_tokens: int = 8, bits: int = 64):
+        """
+        Initialize the deduplicator.
+
+        Args:
+            max_distance: Largest SimHash Hamming distance treated as a near-duplicate
+            min_tokens: Items with fewer title+content tokens are matched by URL only
+                        (very short texts give unreliable fingerprints)
+            bits: SimHash width
+        """
+        self.max_distance = max_distance
+        self.min_tokens = min_tokens
+        self.bits = bits
+        # Pigeonhole: two fingerprints within max_distance bits agree on at least one of max_distance + 1 blocks
+        block_count = max_distance + 1
+        edges = [round(i * bits / block_count) for i in range(block_count + 1)]
+        self._blocks = [(edges[i], (1 << (edges[i + 1] - edges[i])) - 1) for i in range(block_count)]
+        self._by_url: Dict[str, Any] = {}
+        self._by_text: Dict[str, Any] = {}
+        self._by_block: Dict[Tuple[int, int], List[Tuple[int, Any]]] = {}
+        self.stats = {"seen": 0, "unique": 0, "url_duplicates": 0, "content_duplicates": 0}
+
+    # =========================================================================
+    # Fingerprinting
+    # =========================================================================
+
+    def _text_tokens(self, item: Any) -> List[str]:
+        title = _TITLE_SUFFIX.sub("", str(_field(item, "title") or ""))
+        content = ""
+        for name in CONTENT_FIELDS:
+            value = _field(item, name)
+            if isinstance(value, str) and value.strip():
+                content = value[:FINGERPRINT_CONTENT_CHARS]
+                break
+        return _tokens(f"{title} {content}")
+
+    def fingerprint(self, item: Any) -> Optional[int]:
+        """SimHash of an item's title + leading content, or None if too short."""
+        tokens = self._text_tokens(item)
+        if len(tokens) < self.min_tokens:
+            return None
+        return simhash(tokens, self.bits)
+
+    def _block_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        return [(shift, (fingerprint >> shift) & mask) for shift, mask in self._blocks]
+
+    def _find_near(self, fingerprint: int) -> Optional[Any]:
+        for key in self._block_keys(fingerprint):
+            for other, survivor in self._by_block.get(key, ()):
+                if hamming(fingerprint, other) <= self.max_distance:
+                    return survivor
+        return None
+
+    # =========================================================================
+    # Provenance
+    # =========================================================================
+
+    @staticmethod
+    def _provenance_entry(item: Any) -> Dict[str, Any]:
+        source = next((s for s in (_field(item, f) for f in SOURCE_FIELDS) if isinstance(s, str) and s), None)
+        return {"source": source, "url": _field(item, "url")}
+
+    @staticmethod
+    def provenance(item: Any) -> List[Dict[str, Any]]:
+        """Provenance list of an item (created on first use)."""
+        if isinstance(item, dict):
+            return item.setdefault("provenance", [ContentDeduplicator._provenance_entry(item)])
+        metadata = getattr(item, "metadata", None)
+        if metadata is None:
+            metadata = {}
+            item.metadata = metadata
+        return metadata.setdefault("provenance", [ContentDeduplicator._provenance_entry(item)])
+
+    def _merge_provenance(self, survivor: Any, duplicate: Any) -> None:
+        entries = self.provenance(survivor)
+        if isinstance(duplicate, dict):
+            incoming = duplicate.get("provenance") or [self._provenance_entry(duplicate)]
+        else:
+            incoming = (getattr(duplicate, "metadata", None) or {}).get("provenance") or [self._provenance_entry(duplicate)]
+        for entry in incoming:
+            if entry not in entries:
+                entries.append(entry)
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def _lookup(self, item: Any) -> Tuple[Optional[Any], Optional[str], Optional[str], Optional[str], Optional[int]]:
+        """(survivor, duplicate kind, url key, text key, fingerprint) without registering anything."""
+        url_key = dedup_url_key(_field(item, "url"))
+        survivor = self._by_url.get(url_key) if url_key else None
+        if survivor is not None:
+            return survivor, "url_duplicates", url_key, None, None
+
+        # URL-less items: exact title+content match even when too short to fingerprint
+        text_key = None if url_key else " ".join(self._text_tokens(item))
+        survivor = self._by_text.get(text_key) if text_key else None
+        if survivor is not None:
+            return survivor, "content_duplicates", url_key, text_key, None
+
+        fingerprint = self.fingerprint(item)
+        survivor = self._find_near(fingerprint) if fingerprint is not None else None
+        if survivor is not None:
+            return survivor, "content_duplicates", url_key, text_key, fingerprint
+        return None, None, url_key, text_key, fingerprint
+
+    def find(self, item: Any) -> Optional[Any]:
+        """The registered item this one duplicates, or None. Registers nothing."""
+        return self._lookup(item)[0]
+
+    def check(self, item: Any) -> Optional[Any]:
+        """
+        Register an item, or report the earlier item it duplicates.
+
+        A duplicate is not registered; its provenance is merged into the
+        survivor.
+
+        Returns:
+            The surviving item this one duplicates, or None if it is new
+        """
+        self.stats["seen"] += 1
+        survivor, kind, url_key, text_key, fingerprint = self._lookup(item)
+        if survivor is not None:
+            if survivor is not item:
+                self._merge_provenance(survivor, item)
+            if url_key and kind == "content_duplicates":
+                self._by_url[url_key] = survivor
+            self.stats[kind] += 1
+            return survivor
+
+        if fingerprint is not None:
+            for key in self._block_keys(fingerprint):
+                self._by_block.setdefault(key, []).append((fingerprint, item))
+        if url_key:
+            self._by_url[url_key] = item
+        elif text_key:
+            self._by_text[text_key] = item
+        self.stats["unique"] += 1
+        return None
+
+    def partition(self, items: Iterable[Any]) -> Tuple[List[Any], List[Any]]:
+        """
+        Split a batch into new items and the registered items it duplicates.
+
+        Unlike deduplicate(), new items are not registered: a caller that
+        filters the batch first registers only what it keeps (via
+        deduplicate() or check()), so an item rejected in one context is
+        still considered in the next. Duplicates within the batch collapse
+        into their first occurrence; duplicates of registered items have
+        their provenance merged into the registered survivor.
+
+        Returns:
+            (new items in input order, registered survivors matched by the batch)
+        """
+        batch = ContentDeduplicator(self.max_distance, self.min_tokens, self.bits)
+        new: List[Any] = []
+        known: List[Any] = []
+        for item in items:
+            survivor, kind, url_key, _, _ = self._lookup(item)
+            if survivor is not None:
+                self.stats["seen"] += 1
+                self.stats[kind] += 1
+                if survivor is not item:
+                    self._merge_provenance(survivor, item)
+                if not any(k is survivor for k in known):
+                    known.append(survivor)
+            elif batch.check(item) is None:
+                new.append(item)
+        # Within-batch duplicates count here; the new items count when registered
+        self.stats["seen"] += batch.duplicates
+        self.stats["url_duplicates"] += batch.stats["url_duplicates"]
+        self.stats["content_duplicates"] += batch.stats["content_duplicates"]
+        return new, known
+
+    def deduplicate(
+        self,
+        items: Iterable[Any],
+        on_duplicate: Optional[Callable[[Any, Any], None]] = None
+    ) -> List[Any]:
+        """
+        Items that are not duplicates of anything seen so far, in input order.
+
+        Args:
+            items: Dict results or Evidence objects
+            on_duplicate: Optional callback(survivor, duplicate) for extra merging
+                          (e.g. hypothesis attribution)
+
+        Returns:
+            Surviving items
+        """
+        unique = []
+        for item in items:
+            survivor = self.check(item)
+            if survivor is None:
+                unique.append(item)
+            elif on_duplicate is not None and survivor is not item:
+                on_duplicate(survivor, item)
+        return unique
+
+    @property
+    def duplicates(self) -> int:
+        return self.stats["url_duplicates"] + self.stats["content_duplicates"]
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Fraction of seen items collapsed into an earlier item."""
+        return self.duplicates / self.stats["seen"] if self.stats["seen"] else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Stats plus dedup_ratio, for run metrics."""
+        return {**self.stats, "dedup_ratio": round(self.dedup_ratio, 3)}
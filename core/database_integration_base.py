@@ -7,7 +7,7 @@ database integrations must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable, TypeVar
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Tuple, TypeVar
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
@@ -123,6 +123,7 @@ class SearchResult(BaseModel):
         - date: Publication/creation date (ISO format string or None)
         - metadata: Dict of source-specific additional data
         - raw_content: Full content (never truncated) - for three-tier model
+        - raw_content_ref: Reference to full content offloaded to disk (core.blob_store)
     """
     title: str = Field(..., description="Title of the result", min_length=1)
     url: Optional[str] = Field(default=None, description="URL link to full result (may be None if unavailable)")
@@ -131,6 +132,8 @@ class SearchResult(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Source-specific metadata")
     # Three-tier model support: full content never truncated
     raw_content: Optional[str] = Field(default=None, description="Full content (never truncated) - for three-tier model")
+    # Set instead of raw_content when the payload was offloaded to a core.blob_store.BlobStore
+    raw_content_ref: Optional[str] = Field(default=None, description="Blob reference to offloaded full content")
 
     @field_validator('title')
     @classmethod
@@ -217,8 +220,9 @@ class Evidence(SearchResult):
         If raw_content is available (three-tier model), prefer it.
         Otherwise fall back to snippet (legacy model).
         """
-        if self.raw_content:
-            return self.raw_content
+        raw = self.load_raw_content()
+        if raw:
+            return raw
         return self.snippet
 
     @property
@@ -228,7 +232,26 @@ class Evidence(SearchResult):
 
         Use this when you need the complete text, not truncated snippet.
         """
-        return self.raw_content or self.snippet
+        return self.load_raw_content() or self.snippet
+
+    def preview(self, max_chars: int) -> str:
+        """
+        content[:max_chars] for prompts and logs.
+
+        When raw_content was offloaded, the inline snippet stands in rather
+        than loading the payload from disk; use content / full_content when
+        the full text is needed.
+        """
+        if self.raw_content is None and self.raw_content_ref and self.snippet:
+            return self.snippet[:max_chars]
+        return self.content[:max_chars]
+
+    def load_raw_content(self) -> Optional[str]:
+        """raw_content, loading it from the blob store if it was offloaded."""
+        if self.raw_content is None and self.raw_content_ref:
+            from core.blob_store import load_blob_text
+            return load_blob_text(self.raw_content_ref)
+        return self.raw_content
 
     @property
     def source(self) -> str:
@@ -386,10 +409,12 @@ class Evidence(SearchResult):
 
         # Clean up None values from new fields unless include_raw
         if not include_raw:
-            for key in ["raw_result_id", "processed_id", "raw_content",
+            for key in ["raw_result_id", "processed_id", "raw_content", "raw_content_ref",
                        "extracted_facts", "extracted_entities", "extracted_dates"]:
                 if key in data and data[key] is None:
                     del data[key]
+        elif data["raw_content"] is None and self.raw_content_ref:
+            data["raw_content"] = self.load_raw_content()  # Storage export: materialize offloaded content
 
         return data
 
@@ -469,8 +494,12 @@ class QueryResult:
                         f"Required fields: title (str), url (str), snippet (str, optional)"
                     )
             self.results = validated_results
+            # Results are now SearchResult-shaped dicts: consumers may build
+            # core.evidence_record.EvidenceRecord from them without re-validating
+            self.validated = True
         else:
             self.results = results
+            self.validated = False
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
@@ -486,6 +515,19 @@ class QueryResult:
         }
 
 
+class PageFetchError(Exception):
+    """
+    Raised by DatabaseIntegration.iter_results() when a page request fails.
+
+    The failed QueryResult is kept on .result so callers can inspect the
+    error/http_code without re-running the request.
+    """
+
+    def __init__(self, result: QueryResult):
+        super().__init__(f"{result.source} page fetch failed: {result.error}")
+        self.result = result
+
+
 class DatabaseIntegration(ABC):
     """
     Abstract base class for all database integrations.
@@ -498,8 +540,24 @@ class DatabaseIntegration(ABC):
 
     This architecture allows adding new databases by simply creating a new
     subclass and registering it - no changes to existing code needed.
+
+    Paginated sources can additionally set PAGINATION_PARAM and override
+    next_page_cursor() to support lazy iteration via iter_results().
+
+    Sources can set QUERY_PARAMS_SCHEMA so a planner that already knows the
+    source (e.g. the recursive agent's goal assessment) can fill in
+    execute_search() params itself and skip the generate_query() LLM call.
     """
 
+    # Key in query_params that execute_search() reads the page/offset/cursor
+    # from. None means the source has no native pagination.
+    PAGINATION_PARAM: Optional[str] = None
+
+    # JSON schema of the params execute_search() accepts (the same object
+    # generate_query() asks its LLM for, minus relevance/reasoning fields).
+    # None means params can only come from generate_query().
+    QUERY_PARAMS_SCHEMA: Optional[Dict] = None
+
     @property
     @abstractmethod
     def metadata(self) -> DatabaseMetadata:
@@ -828,3 +886,154 @@ Return your response as JSON following this schema:
         # Should never reach here, but just in case
         if last_exception:
             raise last_exception
+
+    # =========================================================================
+    # Pagination
+    # =========================================================================
+
+    @property
+    def supports_pagination(self) -> bool:
+        """True if this integration can walk result pages via iter_results()."""
+        return self.PAGINATION_PARAM is not None
+
+    def next_page_cursor(self, result: QueryResult, query_params: Dict) -> Optional[Any]:
+        """
+        Return the cursor for the page after `result`, or None if it was the last.
+
+        Override in paginated integrations. The returned value is written to
+        query_params[PAGINATION_PARAM] for the next execute_search() call.
+
+        Args:
+            result: Successful QueryResult for the current page
+            query_params: Parameters (including the current cursor) that produced it
+
+        Returns:
+            Next cursor (page number, offset, or opaque token), or None
+        """
+        return None
+
+    async def fetch_page(
+        self,
+        query_params: Dict,
+        cursor: Optional[Any] = None,
+        api_key: Optional[str] = None,
+        page_size: int = 25
+    ) -> Tuple[QueryResult, Optional[Any]]:
+        """
+        Fetch a single page of results.
+
+        Args:
+            query_params: Parameters from generate_query()
+            cursor: Page cursor (None = source's first page)
+            api_key: API key if required by this database
+            page_size: Results per page
+
+        Returns:
+            Tuple of (QueryResult, next cursor or None if no further pages)
+
+        Raises:
+            ValueError: If a cursor is given but the source has no pagination
+        """
+        params = dict(query_params)
+        if cursor is not None:
+            if not self.supports_pagination:
+                raise ValueError(f"{self.metadata.name} does not support pagination")
+            params[self.PAGINATION_PARAM] = cursor
+
+        result = await self.execute_search(params, api_key, page_size)
+        if not result.success or not result.results:
+            return result, None
+        return result, self.next_page_cursor(result, params)
+
+    async def iter_results(
+        self,
+        query_params: Dict,
+        api_key: Optional[str] = None,
+        page_size: int = 25,
+        max_results: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        start_cursor: Optional[Any] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Lazily yield normalized results, walking the source's native pagination.
+
+        The next page is requested as soon as the current one arrives, so the
+        HTTP round-trip overlaps with the consumer's processing of the current
+        page. Sources without pagination yield a single page.
+
+        Args:
+            query_params: Parameters from generate_query()
+            api_key: API key if required by this database
+            page_size: Results per page request
+            max_results: Stop after yielding this many results (None = no cap)
+            max_pages: Stop after this many page requests (None = no cap)
+            start_cursor: Resume from this cursor instead of the first page
+
+        Yields:
+            Result dicts in the same shape as QueryResult.results
+
+        Raises:
+            PageFetchError: If a page request fails
+
+        Example:
+            async for item in integration.iter_results(params, max_results=100):
+                process(item)
+        """
+        yielded = 0
+        pages = 1
+        pending = asyncio.ensure_future(self.fetch_page(query_params, start_cursor, api_key, page_size))
+        try:
+            while pending is not None:
+                result, next_cursor = await pending
+                pending = None
+                if not result.success:
+                    raise PageFetchError(result)
+
+                if (next_cursor is not None
+                        and (max_pages is None or pages < max_pages)
+                        and (max_results is None or yielded + len(result.results) < max_results)):
+                    pending = asyncio.ensure_future(self.fetch_page(query_params, next_cursor, api_key, page_size))
+                    pages += 1
+
+                for item in result.results:
+                    yield item
+                    yielded += 1
+                    if max_results is not None and yielded >= max_results:
+                        return
+        finally:
+            if pending is not None:
+                pending.cancel()
+                try:
+                    await pending
+                except (asyncio.CancelledError, Exception):
+                    pass
+
+    # =========================================================================
+    # Planner-supplied query params
+    # =========================================================================
+
+    def validate_query_params(self, query_params: Any) -> Optional[Dict]:
+        """
+        Check params produced outside generate_query() against QUERY_PARAMS_SCHEMA.
+
+        Args:
+            query_params: Candidate execute_search() params
+
+        Returns:
+            A copy restricted to the schema's properties, or None if the source
+            declares no schema or the params do not validate.
+        """
+        schema = self.QUERY_PARAMS_SCHEMA
+        if schema is None or not isinstance(query_params, dict):
+            return None
+
+        import jsonschema
+
+        properties = schema.get("properties", {})
+        params = {key: value for key, value in query_params.items() if key in properties}
+        try:
+            jsonschema.validate(params, schema)
+        except jsonschema.ValidationError as e:
+            logger.debug(f"{self.metadata.name}: planner query params rejected: {e.message}")
+            return None
+        return params
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Run-wide deadlines with cooperative cancellation.
+
+A Deadline is an absolute point on the monotonic clock. The active deadline
+lives in a context variable, so every coroutine and task started inside a
+deadline_scope() sees it without threading it through call signatures:
+llm_utils.acompletion() and core.http_client clamp their own timeouts to the
+time remaining, and with_deadline() bounds any other awaitable (integration
+calls, Playwright scrapes) the same way.
+
+Usage:
+    from core.deadline import Deadline, deadline_scope, with_deadline, clamp_timeout
+
+    deadline = Deadline.after(300)
+    with deadline_scope(deadline.reserve(30)):   # last 30s kept for synthesis
+        await research()                          # every call gets min(own timeout, remaining)
+        result = await with_deadline(integration.execute_search(params))
+    with deadline_scope(deadline):
+        await synthesize()
+
+    clamp_timeout(180)  # -> 180, or the seconds left if fewer; raises once expired
+"""
+
+import asyncio
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_current_deadline: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "current_deadline", default=None
+)
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """Raised when work is started or still running after the run deadline."""
+
+
+class Deadline:
+    """Absolute expiry time (time.monotonic) shared by a whole research run."""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Deadline `seconds` from now."""
+        return cls(time.monotonic() + seconds)
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """Earlier deadline that leaves `seconds` of this one unused (e.g. for synthesis)."""
+        return Deadline(self.expires_at - max(0.0, seconds))
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def clamp(self, timeout: Optional[float]) -> float:
+        """
+        min(timeout, remaining), for passing to a call that has its own timeout.
+
+        Raises:
+            DeadlineExceeded: If the deadline has already passed
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded("Run deadline exceeded")
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.1f}s)"
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline active in this task, or None if unbounded."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Make `deadline` the active deadline for the block (and tasks created in it)."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def clamp_timeout(timeout: Optional[float]) -> Optional[float]:
+    """
+    Clamp a per-call timeout to the active deadline (unchanged if there is none).
+
+    Raises:
+        DeadlineExceeded: If the active deadline has already passed
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return timeout
+    return deadline.clamp(timeout)
+
+
+async def with_deadline(awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """
+    Await `awaitable`, cancelling it at min(timeout, active deadline).
+
+    Raises:
+        DeadlineExceeded: If the deadline passes first (or already has)
+        asyncio.TimeoutError: If only the call's own timeout elapsed
+    """
+    try:
+        bounded = clamp_timeout(timeout)
+    except DeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()  # never started - avoid "coroutine was never awaited"
+        raise
+    if bounded is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, bounded)
+    except asyncio.TimeoutError:
+        deadline = _current_deadline.get()
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceeded("Run deadline exceeded") from None
+        raise
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+EvidenceRecord - compact, validation-free evidence for internal hot paths.
+
+Evidence (core.database_integration_base) is a Pydantic model: every
+construction re-runs field validation, and QueryResult has usually validated
+the same dict once already. At tens of thousands of results per run that
+validation and dict conversion dominates the profile.
+
+EvidenceRecord is a slotted dataclass with the same attributes and read
+properties as Evidence (content, full_content, source, to_dict(), ...), so
+the research agent, dedup, synthesis and report code use either
+interchangeably. It is only built from TRUSTED dicts - results QueryResult
+already validated, or SearchResultBuilder output - and converts to a full
+Evidence model at API/persistence boundaries via to_evidence().
+
+Usage:
+    from core.evidence_record import EvidenceRecord
+
+    record = EvidenceRecord.from_trusted(item, source_id="sam")   # no validation
+    record.snippet = summary                                        # mutable like Evidence
+    payload = record.to_dict()                                      # same shape as Evidence.to_dict()
+    evidence = record.to_evidence()                                 # validated Pydantic model
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from core.database_integration_base import Evidence
+
+logger = logging.getLogger(__name__)
+
+# Evidence fields dropped from to_dict() when None unless include_raw=True
+_RAW_FIELDS = ("raw_result_id", "processed_id", "raw_content", "raw_content_ref",
+               "extracted_facts", "extracted_entities", "extracted_dates")
+
+
+@dataclass(slots=True)
+class EvidenceRecord:
+    """
+    Slotted stand-in for Evidence with no per-instance validation.
+
+    Field names, defaults and properties mirror Evidence exactly; only build
+    it from data that has already been validated (see module docstring).
+    """
+    title: str
+    source_id: str
+    url: Optional[str] = None
+    snippet: str = ""
+    date: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    raw_content: Optional[str] = None
+    raw_content_ref: Optional[str] = None  # Offloaded raw_content (core.blob_store)
+    relevance_score: Optional[float] = None
+    raw_result_id: Optional[str] = None
+    processed_id: Optional[str] = None
+    extracted_facts: Optional[List[str]] = None
+    extracted_entities: Optional[List[str]] = None
+    extracted_dates: Optional[List[str]] = None
+
+    @classmethod
+    def from_trusted(
+        cls,
+        data: Dict[str, Any],
+        source_id: str,
+        relevance_score: Optional[float] = None
+    ) -> "EvidenceRecord":
+        """
+        Build from an already-validated result dict (QueryResult/SearchResultBuilder).
+
+        Unknown keys are ignored, as Evidence.from_dict() would strip them.
+        """
+        return cls(
+            title=data["title"],
+            source_id=source_id,
+            url=data.get("url"),
+            snippet=data.get("snippet") or "",
+            date=data.get("date"),
+            metadata=data.get("metadata") or {},
+            raw_content=data.get("raw_content"),
+            raw_content_ref=data.get("raw_content_ref"),
+            relevance_score=relevance_score,
+        )
+
+    @classmethod
+    def from_evidence(cls, evidence: "Evidence") -> "EvidenceRecord":
+        """Compact copy of a Pydantic Evidence (already validated)."""
+        return cls(
+            title=evidence.title,
+            source_id=evidence.source_id,
+            url=evidence.url,
+            snippet=evidence.snippet,
+            date=evidence.date,
+            metadata=evidence.metadata if evidence.metadata is not None else {},
+            raw_content=evidence.raw_content,
+            raw_content_ref=evidence.raw_content_ref,
+            relevance_score=evidence.relevance_score,
+            raw_result_id=evidence.raw_result_id,
+            processed_id=evidence.processed_id,
+            extracted_facts=evidence.extracted_facts,
+            extracted_entities=evidence.extracted_entities,
+            extracted_dates=evidence.extracted_dates,
+        )
+
+    def to_evidence(self) -> "Evidence":
+        """
+        Full Pydantic Evidence for API/persistence boundaries.
+
+        Raises:
+            pydantic.ValidationError: If the record holds data Evidence rejects
+        """
+        from core.database_integration_base import Evidence
+        return Evidence.model_validate(self.to_dict(include_raw=True))
+
+    # === Evidence-compatible read properties ===
+
+    @property
+    def content(self) -> str:
+        """Full content if available, else snippet (same as Evidence.content)."""
+        raw = self.load_raw_content()
+        if raw:
+            return raw
+        return self.snippet
+
+    @property
+    def full_content(self) -> str:
+        return self.load_raw_content() or self.snippet
+
+    def preview(self, max_chars: int) -> str:
+        """
+        content[:max_chars] for prompts and logs.
+
+        When raw_content was offloaded, the inline snippet stands in rather
+        than loading the payload from disk; use content / full_content when
+        the full text is needed.
+        """
+        if self.raw_content is None and self.raw_content_ref and self.snippet:
+            return self.snippet[:max_chars]
+        return self.content[:max_chars]
+
+    def load_raw_content(self) -> Optional[str]:
+        """raw_content, loading it from the blob store if it was offloaded."""
+        if self.raw_content is None and self.raw_content_ref:
+            from core.blob_store import load_blob_text
+            return load_blob_text(self.raw_content_ref)
+        return self.raw_content
+
+    @property
+    def source(self) -> str:
+        return self.source_id
+
+    @property
+    def llm_context(self) -> str:
+        return self.snippet
+
+    @property
+    def has_raw_data(self) -> bool:
+        return self.raw_result_id is not None
+
+    @property
+    def has_processed_data(self) -> bool:
+        return self.processed_id is not None or bool(self.extracted_facts)
+
+    # === Serialization (same shape as Evidence.to_dict) ===
+
+    def to_dict(self, max_content_length: Optional[int] = None, include_raw: bool = False) -> Dict[str, Any]:
+        """Convert to dict; identical output to Evidence.to_dict() for the same data."""
+        data = {
+            "title": self.title,
+            "url": self.url,
+            "snippet": self.snippet,
+            "date": self.date,
+            "metadata": dict(self.metadata),
+            "raw_content": self.raw_content,
+            "raw_content_ref": self.raw_content_ref,
+            "source_id": self.source_id,
+            "relevance_score": self.relevance_score,
+            "raw_result_id": self.raw_result_id,
+            "processed_id": self.processed_id,
+            "extracted_facts": self.extracted_facts,
+            "extracted_entities": self.extracted_entities,
+            "extracted_dates": self.extracted_dates,
+            "content": self.content,
+            "source": self.source_id,
+        }
+
+        if max_content_length and len(data["snippet"]) > max_content_length:
+            data["snippet"] = data["snippet"][:max_content_length]
+            data["content"] = data["snippet"]
+
+        if not include_raw:
+            for key in _RAW_FIELDS:
+                if data[key] is None:
+                    del data[key]
+        elif data["raw_content"] is None and self.raw_content_ref:
+            data["raw_content"] = self.load_raw_content()
+
+        return data
+
+    def to_full_dict(self) -> Dict[str, Any]:
+        """Convert to dict with ALL data, no truncation."""
+        return self.to_dict(include_raw=True)
@@ -4,10 +4,13 @@ Shared HTTP client utilities for integrations.
 
 Provides async-compatible HTTP request functions with:
 - Automatic async wrapping of synchronous requests
-- Configurable timeouts and retries
+- Configurable timeouts and retries, clamped to the active run deadline
+  (core.deadline) so no request or retry outlives the research budget
 - Standard error handling and logging
 - User-Agent management
 - Response validation
+- Shared aiohttp session (connection pool) for native async clients
+- Request hedging for idempotent GETs to slow-tailed sources (databases.<id>.hedge)
 
 Usage:
     from core.http_client import http_get, http_post, HttpClientError
@@ -28,17 +31,37 @@ Usage:
         max_retries=3,
         retry_delay=1.0
     )
+
+    # Native async clients reuse one pooled session per event loop
+    session = await get_shared_session()
+    async with session.get("https://api.example.com/data") as resp:
+        data = await resp.json()
+
+    # Hedged GET: a backup request after the source's p95 latency, first answer wins
+    data = await http_get("https://api.sam.gov/...", hedge_source="sam", hedge_rate_limit_name="SAM.gov")
+    response = await hedged_call("sam", lambda: requests.get(url, params=params, timeout=60),
+                                 rate_limit_name="SAM.gov")
+    hedge_tracker.stats("sam")  # hedge_rate, win_rate, p50/p95/p99_ms
 """
 
 import asyncio
 import logging
-from typing import Dict, Optional, Any, Union
-from dataclasses import dataclass
+import math
+import time
+import weakref
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Any, TypeVar, Union
+from dataclasses import dataclass, field
 from functools import partial
 
+import aiohttp
 import requests
 from requests.exceptions import RequestException, Timeout, HTTPError
 
+from config_loader import config
+from core.deadline import DeadlineExceeded, clamp_timeout, current_deadline
+from core.rate_limiter import rate_limiter
+
 logger = logging.getLogger(__name__)
 
 # Default configuration
@@ -46,6 +69,22 @@ DEFAULT_TIMEOUT = 30  # seconds
 DEFAULT_USER_AGENT = "SIGINT_Platform/1.0"
 DEFAULT_MAX_RETRIES = 0
 DEFAULT_RETRY_DELAY = 1.0  # seconds
+SHARED_POOL_LIMIT = 100  # Max open connections in the shared session
+SHARED_POOL_LIMIT_PER_HOST = 10  # Max open connections per host
+
+# Request hedging
+HEDGE_WINDOW = 200  # Recent latencies kept per source
+HEDGE_MIN_SAMPLES = 20  # Observations before a source's p95 is trusted
+HEDGE_PERCENTILE = 0.95  # Backup request goes out after this latency percentile
+HEDGE_MAX_FRACTION = 0.1  # At most this share of a source's requests get a backup
+
+T = TypeVar("T")
+
+# One aiohttp session per event loop (sessions cannot cross loops, and the
+# Streamlit apps create a fresh loop per asyncio.run call)
+_shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 @dataclass
@@ -77,6 +116,236 @@ class HttpClientError(Exception):
         self.message = message
 
 
+async def get_shared_session() -> aiohttp.ClientSession:
+    """
+    Return the pooled aiohttp session for the running event loop.
+
+    Native async clients (Reddit, Twitter, PDF downloads) use this instead of
+    opening a ClientSession per request, so TCP/TLS connections are reused
+    across calls. Callers must NOT close the returned session; use
+    close_shared_session() at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=SHARED_POOL_LIMIT,
+            limit_per_host=SHARED_POOL_LIMIT_PER_HOST
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": DEFAULT_USER_AGENT}
+        )
+        _shared_sessions[loop] = session
+    return session
+
+
+async def close_shared_session() -> None:
+    """Close the pooled session for the running event loop (if any)."""
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.pop(loop, None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+def _percentile(samples, fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty sample."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+@dataclass
+class _SourceHedgeState:
+    """Latency window and hedge counters for one source."""
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=HEDGE_WINDOW))
+    observed: Deque[float] = field(default_factory=lambda: deque(maxlen=HEDGE_WINDOW))
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+
+
+class HedgeTracker:
+    """
+    Per-source latency percentiles, hedge budget and hedge/win accounting.
+
+    Each request attempt (primary or backup) feeds `latencies`, whose p95 is
+    the hedge delay; `observed` holds the latency callers actually saw, for
+    comparing p99 with and without hedging.
+    """
+
+    def __init__(
+        self,
+        percentile: float = HEDGE_PERCENTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        max_hedge_fraction: float = HEDGE_MAX_FRACTION
+    ):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_fraction = max_hedge_fraction
+        self._sources: Dict[str, _SourceHedgeState] = {}
+
+    def _state(self, source: str) -> _SourceHedgeState:
+        if source not in self._sources:
+            self._sources[source] = _SourceHedgeState()
+        return self._sources[source]
+
+    def hedge_delay(self, source: str) -> Optional[float]:
+        """Seconds to wait before a backup request, or None until enough samples."""
+        state = self._state(source)
+        if len(state.latencies) < self.min_samples:
+            return None
+        return _percentile(state.latencies, self.percentile)
+
+    def try_spend(self, source: str) -> bool:
+        """Take one hedge from the source's budget (max_hedge_fraction of its requests)."""
+        state = self._state(source)
+        if state.hedged + 1 > self.max_hedge_fraction * state.requests:
+            return False
+        state.hedged += 1
+        return True
+
+    def record_attempt(self, source: str, latency: float) -> None:
+        """Latency of one request attempt (primary or backup)."""
+        self._state(source).latencies.append(latency)
+
+    def record_request(self, source: str, latency: float, hedge_won: bool = False) -> None:
+        """Latency the caller saw for one logical request."""
+        state = self._state(source)
+        state.requests += 1
+        state.observed.append(latency)
+        if hedge_won:
+            state.hedge_wins += 1
+
+    def stats(self, source: str) -> Dict[str, Any]:
+        """Hedge rate, win rate and observed latency percentiles for a source."""
+        state = self._state(source)
+        observed = list(state.observed)
+        return {
+            "requests": state.requests,
+            "hedged": state.hedged,
+            "hedge_wins": state.hedge_wins,
+            "hedge_rate": state.hedged / state.requests if state.requests else 0.0,
+            "win_rate": state.hedge_wins / state.hedged if state.hedged else 0.0,
+            "p50_ms": _percentile(observed, 0.50) * 1000 if observed else None,
+            "p95_ms": _percentile(observed, 0.95) * 1000 if observed else None,
+            "p99_ms": _percentile(observed, 0.99) * 1000 if observed else None,
+        }
+
+    def reset(self, source: Optional[str] = None) -> None:
+        """Forget one source's (or every source's) history."""
+        if source is None:
+            self._sources.clear()
+        else:
+            self._sources.pop(source, None)
+
+
+# Global tracker shared by all hedged calls (like core.rate_limiter.rate_limiter)
+hedge_tracker = HedgeTracker()
+
+
+def hedging_enabled(source: str) -> bool:
+    """True if config enables hedging for this database (databases.<id>.hedge)."""
+    return bool(config.get_database_config(source).get("hedge", False))
+
+
+def _usable(result: Any) -> bool:
+    """A response worth returning: not a transport failure, 429 or 5xx."""
+    status = getattr(result, "status_code", None)
+    return status is None or (0 < status < 500 and status != 429)
+
+
+async def hedged_call(
+    source: str,
+    request_fn: Callable[[], T],
+    tracker: Optional[HedgeTracker] = None,
+    enabled: Optional[bool] = None,
+    rate_limit_name: Optional[str] = None
+) -> T:
+    """
+    Run a blocking, IDEMPOTENT request in the executor, hedged after the source's p95.
+
+    If the first attempt has not answered within the source's observed p95
+    latency, a backup attempt is started and whichever returns a usable
+    response first is returned. Backups are capped at HEDGE_MAX_FRACTION of the
+    source's requests, are skipped while core.rate_limiter has the source
+    blocked (429s seen here are reported to it) and are spaced by the source's
+    rate_limit_per_second, if configured. The losing attempt runs to its own timeout in its thread; its result is
+    discarded.
+
+    Args:
+        source: Database id (config and tracker key)
+        request_fn: Zero-argument blocking call, e.g. lambda: requests.get(...)
+        tracker: HedgeTracker (default: module-wide hedge_tracker)
+        enabled: Force hedging on/off (default: databases.<source>.hedge)
+        rate_limit_name: Name core.rate_limiter knows the source by - its display
+                         name, as in rate_limiting.circuit_breaker_sources
+                         (e.g. "SAM.gov"; default: source)
+
+    Returns:
+        The winning attempt's result (a non-usable one only if both were)
+
+    Raises:
+        Whatever request_fn raised, if every attempt raised
+    """
+    tracker = tracker or hedge_tracker
+    limiter_key = rate_limit_name or source
+    loop = asyncio.get_running_loop()
+    start = time.monotonic()
+
+    def start_attempt() -> asyncio.Future:
+        attempt_start = time.monotonic()
+        future = loop.run_in_executor(None, request_fn)
+
+        def finished(done: asyncio.Future) -> None:
+            tracker.record_attempt(source, time.monotonic() - attempt_start)
+            if not done.cancelled() and done.exception() is None and getattr(done.result(), "status_code", None) == 429:
+                rate_limiter.record_rate_limit(limiter_key)
+
+        future.add_done_callback(finished)
+        return future
+
+    primary = start_attempt()
+    delay = tracker.hedge_delay(source) if (hedging_enabled(source) if enabled is None else enabled) else None
+    if delay is not None:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if not done and rate_limiter.is_available(limiter_key) and tracker.try_spend(source):
+            rps = config.get_database_config(source).get("rate_limit_per_second")
+            await rate_limiter.wait_if_needed(limiter_key, rps)
+            backup = start_attempt()
+            logger.debug(f"Hedging {source} request after {delay * 1000:.0f}ms")
+
+            pending = {primary, backup}
+            winner = None
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None and _usable(future.result()):
+                        winner = future
+                        break
+            if winner is None:
+                # Neither attempt was usable: report the primary's outcome
+                winner = primary
+            tracker.record_request(source, time.monotonic() - start, hedge_won=winner is backup)
+            return winner.result()
+
+    try:
+        return await primary
+    finally:
+        tracker.record_request(source, time.monotonic() - start)
+
+
+def _deadline_exceeded_response(url: str) -> HttpResponse:
+    """Failure returned instead of starting a request after the run deadline."""
+    logger.info(f"HTTP request skipped, run deadline exceeded: {url}")
+    return HttpResponse(success=False, status_code=0, error="Run deadline exceeded")
+
+
+def _retry_fits_deadline(delay: float) -> bool:
+    """True if sleeping `delay` seconds still leaves time before the run deadline."""
+    deadline = current_deadline()
+    return deadline is None or deadline.remaining() > delay
+
+
 def _build_headers(
     headers: Optional[Dict[str, str]] = None,
     user_agent: Optional[str] = None,
@@ -225,19 +494,22 @@ async def http_get(
     parse_json: bool = True,
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_delay: float = DEFAULT_RETRY_DELAY,
-    retry_on_status: Optional[list] = None
+    retry_on_status: Optional[list] = None,
+    hedge_source: Optional[str] = None,
+    hedge_rate_limit_name: Optional[str] = None
 ) -> HttpResponse:
     """
     Async-compatible HTTP GET request.
 
     Wraps synchronous requests in an executor for async compatibility.
     Includes automatic retry logic for transient failures.
+    With hedge_source set, each attempt is a hedged_call() for that database.
 
     Args:
         url: Request URL
         params: Query parameters
         headers: Additional headers (merged with defaults)
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (clamped to the active run deadline)
         user_agent: Custom User-Agent header
         api_key: API key to include in headers
         api_key_header: Header name for API key (default: Authorization)
@@ -245,6 +517,10 @@ async def http_get(
         max_retries: Number of retries on failure (default: 0)
         retry_delay: Seconds between retries (default: 1.0)
         retry_on_status: HTTP status codes to retry on (default: [429, 500, 502, 503, 504])
+        hedge_source: Database id whose latency history drives hedging (GET is
+                      idempotent; hedging still requires databases.<id>.hedge)
+        hedge_rate_limit_name: The source's display name for core.rate_limiter
+                               (see hedged_call's rate_limit_name)
 
     Returns:
         HttpResponse with success status, data, and metadata
@@ -268,10 +544,16 @@ async def http_get(
     attempt = 0
 
     while True:
-        response = await loop.run_in_executor(
-            None,
-            partial(_sync_get, url, params, full_headers, timeout, parse_json)
-        )
+        try:
+            attempt_timeout = clamp_timeout(timeout)
+        except DeadlineExceeded:
+            return _deadline_exceeded_response(url)
+
+        request_fn = partial(_sync_get, url, params, full_headers, attempt_timeout, parse_json)
+        if hedge_source:
+            response = await hedged_call(hedge_source, request_fn, rate_limit_name=hedge_rate_limit_name)
+        else:
+            response = await loop.run_in_executor(None, request_fn)
 
         # Success or non-retryable error
         if response.success or response.status_code not in retry_on_status:
@@ -279,7 +561,7 @@ async def http_get(
 
         # Check if we should retry
         attempt += 1
-        if attempt > max_retries:
+        if attempt > max_retries or not _retry_fits_deadline(retry_delay * attempt):
             return response
 
         # Log retry
@@ -330,16 +612,21 @@ async def http_post(
     attempt = 0
 
     while True:
+        try:
+            attempt_timeout = clamp_timeout(timeout)
+        except DeadlineExceeded:
+            return _deadline_exceeded_response(url)
+
         response = await loop.run_in_executor(
             None,
-            partial(_sync_post, url, data, json_data, full_headers, timeout, parse_json)
+            partial(_sync_post, url, data, json_data, full_headers, attempt_timeout, parse_json)
         )
 
         if response.success or response.status_code not in retry_on_status:
             return response
 
         attempt += 1
-        if attempt > max_retries:
+        if attempt > max_retries or not _retry_fits_deadline(retry_delay * attempt):
             return response
 
         logger.info(f"HTTP POST retry {attempt}/{max_retries}: {url} (status {response.status_code})")
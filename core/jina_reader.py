@@ -14,6 +14,18 @@ Usage:
     # Multiple pages (with rate limiting)
     contents = await fetch_multiple_pages(urls, max_concurrent=5)
 
+Fetch pipeline:
+    - Page cache keyed by canonical URL: an in-memory layer for the current
+      run over a disk layer (data/jina_cache) shared across runs. Entries
+      younger than CACHE_FRESH_SECONDS are served directly; older ones are
+      revalidated with If-None-Match / If-Modified-Since when the response
+      carried an ETag / Last-Modified, and served stale if the refetch fails.
+    - In-flight coalescing: concurrent callers asking for the same URL
+      await a single request.
+    - AIMD concurrency (core.rate_limiter.AdaptiveConcurrencyLimiter) shared
+      by all callers: grows while responses are healthy, halves on 429s or
+      slow responses, and pauses for Retry-After.
+
 Rate Limits (Jina Reader):
     - Without API key: 20 requests/minute
     - With free API key: 200 requests/minute
@@ -24,15 +36,27 @@ API Key:
 """
 
 import asyncio
+import dataclasses
+import hashlib
+import json
 import logging
 import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from typing import Dict, List, Optional
 from datetime import datetime
 from dataclasses import dataclass
+from pathlib import Path
 
 import aiohttp
 from dotenv import load_dotenv
 
+from core.http_client import get_shared_session
+from core.rate_limiter import AdaptiveConcurrencyLimiter
+from core.url_utils import canonicalize_url
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -43,7 +67,28 @@ JINA_API_KEY = os.getenv("JINA_API_KEY")  # Optional - increases rate limit
 
 # Rate limiting
 REQUESTS_PER_MINUTE = 200 if JINA_API_KEY else 20
-REQUEST_DELAY = 60.0 / REQUESTS_PER_MINUTE  # Seconds between requests
+MAX_429_RETRIES = 2
+SLOW_RESPONSE_MS = 20000.0  # Jina renders pages server-side; slower than this counts as congestion
+
+# Page cache
+JINA_CACHE_DIR = Path("data/jina_cache")
+CACHE_FRESH_SECONDS = 24 * 60 * 60  # Served without revalidation inside this window
+CACHE_MAX_AGE_SECONDS = 30 * 24 * 60 * 60  # Older disk entries are deleted rather than revalidated
+CACHE_MAX_BYTES = 512 * 1024 * 1024  # Disk budget; oldest entries are pruned past it
+CACHE_MEMORY_ENTRIES = 256  # Pages kept in memory (LRU)
+
+# Shared AIMD limiter: start conservatively, allow more headroom with an API key.
+# Request starts are also spaced to stay under Jina's published per-minute quota.
+_limiter = AdaptiveConcurrencyLimiter(
+    initial=5 if JINA_API_KEY else 2,
+    minimum=1,
+    maximum=20 if JINA_API_KEY else 5,
+    latency_target_ms=SLOW_RESPONSE_MS,
+    min_interval_seconds=60.0 / REQUESTS_PER_MINUTE
+)
+
+# In-flight fetches per event loop, keyed by canonical URL
+_in_flight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = weakref.WeakKeyDictionary()
 
 
 @dataclass
@@ -56,12 +101,318 @@ class PageContent:
     error: Optional[str] = None
     fetch_time_ms: float = 0.0
     content_length: int = 0
+    cached: bool = False  # Served from the page cache (fresh, revalidated, or stale after an error)
+
+
+class PageCache:
+    """
+    Page-content cache keyed by canonical URL.
+
+    The memory layer is an LRU of the most recently used pages; the disk
+    layer persists entries as JSON files named by URL hash. Disk entries
+    older than max_age_seconds are dropped, and once the directory exceeds
+    max_bytes the least recently written entries are pruned.
+
+    Async callers use aget()/aput(), which do disk IO in a worker thread.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = JINA_CACHE_DIR,
+        fresh_seconds: float = CACHE_FRESH_SECONDS,
+        max_age_seconds: float = CACHE_MAX_AGE_SECONDS,
+        max_bytes: int = CACHE_MAX_BYTES,
+        memory_entries: int = CACHE_MEMORY_ENTRIES
+    ):
+        self.cache_dir = cache_dir
+        self.fresh_seconds = fresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None  # Seeded by a directory scan on first write
+        self._disk_lock = threading.RLock()  # Disk accounting is shared by worker threads
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _remember(self, key: str, entry: Dict) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _expired(self, entry: Dict) -> bool:
+        return time.time() - entry.get("fetched_at", 0) >= self.max_age_seconds
+
+    def _memory_get(self, key: str) -> Optional[Dict]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+
+    def _load(self, key: str) -> Optional[Dict]:
+        """Read a disk entry (deleting it if expired)."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable Jina cache entry {path}: {e}")
+            return None
+        if self._expired(entry):
+            self._delete(path)
+            return None
+        return entry
+
+    def _store(self, key: str, entry: Dict) -> None:
+        """Write a disk entry, pruning the directory if it is over budget."""
+        with self._disk_lock:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                path = self._path(key)
+                if self._disk_bytes is None:
+                    self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+                replaced = path.stat().st_size if path.exists() else 0
+                data = json.dumps(entry).encode("utf-8")
+                tmp = path.with_suffix(".tmp")
+                tmp.write_bytes(data)
+                tmp.replace(path)
+                self._disk_bytes += len(data) - replaced
+            except OSError as e:
+                logger.warning(f"Jina cache write failed for {key}: {e}")
+                return
+            if self._disk_bytes > self.max_bytes:
+                self.prune()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return the cache entry for a canonical URL, or None."""
+        entry = self._memory_get(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: Dict) -> None:
+        """Store an entry in both layers."""
+        self._remember(key, entry)
+        self._store(key, entry)
+
+    async def aget(self, key: str) -> Optional[Dict]:
+        """get() with the disk read in a worker thread (memory hits stay inline)."""
+        entry = self._memory_get(key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    async def aput(self, key: str, entry: Dict) -> None:
+        """put() with the disk write (and any pruning) in a worker thread."""
+        self._remember(key, entry)
+        await asyncio.to_thread(self._store, key, entry)
+
+    def _disk_entries(self):
+        """(path, size, mtime) for every entry on disk."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _delete(self, path: Path) -> int:
+        with self._disk_lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return 0
+            if self._disk_bytes is not None:
+                self._disk_bytes -= size
+            return size
+
+    def prune(self) -> int:
+        """
+        Delete expired entries, then the oldest until under max_bytes.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._disk_lock:
+            if not self.cache_dir.exists():
+                return 0
+            entries = sorted(self._disk_entries(), key=lambda e: e[2])
+            total = sum(size for _, size, _ in entries)
+            cutoff = time.time() - self.max_age_seconds
+            removed = 0
+            for path, size, mtime in entries:
+                if mtime >= cutoff and total <= self.max_bytes:
+                    break
+                if path.exists():
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                total -= size
+            self._disk_bytes = total
+            if removed:
+                logger.info(f"Pruned {removed} Jina cache entries ({total} bytes kept)")
+            return removed
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return time.time() - entry.get("fetched_at", 0) < self.fresh_seconds
+
+    def clear_run(self) -> None:
+        """Drop the in-memory layer (disk entries are kept)."""
+        self._memory.clear()
+
+
+_page_cache = PageCache()
+
+
+def get_page_cache() -> PageCache:
+    """Return the module-level page cache."""
+    return _page_cache
+
+
+def _extract_title(content: str) -> Optional[str]:
+    """Extract title from first markdown heading if present."""
+    for line in content.split('\n')[:10]:  # Check first 10 lines
+        if line.startswith('# '):
+            return line[2:].strip()
+    return None
+
+
+def _page_from_entry(url: str, entry: Dict, fetch_time_ms: float, cached: bool) -> PageContent:
+    content = entry["content"]
+    return PageContent(
+        url=url,
+        success=True,
+        content=content,
+        title=entry.get("title"),
+        fetch_time_ms=fetch_time_ms,
+        content_length=len(content),
+        cached=cached
+    )
+
+
+def _truncate(page: PageContent, url: str, max_content_length: int) -> PageContent:
+    """Per-caller view of a shared result: original URL and length cap applied."""
+    content = page.content
+    if content is not None and len(content) > max_content_length:
+        content = content[:max_content_length] + "\n\n[Content truncated...]"
+    return dataclasses.replace(
+        page,
+        url=url,
+        content=content,
+        content_length=len(content) if content is not None else 0
+    )
+
+
+async def _fetch_from_jina(url: str, key: str, timeout: int, stale: Optional[Dict]) -> PageContent:
+    """
+    Fetch one URL through Jina under the shared AIMD limiter and update the cache.
+
+    Returns the full (untruncated) page; a stale cache entry is returned if
+    the server answers 304 or the refetch fails.
+    """
+    start_time = datetime.now()
+    jina_url = f"{JINA_READER_BASE}{url}"
+
+    headers = {
+        "Accept": "text/markdown",
+    }
+
+    # Add API key if available for higher rate limits
+    if JINA_API_KEY:
+        headers["Authorization"] = f"Bearer {JINA_API_KEY}"
+
+    # Conditional request when revalidating a cached page
+    if stale:
+        if stale.get("etag"):
+            headers["If-None-Match"] = stale["etag"]
+        if stale.get("last_modified"):
+            headers["If-Modified-Since"] = stale["last_modified"]
+
+    error = None
+    for attempt in range(MAX_429_RETRIES + 1):
+        request_start = time.monotonic()
+        try:
+            async with _limiter.slot():
+                session = await get_shared_session()
+                async with session.get(
+                    jina_url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=timeout)
+                ) as response:
+                    status = response.status
+                    retry_after = response.headers.get("Retry-After")
+                    content = await response.text() if status == 200 else None
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                    reason = response.reason
+        except asyncio.TimeoutError:
+            _limiter.record_response(0, (time.monotonic() - request_start) * 1000)
+            error = "Request timed out"
+            break
+        except Exception as e:
+            logger.error(f"Jina Reader fetch failed for {url}: {e}", exc_info=True)
+            _limiter.record_response(0, (time.monotonic() - request_start) * 1000)
+            error = str(e)
+            break
+
+        latency_ms = (time.monotonic() - request_start) * 1000
+        try:
+            retry_seconds = float(retry_after) if retry_after else None
+        except ValueError:
+            retry_seconds = None
+        _limiter.record_response(status, latency_ms, retry_seconds)
+
+        fetch_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+
+        if status == 304 and stale:
+            stale = dict(stale, fetched_at=time.time())
+            await _page_cache.aput(key, stale)
+            return _page_from_entry(url, stale, fetch_time_ms, cached=True)
+
+        if status == 200:
+            entry = {
+                "url": url,
+                "content": content,
+                "title": _extract_title(content),
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.time()
+            }
+            await _page_cache.aput(key, entry)
+            return _page_from_entry(url, entry, fetch_time_ms, cached=False)
+
+        error = f"HTTP {status}: {reason}"
+        if status != 429:
+            break
+        logger.warning(f"Jina Reader 429 for {url} (attempt {attempt + 1}/{MAX_429_RETRIES + 1})")
+
+    fetch_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+    if stale:
+        logger.info(f"Jina Reader refetch failed for {url} ({error}), serving cached copy")
+        return _page_from_entry(url, stale, fetch_time_ms, cached=True)
+
+    return PageContent(
+        url=url,
+        success=False,
+        error=error,
+        fetch_time_ms=fetch_time_ms
+    )
 
 
 async def fetch_page_content(
     url: str,
     timeout: int = 30,
-    max_content_length: int = 50000
+    max_content_length: int = 50000,
+    use_cache: bool = True
 ) -> PageContent:
     """
     Fetch a single URL and convert to markdown using Jina Reader.
@@ -70,78 +421,30 @@ async def fetch_page_content(
         url: The URL to fetch
         timeout: Request timeout in seconds
         max_content_length: Maximum content length to return (chars)
+        use_cache: Serve/revalidate from the page cache (False forces a refetch)
 
     Returns:
         PageContent with markdown content or error
     """
-    start_time = datetime.now()
-    jina_url = f"{JINA_READER_BASE}{url}"
+    key = canonicalize_url(url)
 
-    headers = {
-        "Accept": "text/markdown",
-    }
+    stale = await _page_cache.aget(key) if use_cache else None
+    if stale and _page_cache.is_fresh(stale):
+        return _truncate(_page_from_entry(url, stale, 0.0, cached=True), url, max_content_length)
 
-    # Add API key if available for higher rate limits
-    if JINA_API_KEY:
-        headers["Authorization"] = f"Bearer {JINA_API_KEY}"
+    # Coalesce concurrent requests for the same page into one fetch
+    loop_fetches = _in_flight.setdefault(asyncio.get_running_loop(), {})
+    task = loop_fetches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_from_jina(url, key, timeout, stale))
+        loop_fetches[key] = task
+        task.add_done_callback(lambda _: loop_fetches.pop(key, None))
+    else:
+        logger.debug(f"Jina Reader: joining in-flight fetch for {url}")
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                jina_url,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as response:
-                fetch_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-
-                if response.status != 200:
-                    return PageContent(
-                        url=url,
-                        success=False,
-                        error=f"HTTP {response.status}: {response.reason}",
-                        fetch_time_ms=fetch_time_ms
-                    )
-
-                content = await response.text()
-
-                # Extract title from first markdown heading if present
-                title = None
-                lines = content.split('\n')
-                for line in lines[:10]:  # Check first 10 lines
-                    if line.startswith('# '):
-                        title = line[2:].strip()
-                        break
-
-                # Truncate if too long
-                if len(content) > max_content_length:
-                    content = content[:max_content_length] + "\n\n[Content truncated...]"
-
-                return PageContent(
-                    url=url,
-                    success=True,
-                    content=content,
-                    title=title,
-                    fetch_time_ms=fetch_time_ms,
-                    content_length=len(content)
-                )
-
-    except asyncio.TimeoutError:
-        fetch_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-        return PageContent(
-            url=url,
-            success=False,
-            error="Request timed out",
-            fetch_time_ms=fetch_time_ms
-        )
-    except Exception as e:
-        fetch_time_ms = (datetime.now() - start_time).total_seconds() * 1000
-        logger.error(f"Jina Reader fetch failed for {url}: {e}", exc_info=True)
-        return PageContent(
-            url=url,
-            success=False,
-            error=str(e),
-            fetch_time_ms=fetch_time_ms
-        )
+    # shield: one caller being cancelled must not cancel the shared fetch
+    page = await asyncio.shield(task)
+    return _truncate(page, url, max_content_length)
 
 
 async def fetch_multiple_pages(
@@ -153,6 +456,9 @@ async def fetch_multiple_pages(
     """
     Fetch multiple URLs with rate limiting and concurrency control.
 
+    Cached pages return immediately; the rest share the adaptive limiter,
+    with max_concurrent as an upper bound for this call.
+
     Args:
         urls: List of URLs to fetch
         max_concurrent: Maximum concurrent requests
@@ -160,46 +466,34 @@ async def fetch_multiple_pages(
         max_content_length: Maximum content length per page (chars)
 
     Returns:
-        List of PageContent results (same order as input URLs)
+        List of PageContent results (same order and length as input URLs)
     """
     if not urls:
         return []
 
-    logger.info(f"Fetching {len(urls)} pages via Jina Reader (max_concurrent={max_concurrent})")
+    logger.info(f"Fetching {len(urls)} pages via Jina Reader (max_concurrent={max_concurrent}, adaptive limit={int(_limiter.limit)})")
 
     semaphore = asyncio.Semaphore(max_concurrent)
-    results = []
 
-    async def fetch_with_semaphore(url: str, index: int) -> tuple:
+    async def fetch_with_semaphore(url: str) -> PageContent:
         async with semaphore:
-            # Rate limiting delay
-            if index > 0:
-                await asyncio.sleep(REQUEST_DELAY)
-
-            result = await fetch_page_content(url, timeout, max_content_length)
-            return index, result
-
-    # Create tasks for all URLs
-    tasks = [
-        fetch_with_semaphore(url, i)
-        for i, url in enumerate(urls)
-    ]
-
-    # Execute with progress logging
-    completed = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Sort by original index and extract results
-    sorted_results = sorted(
-        [(idx, res) for idx, res in completed if not isinstance(res, Exception)],
-        key=lambda x: x[0]
-    )
+            return await fetch_page_content(url, timeout, max_content_length)
+
+    completed = await asyncio.gather(*(fetch_with_semaphore(url) for url in urls), return_exceptions=True)
 
-    results = [res for _, res in sorted_results]
+    # Failures stay in place so results line up with the input URLs
+    results = []
+    for url, res in zip(urls, completed):
+        if isinstance(res, BaseException):
+            logger.error(f"Jina Reader fetch raised for {url}: {res}", exc_info=res)
+            res = PageContent(url=url, success=False, error=f"{type(res).__name__}: {res}")
+        results.append(res)
 
     # Log summary
     successful = sum(1 for r in results if r.success)
+    cached = sum(1 for r in results if r.cached)
     total_chars = sum(r.content_length for r in results if r.success)
-    logger.info(f"Jina Reader: {successful}/{len(urls)} pages fetched, {total_chars:,} chars total")
+    logger.info(f"Jina Reader: {successful}/{len(urls)} pages fetched ({cached} from cache), {total_chars:,} chars total")
 
     return results
 
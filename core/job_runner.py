@@ -0,0 +1,621 @@
+#!/usr/bin/env python3
+"""
+Local background job runner backed by a SQLite job table.
+
+Long research and search jobs run in separate worker processes instead of the
+Streamlit script thread, so reruns, widget interactions and browser refreshes
+neither block nor kill them. The UI submits a job, keeps its id, and polls the
+table for status, progress events and partial results.
+
+A job target is an importable "module:function" taking (params, job), where
+job is a JobContext for reporting progress. Coroutine functions are run with
+asyncio.run(); plain functions in a thread. The return value (JSON-serializable)
+becomes the job result.
+
+Workers are detached processes (python3 -m core.job_runner worker): each one
+claims queued jobs until none are left, then exits. While a job runs, a
+heartbeat thread (its own connection, so a job blocking its event loop does
+not stall it) refreshes the job's heartbeat and watches for cancel requests.
+A worker that dies mid-job (crash, OOM kill, host restart) is detected by
+recover(), which requeues the job until max_attempts is reached, then marks
+it failed. A worker that is alive but has stopped heartbeating (hung) is
+failed rather than requeued, so two workers never run the same job. Every
+write a worker makes is fenced on the job still being RUNNING under its pid:
+a worker whose job was taken away writes nothing more and is cancelled.
+
+Usage:
+    from core.job_runner import JobRunner
+
+    runner = JobRunner()
+    job_id = runner.submit("apps.jobs:deep_research", {"question": "..."}, label="...")
+
+    job = runner.get(job_id)                 # status, partial, result, error
+    for event in runner.events(job_id, after=last_seen):
+        print(event.kind, event.message)
+    runner.cancel(job_id)
+
+    # Target signature
+    async def my_job(params: dict, job: JobContext) -> dict:
+        job.progress("Searching", source="sam")
+        job.partial({"found": 12})
+        return {"found": 30}
+
+CLI:
+    python3 -m core.job_runner list
+    python3 -m core.job_runner cancel JOB_ID
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_DB_PATH = Path("data/jobs/jobs.sqlite")
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = "queued", "running", "succeeded", "failed", "cancelled"
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        target TEXT NOT NULL,
+        label TEXT NOT NULL DEFAULT '',
+        params TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL,
+        heartbeat_at REAL,
+        pid INTEGER,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        max_attempts INTEGER NOT NULL DEFAULT 1,
+        cancel_requested INTEGER NOT NULL DEFAULT 0,
+        partial TEXT,
+        result TEXT,
+        error TEXT
+    );
+    CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+    CREATE TABLE IF NOT EXISTS job_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_id TEXT NOT NULL,
+        at REAL NOT NULL,
+        kind TEXT NOT NULL,
+        message TEXT NOT NULL,
+        data TEXT
+    );
+    CREATE INDEX IF NOT EXISTS job_events_job ON job_events (job_id, id);
+"""
+
+
+@dataclass
+class Job:
+    """One row of the job table."""
+    id: str
+    target: str
+    label: str
+    params: Dict[str, Any]
+    status: str
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    heartbeat_at: Optional[float]
+    pid: Optional[int]
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    partial: Optional[Any]
+    result: Optional[Any]
+    error: Optional[str]
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Job":
+        data = dict(row)
+        for key in ("params", "partial", "result"):
+            data[key] = json.loads(data[key]) if data[key] is not None else None
+        data["cancel_requested"] = bool(data["cancel_requested"])
+        return cls(**data)
+
+
+@dataclass
+class JobEvent:
+    """A status change or progress message; ids increase monotonically across jobs."""
+    id: int
+    job_id: str
+    at: float
+    kind: str  # "status" or "progress"
+    message: str
+    data: Optional[Dict[str, Any]]
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    # Autocommit; writers take BEGIN IMMEDIATE where read-then-write must be atomic.
+    # WAL lets the UI read while a worker writes. Not thread-bound: synchronous
+    # job targets report progress from a worker thread.
+    conn = sqlite3.connect(str(db_path), timeout=30, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _add_event(conn: sqlite3.Connection, job_id: str, kind: str, message: str,
+               data: Optional[Dict[str, Any]] = None) -> None:
+    conn.execute(
+        "INSERT INTO job_events (job_id, at, kind, message, data) VALUES (?, ?, ?, ?, ?)",
+        (job_id, time.time(), kind, message, json.dumps(data, default=str) if data is not None else None)
+    )
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+class JobRunner:
+    """
+    Submit, poll and cancel background jobs; starts workers on demand.
+
+    Safe to keep for the lifetime of a Streamlit server (st.cache_resource):
+    every call opens its own short-lived connection, and all job state lives in
+    the database, so a new runner (or a restarted server) attaches to existing
+    jobs by id.
+
+    Args:
+        db_path: SQLite job table (created if missing)
+        max_workers: Maximum concurrent worker processes (= concurrent jobs)
+        heartbeat_timeout: Seconds without a heartbeat before a running job
+            is considered orphaned and recovered
+        poll_interval: Worker heartbeat / cancel-check interval in seconds
+    """
+
+    def __init__(self, db_path: Union[str, Path] = DEFAULT_DB_PATH, max_workers: int = 2,
+                 heartbeat_timeout: float = 60.0, poll_interval: float = 0.5):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.heartbeat_timeout = heartbeat_timeout
+        self.poll_interval = poll_interval
+        self._workers: List[subprocess.Popen] = []
+        self._workers_lock = threading.Lock()  # Streamlit sessions share one runner
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+        self.recover()
+
+    @classmethod
+    def from_config(cls) -> "JobRunner":
+        """Runner configured from the jobs section of config.yaml."""
+        from config_loader import config
+        settings = config.get_raw_config().get("jobs", {}) or {}
+        return cls(
+            db_path=settings.get("db_path", DEFAULT_DB_PATH),
+            max_workers=int(settings.get("max_workers", 2)),
+            heartbeat_timeout=float(settings.get("heartbeat_timeout_seconds", 60)),
+            poll_interval=float(settings.get("poll_interval_seconds", 0.5)),
+        )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        conn = _connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    # === Submit / Query ===
+
+    def submit(self, target: str, params: Optional[Dict[str, Any]] = None,
+               label: str = "", max_attempts: int = 2) -> str:
+        """
+        Queue a job and make sure a worker will pick it up.
+
+        Args:
+            target: "package.module:function" importable by the worker
+            params: JSON-serializable arguments passed to the target
+            label: Human-readable description shown in job lists
+            max_attempts: Runs allowed before a job whose worker died is failed
+
+        Returns:
+            Job id
+        """
+        if ":" not in target:
+            raise ValueError(f"Job target must be 'module:function', got {target!r}")
+        job_id = uuid.uuid4().hex[:12]
+        with self._connection() as conn, _transaction(conn):
+            conn.execute(
+                "INSERT INTO jobs (id, target, label, params, status, created_at, max_attempts) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, target, label, json.dumps(params or {}, default=str), QUEUED, time.time(), max_attempts)
+            )
+            _add_event(conn, job_id, "status", QUEUED)
+        logger.info(f"Queued job {job_id} ({target})")
+        self._ensure_workers()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Current state of a job (None if unknown). Recovers orphaned jobs first."""
+        self.recover()
+        with self._connection() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_row(row) if row else None
+
+    def list_jobs(self, limit: int = 20, target: Optional[str] = None) -> List[Job]:
+        """Most recent jobs first, optionally for one target."""
+        query, args = "SELECT * FROM jobs", []
+        if target:
+            query += " WHERE target = ?"
+            args.append(target)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        args.append(limit)
+        with self._connection() as conn:
+            return [Job.from_row(row) for row in conn.execute(query, args)]
+
+    def events(self, job_id: str, after: int = 0) -> List[JobEvent]:
+        """Events of a job with id > after, oldest first."""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM job_events WHERE job_id = ? AND id > ? ORDER BY id", (job_id, after)
+            ).fetchall()
+        return [
+            JobEvent(id=r["id"], job_id=r["job_id"], at=r["at"], kind=r["kind"], message=r["message"],
+                     data=json.loads(r["data"]) if r["data"] is not None else None)
+            for r in rows
+        ]
+
+    def stream(self, job_id: str, after: int = 0, poll_interval: float = 0.5) -> Iterator[JobEvent]:
+        """Yield events as they are written, until the job finishes."""
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                raise KeyError(f"Unknown job: {job_id}")
+            for event in self.events(job_id, after):
+                after = event.id
+                yield event
+            if job.done:
+                return
+            time.sleep(poll_interval)
+
+    def wait(self, job_id: str, timeout: Optional[float] = None, poll_interval: float = 0.2) -> Job:
+        """Block until the job finishes; raises TimeoutError after timeout seconds."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                raise KeyError(f"Unknown job: {job_id}")
+            if job.done:
+                return job
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Job {job_id} still {job.status} after {timeout}s")
+            time.sleep(poll_interval)
+
+    # === Cancel / Recover ===
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job. Queued jobs are cancelled at once; running jobs get a
+        cancel request that their worker turns into asyncio cancellation
+        within poll_interval.
+
+        Returns:
+            False if the job is unknown or already finished
+        """
+        with self._connection() as conn, _transaction(conn):
+            row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or row["status"] in FINISHED_STATUSES:
+                return False
+            if row["status"] == QUEUED:
+                conn.execute("UPDATE jobs SET status = ?, finished_at = ?, cancel_requested = 1 WHERE id = ?",
+                             (CANCELLED, time.time(), job_id))
+                _add_event(conn, job_id, "status", CANCELLED)
+            else:
+                conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ?", (job_id,))
+                _add_event(conn, job_id, "status", "cancel requested")
+        return True
+
+    def recover(self) -> List[str]:
+        """
+        Requeue (or fail) running jobs whose worker is gone, fail those whose
+        worker is alive but has stopped heartbeating, then start workers for
+        queued jobs.
+
+        Returns:
+            Ids of the recovered jobs
+        """
+        with self._workers_lock:
+            self._workers = [p for p in self._workers if p.poll() is None]  # Reap exited workers
+        recovered = []
+        stale_before = time.time() - self.heartbeat_timeout
+        with self._connection() as conn, _transaction(conn):
+            for row in conn.execute("SELECT * FROM jobs WHERE status = ?", (RUNNING,)).fetchall():
+                job = Job.from_row(row)
+                alive = _pid_alive(job.pid)
+                if alive and (job.heartbeat_at or 0) >= stale_before:
+                    continue
+                reason = "heartbeat timed out" if alive else "worker exited"
+                if job.cancel_requested:
+                    status, message = CANCELLED, CANCELLED
+                elif alive:
+                    # Hung but still running: a requeued copy would run alongside it
+                    # (same output dir, double LLM spend). The fenced old worker
+                    # stops writing and cancels itself once it sees this.
+                    status, message = FAILED, FAILED
+                elif job.attempts < job.max_attempts:
+                    status, message = QUEUED, f"requeued ({reason}, attempt {job.attempts}/{job.max_attempts})"
+                else:
+                    status, message = FAILED, FAILED
+                conn.execute(
+                    "UPDATE jobs SET status = ?, pid = NULL, finished_at = ?, error = ? WHERE id = ?",
+                    (status, time.time() if status != QUEUED else None,
+                     f"Worker lost: {reason}" if status == FAILED else None, job.id)
+                )
+                _add_event(conn, job.id, "status", message, {"reason": reason})
+                logger.warning(f"Job {job.id}: {message}")
+                recovered.append(job.id)
+        self._ensure_workers()
+        return recovered
+
+    # === Workers ===
+
+    def _ensure_workers(self) -> None:
+        with self._workers_lock:
+            self._workers = [p for p in self._workers if p.poll() is None]
+            with self._connection() as conn:
+                queued = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (QUEUED,)).fetchone()[0]
+                running = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (RUNNING,)).fetchone()[0]
+            # Busy workers show up both as live processes and as running jobs;
+            # workers started by another runner only as running jobs
+            busy = max(len(self._workers), running)
+            for _ in range(min(queued, self.max_workers - busy)):
+                self._workers.append(self._spawn_worker())
+
+    def _spawn_worker(self) -> subprocess.Popen:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(REPO_ROOT.resolve()), env.get("PYTHONPATH")]))
+        log_file = open(self.db_path.parent / "workers.log", "a")
+        try:
+            # New session: the worker outlives the Streamlit server that started it
+            process = subprocess.Popen(
+                [sys.executable, "-m", "core.job_runner", "--db", str(self.db_path.resolve()),
+                 "worker", "--poll-interval", str(self.poll_interval)],
+                stdout=log_file, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                cwd=str(REPO_ROOT.resolve()), env=env, start_new_session=True,
+            )
+        finally:
+            log_file.close()
+        logger.info(f"Started job worker pid={process.pid}")
+        return process
+
+
+# =============================================================================
+# Worker side
+# =============================================================================
+
+# Fence for worker writes: the job is still running under this worker's pid
+_OWNED = "id = ? AND status = 'running' AND pid = ?"
+
+
+class JobContext:
+    """
+    Handle passed to a job target for reporting progress and partial results.
+
+    Writes are dropped once the job no longer belongs to this worker
+    (recover() failed or requeued it); `lost` is then True.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, job: Job):
+        self._conn = conn
+        self.job_id = job.id
+        self.attempt = job.attempts
+        self.label = job.label
+        self.lost = False
+
+    def _fenced(self, rowcount: int) -> None:
+        if not rowcount and not self.lost:
+            self.lost = True
+            logger.warning(f"Job {self.job_id} is no longer owned by this worker, dropping its writes")
+
+    def progress(self, message: str, **data: Any) -> None:
+        """Append a progress event (shown live in the UI)."""
+        self._fenced(self._conn.execute(
+            f"INSERT INTO job_events (job_id, at, kind, message, data) "
+            f"SELECT ?, ?, 'progress', ?, ? WHERE EXISTS (SELECT 1 FROM jobs WHERE {_OWNED})",
+            (self.job_id, time.time(), message, json.dumps(data, default=str) if data else None,
+             self.job_id, os.getpid())
+        ).rowcount)
+
+    def partial(self, data: Any) -> None:
+        """Replace the job's partial result (JSON-serializable)."""
+        self._fenced(self._conn.execute(
+            f"UPDATE jobs SET partial = ? WHERE {_OWNED}",
+            (json.dumps(data, default=str), self.job_id, os.getpid())
+        ).rowcount)
+
+
+def _claim_next(conn: sqlite3.Connection) -> Optional[Job]:
+    now = time.time()
+    with _transaction(conn):
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE jobs SET status = ?, pid = ?, attempts = attempts + 1, started_at = ?, heartbeat_at = ? "
+            "WHERE id = ?",
+            (RUNNING, os.getpid(), now, now, row["id"])
+        )
+        _add_event(conn, row["id"], "status", RUNNING, {"pid": os.getpid(), "attempt": row["attempts"] + 1})
+    return Job.from_row(conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone())
+
+
+def _resolve_target(target: str):
+    module_name, _, function_name = target.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+class _Heartbeat(threading.Thread):
+    """
+    Heartbeat and cancel watcher for one running job.
+
+    Runs in its own thread with its own connection: integrations make blocking
+    calls on the job's event loop, and a heartbeat task on that loop would go
+    stale during them and get a live job recovered. Cancels the job's task
+    when a cancel is requested or the job stops belonging to this worker.
+    """
+
+    def __init__(self, db_path: Path, job: Job, task: asyncio.Task, interval: float):
+        super().__init__(name=f"job-heartbeat-{job.id}", daemon=True)
+        self.db_path = db_path
+        self.job_id = job.id
+        self.task = task
+        self.interval = interval
+        self.loop = asyncio.get_running_loop()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        conn = _connect(self.db_path)
+        try:
+            while not self._stopped.is_set():
+                owned = conn.execute(
+                    f"UPDATE jobs SET heartbeat_at = ? WHERE {_OWNED}", (time.time(), self.job_id, os.getpid())
+                ).rowcount
+                if not owned:
+                    logger.warning(f"Job {self.job_id} was taken away from this worker, cancelling it")
+                    self._cancel_task()
+                    return
+                row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (self.job_id,)).fetchone()
+                if row["cancel_requested"]:
+                    self._cancel_task()
+                    return
+                self._stopped.wait(self.interval)
+        except Exception as e:
+            logger.error(f"Heartbeat for job {self.job_id} failed: {e}")
+        finally:
+            conn.close()
+
+    def _cancel_task(self) -> None:
+        if not self._stopped.is_set():
+            self.loop.call_soon_threadsafe(self.task.cancel)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+async def _run_with_watcher(conn: sqlite3.Connection, db_path: Path, job: Job, poll_interval: float):
+    fn = _resolve_target(job.target)
+    context = JobContext(conn, job)
+    if asyncio.iscoroutinefunction(fn):
+        task = asyncio.create_task(fn(job.params, context))
+    else:
+        task = asyncio.create_task(asyncio.to_thread(fn, job.params, context))
+
+    heartbeat = _Heartbeat(db_path, job, task, poll_interval)
+    heartbeat.start()
+    try:
+        return await task
+    finally:
+        heartbeat.stop()
+
+
+def _finish(conn: sqlite3.Connection, job: Job, status: str, result: Any = None,
+            error: Optional[str] = None) -> None:
+    with _transaction(conn):
+        # Skip if recover() already took the job away from this worker
+        updated = conn.execute(
+            f"UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE {_OWNED}",
+            (status, json.dumps(result, default=str) if result is not None else None, error,
+             time.time(), job.id, os.getpid())
+        ).rowcount
+        if updated:
+            _add_event(conn, job.id, "status", status, {"error": error} if error else None)
+
+
+def run_worker(db_path: Union[str, Path], poll_interval: float = 0.5) -> int:
+    """Claim and run queued jobs until none are left. Returns the number run."""
+    db_path = Path(db_path)
+    conn = _connect(db_path)
+    conn.executescript(SCHEMA)
+    count = 0
+    try:
+        while (job := _claim_next(conn)) is not None:
+            count += 1
+            logger.info(f"Running job {job.id} ({job.target}), attempt {job.attempts}/{job.max_attempts}")
+            try:
+                result = asyncio.run(_run_with_watcher(conn, db_path, job, poll_interval))
+            except asyncio.CancelledError:
+                _finish(conn, job, CANCELLED)
+            except Exception as e:
+                logger.error(f"Job {job.id} failed: {e}", exc_info=True)
+                _finish(conn, job, FAILED, error=f"{type(e).__name__}: {e}\n{traceback.format_exc()}")
+            else:
+                _finish(conn, job, SUCCEEDED, result=result)
+    finally:
+        conn.close()
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Background job runner")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Job database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    worker = commands.add_parser("worker", help="Run queued jobs until the queue is empty")
+    worker.add_argument("--poll-interval", type=float, default=0.5, help="Heartbeat/cancel-check seconds")
+    commands.add_parser("list", help="Show recent jobs")
+    cancel = commands.add_parser("cancel", help="Cancel a job")
+    cancel.add_argument("job_id")
+    args = parser.parse_args()
+
+    if args.command == "worker":
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(process)d] %(name)s: %(message)s")
+        run_worker(args.db, poll_interval=args.poll_interval)
+        return
+
+    runner = JobRunner(args.db)
+    if args.command == "list":
+        for job in runner.list_jobs():
+            created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(job.created_at))
+            print(f"{job.id}  {job.status:<10} {created}  {job.target}  {job.label[:60]}")
+    elif args.command == "cancel":
+        print("Cancel requested" if runner.cancel(args.job_id) else "Job unknown or already finished")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""
+Local analytical warehouse for USAspending and FEC bulk data.
+
+Bulk archives are normalized once into Parquet files and queried with DuckDB,
+so aggregate questions ("top recipients of AI contracts by agency over five
+years") become a single vectorized scan instead of dozens of 100-row API calls.
+
+Layout (root defaults to data/warehouse):
+    manifest.json                       # ingested files + download validators
+    raw/                                # downloaded bulk archives (pruned after raw_retention_days)
+    <dataset>/<archive stem>.parquet    # one Parquet file per ingested archive
+
+Re-ingesting an archive overwrites its Parquet file. When several archives
+contain the same record (monthly USAspending delta files, re-published FEC
+bulk files), the newest version wins: the row's own modification date where
+the dataset has one (USAspending last_modified_date), else the archive's
+publication date from its file name (..._20241008); ingestion time only
+breaks ties, so re-ingesting an old archive never overrides newer data.
+USAspending delta rows flagged for deletion hide the record.
+
+DuckDB is optional (pip install duckdb) and only needed for local mode.
+
+Usage:
+    from core.local_warehouse import get_local_warehouse
+
+    warehouse = get_local_warehouse()
+    warehouse.ingest_file("FY2024_All_Contracts_Full_20241008.zip", "usaspending_awards")
+    await warehouse.refresh()  # download changed bulk archives, ingest them
+
+    rows = await warehouse.aquery(
+        "SELECT recipient_name, SUM(amount) AS total FROM usaspending_awards "
+        "GROUP BY 1 ORDER BY 2 DESC LIMIT 10"
+    )
+"""
+
+import asyncio
+import csv
+import json
+import logging
+import re
+import tempfile
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from config_loader import config
+from core.http_client import get_shared_session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = Path("data/warehouse")
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+USASPENDING_MONTHLY_FILES_URL = "https://api.usaspending.gov/api/v2/bulk_download/list_monthly_files/"
+
+# Archive stems like "FY2024_All_Contracts_Full_20241008": a newer Full file
+# of the same series replaces the older one outright
+FULL_ARCHIVE_SERIES = re.compile(r"^(?P<series>.+_Full)_\d{8}$")
+# Publication date at the end of an archive stem, e.g. "..._Delta_20241008"
+ARCHIVE_DATE = re.compile(r"_(?P<date>\d{8})$")
+DEFAULT_RAW_RETENTION_DAYS = 30  # Ingested archives in raw/ are deleted after this
+
+# Lazy import DuckDB (only when local mode is used)
+duckdb = None
+
+
+def _import_duckdb() -> None:
+    """Lazy import DuckDB to avoid import errors if not installed."""
+    global duckdb
+    if duckdb is None:
+        import duckdb as _duckdb
+        duckdb = _duckdb
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """
+    How a bulk file maps onto a normalized warehouse table.
+
+    columns maps each normalized column to its type and the source column
+    names it may come from (first non-null wins; names match case-insensitively).
+    """
+    name: str
+    columns: Dict[str, Tuple[str, Tuple[str, ...]]]
+    key: Tuple[str, ...]
+    delimiter: str = ","
+    header_names: Optional[Tuple[str, ...]] = None  # For headerless files
+    date_formats: Tuple[str, ...] = ()
+    delete_flag: Optional[Tuple[str, str]] = None  # (source column, value meaning "deleted")
+    version: Tuple[str, ...] = ()  # Source columns with the row's last-modified timestamp
+
+
+FEC_INDIV_COLUMNS = (
+    "CMTE_ID", "AMNDT_IND", "RPT_TP", "TRANSACTION_PGI", "IMAGE_NUM", "TRANSACTION_TP",
+    "ENTITY_TP", "NAME", "CITY", "STATE", "ZIP_CODE", "EMPLOYER", "OCCUPATION",
+    "TRANSACTION_DT", "TRANSACTION_AMT", "OTHER_ID", "TRAN_ID", "FILE_NUM", "MEMO_CD",
+    "MEMO_TEXT", "SUB_ID",
+)
+FEC_COMMITTEE_COLUMNS = (
+    "CMTE_ID", "CMTE_NM", "TRES_NM", "CMTE_ST1", "CMTE_ST2", "CMTE_CITY", "CMTE_ST",
+    "CMTE_ZIP", "CMTE_DSGN", "CMTE_TP", "CMTE_PTY_AFFILIATION", "CMTE_FILING_FREQ",
+    "ORG_TP", "CONNECTED_ORG_NM", "CAND_ID",
+)
+FEC_CANDIDATE_COLUMNS = (
+    "CAND_ID", "CAND_NAME", "CAND_PTY_AFFILIATION", "CAND_ELECTION_YR", "CAND_OFFICE_ST",
+    "CAND_OFFICE", "CAND_OFFICE_DISTRICT", "CAND_ICI", "CAND_STATUS", "CAND_PCC",
+    "CAND_ST1", "CAND_ST2", "CAND_CITY", "CAND_ST", "CAND_ZIP",
+)
+
+DATASETS: Dict[str, DatasetSpec] = {
+    # USAspending Award Data Archive (contracts and assistance, full + delta files)
+    "usaspending_awards": DatasetSpec(
+        name="usaspending_awards",
+        columns={
+            "txn_key": ("VARCHAR", ("contract_transaction_unique_key", "assistance_transaction_unique_key")),
+            "award_key": ("VARCHAR", ("contract_award_unique_key", "assistance_award_unique_key")),
+            "award_id": ("VARCHAR", ("award_id_piid", "award_id_fain", "award_id_uri")),
+            "amount": ("DOUBLE", ("federal_action_obligation",)),
+            "action_date": ("DATE", ("action_date",)),
+            "start_date": ("DATE", ("period_of_performance_start_date",)),
+            "end_date": ("DATE", ("period_of_performance_current_end_date",)),
+            "awarding_agency": ("VARCHAR", ("awarding_agency_name",)),
+            "awarding_sub_agency": ("VARCHAR", ("awarding_sub_agency_name",)),
+            "funding_agency": ("VARCHAR", ("funding_agency_name",)),
+            "recipient_name": ("VARCHAR", ("recipient_name",)),
+            "description": ("VARCHAR", ("transaction_description", "prime_award_base_transaction_description", "award_description")),
+            "award_type_code": ("VARCHAR", ("award_type_code", "assistance_type_code")),
+            "permalink": ("VARCHAR", ("usaspending_permalink",)),
+        },
+        key=("txn_key",),
+        delete_flag=("correction_delete_ind", "D"),
+        version=("last_modified_date",),
+    ),
+    # FEC individual contributions (indivYY.zip / itcont.txt)
+    "fec_contributions": DatasetSpec(
+        name="fec_contributions",
+        columns={
+            "sub_id": ("VARCHAR", ("SUB_ID",)),
+            "committee_id": ("VARCHAR", ("CMTE_ID",)),
+            "contributor_name": ("VARCHAR", ("NAME",)),
+            "city": ("VARCHAR", ("CITY",)),
+            "state": ("VARCHAR", ("STATE",)),
+            "employer": ("VARCHAR", ("EMPLOYER",)),
+            "occupation": ("VARCHAR", ("OCCUPATION",)),
+            "date": ("DATE", ("TRANSACTION_DT",)),
+            "amount": ("DOUBLE", ("TRANSACTION_AMT",)),
+            "transaction_id": ("VARCHAR", ("TRAN_ID",)),
+            "cycle": ("INTEGER", ()),
+        },
+        key=("sub_id",),
+        delimiter="|",
+        header_names=FEC_INDIV_COLUMNS,
+        date_formats=("%m%d%Y",),
+    ),
+    # FEC committee master (cmYY.zip / cm.txt)
+    "fec_committees": DatasetSpec(
+        name="fec_committees",
+        columns={
+            "committee_id": ("VARCHAR", ("CMTE_ID",)),
+            "committee_name": ("VARCHAR", ("CMTE_NM",)),
+            "treasurer_name": ("VARCHAR", ("TRES_NM",)),
+            "state": ("VARCHAR", ("CMTE_ST",)),
+            "designation": ("VARCHAR", ("CMTE_DSGN",)),
+            "committee_type": ("VARCHAR", ("CMTE_TP",)),
+            "party": ("VARCHAR", ("CMTE_PTY_AFFILIATION",)),
+            "connected_org": ("VARCHAR", ("CONNECTED_ORG_NM",)),
+            "candidate_id": ("VARCHAR", ("CAND_ID",)),
+            "cycle": ("INTEGER", ()),
+        },
+        key=("committee_id", "cycle"),
+        delimiter="|",
+        header_names=FEC_COMMITTEE_COLUMNS,
+    ),
+    # FEC candidate master (cnYY.zip / cn.txt)
+    "fec_candidates": DatasetSpec(
+        name="fec_candidates",
+        columns={
+            "candidate_id": ("VARCHAR", ("CAND_ID",)),
+            "candidate_name": ("VARCHAR", ("CAND_NAME",)),
+            "party": ("VARCHAR", ("CAND_PTY_AFFILIATION",)),
+            "election_year": ("INTEGER", ("CAND_ELECTION_YR",)),
+            "office_state": ("VARCHAR", ("CAND_OFFICE_ST",)),
+            "office": ("VARCHAR", ("CAND_OFFICE",)),
+            "district": ("VARCHAR", ("CAND_OFFICE_DISTRICT",)),
+            "incumbent_challenge": ("VARCHAR", ("CAND_ICI",)),
+            "status": ("VARCHAR", ("CAND_STATUS",)),
+            "principal_committee_id": ("VARCHAR", ("CAND_PCC",)),
+            "cycle": ("INTEGER", ()),
+        },
+        key=("candidate_id", "election_year"),
+        delimiter="|",
+        header_names=FEC_CANDIDATE_COLUMNS,
+    ),
+    # FEC independent expenditures (independent_expenditure_YYYY.csv)
+    "fec_independent_expenditures": DatasetSpec(
+        name="fec_independent_expenditures",
+        columns={
+            "transaction_id": ("VARCHAR", ("tran_id",)),
+            "committee_id": ("VARCHAR", ("spe_id",)),
+            "committee_name": ("VARCHAR", ("spe_nam",)),
+            "candidate_id": ("VARCHAR", ("cand_id",)),
+            "candidate_name": ("VARCHAR", ("cand_name",)),
+            "amount": ("DOUBLE", ("exp_amo",)),
+            "date": ("DATE", ("exp_date", "dissem_dt")),
+            "support_oppose": ("VARCHAR", ("sup_opp",)),
+            "purpose": ("VARCHAR", ("pur",)),
+            "payee": ("VARCHAR", ("pay",)),
+            "cycle": ("INTEGER", ("fec_election_yr",)),
+        },
+        key=("committee_id", "transaction_id"),
+        date_formats=("%d-%b-%y", "%m/%d/%Y"),
+    ),
+}
+
+
+def _quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _quote_literal(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _archive_date(stem: str) -> Optional[datetime]:
+    """Publication date encoded in an archive stem, if any."""
+    match = ARCHIVE_DATE.search(stem)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group("date"), "%Y%m%d")
+    except ValueError:
+        return None
+
+
+@dataclass
+class IngestStats:
+    """Outcome of ingesting one bulk archive."""
+    dataset: str
+    source: str
+    parquet_path: str
+    rows: int
+    replaced: List[str] = field(default_factory=list)
+
+
+class LocalWarehouse:
+    """
+    Parquet + DuckDB store for bulk government spending data.
+
+    Datasets are exposed to SQL as views named after DATASETS keys
+    (usaspending_awards, fec_contributions, ...). A dataset with no ingested
+    files is an empty view with the normalized columns, so joins still work.
+    """
+
+    def __init__(self, root: Optional[Path] = None, sources: Optional[List[Dict[str, Any]]] = None,
+                 usaspending_monthly: Optional[Dict[str, Any]] = None, timeout: int = 600,
+                 raw_retention_days: Optional[int] = DEFAULT_RAW_RETENTION_DAYS):
+        """
+        Initialize the warehouse.
+
+        Args:
+            root: Warehouse directory (default: data/warehouse)
+            sources: Static bulk archives for refresh(), each
+                {"url": ..., "dataset": ..., "cycle": optional int}
+            usaspending_monthly: {"fiscal_years": [...], "award_types": [...]}
+                for discovering USAspending monthly archive files
+            timeout: Download timeout in seconds
+            raw_retention_days: Days to keep ingested archives in raw/
+                after refresh() (None keeps them)
+        """
+        self.root = Path(root) if root else DEFAULT_ROOT
+        self.sources = sources or []
+        self.usaspending_monthly = usaspending_monthly or {}
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.raw_retention_days = raw_retention_days
+        self.manifest_path = self.root / "manifest.json"
+        self._manifest: Optional[Dict[str, Any]] = None
+
+    # =========================================================================
+    # Manifest
+    # =========================================================================
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads(self.manifest_path.read_text())
+            except (OSError, ValueError):
+                self._manifest = {"files": {}, "downloads": {}}
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+        tmp_path.replace(self.manifest_path)
+
+    # =========================================================================
+    # Ingestion
+    # =========================================================================
+
+    def dataset_dir(self, dataset: str) -> Path:
+        return self.root / dataset
+
+    def has_data(self, dataset: str) -> bool:
+        """True if at least one archive has been ingested for dataset."""
+        return any(self.dataset_dir(dataset).glob("*.parquet"))
+
+    def ingest_file(self, path: Path, dataset: str, cycle: Optional[int] = None) -> IngestStats:
+        """
+        Normalize one bulk archive (CSV/TXT, or a ZIP of them) into Parquet.
+
+        Args:
+            path: Local archive path
+            dataset: Key of DATASETS
+            cycle: Election cycle to record for FEC files that don't carry one
+
+        Returns:
+            IngestStats for the written Parquet file
+
+        Raises:
+            ImportError: If DuckDB is not installed
+            KeyError: If dataset is unknown
+            ValueError: If the archive contains no data files
+        """
+        _import_duckdb()
+        spec = DATASETS[dataset]
+        path = Path(path)
+        stem = path.name.split(".")[0]
+        out_dir = self.dataset_dir(dataset)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        parquet_path = out_dir / f"{stem}.parquet"
+        part_path = out_dir / f"{stem}.parquet.part"
+
+        tmp_root = self.root / "tmp"
+        tmp_root.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=tmp_root) as tmp_dir:
+            data_files = self._data_files(path, Path(tmp_dir))
+            if not data_files:
+                raise ValueError(f"No CSV/TXT data files in {path}")
+            select_sql = self._normalize_sql(spec, data_files, stem, cycle)
+
+            con = duckdb.connect()
+            try:
+                con.execute(
+                    f"COPY ({select_sql}) TO {_quote_literal(str(part_path))} "
+                    f"(FORMAT PARQUET, COMPRESSION ZSTD)"
+                )
+                rows = con.execute(
+                    f"SELECT COUNT(*) FROM read_parquet({_quote_literal(str(part_path))})"
+                ).fetchone()[0]
+            finally:
+                con.close()
+        part_path.replace(parquet_path)
+
+        replaced = self._replace_older_full_archives(dataset, stem)
+        self.manifest["files"][f"{dataset}/{stem}"] = {
+            "source": str(path),
+            "rows": rows,
+            "cycle": cycle,
+            "ingested_at": datetime.now().isoformat(),
+        }
+        self._save_manifest()
+        logger.info(f"Warehouse: ingested {rows} rows from {path.name} into {dataset}")
+        return IngestStats(dataset=dataset, source=str(path), parquet_path=str(parquet_path), rows=rows, replaced=replaced)
+
+    @staticmethod
+    def _data_files(path: Path, tmp_dir: Path) -> List[Path]:
+        """Return data files for path, extracting ZIP members into tmp_dir."""
+        if not zipfile.is_zipfile(path):
+            return [path]
+        with zipfile.ZipFile(path) as archive:
+            members = [m for m in archive.namelist() if m.lower().endswith((".csv", ".txt"))]
+            # FEC zips also carry by_date/ splits of the same rows; prefer top-level files
+            top_level = [m for m in members if "/" not in m]
+            selected = top_level or members
+            for member in selected:
+                archive.extract(member, tmp_dir)
+        return [tmp_dir / member for member in selected]
+
+    @staticmethod
+    def _read_header(data_file: Path, delimiter: str) -> List[str]:
+        with open(data_file, newline="", encoding="utf-8", errors="replace") as f:
+            return next(csv.reader(f, delimiter=delimiter), [])
+
+    def _normalize_sql(self, spec: DatasetSpec, data_files: List[Path], stem: str, cycle: Optional[int]) -> str:
+        """Build the SELECT that maps raw bulk columns onto spec's normalized columns."""
+        files = "[" + ", ".join(_quote_literal(str(f)) for f in data_files) + "]"
+        if spec.header_names:
+            source_columns = list(spec.header_names)
+            names = "[" + ", ".join(_quote_literal(c) for c in source_columns) + "]"
+            reader = (f"read_csv({files}, delim={_quote_literal(spec.delimiter)}, header=false, "
+                      f"names={names}, all_varchar=true, quote='', escape='', ignore_errors=true)")
+        else:
+            source_columns = self._read_header(data_files[0], spec.delimiter)
+            reader = (f"read_csv({files}, delim={_quote_literal(spec.delimiter)}, header=true, "
+                      f"all_varchar=true, union_by_name=true, ignore_errors=true)")
+        available = {c.lower(): c for c in source_columns}
+
+        expressions = []
+        for column, (column_type, candidates) in spec.columns.items():
+            present = [available[c.lower()] for c in candidates if c.lower() in available]
+            values = [f"NULLIF(TRIM({_quote_ident(c)}), '')" for c in present]
+            if column == "cycle" and cycle is not None:
+                values.append(str(int(cycle)))
+            raw = f"COALESCE({', '.join(values)})" if values else "NULL"
+            if column_type == "DATE":
+                parsed = [f"TRY_CAST({raw} AS DATE)"]
+                parsed += [f"TRY_STRPTIME({raw}, {_quote_literal(fmt)})::DATE" for fmt in spec.date_formats]
+                expr = f"COALESCE({', '.join(parsed)})"
+            elif column_type == "VARCHAR":
+                expr = raw
+            else:
+                expr = f"TRY_CAST({raw} AS {column_type})"
+            expressions.append(f"{expr} AS {_quote_ident(column)}")
+
+        if spec.delete_flag and spec.delete_flag[0].lower() in available:
+            flag_column, flag_value = spec.delete_flag
+            expressions.append(
+                f"COALESCE(UPPER(TRIM({_quote_ident(available[flag_column.lower()])})) = "
+                f"{_quote_literal(flag_value)}, FALSE) AS _deleted"
+            )
+        else:
+            expressions.append("FALSE AS _deleted")
+        # Version for "newest row wins": the row's own timestamp, else the archive date
+        versions = [available[c.lower()] for c in spec.version if c.lower() in available]
+        parsed = []
+        for c in versions:
+            value = f"NULLIF(TRIM({_quote_ident(c)}), '')"
+            # USAspending timestamps carry a UTC offset ("2024-10-05 14:31:20.123+00")
+            parsed += [f"TRY_CAST({value} AS TIMESTAMP)", f"TRY_CAST(LEFT({value}, 19) AS TIMESTAMP)"]
+        published = _archive_date(stem)
+        if published:
+            parsed.append(f"TIMESTAMP {_quote_literal(published.isoformat(sep=' '))}")
+        expressions.append(f"COALESCE({', '.join(parsed)}) AS _version" if parsed else "CAST(NULL AS TIMESTAMP) AS _version")
+        expressions.append(f"{_quote_literal(stem)} AS _source_file")
+        expressions.append(f"TIMESTAMP {_quote_literal(datetime.now().isoformat(sep=' '))} AS _ingested_at")
+
+        return f"SELECT {', '.join(expressions)} FROM {reader}"
+
+    def _replace_older_full_archives(self, dataset: str, stem: str) -> List[str]:
+        """Delete Parquet files from older Full archives of the same series as stem."""
+        match = FULL_ARCHIVE_SERIES.match(stem)
+        if not match:
+            return []
+        replaced = []
+        for parquet in self.dataset_dir(dataset).glob("*.parquet"):
+            other = FULL_ARCHIVE_SERIES.match(parquet.stem)
+            if other and other.group("series") == match.group("series") and parquet.stem < stem:
+                parquet.unlink()
+                self.manifest["files"].pop(f"{dataset}/{parquet.stem}", None)
+                replaced.append(parquet.stem)
+        return replaced
+
+    # =========================================================================
+    # Incremental refresh
+    # =========================================================================
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Download bulk archives that changed since the last refresh and ingest them.
+
+        Static sources are revalidated with ETag/Last-Modified; USAspending
+        monthly files are discovered via the bulk_download API and fetched only
+        when the file name/updated date is new. Intended to run monthly.
+
+        Returns:
+            Dict with 'ingested' (IngestStats list), 'unchanged' and 'failed'
+            counts, and 'pruned' (archives deleted from raw/) when retention is on
+        """
+        sources = list(self.sources)
+        try:
+            sources.extend(await self._usaspending_monthly_sources())
+        except Exception as e:
+            # Catch-all at refresh boundary - static sources still refresh
+            logger.warning(f"Warehouse: USAspending monthly file listing failed: {e}")
+
+        summary: Dict[str, Any] = {"ingested": [], "unchanged": 0, "failed": 0}
+        for source in sources:
+            try:
+                path = await self._download(source)
+                if path is None:
+                    summary["unchanged"] += 1
+                    continue
+                stats = await asyncio.to_thread(self.ingest_file, path, source["dataset"], source.get("cycle"))
+                summary["ingested"].append(stats)
+            except Exception as e:
+                # Catch-all at refresh boundary - one bad archive doesn't stop the rest
+                logger.error(f"Warehouse: refresh of {source.get('url')} failed: {e}", exc_info=True)
+                summary["failed"] += 1
+        if self.raw_retention_days is not None:
+            summary["pruned"] = await asyncio.to_thread(self.prune_raw, self.raw_retention_days)
+        return summary
+
+    def prune_raw(self, older_than_days: int) -> List[str]:
+        """
+        Delete downloaded archives in raw/ older than older_than_days.
+
+        Only archives that were ingested (their Parquet is what queries read)
+        and abandoned .part downloads are deleted; an archive whose ingest
+        failed is kept so it can be loaded by hand. Download validators stay
+        in the manifest, so pruned archives are not fetched again.
+
+        Returns:
+            Names of deleted files
+        """
+        raw_dir = self.root / "raw"
+        if not raw_dir.exists():
+            return []
+        ingested = {Path(entry["source"]).resolve() for entry in self.manifest["files"].values() if entry.get("source")}
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).timestamp()
+        pruned = []
+        for path in raw_dir.iterdir():
+            if not path.is_file() or path.stat().st_mtime > cutoff:
+                continue
+            if path.name.endswith(".part") or path.resolve() in ingested:
+                path.unlink()
+                pruned.append(path.name)
+        if pruned:
+            logger.info(f"Warehouse: pruned {len(pruned)} archives from {raw_dir}")
+        return pruned
+
+    async def _usaspending_monthly_sources(self) -> List[Dict[str, Any]]:
+        """List USAspending monthly archive files for the configured fiscal years/types."""
+        fiscal_years = self.usaspending_monthly.get("fiscal_years") or []
+        award_types = self.usaspending_monthly.get("award_types") or ["contracts"]
+        session = await get_shared_session()
+        sources = []
+        for fiscal_year in fiscal_years:
+            for award_type in award_types:
+                body = {"agency": "all", "fiscal_year": fiscal_year, "type": award_type}
+                async with session.post(USASPENDING_MONTHLY_FILES_URL, json=body, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+                for item in data.get("monthly_files", []):
+                    sources.append({
+                        "url": item["url"],
+                        "dataset": "usaspending_awards",
+                        "version": item.get("updated_date") or item.get("file_name"),
+                    })
+        return sources
+
+    async def _download(self, source: Dict[str, Any]) -> Optional[Path]:
+        """
+        Stream source["url"] into raw/ unless unchanged since the last download.
+
+        Returns:
+            Path to the new archive, or None if it has not changed
+        """
+        url = source["url"]
+        previous = self.manifest["downloads"].get(url, {})
+        if source.get("version") and previous.get("version") == source["version"]:
+            return None
+
+        headers = {}
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+        raw_dir = self.root / "raw"
+        raw_dir.mkdir(parents=True, exist_ok=True)
+        path = raw_dir / url.rstrip("/").rsplit("/", 1)[-1]
+        part_path = path.with_name(path.name + ".part")
+
+        session = await get_shared_session()
+        async with session.get(url, headers=headers, timeout=self.timeout) as response:
+            if response.status == 304:
+                return None
+            response.raise_for_status()
+            with open(part_path, "wb") as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_BYTES):
+                    f.write(chunk)
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        part_path.replace(path)
+
+        self.manifest["downloads"][url] = {
+            **validators,
+            "version": source.get("version"),
+            "path": str(path),
+            "downloaded_at": datetime.now().isoformat(),
+        }
+        self._save_manifest()
+        return path
+
+    # =========================================================================
+    # Querying
+    # =========================================================================
+
+    def _view_sql(self, spec: DatasetSpec) -> str:
+        """Newest-version-per-key view over a dataset's Parquet files."""
+        files = list(self.dataset_dir(spec.name).glob("*.parquet"))
+        columns = ", ".join(_quote_ident(c) for c in spec.columns)
+        if not files:
+            empty = ", ".join(f"CAST(NULL AS {t}) AS {_quote_ident(c)}" for c, (t, _) in spec.columns.items())
+            return f"SELECT {empty} WHERE FALSE"
+
+        parquet = "[" + ", ".join(_quote_literal(str(f)) for f in sorted(files)) + "]"
+        # Rows without a key are distinct records, never collapsed together
+        key = " || '|' || ".join(f"COALESCE(CAST({_quote_ident(k)} AS VARCHAR), '')" for k in spec.key)
+        missing = " AND ".join(f"{_quote_ident(k)} IS NULL" for k in spec.key)
+        partition = f"CASE WHEN {missing} THEN CAST(gen_random_uuid() AS VARCHAR) ELSE {key} END"
+        return (
+            f"SELECT {columns} FROM ("
+            f"SELECT *, ROW_NUMBER() OVER (PARTITION BY {partition} "
+            f"ORDER BY _version DESC NULLS LAST, _ingested_at DESC) AS _rank "
+            f"FROM read_parquet({parquet}, union_by_name=true)"
+            f") WHERE _rank = 1 AND NOT _deleted"
+        )
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """
+        Run SQL against the dataset views and return rows as dicts.
+
+        Dates are returned as ISO strings so rows are JSON-serializable.
+
+        Raises:
+            ImportError: If DuckDB is not installed
+        """
+        _import_duckdb()
+        con = duckdb.connect()
+        try:
+            for spec in DATASETS.values():
+                con.execute(f"CREATE VIEW {spec.name} AS {self._view_sql(spec)}")
+            cursor = con.execute(sql, list(params))
+            names = [d[0] for d in cursor.description]
+            rows = cursor.fetchall()
+        finally:
+            con.close()
+
+        return [
+            {name: value.isoformat() if isinstance(value, (date, datetime)) else value
+             for name, value in zip(names, row)}
+            for row in rows
+        ]
+
+    async def aquery(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """query() in a worker thread so the event loop isn't blocked by the scan."""
+        return await asyncio.to_thread(self.query, sql, params)
+
+
+def execution_mode(db_id: str, query_params: Dict) -> str:
+    """
+    Resolve whether an integration should answer from the API or the warehouse.
+
+    query_params["execution_mode"] overrides databases.<db_id>.execution_mode.
+
+    Returns:
+        "api", "local", or "auto" (local when the warehouse has data)
+    """
+    mode = query_params.get("execution_mode") or config.get_database_config(db_id).get("execution_mode", "api")
+    return mode if mode in ("api", "local", "auto") else "api"
+
+
+_warehouse: Optional[LocalWarehouse] = None
+
+
+def get_local_warehouse() -> LocalWarehouse:
+    """Get or create the singleton warehouse configured under local_warehouse in config.yaml."""
+    global _warehouse
+    if _warehouse is None:
+        warehouse_config = config.get_raw_config().get("local_warehouse", {})
+        _warehouse = LocalWarehouse(
+            root=warehouse_config.get("root"),
+            sources=warehouse_config.get("sources"),
+            usaspending_monthly=warehouse_config.get("usaspending_monthly"),
+            timeout=warehouse_config.get("download_timeout", 600),
+            raw_retention_days=warehouse_config.get("raw_retention_days", DEFAULT_RAW_RETENTION_DAYS),
+        )
+    return _warehouse
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Runtime metrics (counters, gauges, histograms) with a Prometheus/OpenMetrics endpoint.
+
+Runtime telemetry was scattered: llm_utils keeps a cost tracker,
+core.api_request_tracker appends JSONL, and monitors only log, so nothing
+showed latency percentiles or error rates of a long-running monitor
+deployment. This module keeps one process-wide registry fed by those hooks:
+
+- LLM calls (llm_utils.acompletion): calls, latency, tokens and cost per model/role
+- Integration requests (api_request_tracker.log_request): latency, status
+  class and rate-limit (429) hits per API
+- Semaphore queue depth (MeteredSemaphore): tasks waiting / holding a slot
+- Monitor runs (monitor_run()): duration and outcome per monitor
+
+start_metrics_server() serves the registry at http://host:port/metrics in
+the Prometheus text format (OpenMetrics when the scraper asks for it). It is
+off unless enabled in config (metrics.enabled) or started explicitly, e.g.
+by the monitor scheduler's --metrics-port. Stdlib only; no prometheus_client.
+
+Usage:
+    from core import metrics
+
+    metrics.record_llm_call("gpt-5-mini", "synthesis", duration_seconds=1.2,
+                            prompt_tokens=900, completion_tokens=150, cost_dollars=0.0004)
+    metrics.record_integration_request("SAM.gov", status_code=429, duration_seconds=0.8)
+
+    semaphore = metrics.MeteredSemaphore(4, name="sub_goals")
+    async with semaphore:               # semaphore_waiting / semaphore_in_use gauges
+        ...
+
+    with metrics.monitor_run("Palantir contracts"):
+        await monitor.run()
+
+    server = metrics.start_metrics_server(port=9464)   # GET /metrics
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Seconds; LLM calls and monitor runs are slower than API requests
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+RUN_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 3600.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def samples(self, openmetrics: bool) -> List[str]:
+        raise NotImplementedError
+
+    def render(self, openmetrics: bool) -> List[str]:
+        # OpenMetrics names the counter family without its _total suffix
+        family = self.name[:-len("_total")] if openmetrics and self.kind == "counter" else self.name
+        return [
+            f"# HELP {family} {self.documentation}",
+            f"# TYPE {family} {self.kind}",
+            *self.samples(openmetrics),
+        ]
+
+
+class Counter(_Metric):
+    """Monotonic count per label set (name should end in _total)."""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name}: counters only go up (got {amount})")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self, openmetrics: bool) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down per label set."""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self, openmetrics: bool) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    """Cumulative buckets, sum and count per label set."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}  # counts per bucket, [sum]
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * len(self.buckets), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def get_count(self, **labels: str) -> int:
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def get_sum(self, **labels: str) -> float:
+        entry = self._values.get(self._key(labels))
+        return entry[1][0] if entry else 0.0
+
+    def samples(self, openmetrics: bool) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(c), t[0])) for k, (c, t) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics rendered together for /metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self, openmetrics: bool = False) -> str:
+        """Exposition text for every metric (Prometheus 0.0.4 or OpenMetrics 1.0)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = [line for metric in metrics for line in metric.render(openmetrics)]
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# === LLM calls ===
+LLM_REQUESTS = REGISTRY.counter("osint_llm_requests_total", "LLM calls.", ("model", "role", "status"))
+LLM_LATENCY = REGISTRY.histogram("osint_llm_request_duration_seconds", "LLM call latency.", ("model", "role"))
+LLM_TOKENS = REGISTRY.counter("osint_llm_tokens_total", "LLM tokens used.", ("model", "role", "kind"))
+LLM_COST = REGISTRY.counter("osint_llm_cost_dollars_total", "Estimated LLM cost in USD.", ("model", "role"))
+
+# === Integration requests ===
+API_REQUESTS = REGISTRY.counter("osint_integration_requests_total", "Integration API requests.",
+                                ("api", "status_class"))
+API_LATENCY = REGISTRY.histogram("osint_integration_request_duration_seconds", "Integration API request latency.",
+                                 ("api",))
+API_RATE_LIMITED = REGISTRY.counter("osint_integration_rate_limited_total", "Integration requests answered with 429.",
+                                    ("api",))
+
+# === Concurrency ===
+SEMAPHORE_WAITING = REGISTRY.gauge("osint_semaphore_waiting", "Tasks queued on a semaphore.", ("name",))
+SEMAPHORE_IN_USE = REGISTRY.gauge("osint_semaphore_in_use", "Semaphore slots held.", ("name",))
+SEMAPHORE_WAIT = REGISTRY.histogram("osint_semaphore_wait_seconds", "Time spent waiting for a semaphore slot.",
+                                    ("name",))
+
+# === Monitors ===
+MONITOR_RUNS = REGISTRY.counter("osint_monitor_runs_total", "Monitor runs.", ("monitor", "status"))
+MONITOR_DURATION = REGISTRY.histogram("osint_monitor_run_duration_seconds", "Monitor run duration.",
+                                      ("monitor", "status"), buckets=RUN_BUCKETS)
+MONITOR_LAST_RUN = REGISTRY.gauge("osint_monitor_last_run_timestamp_seconds", "Unix time the monitor last finished.",
+                                  ("monitor",))
+
+
+def status_class(status_code: Optional[int]) -> str:
+    """'2xx', '4xx', '5xx', ... or 'error' when no HTTP response was received (code 0/None)."""
+    if not status_code:
+        return "error"
+    return f"{int(status_code) // 100}xx"
+
+
+def record_llm_call(
+    model: str,
+    role: Optional[str],
+    duration_seconds: float,
+    status: str = "success",
+    prompt_tokens: Optional[int] = None,
+    completion_tokens: Optional[int] = None,
+    cost_dollars: Optional[float] = None,
+) -> None:
+    """Count one LLM call (status: 'success' or 'error')."""
+    role = role or "default"
+    LLM_REQUESTS.inc(model=model, role=role, status=status)
+    LLM_LATENCY.observe(duration_seconds, model=model, role=role)
+    if prompt_tokens:
+        LLM_TOKENS.inc(prompt_tokens, model=model, role=role, kind="prompt")
+    if completion_tokens:
+        LLM_TOKENS.inc(completion_tokens, model=model, role=role, kind="completion")
+    if cost_dollars:
+        LLM_COST.inc(cost_dollars, model=model, role=role)
+
+
+def record_integration_request(api: str, status_code: Optional[int], duration_seconds: Optional[float]) -> None:
+    """Count one integration request; 429 also counts as a rate-limit hit."""
+    API_REQUESTS.inc(api=api, status_class=status_class(status_code))
+    if duration_seconds is not None:
+        API_LATENCY.observe(duration_seconds, api=api)
+    if status_code == 429:
+        API_RATE_LIMITED.inc(api=api)
+
+
+class MeteredSemaphore(asyncio.Semaphore):
+    """asyncio.Semaphore that reports its queue depth and slots in use under `name`."""
+
+    def __init__(self, value: int = 1, name: str = "default"):
+        super().__init__(value)
+        self.name = name
+
+    async def acquire(self) -> bool:
+        if not self.locked():
+            await super().acquire()
+            SEMAPHORE_IN_USE.inc(name=self.name)
+            return True
+        SEMAPHORE_WAITING.inc(name=self.name)
+        start = time.perf_counter()
+        try:
+            await super().acquire()
+        finally:
+            SEMAPHORE_WAITING.dec(name=self.name)
+        SEMAPHORE_WAIT.observe(time.perf_counter() - start, name=self.name)
+        SEMAPHORE_IN_USE.inc(name=self.name)
+        return True
+
+    def release(self) -> None:
+        SEMAPHORE_IN_USE.dec(name=self.name)
+        super().release()
+
+
+@contextmanager
+def monitor_run(monitor: str) -> Iterator[None]:
+    """Time a monitor run; status is 'failed' if the block raises."""
+    start = time.perf_counter()
+    status = "failed"
+    try:
+        yield
+        status = "success"
+    finally:
+        MONITOR_RUNS.inc(monitor=monitor, status=status)
+        MONITOR_DURATION.observe(time.perf_counter() - start, monitor=monitor, status=status)
+        MONITOR_LAST_RUN.set(time.time(), monitor=monitor)
+
+
+# =============================================================================
+# HTTP endpoint
+# =============================================================================
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404, "Only /metrics is served")
+            return
+        openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+        body = self.registry.render(openmetrics=openmetrics).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # Scrapes every few seconds: keep them out of the logs
+        logger.debug(f"/metrics {self.address_string()} " + format % args)
+
+
+def start_metrics_server(port: int = 9464, host: str = "127.0.0.1",
+                         registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    Serve `registry` at http://host:port/metrics from a daemon thread.
+
+    Returns the server (server.server_address has the bound port when port=0;
+    call server.shutdown() to stop it).
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    logger.info(f"Metrics endpoint: http://{server.server_address[0]}:{server.server_address[1]}/metrics")
+    return server
+
+
+def start_metrics_server_from_config() -> Optional[ThreadingHTTPServer]:
+    """Start the endpoint if metrics.enabled is set in config; returns None otherwise."""
+    from config_loader import config
+    settings = config.get_raw_config().get("metrics", {}) or {}
+    if not settings.get("enabled", False):
+        return None
+    return start_metrics_server(port=int(settings.get("port", 9464)), host=settings.get("host", "127.0.0.1"))
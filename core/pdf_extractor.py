@@ -4,33 +4,103 @@ PDF extraction utility for document-heavy sources.
 
 Provides async-safe PDF downloading and text extraction using PyMuPDF.
 Used by integrations like FBI Vault, GovInfo, CourtListener, Federal Register.
+
+Pipeline:
+- Downloads stream to disk in chunks through the shared HTTP pool and are
+  abandoned as soon as they exceed the size limit
+- Extracted text is cached by SHA-256 of the PDF bytes (text + page offsets),
+  so the same document is never re-extracted, even from a different URL
+- Extraction of large PDFs is split into page chunks and run in a process
+  pool (PyMuPDF text extraction is CPU-bound and holds the GIL)
+- Cache size is bounded: the total is tracked as files are written, and once
+  it exceeds max_cache_mb the least-recently-used files are evicted (in a
+  worker thread, off the event loop)
+
+Usage:
+    extractor = get_pdf_extractor()
+    text, meta = await extractor.extract_from_url(url)
+    text, meta = await extractor.extract_from_url(url, pages=(1, 10))
+    by_url = await extractor.extract_many([url1, url2])
 """
 
 import asyncio
 import hashlib
+import json
 import logging
-import tempfile
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
 
+from core.http_client import get_shared_session
+
 logger = logging.getLogger(__name__)
 
 # Cache directory for downloaded PDFs
 PDF_CACHE_DIR = Path("data/pdf_cache")
 
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+PAGES_PER_TASK = 25                      # Page chunk size for parallel extraction
+PROCESS_POOL_MIN_BYTES = 2 * 1024 * 1024  # Smaller PDFs extract in a thread (no IPC overhead)
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared extraction process pool."""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the extraction process pool (call at application shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _extract_pages(pdf_path: str, page_numbers: List[int]) -> Tuple[Dict[int, str], int]:
+    """
+    Extract text for 1-based page numbers (runs in a worker process or thread).
+
+    Returns:
+        Tuple of ({page_number: text}, total_pages_in_document)
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(pdf_path)
+    try:
+        total = len(doc)
+        return {p: doc[p - 1].get_text() for p in page_numbers if 1 <= p <= total}, total
+    finally:
+        doc.close()
+
+
+def _format_pages(pages: Dict[int, str], first: int, last: int) -> str:
+    """Join non-empty pages in [first, last] with [Page N] markers."""
+    return "\n\n".join(
+        f"[Page {p}]\n{pages[p]}"
+        for p in range(first, last + 1)
+        if pages.get(p, "").strip()
+    )
+
 
 class PDFExtractor:
     """
     Async-safe PDF text extraction.
 
     Features:
-    - Downloads PDFs asynchronously
-    - Extracts text using PyMuPDF (fitz)
-    - Caches PDFs locally by URL hash
-    - Configurable max pages and size limits
+    - Streams PDFs to disk via the shared HTTP pool, with a size cutoff
+    - Extracts text using PyMuPDF (fitz), large files in a process pool
+    - Caches PDFs by URL hash and extracted text by content hash
+    - Page-range extraction (only missing pages are extracted)
+    - LRU-by-bytes cache eviction
     - Graceful error handling
     """
 
@@ -39,34 +109,65 @@ class PDFExtractor:
         cache_dir: Path = PDF_CACHE_DIR,
         max_size_mb: float = 50.0,
         max_pages: int = 100,
-        timeout_seconds: int = 30
+        timeout_seconds: int = 30,
+        max_cache_mb: float = 2048.0,
+        max_concurrent: int = 4
     ):
         """
         Initialize PDF extractor.
 
         Args:
-            cache_dir: Directory to cache downloaded PDFs
+            cache_dir: Directory to cache downloaded PDFs and extracted text
             max_size_mb: Maximum PDF size to download (MB)
-            max_pages: Maximum pages to extract text from
+            max_pages: Maximum pages to extract text from (default range)
             timeout_seconds: Download timeout
+            max_cache_mb: Cache size above which LRU files are evicted
+            max_concurrent: Max concurrent downloads/extractions in extract_many()
         """
         self.cache_dir = cache_dir
+        self.text_cache_dir = cache_dir / "text"
         self.max_size_bytes = int(max_size_mb * 1024 * 1024)
         self.max_pages = max_pages
+        self.max_cache_bytes = int(max_cache_mb * 1024 * 1024)
+        self.max_concurrent = max_concurrent
         self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self._digests: Dict[Path, str] = {}
+        self._cache_bytes: Optional[int] = None  # Tracked total; None until the first scan
+        self._evicting = False
 
-        # Ensure cache directory exists
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure cache directories exist
+        self.text_cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _url_to_cache_path(self, url: str) -> Path:
         """Convert URL to cache file path using hash."""
         url_hash = hashlib.md5(url.encode()).hexdigest()
         return self.cache_dir / f"{url_hash}.pdf"
 
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark a cache file as recently used (mtime drives LRU eviction)."""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _content_digest(self, pdf_path: Path) -> str:
+        """SHA-256 of the PDF bytes (memoized per file)."""
+        digest = self._digests.get(pdf_path)
+        if digest is None:
+            with open(pdf_path, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            self._digests[pdf_path] = digest
+        return digest
+
     async def download_pdf(self, url: str) -> Optional[Path]:
         """
         Download PDF from URL, using cache if available.
 
+        The body is streamed to a temporary file in chunks and abandoned as
+        soon as it exceeds max_size_mb, so oversized documents without a
+        Content-Length header never sit fully in memory.
+
         Args:
             url: PDF URL to download
 
@@ -78,8 +179,10 @@ class PDFExtractor:
         # Return cached version if exists
         if cache_path.exists():
             logger.debug(f"Using cached PDF: {cache_path}")
+            self._touch(cache_path)
             return cache_path
 
+        part_path = cache_path.with_suffix(".part")
         try:
             # Headers to avoid bot detection
             headers = {
@@ -88,45 +191,155 @@ class PDFExtractor:
             }
 
             # Allow redirects
-            async with aiohttp.ClientSession(timeout=self.timeout, headers=headers) as session:
-                async with session.get(url, allow_redirects=True) as response:
-                    if response.status != 200:
-                        logger.warning(f"PDF download failed: HTTP {response.status} for {url}")
-                        return None
-
-                    # Check content length
-                    content_length = response.headers.get('Content-Length')
-                    if content_length and int(content_length) > self.max_size_bytes:
-                        logger.warning(f"PDF too large: {int(content_length) / 1024 / 1024:.1f}MB > {self.max_size_bytes / 1024 / 1024:.1f}MB limit")
-                        return None
-
-                    # Check content type
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'pdf' not in content_type.lower() and not url.lower().endswith('.pdf'):
-                        logger.warning(f"URL does not appear to be PDF: {content_type}")
-                        # Continue anyway - some servers don't set content type correctly
-
-                    # Download to cache
-                    content = await response.read()
-
-                    if len(content) > self.max_size_bytes:
-                        logger.warning(f"PDF content too large: {len(content) / 1024 / 1024:.1f}MB")
-                        return None
-
-                    cache_path.write_bytes(content)
-                    logger.info(f"Downloaded PDF: {url} -> {cache_path}")
-                    return cache_path
+            session = await get_shared_session()
+            async with session.get(url, headers=headers, timeout=self.timeout, allow_redirects=True) as response:
+                if response.status != 200:
+                    logger.warning(f"PDF download failed: HTTP {response.status} for {url}")
+                    return None
+
+                # Check content length
+                content_length = response.headers.get('Content-Length')
+                if content_length and int(content_length) > self.max_size_bytes:
+                    logger.warning(f"PDF too large: {int(content_length) / 1024 / 1024:.1f}MB > {self.max_size_bytes / 1024 / 1024:.1f}MB limit")
+                    return None
+
+                # Check content type
+                content_type = response.headers.get('Content-Type', '')
+                if 'pdf' not in content_type.lower() and not url.lower().endswith('.pdf'):
+                    logger.warning(f"URL does not appear to be PDF: {content_type}")
+                    # Continue anyway - some servers don't set content type correctly
+
+                # Stream to disk, hashing as we go
+                hasher = hashlib.sha256()
+                size = 0
+                with open(part_path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_BYTES):
+                        size += len(chunk)
+                        if size > self.max_size_bytes:
+                            logger.warning(f"PDF content too large: >{self.max_size_bytes / 1024 / 1024:.1f}MB, aborting {url}")
+                            break
+                        hasher.update(chunk)
+                        f.write(chunk)
+
+            if size > self.max_size_bytes:
+                part_path.unlink(missing_ok=True)
+                return None
+
+            part_path.replace(cache_path)
+            self._digests[cache_path] = hasher.hexdigest()
+            logger.info(f"Downloaded PDF: {url} -> {cache_path} ({size / 1024:.0f}KB)")
+            await self._account(size)
+            return cache_path
 
         except asyncio.TimeoutError:
             logger.warning(f"PDF download timeout: {url}")
+            part_path.unlink(missing_ok=True)
             return None
         except Exception as e:
             logger.error(f"PDF download failed: {e}", exc_info=True)
+            part_path.unlink(missing_ok=True)
             return None
 
+    def _text_cache_path(self, digest: str) -> Path:
+        return self.text_cache_dir / f"{digest}.json"
+
+    def _load_text_cache(self, digest: str) -> Tuple[Dict[int, str], Optional[int]]:
+        """
+        Load cached pages for a content hash.
+
+        Cache format: {"total_pages": N, "text": "...", "offsets": [[page, start, end], ...]}
+
+        Returns:
+            Tuple of ({page_number: text}, total_pages or None if not cached)
+        """
+        path = self._text_cache_path(digest)
+        if not path.exists():
+            return {}, None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable PDF text cache {path}: {e}")
+            return {}, None
+        self._touch(path)
+        text = entry["text"]
+        return {page: text[start:end] for page, start, end in entry["offsets"]}, entry["total_pages"]
+
+    def _save_text_cache(self, digest: str, pages: Dict[int, str], total_pages: int) -> int:
+        """Write a text cache entry; returns its size in bytes."""
+        parts, offsets, position = [], [], 0
+        for page in sorted(pages):
+            parts.append(pages[page])
+            offsets.append([page, position, position + len(pages[page])])
+            position += len(pages[page])
+        entry = {"total_pages": total_pages, "text": "".join(parts), "offsets": offsets}
+        path = self._text_cache_path(digest)
+        tmp = path.with_suffix(".tmp")
+        data = json.dumps(entry).encode("utf-8")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+        return len(data)
+
+    async def _extract_missing(self, pdf_path: Path, page_numbers: List[int]) -> Tuple[Dict[int, str], int]:
+        """Extract pages in parallel chunks (process pool for large files, thread otherwise)."""
+        chunks = [page_numbers[i:i + PAGES_PER_TASK] for i in range(0, len(page_numbers), PAGES_PER_TASK)]
+        if pdf_path.stat().st_size >= PROCESS_POOL_MIN_BYTES:
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool()
+            futures = [loop.run_in_executor(pool, _extract_pages, str(pdf_path), chunk) for chunk in chunks]
+        else:
+            futures = [asyncio.to_thread(_extract_pages, str(pdf_path), page_numbers)]
+
+        pages: Dict[int, str] = {}
+        total = 0
+        for chunk_pages, chunk_total in await asyncio.gather(*futures):
+            pages.update(chunk_pages)
+            total = chunk_total
+        return pages, total
+
+    async def extract_pages(
+        self,
+        pdf_path: Path,
+        pages: Optional[Tuple[int, int]] = None
+    ) -> Tuple[str, dict]:
+        """
+        Extract text for a page range, using the content-hash text cache.
+
+        Args:
+            pdf_path: Path to PDF file
+            pages: Inclusive 1-based (first, last); default first max_pages pages
+
+        Returns:
+            Tuple of (extracted_text, info) where info has page_count,
+            total_pages and text_cached
+        """
+        first, last = pages if pages else (1, self.max_pages)
+        first = max(1, first)
+
+        digest = await asyncio.to_thread(self._content_digest, pdf_path)
+        cached_pages, total = self._load_text_cache(digest)
+
+        if total is not None:
+            last = min(last, total)
+        wanted = list(range(first, last + 1))
+        # Cached entries list every extracted page, including empty ones
+        missing = [p for p in wanted if p not in cached_pages]
+
+        text_cached = total is not None and not missing
+        if missing:
+            new_pages, total = await self._extract_missing(pdf_path, missing)
+            last = min(last, total)
+            cached_pages.update(new_pages)
+            written = await asyncio.to_thread(self._save_text_cache, digest, cached_pages, total)
+            await self._account(written)
+
+        text = _format_pages(cached_pages, first, last)
+        page_count = max(0, last - first + 1)
+        logger.debug(f"Extracted {len(text)} chars from {page_count} pages (cached={text_cached})")
+        return text, {"page_count": page_count, "total_pages": total, "text_cached": text_cached}
+
     def extract_text(self, pdf_path: Path) -> Tuple[str, int]:
         """
-        Extract text from PDF file.
+        Extract text from PDF file (synchronous, no caching).
 
         Args:
             pdf_path: Path to PDF file
@@ -135,25 +348,15 @@ class PDFExtractor:
             Tuple of (extracted_text, page_count)
         """
         try:
-            import fitz  # PyMuPDF
+            import fitz  # noqa: F401  PyMuPDF
         except ImportError:
             logger.error("PyMuPDF not installed. Run: pip install PyMuPDF")
             return "", 0
 
         try:
-            doc = fitz.open(pdf_path)
-            text_parts = []
-            page_count = min(len(doc), self.max_pages)
-
-            for page_num in range(page_count):
-                page = doc[page_num]
-                text = page.get_text()
-                if text.strip():
-                    text_parts.append(f"[Page {page_num + 1}]\n{text}")
-
-            doc.close()
-
-            full_text = "\n\n".join(text_parts)
+            pages, total = _extract_pages(str(pdf_path), list(range(1, self.max_pages + 1)))
+            page_count = min(total, self.max_pages)
+            full_text = _format_pages(pages, 1, page_count)
             logger.debug(f"Extracted {len(full_text)} chars from {page_count} pages")
             return full_text, page_count
 
@@ -161,12 +364,13 @@ class PDFExtractor:
             logger.error(f"PDF extraction failed for {pdf_path}: {e}", exc_info=True)
             return "", 0
 
-    async def extract_from_url(self, url: str) -> Tuple[str, dict]:
+    async def extract_from_url(self, url: str, pages: Optional[Tuple[int, int]] = None) -> Tuple[str, dict]:
         """
         Download and extract text from PDF URL.
 
         Args:
             url: PDF URL
+            pages: Optional inclusive 1-based page range (first, last)
 
         Returns:
             Tuple of (extracted_text, metadata_dict)
@@ -175,8 +379,11 @@ class PDFExtractor:
             "url": url,
             "success": False,
             "page_count": 0,
+            "total_pages": None,
+            "page_range": list(pages) if pages else None,
             "char_count": 0,
             "cached": False,
+            "text_cached": False,
             "error": None
         }
 
@@ -190,33 +397,111 @@ class PDFExtractor:
             metadata["error"] = "Download failed"
             return "", metadata
 
-        # Extract - run in thread to avoid blocking
-        text, page_count = await asyncio.to_thread(self.extract_text, pdf_path)
+        try:
+            text, info = await self.extract_pages(pdf_path, pages)
+        except ImportError:
+            logger.error("PyMuPDF not installed. Run: pip install PyMuPDF")
+            metadata["error"] = "PyMuPDF not installed"
+            return "", metadata
+        except Exception as e:
+            logger.error(f"PDF extraction failed for {pdf_path}: {e}", exc_info=True)
+            metadata["error"] = f"Extraction failed: {e}"
+            return "", metadata
 
+        metadata.update(info)
         metadata["success"] = bool(text)
-        metadata["page_count"] = page_count
         metadata["char_count"] = len(text)
 
         return text, metadata
 
-    def clear_cache(self, older_than_days: int = 7):
+    async def extract_many(
+        self,
+        urls: List[str],
+        pages: Optional[Tuple[int, int]] = None
+    ) -> Dict[str, Tuple[str, dict]]:
         """
-        Clear old cached PDFs.
+        Download and extract several PDFs concurrently.
 
         Args:
-            older_than_days: Delete files older than this many days
+            urls: PDF URLs (duplicates are fetched once)
+            pages: Optional page range applied to every document
+
+        Returns:
+            Dict mapping URL to (extracted_text, metadata_dict)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        unique = list(dict.fromkeys(urls))
+
+        async def _one(url: str) -> Tuple[str, dict]:
+            async with semaphore:
+                return await self.extract_from_url(url, pages)
+
+        results = await asyncio.gather(*(_one(url) for url in unique))
+        return dict(zip(unique, results))
+
+    def _cache_entries(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of every cached PDF and text entry, oldest first."""
+        entries = []
+        for path in list(self.cache_dir.glob("*.pdf")) + list(self.text_cache_dir.glob("*.json")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    async def _account(self, added_bytes: int) -> None:
         """
-        import time
+        Add a written file to the tracked cache size and evict only when over
+        max_cache_mb. Directory scans and deletes run in a worker thread.
+        """
+        if self._cache_bytes is None:
+            # First write: one scan (which already sees the new file) seeds the total
+            entries = await asyncio.to_thread(self._cache_entries)
+            self._cache_bytes = sum(size for _, size, _ in entries)
+        else:
+            self._cache_bytes += added_bytes
+        if self._cache_bytes <= self.max_cache_bytes or self._evicting:
+            return
+        self._evicting = True
+        try:
+            await asyncio.to_thread(self.clear_cache, None, max_bytes=self.max_cache_bytes)
+        finally:
+            self._evicting = False
 
-        cutoff = time.time() - (older_than_days * 24 * 60 * 60)
-        deleted = 0
+    def clear_cache(self, older_than_days: Optional[int] = 7, *, max_bytes: Optional[int] = None) -> dict:
+        """
+        Evict cached PDFs and extracted text, least recently used first.
 
-        for pdf_file in self.cache_dir.glob("*.pdf"):
-            if pdf_file.stat().st_mtime < cutoff:
-                pdf_file.unlink()
-                deleted += 1
+        Args:
+            older_than_days: Delete anything not used in this many days
+                             (None = age is no reason to delete)
+            max_bytes: Target total cache size (default: max_cache_mb)
 
-        logger.info(f"Cleared {deleted} cached PDFs older than {older_than_days} days")
+        Returns:
+            Dict with deleted file count, freed bytes and remaining bytes
+        """
+        limit = self.max_cache_bytes if max_bytes is None else max_bytes
+        cutoff = time.time() - older_than_days * 24 * 60 * 60 if older_than_days is not None else None
+
+        entries = self._cache_entries()
+        total = sum(size for _, size, _ in entries)
+        deleted = 0
+        freed = 0
+        for mtime, size, path in entries:
+            if total <= limit and (cutoff is None or mtime >= cutoff):
+                continue
+            path.unlink(missing_ok=True)
+            self._digests.pop(path, None)
+            total -= size
+            freed += size
+            deleted += 1
+
+        self._cache_bytes = total
+        if deleted:
+            logger.info(f"Evicted {deleted} PDF cache files ({freed / 1024 / 1024:.1f}MB), {total / 1024 / 1024:.1f}MB remaining")
+        return {"deleted": deleted, "freed_bytes": freed, "remaining_bytes": total}
 
 
 # Singleton instance
@@ -231,15 +516,16 @@ def get_pdf_extractor() -> PDFExtractor:
     return _extractor
 
 
-async def extract_pdf_text(url: str) -> Tuple[str, dict]:
+async def extract_pdf_text(url: str, pages: Optional[Tuple[int, int]] = None) -> Tuple[str, dict]:
     """
     Convenience function to extract text from PDF URL.
 
     Args:
         url: PDF URL
+        pages: Optional inclusive 1-based page range (first, last)
 
     Returns:
         Tuple of (extracted_text, metadata_dict)
     """
     extractor = get_pdf_extractor()
-    return await extractor.extract_from_url(url)
+    return await extractor.extract_from_url(url, pages)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Token-budget prompt packing for evidence-heavy prompts.
+
+Call sites used to cut evidence by fixed character counts (500 chars, 30
+items, the last N goals), which overshoots small context windows and wastes
+large ones. PromptPacker instead fills a token budget:
+
+1. Items are taken greedily by priority (e.g. relevance score, recency).
+   Every included item keeps its title line; an item is only included if
+   its title plus a minimum body share still fits.
+2. The budget left after titles is spread evenly over the included bodies
+   (water-filling: short bodies take only what they need, the rest is
+   shared by the longer ones).
+3. The joined text is re-counted and trimmed until it fits, so the packed
+   section never exceeds its budget whatever the input looks like.
+
+Tokens are counted with tiktoken (cl100k_base) when its encoding is
+available locally, otherwise with a conservative regex heuristic.
+prompt_budget() derives a call site's budget from the model's context
+window in config (llm.prompt_packing), minus the rest of the prompt.
+
+Usage:
+    from core.prompt_packer import PackItem, PromptPacker, prompt_budget
+
+    budget = prompt_budget("synthesis", model, overhead_text=prompt_without_evidence)
+    packed = PromptPacker(budget).pack([
+        PackItem(title=f"[{e.source}] {e.title}", body=e.content, priority=e.relevance_score or 0)
+        for e in evidence
+    ])
+    packed.text, packed.tokens, packed.included, packed.dropped
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTEXT_WINDOW = 128_000
+DEFAULT_RESERVE_OUTPUT_TOKENS = 4_000
+DEFAULT_MAX_CONTENT_TOKENS = 8_000
+
+# Heuristic tokens: letter runs of up to 6, digit runs of up to 3, any other
+# non-space character on its own. Over-counts English slightly (~1.1x vs
+# cl100k) and never under-counts CJK, symbols or random noise by much.
+_HEURISTIC_TOKEN = re.compile(r"[A-Za-z]{1,6}|[0-9]{1,3}|\S")
+
+# Characters per token never exceeded by either counter, for cheap pre-cuts
+# (whitespace runs can be longer, which only makes pre-cuts conservative)
+_MAX_CHARS_PER_TOKEN = 16
+
+
+class TokenCounter:
+    """Counts and truncates text by tokens (tiktoken or heuristic)."""
+
+    def __init__(self, encoding: Any = None):
+        self._encoding = encoding
+        self.name = getattr(encoding, "name", None) or "heuristic"
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        return len(_HEURISTIC_TOKEN.findall(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of `text` with at most `max_tokens` tokens."""
+        if max_tokens <= 0 or not text:
+            return ""
+        text = text[:max_tokens * _MAX_CHARS_PER_TOKEN]
+        if self.count(text) <= max_tokens:
+            return text
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            cut = self._encoding.decode(tokens[:max_tokens])
+            # Decoding can merge differently at the cut; back off until it fits
+            while cut and self.count(cut) > max_tokens:
+                cut = cut[:-1]
+            return cut
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.count(text[:mid]) <= max_tokens:
+                lo = mid
+            else:
+                hi = mid - 1
+        return text[:lo]
+
+
+_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Process-wide counter: tiktoken cl100k_base if loadable, else heuristic."""
+    global _counter
+    if _counter is None:
+        encoding = None
+        try:
+            import tiktoken
+            encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:  # ImportError, or the encoding file cannot be fetched
+            logger.info(f"tiktoken unavailable ({type(e).__name__}), using heuristic token counts")
+        _counter = TokenCounter(encoding)
+    return _counter
+
+
+def count_tokens(text: str) -> int:
+    """Token count of `text` with the process-wide counter."""
+    return get_token_counter().count(text)
+
+
+@dataclass
+class PackItem:
+    """One entry to pack: a title line that is always kept, and a body that may be cut."""
+    title: str
+    body: str = ""
+    priority: float = 0.0
+    key: Any = None  # Caller's handle (e.g. index into the evidence list)
+
+
+@dataclass
+class PackResult:
+    """Packed text plus which items made it in (in output order)."""
+    text: str
+    tokens: int
+    budget: int
+    included: List[PackItem] = field(default_factory=list)
+    dropped: List[PackItem] = field(default_factory=list)
+
+
+class PromptPacker:
+    """Greedy, priority-ordered packing of titled items into a token budget."""
+
+    def __init__(
+        self,
+        budget_tokens: int,
+        counter: Optional[TokenCounter] = None,
+        separator: str = "\n\n",
+        min_body_tokens: int = 24,
+        max_title_tokens: int = 48,
+        keep_order: bool = False,
+    ):
+        """
+        Args:
+            budget_tokens: Hard cap for the packed text
+            counter: Token counter (default: get_token_counter())
+            separator: Joins items
+            min_body_tokens: Body share an item must still get to be included
+            max_title_tokens: Titles longer than this are cut (adversarial titles)
+            keep_order: Emit included items in input order instead of priority order
+        """
+        self.budget = max(0, budget_tokens)
+        self.counter = counter or get_token_counter()
+        self.separator = separator
+        self.min_body_tokens = min_body_tokens
+        self.max_title_tokens = max_title_tokens
+        self.keep_order = keep_order
+
+    def pack(self, items: Sequence[PackItem]) -> PackResult:
+        count = self.counter.count
+        sep_tokens = count(self.separator)
+        ranked = sorted(range(len(items)), key=lambda i: -items[i].priority)  # stable: ties keep input order
+
+        # 1. Titles, greedily by priority
+        chosen: List[int] = []
+        titles: Dict[int, str] = {}
+        body_need: Dict[int, int] = {}
+        used = 0
+        reserved = 0  # Minimum body shares promised to items already chosen
+        for i in ranked:
+            item = items[i]
+            title = self.counter.truncate(item.title, self.max_title_tokens)
+            cost = count(title) + (sep_tokens if chosen else 0)
+            body_tokens = count(item.body[:self.budget * _MAX_CHARS_PER_TOKEN]) if item.body else 0
+            need_now = min(body_tokens + 1, self.min_body_tokens) if body_tokens else 0  # +1: title/body newline
+            if used + reserved + cost + need_now > self.budget:
+                continue
+            chosen.append(i)
+            titles[i] = title
+            body_need[i] = body_tokens + 1 if body_tokens else 0
+            used += cost
+            reserved += need_now
+
+        # 2. Spread the rest evenly over the bodies (water-filling)
+        shares = self._water_fill({i: body_need[i] for i in chosen}, self.budget - used)
+
+        # 3. Assemble, then trim until the whole text fits
+        order = sorted(chosen) if self.keep_order else chosen
+        parts = {i: self._render(titles[i], items[i].body, shares[i]) for i in order}
+        text = self.separator.join(parts[i] for i in order)
+        tokens = count(text)
+        while tokens > self.budget and order:
+            # Boundary merges can cost a few tokens: shave the longest body, or drop the last item
+            longest = max(order, key=lambda i: shares[i])
+            if shares[longest] > 1:
+                shares[longest] -= max(1, tokens - self.budget)
+                parts[longest] = self._render(titles[longest], items[longest].body, shares[longest])
+            else:
+                order.remove(order[-1])
+            text = self.separator.join(parts[i] for i in order)
+            tokens = count(text)
+
+        included = [items[i] for i in order]
+        kept = set(order)
+        return PackResult(
+            text=text,
+            tokens=tokens,
+            budget=self.budget,
+            included=included,
+            dropped=[items[i] for i in range(len(items)) if i not in kept],
+        )
+
+    def _render(self, title: str, body: str, body_tokens: int) -> str:
+        if body_tokens <= 1 or not body:
+            return title
+        return f"{title}\n{self.counter.truncate(body, body_tokens - 1)}"
+
+    @staticmethod
+    def _water_fill(needs: Dict[Any, int], budget: int) -> Dict[Any, int]:
+        """Even split of `budget`; items needing less than their share free the remainder."""
+        shares = {k: 0 for k in needs}
+        pending = {k: n for k, n in needs.items() if n > 0}
+        remaining = max(0, budget)
+        while pending and remaining > 0:
+            share = remaining // len(pending)
+            if share == 0:
+                break
+            satisfied = {k: n for k, n in pending.items() if n <= share}
+            if not satisfied:
+                for k in pending:
+                    shares[k] = share
+                break
+            for k, n in satisfied.items():
+                shares[k] = n
+                remaining -= n
+                del pending[k]
+        return shares
+
+
+def context_window(model: str) -> int:
+    """Context window (tokens) for `model` from llm.prompt_packing.context_windows."""
+    settings = _settings()
+    windows = settings.get("context_windows") or {}
+    if model in windows:
+        return int(windows[model])
+    # "gemini/gemini-2.5-flash" also matches a "gemini-2.5-flash" entry
+    bare = model.split("/", 1)[-1]
+    return int(windows.get(bare, settings.get("default_context_window", DEFAULT_CONTEXT_WINDOW)))
+
+
+def prompt_budget(call_site: str, model: str, overhead_text: str = "") -> int:
+    """
+    Tokens available for packed content at `call_site`.
+
+    min(context window - reserved output - rest of the prompt,
+        llm.prompt_packing.max_content_tokens[call_site])
+    """
+    settings = _settings()
+    caps = settings.get("max_content_tokens") or {}
+    cap = int(caps.get(call_site, DEFAULT_MAX_CONTENT_TOKENS))
+    reserve = int(settings.get("reserve_output_tokens", DEFAULT_RESERVE_OUTPUT_TOKENS))
+    room = context_window(model) - reserve - count_tokens(overhead_text)
+    return max(0, min(room, cap))
+
+
+def packing_enabled() -> bool:
+    return bool(_settings().get("enabled", True))
+
+
+def _settings() -> Dict[str, Any]:
+    from config_loader import config
+    return config.get_raw_config().get("llm", {}).get("prompt_packing", {}) or {}
@@ -6,6 +6,7 @@ Provides:
 - Circuit breaker pattern for sources with strict rate limits
 - Per-second rate limiting (token bucket algorithm)
 - Exponential backoff for 429 errors
+- AIMD adaptive concurrency (AdaptiveConcurrencyLimiter)
 - Integration with config.yaml rate limiting settings
 
 Usage:
@@ -378,6 +379,118 @@ class RateLimiter:
         logger.info("Rate limiter reset")
 
 
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (additive-increase, multiplicative-decrease) concurrency limit.
+
+    Each healthy response grows the limit by 1/limit (about +1 slot per
+    window of `limit` responses). A 429 or a response slower than
+    latency_target_ms multiplies the limit by decrease_factor, at most once
+    per cooldown, so one burst of errors counts as one congestion signal.
+    A 429 also pauses new requests for its Retry-After. A nonzero
+    min_interval_seconds additionally spaces request starts, capping the
+    request rate independently of the concurrency limit.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter(initial=5, maximum=20, min_interval_seconds=0.3)
+        async with limiter.slot():
+            response = await fetch()
+        limiter.record_response(status, latency_ms, retry_after)
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 16,
+        latency_target_ms: float = 10000.0,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 1.0,
+        min_interval_seconds: float = 0.0
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target_ms = latency_target_ms
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._next_start = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one concurrency slot for the duration of a request."""
+        while (delay := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        if self.min_interval_seconds > 0:
+            # Reserve the next start time before sleeping so concurrent callers queue up behind it
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval_seconds
+            if start > now:
+                await asyncio.sleep(start - now)
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with condition:
+                self.in_flight -= 1
+                condition.notify_all()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        self.decreases += 1
+        logger.info(f"Adaptive concurrency decreased to {int(self.limit)}")
+
+    def record_response(
+        self,
+        status: int,
+        latency_ms: float,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """
+        Feed one response back into the limit.
+
+        Args:
+            status: HTTP status (0 for transport errors)
+            latency_ms: Observed request latency
+            retry_after: Seconds from a Retry-After header, if any
+        """
+        if status == 429:
+            self._paused_until = max(self._paused_until, time.monotonic() + (retry_after or self.cooldown_seconds))
+            self._decrease()
+        elif latency_ms > self.latency_target_ms:
+            self._decrease()
+        elif status and status < 500:
+            previous = int(self.limit)
+            self.limit = min(float(self.maximum), self.limit + 1.0 / self.limit)
+            if int(self.limit) > previous:
+                # Waiters re-check the raised limit on the next slot release
+                self.increases += 1
+
+
 # Global singleton instance
 rate_limiter = RateLimiter()
 
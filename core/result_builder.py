@@ -38,6 +38,7 @@ from datetime import datetime, date
 import logging
 
 if TYPE_CHECKING:
+    from core.evidence_record import EvidenceRecord
     from core.raw_result import RawResult
 
 logger = logging.getLogger(__name__)
@@ -292,6 +293,27 @@ class SearchResultBuilder:
             response_time_ms=self._response_time_ms
         )
 
+    def build_record(self, source_id: str) -> 'EvidenceRecord':
+        """
+        Build a compact EvidenceRecord directly (no Pydantic validation).
+
+        The builder's safe_* setters already guarantee what SearchResult
+        validates (non-empty title, bounded snippet), so the result is
+        trusted. Use for bulk internal processing; call .to_evidence() at
+        API/persistence boundaries.
+        """
+        from core.evidence_record import EvidenceRecord
+
+        return EvidenceRecord(
+            title=self._title or "Untitled",
+            source_id=source_id,
+            url=self._url,
+            snippet=self._snippet,
+            date=self._date,
+            metadata=self._metadata,
+            raw_content=self._raw_content,
+        )
+
     def build_with_raw(self) -> Dict[str, Any]:
         """
         Build result dict that includes raw_content field.
@@ -299,6 +321,8 @@ class SearchResultBuilder:
         Returns standard dict format but with additional raw_content
         field for full text. Use this for gradual migration.
         """
+        from core.blob_store import current_blob_store
+
         result = self.build()
         # Add raw_content if available (for three-tier model)
         if self._raw_content is not None:
@@ -306,6 +330,15 @@ class SearchResultBuilder:
         elif self._snippet:
             # If no raw_content set but snippet exists, use snippet as raw
             result["raw_content"] = self._snippet
+
+        # Inside a blob_store_scope(), large payloads go to disk; the result
+        # carries only a reference (Evidence loads it on demand)
+        store = current_blob_store()
+        if store is not None:
+            ref = store.offload(result.get("raw_content"))
+            if ref:
+                result["raw_content"] = None
+                result["raw_content_ref"] = ref
         return result
 
     # === Convenience Class Method ===
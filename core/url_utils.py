@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+URL canonicalization for cache keys and duplicate detection.
+
+Two URLs that point at the same document should produce the same key:
+- Scheme and host lowercased, default ports and "www." dropped
+- Fragment removed
+- Tracking parameters (utm_*, fbclid, gclid, ...) removed
+- Remaining query parameters sorted
+- Trailing slash removed from non-root paths
+
+Usage:
+    from core.url_utils import canonicalize_url
+
+    canonicalize_url("HTTPS://www.Example.com:443/a/?utm_source=x&b=2&a=1#top")
+    # -> "https://example.com/a?a=1&b=2"
+"""
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that never change page content
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "yclid", "_hsenc", "_hsmi", "ref_src", "ref_url", "cmpid", "ocid",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Return a canonical form of url suitable for use as a cache/dedup key.
+
+    Non-HTTP(S) strings are returned stripped but otherwise unchanged.
+
+    Args:
+        url: URL to canonicalize
+
+    Returns:
+        Canonical URL string
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port != DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
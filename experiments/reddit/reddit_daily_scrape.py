@@ -9,10 +9,16 @@ Implements Codex recommendations:
 - Credentials from .env
 - Error handling per-subreddit
 - JSON output to data/reddit/
+
+Pass --async to use the native async client: one listing call per subreddit
+and concurrent comment expansion across submissions, all within Reddit's
+60 req/min budget (instead of sleeping between posts).
 """
 
+import asyncio
 import json
 import os
+import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -20,6 +26,10 @@ from typing import List, Dict
 from dotenv import load_dotenv
 import praw
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from core.http_client import close_shared_session
+from integrations.social.reddit_async_client import AsyncRedditClient
+
 # Load environment variables
 load_dotenv()
 
@@ -166,6 +176,82 @@ def scrape_subreddit(reddit_client, subreddit_name: str, cutoff_time: float) ->
         }
 
 
+def _async_post_to_output(post: Dict, comments: List[Dict]) -> Dict:
+    """Convert a normalized async-client post into the get_post_data() shape."""
+    text = post.get("selftext") or ""
+    return {
+        "id": post["id"],
+        "title": post["title"],
+        "url": post.get("url"),
+        "score": post["score"],
+        "upvote_ratio": post["upvote_ratio"],
+        "num_comments": post["num_comments"],
+        "author": post["author"],
+        "created_utc": post["created_utc"],
+        "created_date": datetime.fromtimestamp(post["created_utc"]).strftime("%Y-%m-%d %H:%M:%S"),
+        "subreddit": post["subreddit"],
+        "text": text[:1000],
+        "is_self": post["is_self"],
+        "link_flair_text": post["link_flair_text"],
+        "permalink": f"https://reddit.com{post['permalink']}",
+        "comments": [
+            {
+                "id": c["id"],
+                "post_id": c["post_id"],
+                "author": c["author"],
+                "score": c["score"],
+                "created_utc": c["created_utc"],
+                "body": c["body"][:500]
+            }
+            for c in comments
+        ]
+    }
+
+
+async def scrape_subreddit_async(client: AsyncRedditClient, subreddit_name: str, cutoff_time: float) -> Dict:
+    """
+    Async equivalent of scrape_subreddit().
+
+    One listing call fetches all post fields; comment trees for every
+    recent post are then expanded concurrently (bounded by the client's
+    request budget instead of fixed sleeps).
+    """
+    try:
+        posts = [p for p in await client.new_posts(subreddit_name, limit=100)
+                 if p["created_utc"] >= cutoff_time]
+        comments_by_post = await client.expand_comments([p["id"] for p in posts])
+        output = [_async_post_to_output(p, comments_by_post.get(p["id"], [])) for p in posts]
+
+        return {
+            "success": True,
+            "subreddit": subreddit_name,
+            "posts": output,
+            "post_count": len(output),
+            "comment_count": sum(len(p["comments"]) for p in output),
+            "error": None
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "subreddit": subreddit_name,
+            "posts": [],
+            "post_count": 0,
+            "comment_count": 0,
+            "error": str(e)
+        }
+
+
+async def scrape_all_async(subreddits: List[str], cutoff_time: float) -> List[Dict]:
+    """Scrape all subreddits concurrently with one shared async client."""
+    client = AsyncRedditClient.from_env(user_agent="SIGINT_Platform_Daily_Scraper/1.0")
+    try:
+        return await asyncio.gather(*(scrape_subreddit_async(client, name, cutoff_time) for name in subreddits))
+    finally:
+        # asyncio.run() closes the loop next; close its pooled aiohttp session first
+        await close_shared_session()
+
+
 def main():
     """Main scraper entry point."""
     print("Reddit Daily Scraper - SIGINT Platform")
@@ -180,14 +266,18 @@ def main():
         print("Please create reddit_config.json with subreddit list.")
         return 1
 
+    use_async = "--async" in sys.argv[1:]
+
     # Get Reddit client
-    try:
-        reddit = get_reddit_client()
-        user = reddit.user.me()
-        print(f"Authenticated as: {user}")
-    except Exception as e:
-        print(f"ERROR: Failed to authenticate with Reddit: {e}")
-        return 1
+    reddit = None
+    if not use_async:
+        try:
+            reddit = get_reddit_client()
+            user = reddit.user.me()
+            print(f"Authenticated as: {user}")
+        except Exception as e:
+            print(f"ERROR: Failed to authenticate with Reddit: {e}")
+            return 1
 
     # Flatten subreddit list from config
     all_subreddits = []
@@ -213,10 +303,15 @@ def main():
     total_posts = 0
     total_comments = 0
 
+    async_results = asyncio.run(scrape_all_async(all_subreddits, cutoff_time)) if use_async else None
+
     for i, subreddit_name in enumerate(all_subreddits, 1):
         print(f"[{i}/{len(all_subreddits)}] Scraping r/{subreddit_name}...")
 
-        result = scrape_subreddit(reddit, subreddit_name, cutoff_time)
+        if use_async:
+            result = async_results[i - 1]
+        else:
+            result = scrape_subreddit(reddit, subreddit_name, cutoff_time)
         results.append(result)
 
         if result["success"]:
@@ -229,7 +324,7 @@ def main():
             print(f"  ✗ Error: {result['error']}")
 
         # Rate limiting between subreddits (Codex recommendation: 1-2s)
-        if i < len(all_subreddits):  # Don't sleep after last one
+        if i < len(all_subreddits) and not use_async:  # Don't sleep after last one
             time.sleep(SLEEP_BETWEEN_SUBREDDITS)
 
     # Save results
@@ -296,21 +296,23 @@ class FBIVaultIntegration(DatabaseIntegration):
             pdfs_extracted = 0
             if extract_pdf and results:
                 pdf_extractor = get_pdf_extractor()
+                # Direct PDF links only; download + extraction run concurrently
+                pdf_urls = [r.get("url", "") for r in results if r.get("url", "").lower().endswith(".pdf")]
+                try:
+                    extracted = await pdf_extractor.extract_many(pdf_urls)
+                except Exception as e:
+                    logger.warning(f"FBI Vault: PDF extraction failed: {e}")
+                    extracted = {}
                 for result in results:
                     url = result.get("url", "")
-                    # Check if URL is a direct PDF link
-                    if url and url.lower().endswith(".pdf"):
-                        try:
-                            pdf_text, pdf_meta = await pdf_extractor.extract_from_url(url)
-                            if pdf_text:
-                                result["raw_content"] = pdf_text
-                                if "metadata" not in result:
-                                    result["metadata"] = {}
-                                result["metadata"]["pdf_extraction"] = pdf_meta
-                                pdfs_extracted += 1
-                                logger.info(f"FBI Vault: Extracted {pdf_meta.get('char_count', 0)} chars from PDF: {url}")
-                        except Exception as e:
-                            logger.warning(f"FBI Vault: PDF extraction failed for {url}: {e}")
+                    pdf_text, pdf_meta = extracted.get(url, ("", {}))
+                    if pdf_text:
+                        result["raw_content"] = pdf_text
+                        if "metadata" not in result:
+                            result["metadata"] = {}
+                        result["metadata"]["pdf_extraction"] = pdf_meta
+                        pdfs_extracted += 1
+                        logger.info(f"FBI Vault: Extracted {pdf_meta.get('char_count', 0)} chars from PDF: {url}")
 
             response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -9,7 +9,7 @@ expenditures, candidate financials, and committee information.
 import json
 import logging
 import os
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from urllib.parse import quote
 import asyncio
@@ -25,6 +25,7 @@ from core.database_integration_base import (
     QueryResult
 )
 from core.api_request_tracker import log_request
+from core.local_warehouse import execution_mode, get_local_warehouse
 from core.result_builder import SearchResultBuilder, build_result
 from config_loader import config
 
@@ -64,8 +65,53 @@ class FECIntegration(DatabaseIntegration):
     API Documentation:
     - https://api.open.fec.gov/developers/
     - Interactive API explorer available
+
+    Local Mode:
+    - databases.fec.execution_mode: local|auto answers the same endpoints from
+      FEC bulk files loaded into core.local_warehouse, with group_by aggregates
     """
 
+    QUERY_PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "endpoint": {
+                "type": "string",
+                "description": "FEC API endpoint to use",
+                "enum": ["candidates", "contributions", "committees", "independent_expenditures"]
+            },
+            "candidate_name": {
+                "type": "string",
+                "description": "Candidate name to search (last name or full name)"
+            },
+            "committee_name": {
+                "type": "string",
+                "description": "Committee/PAC name to search"
+            },
+            "contributor_name": {
+                "type": "string",
+                "description": "Contributor/donor name to search"
+            },
+            "office": {
+                "type": "string",
+                "description": "Office sought: 'P' (President), 'S' (Senate), 'H' (House), (optional)"
+            },
+            "state": {
+                "type": "string",
+                "description": "Two-letter state code (optional)"
+            },
+            "cycle": {
+                "type": "integer",
+                "description": "Election cycle year (2024, 2022, 2020, etc.)"
+            },
+            "party": {
+                "type": "string",
+                "description": "Party code: 'DEM', 'REP', 'IND', etc. (optional)"
+            }
+        },
+        "required": ["endpoint", "candidate_name", "committee_name", "contributor_name", "office", "state", "party"],
+        "additionalProperties": False
+    }
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -150,45 +196,13 @@ class FECIntegration(DatabaseIntegration):
         schema = {
             "type": "object",
             "properties": {
-                "endpoint": {
-                    "type": "string",
-                    "description": "FEC API endpoint to use",
-                    "enum": ["candidates", "contributions", "committees", "independent_expenditures"]
-                },
-                "candidate_name": {
-                    "type": "string",
-                    "description": "Candidate name to search (last name or full name)"
-                },
-                "committee_name": {
-                    "type": "string",
-                    "description": "Committee/PAC name to search"
-                },
-                "contributor_name": {
-                    "type": "string",
-                    "description": "Contributor/donor name to search"
-                },
-                "office": {
-                    "type": "string",
-                    "description": "Office sought: 'P' (President), 'S' (Senate), 'H' (House), (optional)"
-                },
-                "state": {
-                    "type": "string",
-                    "description": "Two-letter state code (optional)"
-                },
-                "cycle": {
-                    "type": "integer",
-                    "description": "Election cycle year (2024, 2022, 2020, etc.)"
-                },
-                "party": {
-                    "type": "string",
-                    "description": "Party code: 'DEM', 'REP', 'IND', etc. (optional)"
-                },
+                **self.QUERY_PARAMS_SCHEMA["properties"],
                 "reasoning": {
                     "type": "string",
                     "description": "Brief explanation of the query strategy"
                 }
             },
-            "required": ["endpoint", "candidate_name", "committee_name", "contributor_name", "office", "state", "party", "reasoning"],
+            "required": self.QUERY_PARAMS_SCHEMA["required"] + ["reasoning"],
             "additionalProperties": False
         }
 
@@ -235,6 +249,12 @@ class FECIntegration(DatabaseIntegration):
         """
         start_time = datetime.now()
 
+        # Local warehouse mode needs no API key - bulk files are already on disk
+        mode = execution_mode("fec", query_params)
+        local_dataset = f"fec_{query_params.get('endpoint', 'candidates')}"
+        if mode == "local" or (mode == "auto" and get_local_warehouse().has_data(local_dataset)):
+            return await self._execute_local(query_params, limit)
+
         if not api_key:
             # Try loading from environment variable (same key as Congress.gov)
             api_key = os.getenv("CONGRESS_API_KEY") or os.getenv("FEC_API_KEY")
@@ -336,53 +356,7 @@ class FECIntegration(DatabaseIntegration):
         )
 
         # Transform results
-        transformed_results = []
-        for candidate in results[:limit]:
-            name = candidate.get("name", "Unknown Candidate")
-            office_full = candidate.get("office_full", "")
-            state = candidate.get("state", "")
-            party_full = candidate.get("party_full", "")
-            candidate_id = candidate.get("candidate_id", "")
-
-            # Build profile URL
-            url = f"https://www.fec.gov/data/candidate/{candidate_id}/" if candidate_id else ""
-
-            # Build snippet with financial summary if available
-            snippet_parts = []
-            if office_full and state:
-                snippet_parts.append(f"{office_full} - {state}")
-            if party_full:
-                snippet_parts.append(f"Party: {party_full}")
-
-            # Add cycle info
-            cycles = candidate.get("cycles", [])
-            if cycles:
-                snippet_parts.append(f"Cycles: {', '.join(map(str, cycles))}")
-
-            snippet = " | ".join(snippet_parts) if snippet_parts else "Federal candidate"
-
-            # Three-tier model: preserve full content with build_with_raw()
-            transformed = (SearchResultBuilder()
-                .title(name, default="Unknown Candidate")
-                .url(url)
-                .snippet(snippet, max_length=500)
-                .raw_content(snippet)  # Full content, never truncated
-                .date(None)  # Candidates don't have a single date
-                .api_response(candidate)  # Preserve complete API response
-                .metadata({
-                    "candidate_id": candidate_id,
-                    "office": candidate.get("office"),
-                    "office_full": office_full,
-                    "state": state,
-                    "district": candidate.get("district"),
-                    "party": candidate.get("party"),
-                    "party_full": party_full,
-                    "cycles": cycles,
-                    "incumbent_challenge": candidate.get("incumbent_challenge_full"),
-                    "candidate_status": candidate.get("candidate_status")
-                })
-                .build_with_raw())
-            transformed_results.append(transformed)
+        transformed_results = [self._candidate_to_result(candidate) for candidate in results[:limit]]
 
         return QueryResult(
             success=True,
@@ -439,50 +413,7 @@ class FECIntegration(DatabaseIntegration):
         )
 
         # Transform results using defensive builder
-        transformed_results = []
-        for contrib in results[:limit]:
-            contributor = SearchResultBuilder.safe_text(
-                contrib.get("contributor_name"), "Unknown Contributor"
-            )
-            amount = SearchResultBuilder.safe_amount(contrib.get("contribution_receipt_amount"))
-            recipient = SearchResultBuilder.safe_text(
-                contrib.get("committee", {}).get("name"), "Unknown Committee"
-            )
-            date = contrib.get("contribution_receipt_date", "")
-
-            # Build specific URL to receipt with all available filters
-            committee_id = contrib.get("committee_id", "")
-            contributor_name = contrib.get("contributor_name", "")
-            url_params = ["data_type=processed"]
-            if committee_id:
-                url_params.append(f"committee_id={committee_id}")
-            if contributor_name:
-                url_params.append(f"contributor_name={quote(contributor_name)}")
-            if date:
-                url_params.append(f"min_date={date}&max_date={date}")
-            url = f"https://www.fec.gov/data/receipts/?{'&'.join(url_params)}"
-
-            snippet_text = f"Amount: {SearchResultBuilder.format_amount(amount)} | Date: {date} | Employer: {contrib.get('contributor_employer', 'N/A')}"
-            # Three-tier model: preserve full content with build_with_raw()
-            transformed = (SearchResultBuilder()
-                .title(f"{SearchResultBuilder.format_amount(amount)} from {contributor} to {recipient}")
-                .url(url)
-                .snippet(snippet_text)
-                .raw_content(snippet_text)  # Full content, never truncated
-                .date(date)
-                .api_response(contrib)  # Preserve complete API response
-                .metadata({
-                    "contributor_name": contributor,
-                    "contributor_employer": contrib.get("contributor_employer"),
-                    "contributor_occupation": contrib.get("contributor_occupation"),
-                    "amount": amount,
-                    "date": date,
-                    "recipient_committee": recipient,
-                    "recipient_committee_id": contrib.get("committee_id"),
-                    "transaction_id": contrib.get("transaction_id")
-                })
-                .build_with_raw())
-            transformed_results.append(transformed)
+        transformed_results = [self._contribution_to_result(contrib) for contrib in results[:limit]]
 
         return QueryResult(
             success=True,
@@ -539,35 +470,7 @@ class FECIntegration(DatabaseIntegration):
         )
 
         # Transform results
-        transformed_results = []
-        for committee in results[:limit]:
-            name = committee.get("name", "Unknown Committee")
-            committee_id = committee.get("committee_id", "")
-            committee_type = committee.get("committee_type_full", "")
-
-            url = f"https://www.fec.gov/data/committee/{committee_id}/" if committee_id else ""
-
-            party_full = SearchResultBuilder.safe_text(committee.get('party_full'), default='N/A')
-            snippet = f"Type: {committee_type} | Party: {party_full}"
-
-            # Three-tier model: preserve full content with build_with_raw()
-            transformed = (SearchResultBuilder()
-                .title(name, default="Unknown Committee")
-                .url(url)
-                .snippet(snippet, max_length=500)
-                .raw_content(snippet)  # Full content, never truncated
-                .date(None)
-                .api_response(committee)  # Preserve complete API response
-                .metadata({
-                    "committee_id": committee_id,
-                    "committee_type": committee.get("committee_type"),
-                    "committee_type_full": committee_type,
-                    "party": committee.get("party"),
-                    "designation": committee.get("designation_full"),
-                    "treasurer_name": committee.get("treasurer_name")
-                })
-                .build_with_raw())
-            transformed_results.append(transformed)
+        transformed_results = [self._committee_to_result(committee) for committee in results[:limit]]
 
         return QueryResult(
             success=True,
@@ -622,41 +525,7 @@ class FECIntegration(DatabaseIntegration):
         )
 
         # Transform results using defensive builder
-        transformed_results = []
-        for expenditure in results[:limit]:
-            amount = SearchResultBuilder.safe_amount(expenditure.get("expenditure_amount"))
-            spender = SearchResultBuilder.safe_text(
-                expenditure.get("committee", {}).get("name"), "Unknown"
-            )
-            candidate = SearchResultBuilder.safe_text(
-                expenditure.get("candidate_name"), "Unknown"
-            )
-            support_oppose = expenditure.get("support_oppose_indicator", "")
-            action = "supporting" if support_oppose == "S" else "opposing"
-
-            # Build specific URL to committee that made the expenditure
-            committee_id = expenditure.get("committee", {}).get("committee_id", "") or expenditure.get("committee_id", "")
-            url = f"https://www.fec.gov/data/committee/{committee_id}/" if committee_id else "https://www.fec.gov/data/independent-expenditures/"
-
-            snippet_text = f"Amount: {SearchResultBuilder.format_amount(amount)} | Purpose: {SearchResultBuilder.safe_text(expenditure.get('expenditure_description'), 'N/A', 100)}"
-            # Three-tier model: preserve full content with build_with_raw()
-            transformed = (SearchResultBuilder()
-                .title(f"{SearchResultBuilder.format_amount(amount)} by {spender} {action} {candidate}")
-                .url(url)
-                .snippet(snippet_text)
-                .raw_content(expenditure.get("expenditure_description") or snippet_text)  # Full content
-                .date(expenditure.get("expenditure_date"))
-                .api_response(expenditure)  # Preserve complete API response
-                .metadata({
-                    "amount": amount,
-                    "spender": spender,
-                    "candidate_name": candidate,
-                    "support_oppose": "Support" if support_oppose == "S" else "Oppose",
-                    "purpose": expenditure.get("expenditure_description"),
-                    "date": expenditure.get("expenditure_date")
-                })
-                .build_with_raw())
-            transformed_results.append(transformed)
+        transformed_results = [self._expenditure_to_result(expenditure) for expenditure in results[:limit]]
 
         return QueryResult(
             success=True,
@@ -670,3 +539,438 @@ class FECIntegration(DatabaseIntegration):
                 "pagination": data.get("pagination", {})
             }
         )
+
+    # =========================================================================
+    # Result normalization (shared by API and local warehouse modes)
+    # =========================================================================
+
+    def _candidate_to_result(self, candidate: Dict) -> Dict:
+        """Normalize one candidate record (API response or local warehouse row)."""
+        name = candidate.get("name", "Unknown Candidate")
+        office_full = candidate.get("office_full", "")
+        state = candidate.get("state", "")
+        party_full = candidate.get("party_full", "")
+        candidate_id = candidate.get("candidate_id", "")
+
+        # Build profile URL
+        url = f"https://www.fec.gov/data/candidate/{candidate_id}/" if candidate_id else ""
+
+        # Build snippet with financial summary if available
+        snippet_parts = []
+        if office_full and state:
+            snippet_parts.append(f"{office_full} - {state}")
+        if party_full:
+            snippet_parts.append(f"Party: {party_full}")
+
+        # Add cycle info
+        cycles = candidate.get("cycles", [])
+        if cycles:
+            snippet_parts.append(f"Cycles: {', '.join(map(str, cycles))}")
+
+        snippet = " | ".join(snippet_parts) if snippet_parts else "Federal candidate"
+
+        # Three-tier model: preserve full content with build_with_raw()
+        return (SearchResultBuilder()
+            .title(name, default="Unknown Candidate")
+            .url(url)
+            .snippet(snippet, max_length=500)
+            .raw_content(snippet)  # Full content, never truncated
+            .date(None)  # Candidates don't have a single date
+            .api_response(candidate)  # Preserve complete API response
+            .metadata({
+                "candidate_id": candidate_id,
+                "office": candidate.get("office"),
+                "office_full": office_full,
+                "state": state,
+                "district": candidate.get("district"),
+                "party": candidate.get("party"),
+                "party_full": party_full,
+                "cycles": cycles,
+                "incumbent_challenge": candidate.get("incumbent_challenge_full"),
+                "candidate_status": candidate.get("candidate_status")
+            })
+            .build_with_raw())
+
+    def _contribution_to_result(self, contrib: Dict) -> Dict:
+        """Normalize one Schedule A contribution (API response or local warehouse row)."""
+        contributor = SearchResultBuilder.safe_text(
+            contrib.get("contributor_name"), "Unknown Contributor"
+        )
+        amount = SearchResultBuilder.safe_amount(contrib.get("contribution_receipt_amount"))
+        recipient = SearchResultBuilder.safe_text(
+            contrib.get("committee", {}).get("name"), "Unknown Committee"
+        )
+        date = contrib.get("contribution_receipt_date", "")
+
+        # Build specific URL to receipt with all available filters
+        committee_id = contrib.get("committee_id", "")
+        contributor_name = contrib.get("contributor_name", "")
+        url_params = ["data_type=processed"]
+        if committee_id:
+            url_params.append(f"committee_id={committee_id}")
+        if contributor_name:
+            url_params.append(f"contributor_name={quote(contributor_name)}")
+        if date:
+            url_params.append(f"min_date={date}&max_date={date}")
+        url = f"https://www.fec.gov/data/receipts/?{'&'.join(url_params)}"
+
+        snippet_text = f"Amount: {SearchResultBuilder.format_amount(amount)} | Date: {date} | Employer: {contrib.get('contributor_employer', 'N/A')}"
+        # Three-tier model: preserve full content with build_with_raw()
+        return (SearchResultBuilder()
+            .title(f"{SearchResultBuilder.format_amount(amount)} from {contributor} to {recipient}")
+            .url(url)
+            .snippet(snippet_text)
+            .raw_content(snippet_text)  # Full content, never truncated
+            .date(date)
+            .api_response(contrib)  # Preserve complete API response
+            .metadata({
+                "contributor_name": contributor,
+                "contributor_employer": contrib.get("contributor_employer"),
+                "contributor_occupation": contrib.get("contributor_occupation"),
+                "amount": amount,
+                "date": date,
+                "recipient_committee": recipient,
+                "recipient_committee_id": contrib.get("committee_id"),
+                "transaction_id": contrib.get("transaction_id")
+            })
+            .build_with_raw())
+
+    def _committee_to_result(self, committee: Dict) -> Dict:
+        """Normalize one committee record (API response or local warehouse row)."""
+        name = committee.get("name", "Unknown Committee")
+        committee_id = committee.get("committee_id", "")
+        committee_type = committee.get("committee_type_full", "")
+
+        url = f"https://www.fec.gov/data/committee/{committee_id}/" if committee_id else ""
+
+        party_full = SearchResultBuilder.safe_text(committee.get('party_full'), default='N/A')
+        snippet = f"Type: {committee_type} | Party: {party_full}"
+
+        # Three-tier model: preserve full content with build_with_raw()
+        return (SearchResultBuilder()
+            .title(name, default="Unknown Committee")
+            .url(url)
+            .snippet(snippet, max_length=500)
+            .raw_content(snippet)  # Full content, never truncated
+            .date(None)
+            .api_response(committee)  # Preserve complete API response
+            .metadata({
+                "committee_id": committee_id,
+                "committee_type": committee.get("committee_type"),
+                "committee_type_full": committee_type,
+                "party": committee.get("party"),
+                "designation": committee.get("designation_full"),
+                "treasurer_name": committee.get("treasurer_name")
+            })
+            .build_with_raw())
+
+    def _expenditure_to_result(self, expenditure: Dict) -> Dict:
+        """Normalize one Schedule E independent expenditure (API response or local warehouse row)."""
+        amount = SearchResultBuilder.safe_amount(expenditure.get("expenditure_amount"))
+        spender = SearchResultBuilder.safe_text(
+            expenditure.get("committee", {}).get("name"), "Unknown"
+        )
+        candidate = SearchResultBuilder.safe_text(
+            expenditure.get("candidate_name"), "Unknown"
+        )
+        support_oppose = expenditure.get("support_oppose_indicator", "")
+        action = "supporting" if support_oppose == "S" else "opposing"
+
+        # Build specific URL to committee that made the expenditure
+        committee_id = expenditure.get("committee", {}).get("committee_id", "") or expenditure.get("committee_id", "")
+        url = f"https://www.fec.gov/data/committee/{committee_id}/" if committee_id else "https://www.fec.gov/data/independent-expenditures/"
+
+        snippet_text = f"Amount: {SearchResultBuilder.format_amount(amount)} | Purpose: {SearchResultBuilder.safe_text(expenditure.get('expenditure_description'), 'N/A', 100)}"
+        # Three-tier model: preserve full content with build_with_raw()
+        return (SearchResultBuilder()
+            .title(f"{SearchResultBuilder.format_amount(amount)} by {spender} {action} {candidate}")
+            .url(url)
+            .snippet(snippet_text)
+            .raw_content(expenditure.get("expenditure_description") or snippet_text)  # Full content
+            .date(expenditure.get("expenditure_date"))
+            .api_response(expenditure)  # Preserve complete API response
+            .metadata({
+                "amount": amount,
+                "spender": spender,
+                "candidate_name": candidate,
+                "support_oppose": "Support" if support_oppose == "S" else "Oppose",
+                "purpose": expenditure.get("expenditure_description"),
+                "date": expenditure.get("expenditure_date")
+            })
+            .build_with_raw())
+
+    # =========================================================================
+    # Local warehouse mode
+    # =========================================================================
+
+    # group_by names accepted in local mode, per endpoint -> local row column
+    LOCAL_GROUP_COLUMNS = {
+        "contributions": {
+            "contributor": "contributor_name",
+            "employer": "contributor_employer",
+            "occupation": "contributor_occupation",
+            "committee": "committee_name",
+            "state": "contributor_state",
+        },
+        "independent_expenditures": {
+            "spender": "committee_name",
+            "candidate": "candidate_name",
+            "support_oppose": "support_oppose_indicator",
+        },
+    }
+
+    OFFICE_NAMES = {"H": "House", "S": "Senate", "P": "President"}
+    INCUMBENT_CHALLENGE = {"I": "Incumbent", "C": "Challenger", "O": "Open seat"}
+    COMMITTEE_TYPES = {
+        "C": "Communication cost", "D": "Delegate committee", "E": "Electioneering communication",
+        "H": "House", "I": "Independent expenditor (person or group)", "N": "PAC - nonqualified",
+        "O": "Super PAC (independent expenditure-only)", "P": "Presidential", "Q": "PAC - qualified",
+        "S": "Senate", "U": "Single-candidate independent expenditure",
+        "V": "Hybrid PAC (with non-contribution account) - nonqualified",
+        "W": "Hybrid PAC (with non-contribution account) - qualified",
+        "X": "Party - nonqualified", "Y": "Party - qualified", "Z": "National party nonfederal account",
+    }
+    COMMITTEE_DESIGNATIONS = {
+        "A": "Authorized by a candidate", "B": "Lobbyist/Registrant PAC", "D": "Leadership PAC",
+        "J": "Joint fundraising committee", "P": "Principal campaign committee", "U": "Unauthorized",
+    }
+
+    # Latest name per committee across ingested cycles (for joins)
+    _COMMITTEE_NAMES_SQL = (
+        "SELECT committee_id, arg_max(committee_name, cycle) AS committee_name "
+        "FROM fec_committees GROUP BY committee_id"
+    )
+
+    def _local_base_sql(self, endpoint_type: str, query_params: Dict) -> Tuple[str, List, str, str]:
+        """
+        Build the row-level SELECT for one endpoint over the local warehouse.
+
+        Columns use the FEC API's field names so the normal _*_to_result()
+        transforms apply unchanged.
+
+        Returns:
+            Tuple of (sql, params, ORDER BY expression, amount column for group_by)
+        """
+        clauses, params = [], []
+
+        def contains(column: str, key: str) -> None:
+            if query_params.get(key):
+                clauses.append(f"{column} ILIKE ?")
+                params.append(f"%{query_params[key]}%")
+
+        def equals(column: str, key: str) -> None:
+            if query_params.get(key):
+                clauses.append(f"{column} = ?")
+                params.append(query_params[key])
+
+        if endpoint_type == "candidates":
+            contains("candidate_name", "candidate_name")
+            equals("office", "office")
+            equals("office_state", "state")
+            equals("party", "party")
+            equals("election_year", "cycle")
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = f"""
+                SELECT candidate_id,
+                       arg_max(candidate_name, election_year) AS name,
+                       arg_max(office, election_year) AS office,
+                       arg_max(office_state, election_year) AS state,
+                       arg_max(district, election_year) AS district,
+                       arg_max(party, election_year) AS party,
+                       arg_max(incumbent_challenge, election_year) AS incumbent_challenge,
+                       arg_max(status, election_year) AS candidate_status,
+                       list(DISTINCT election_year ORDER BY election_year) AS cycles,
+                       MAX(election_year) AS latest_cycle
+                FROM fec_candidates
+                {where}
+                GROUP BY candidate_id
+            """
+            return sql, params, "latest_cycle DESC, name", "NULL"
+
+        if endpoint_type == "contributions":
+            contains("c.contributor_name", "contributor_name")
+            equals("c.cycle", "cycle")
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            sql = f"""
+                SELECT c.contributor_name,
+                       c.amount AS contribution_receipt_amount,
+                       c.date AS contribution_receipt_date,
+                       c.committee_id,
+                       m.committee_name,
+                       c.employer AS contributor_employer,
+                       c.occupation AS contributor_occupation,
+                       c.state AS contributor_state,
+                       c.transaction_id
+                FROM fec_contributions c
+                LEFT JOIN ({self._COMMITTEE_NAMES_SQL}) m ON m.committee_id = c.committee_id
+                {where}
+            """
+            return sql, params, "contribution_receipt_amount DESC NULLS LAST", "contribution_receipt_amount"
+
+        if endpoint_type == "committees":
+            contains("m.committee_name", "committee_name")
+            equals("m.cycle", "cycle")
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            # API sorts committees by receipts; locally that's summed itemized contributions
+            sql = f"""
+                SELECT m.committee_id,
+                       arg_max(m.committee_name, m.cycle) AS name,
+                       arg_max(m.committee_type, m.cycle) AS committee_type,
+                       arg_max(m.party, m.cycle) AS party,
+                       arg_max(m.designation, m.cycle) AS designation,
+                       arg_max(m.treasurer_name, m.cycle) AS treasurer_name,
+                       ANY_VALUE(r.receipts) AS receipts
+                FROM fec_committees m
+                LEFT JOIN (
+                    SELECT committee_id, SUM(amount) AS receipts FROM fec_contributions GROUP BY committee_id
+                ) r ON r.committee_id = m.committee_id
+                {where}
+                GROUP BY m.committee_id
+            """
+            return sql, params, "receipts DESC NULLS LAST, name", "receipts"
+
+        # independent_expenditures
+        equals("cycle", "cycle")
+        contains("candidate_name", "candidate_name")
+        contains("committee_name", "committee_name")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"""
+            SELECT amount AS expenditure_amount,
+                   committee_id,
+                   committee_name,
+                   candidate_name,
+                   support_oppose AS support_oppose_indicator,
+                   purpose AS expenditure_description,
+                   date AS expenditure_date
+            FROM fec_independent_expenditures
+            {where}
+        """
+        return sql, params, "expenditure_amount DESC NULLS LAST", "expenditure_amount"
+
+    def _local_row_to_api_shape(self, endpoint_type: str, row: Dict) -> Dict:
+        """Fill in the nested/descriptive fields the API would have returned."""
+        if endpoint_type == "candidates":
+            row["office_full"] = self.OFFICE_NAMES.get(row.get("office"), row.get("office") or "")
+            row["party_full"] = row.get("party") or ""
+            row["incumbent_challenge_full"] = self.INCUMBENT_CHALLENGE.get(row.get("incumbent_challenge"))
+        elif endpoint_type == "committees":
+            row["committee_type_full"] = self.COMMITTEE_TYPES.get(row.get("committee_type"), row.get("committee_type") or "")
+            row["party_full"] = row.get("party")
+            row["designation_full"] = self.COMMITTEE_DESIGNATIONS.get(row.get("designation"))
+        else:
+            row["committee"] = {"name": row.get("committee_name"), "committee_id": row.get("committee_id")}
+        return row
+
+    async def _execute_local(self, query_params: Dict, limit: int) -> QueryResult:
+        """
+        Answer query_params from the local Parquet/DuckDB warehouse (FEC bulk files).
+
+        Supports the same endpoints and filters as the API path. For
+        contributions and independent_expenditures, query_params["group_by"]
+        (keys of LOCAL_GROUP_COLUMNS) returns aggregate rows instead - e.g.
+        ["employer"] for the top employers of donors to a committee.
+        """
+        start_time = datetime.now()
+        endpoint_type = query_params.get("endpoint", "candidates")
+        if endpoint_type not in ("candidates", "contributions", "committees", "independent_expenditures"):
+            return QueryResult(
+                success=False,
+                source="FEC",
+                total=0,
+                results=[],
+                query_params=query_params,
+                error=f"Unknown endpoint type: {endpoint_type}",
+                http_code=None  # Validation error, not HTTP
+            )
+
+        group_by = query_params.get("group_by") or []
+        group_columns = self.LOCAL_GROUP_COLUMNS.get(endpoint_type, {})
+        unknown = [g for g in group_by if g not in group_columns]
+        if unknown:
+            return QueryResult(
+                success=False,
+                source="FEC",
+                total=0,
+                results=[],
+                query_params=query_params,
+                error=f"Unsupported group_by for local {endpoint_type}: {unknown} (use {sorted(group_columns)})",
+                http_code=None  # Validation error, not HTTP
+            )
+
+        base_sql, params, order_by, amount_column = self._local_base_sql(endpoint_type, query_params)
+        if group_by:
+            columns = ", ".join(group_columns[g] for g in group_by)
+            sql = f"""
+                SELECT {columns},
+                       SUM({amount_column}) AS total_amount,
+                       COUNT(*) AS record_count,
+                       COUNT(*) OVER () AS _total
+                FROM ({base_sql})
+                GROUP BY {columns}
+                ORDER BY total_amount DESC NULLS LAST
+                LIMIT ?
+            """
+        else:
+            sql = f"SELECT *, COUNT(*) OVER () AS _total FROM ({base_sql}) ORDER BY {order_by} LIMIT ?"
+        params.append(limit)
+
+        try:
+            rows = await get_local_warehouse().aquery(sql, params)
+        except Exception as e:
+            # Catch-all at integration boundary - DuckDB missing or unreadable Parquet
+            logger.error(f"FEC local query failed: {e}", exc_info=True)
+            return QueryResult(
+                success=False,
+                source="FEC",
+                total=0,
+                results=[],
+                query_params=query_params,
+                error=f"Local warehouse query failed: {str(e)}",
+                http_code=None  # Non-HTTP error
+            )
+        response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+
+        total = rows[0]["_total"] if rows else 0
+        for row in rows:
+            row.pop("_total")
+
+        if group_by:
+            results = [self._group_to_result(row, [group_columns[g] for g in group_by], endpoint_type) for row in rows]
+        else:
+            transform = {
+                "candidates": self._candidate_to_result,
+                "contributions": self._contribution_to_result,
+                "committees": self._committee_to_result,
+                "independent_expenditures": self._expenditure_to_result,
+            }[endpoint_type]
+            results = [transform(self._local_row_to_api_shape(endpoint_type, row)) for row in rows]
+
+        return QueryResult(
+            success=True,
+            source="FEC",
+            total=total,
+            results=results,
+            query_params=query_params,
+            response_time_ms=response_time_ms,
+            metadata={
+                "execution_mode": "local",
+                "endpoint": endpoint_type,
+                "group_by": group_by
+            }
+        )
+
+    def _group_to_result(self, row: Dict, columns: List[str], endpoint_type: str) -> Dict:
+        """Normalize one aggregate row from local mode into a result dict."""
+        labels = [str(row.get(column) or "Unknown") for column in columns]
+        noun = "contributions" if endpoint_type == "contributions" else "expenditures"
+        snippet = f"{SearchResultBuilder.format_amount(row.get('total_amount'))} across {row.get('record_count', 0)} {noun}"
+
+        return (SearchResultBuilder()
+            .title(" / ".join(labels))
+            .url(f"https://www.fec.gov/search/?query={quote(labels[0])}")
+            .snippet(snippet)
+            .raw_content(snippet)
+            .date(None)
+            .api_response(row)
+            .metadata(row)
+            .build_with_raw())
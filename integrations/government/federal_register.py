@@ -55,6 +55,37 @@ class FederalRegisterIntegration(DatabaseIntegration):
     - Use date range filters to get more results if needed
     """
 
+    # documents.json pages are 1-based; next_page_url is absent on the last page
+    PAGINATION_PARAM = "page"
+
+    QUERY_PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "term": {
+                "type": "string",
+                "description": "Search term for document titles and text"
+            },
+            "document_types": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of document types, empty for all"
+            },
+            "agencies": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of agency slugs, empty if not specified"
+            },
+            "date_range_days": {
+                "type": "integer",
+                "description": "Days back to search, 1-730",
+                "minimum": 1,
+                "maximum": 730
+            }
+        },
+        "required": ["term", "document_types", "agencies", "date_range_days"],
+        "additionalProperties": False
+    }
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -145,32 +176,13 @@ class FederalRegisterIntegration(DatabaseIntegration):
         schema = {
             "type": "object",
             "properties": {
-                                "term": {
-                    "type": "string",
-                    "description": "Search term for document titles and text"
-                },
-                "document_types": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of document types, empty for all"
-                },
-                "agencies": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of agency slugs, empty if not specified"
-                },
-                "date_range_days": {
-                    "type": "integer",
-                    "description": "Days back to search, 1-730",
-                    "minimum": 1,
-                    "maximum": 730
-                },
+                **self.QUERY_PARAMS_SCHEMA["properties"],
                 "reasoning": {
                     "type": "string",
                     "description": "Brief explanation of the query strategy"
                 }
             },
-            "required": ["term", "document_types", "agencies", "date_range_days", "reasoning"],
+            "required": self.QUERY_PARAMS_SCHEMA["required"] + ["reasoning"],
             "additionalProperties": False
         }
 
@@ -200,6 +212,12 @@ class FederalRegisterIntegration(DatabaseIntegration):
             "date_range_days": result["date_range_days"]
         }
 
+    def next_page_cursor(self, result: QueryResult, query_params: Dict) -> Optional[int]:
+        """Next 1-based page number, or None when the API reports no next_page_url."""
+        if not result.metadata.get("next_page_url"):
+            return None
+        return result.metadata.get("page", 1) + 1
+
     async def execute_search(self,
                            query_params: Dict,
                            api_key: Optional[str] = None,
@@ -262,6 +280,8 @@ class FederalRegisterIntegration(DatabaseIntegration):
                 "per_page": min(limit, 1000),  # Max 1000 per request
                 "order": "newest",  # Most recent first
             }
+            if query_params.get("page"):
+                params["page"] = query_params["page"]
 
             # Add search term if specified
             if query_params.get("term"):
@@ -355,6 +375,7 @@ class FederalRegisterIntegration(DatabaseIntegration):
                 response_time_ms=response_time_ms,
                 metadata={
                     "api_url": endpoint,
+                    "page": query_params.get("page", 1),
                     "next_page_url": data.get("next_page_url"),
                     "total_pages": data.get("total_pages", 1)
                 }
@@ -11,7 +11,7 @@ import json
 import logging
 from typing import Dict, Optional
 from datetime import datetime
-import asyncio
+from urllib.parse import parse_qs, urlsplit
 import requests
 from llm_utils import acompletion
 from core.prompt_loader import render_prompt
@@ -25,6 +25,7 @@ from core.database_integration_base import (
 )
 from core.result_builder import SearchResultBuilder
 from core.api_request_tracker import log_request
+from core.http_client import hedged_call
 from config_loader import config
 
 # Set up logger for this module
@@ -65,6 +66,9 @@ class GovInfoIntegration(DatabaseIntegration):
     - https://github.com/usgpo/api
     """
 
+    # Both search and collections APIs page with an opaque offsetMark ("*" = first page)
+    PAGINATION_PARAM = "offset_mark"
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -234,6 +238,21 @@ class GovInfoIntegration(DatabaseIntegration):
             "sort_by": result["sort_by"]
         }
 
+    def next_page_cursor(self, result: QueryResult, query_params: Dict) -> Optional[str]:
+        """offsetMark for the next page, or None once GovInfo stops returning one."""
+        next_mark = result.metadata.get("next_offset_mark")
+        if not next_mark or next_mark == query_params.get("offset_mark"):
+            return None
+        return next_mark
+
+    @staticmethod
+    def _offset_mark_from_url(next_page_url: Optional[str]) -> Optional[str]:
+        """Extract offsetMark from a collections API nextPage link."""
+        if not next_page_url:
+            return None
+        marks = parse_qs(urlsplit(next_page_url).query).get("offsetMark")
+        return marks[0] if marks else None
+
     async def execute_search(self,
                            query_params: Dict,
                            api_key: Optional[str] = None,
@@ -286,18 +305,18 @@ class GovInfoIntegration(DatabaseIntegration):
                 start_date_iso = cutoff_date.strftime("%Y-%m-%dT%H:%M:%SZ")
                 endpoint = f"https://api.govinfo.gov/collections/{collection_code}/{start_date_iso}"
 
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
+                response = await hedged_call(
+                    "govinfo",
                     lambda: requests.get(
                         endpoint,
                         params={
                             "api_key": api_key,
-                            "offset": 0,
+                            "offsetMark": query_params.get("offset_mark", "*"),
                             "pageSize": min(limit, 100)
                         },
                         timeout=30
-                    )
+                    ),
+                    rate_limit_name=self.metadata.name
                 )
                 response.raise_for_status()
                 response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
@@ -305,6 +324,7 @@ class GovInfoIntegration(DatabaseIntegration):
                 data = response.json()
                 raw_results = data.get("packages", [])
                 total = data.get("count", len(raw_results))
+                next_offset_mark = self._offset_mark_from_url(data.get("nextPage"))
 
                 # Filter by search terms if provided
                 if search_terms:
@@ -346,7 +366,7 @@ class GovInfoIntegration(DatabaseIntegration):
                 payload = {
                     "query": full_query,
                     "pageSize": min(limit, 100),
-                    "offsetMark": "*",
+                    "offsetMark": query_params.get("offset_mark", "*"),
                     "sorts": [
                         {
                             "field": query_params.get("sort_by", "publishdate"),
@@ -355,16 +375,17 @@ class GovInfoIntegration(DatabaseIntegration):
                     ]
                 }
 
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
+                # Search is a read-only query, so hedging the POST is safe
+                response = await hedged_call(
+                    "govinfo",
                     lambda: requests.post(
                         endpoint,
                         params={"api_key": api_key},
                         json=payload,
                         headers={"Content-Type": "application/json"},
                         timeout=30
-                    )
+                    ),
+                    rate_limit_name=self.metadata.name
                 )
                 response.raise_for_status()
                 response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
@@ -372,10 +393,21 @@ class GovInfoIntegration(DatabaseIntegration):
                 data = response.json()
                 raw_results = data.get("results", [])
                 total = data.get("count", len(raw_results))
+                next_offset_mark = data.get("offsetMark")
 
             # Transform to standardized format
             transformed_results = []
-            pdf_extractor = get_pdf_extractor() if extract_pdf else None
+            # Download + extract all PDFs concurrently before building results
+            pdf_texts = {}
+            if extract_pdf:
+                pdf_urls = [
+                    f"https://www.govinfo.gov/content/pkg/{doc['packageId']}/pdf/{doc['packageId']}.pdf"
+                    for doc in raw_results[:limit] if doc.get("packageId")
+                ]
+                try:
+                    pdf_texts = await get_pdf_extractor().extract_many(pdf_urls)
+                except Exception as e:
+                    logger.warning(f"GovInfo: PDF extraction failed: {e}")
 
             for doc in raw_results[:limit]:
                 # Extract fields from GovInfo response
@@ -403,15 +435,12 @@ class GovInfoIntegration(DatabaseIntegration):
                 # Extract PDF text if requested and PDF URL exists
                 raw_content = snippet
                 pdf_metadata = None
-                if extract_pdf and pdf_url and pdf_extractor:
-                    try:
-                        pdf_text, pdf_meta = await pdf_extractor.extract_from_url(pdf_url)
-                        if pdf_text:
-                            raw_content = pdf_text
-                            pdf_metadata = pdf_meta
-                            logger.info(f"GovInfo: Extracted {pdf_meta.get('char_count', 0)} chars from PDF: {package_id}")
-                    except Exception as e:
-                        logger.warning(f"GovInfo: PDF extraction failed for {package_id}: {e}")
+                if pdf_url in pdf_texts:
+                    pdf_text, pdf_meta = pdf_texts[pdf_url]
+                    if pdf_text:
+                        raw_content = pdf_text
+                        pdf_metadata = pdf_meta
+                        logger.info(f"GovInfo: Extracted {pdf_meta.get('char_count', 0)} chars from PDF: {package_id}")
 
                 # Three-tier model: preserve full content with build_with_raw()
                 metadata_dict = {
@@ -458,7 +487,8 @@ class GovInfoIntegration(DatabaseIntegration):
                 metadata={
                     "api_url": endpoint,
                     "search_terms": search_terms,
-                    "collections_searched": collections
+                    "collections_searched": collections,
+                    "next_offset_mark": next_offset_mark
                 }
             )
 
@@ -22,6 +22,7 @@ from core.database_integration_base import (
     QueryResult
 )
 from core.api_request_tracker import log_request
+from core.http_client import hedged_call
 from core.result_builder import SearchResultBuilder
 from config_loader import config
 
@@ -51,6 +52,45 @@ class SAMIntegration(DatabaseIntegration):
     - Recommendation: 1-2 seconds between requests
     """
 
+    # SAM.gov "offset" is a zero-based page index (pages of `limit` records)
+    PAGINATION_PARAM = "offset"
+
+    QUERY_PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "keywords": {
+                "type": "string",
+                "description": "Search keywords for opportunity titles and descriptions"
+            },
+            "procurement_types": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of procurement types, empty if not specified"
+            },
+            "set_aside": {
+                "type": "string",
+                "description": "Set-aside type code (optional)"
+            },
+            "naics_codes": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "List of NAICS codes, empty if not specified"
+            },
+            "organization": {
+                "type": "string",
+                "description": "Agency/organization name (optional)"
+            },
+            "date_range_days": {
+                "type": "integer",
+                "description": "Days back to search, 1-364 (NOT 365 - API limit)",
+                "minimum": 1,
+                "maximum": 364
+            }
+        },
+        "required": ["keywords", "procurement_types", "naics_codes", "date_range_days"],
+        "additionalProperties": False
+    }
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -145,34 +185,7 @@ class SAMIntegration(DatabaseIntegration):
                     "type": "boolean",
                     "description": "Whether SAM.gov is relevant for this research question"
                 },
-                "keywords": {
-                    "type": "string",
-                    "description": "Search keywords for opportunity titles and descriptions"
-                },
-                "procurement_types": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of procurement types, empty if not specified"
-                },
-                "set_aside": {
-                    "type": "string",
-                    "description": "Set-aside type code (optional)"
-                },
-                "naics_codes": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "List of NAICS codes, empty if not specified"
-                },
-                "organization": {
-                    "type": "string",
-                    "description": "Agency/organization name (optional)"
-                },
-                "date_range_days": {
-                    "type": "integer",
-                    "description": "Days back to search, 1-364 (NOT 365 - API limit)",
-                    "minimum": 1,
-                    "maximum": 364
-                },
+                **self.QUERY_PARAMS_SCHEMA["properties"],
                 "reasoning": {
                     "type": "string",
                     "description": "Brief explanation of the query strategy"
@@ -182,7 +195,7 @@ class SAMIntegration(DatabaseIntegration):
                     "description": "Suggested query reformulation if not relevant (optional)"
                 }
             },
-            "required": ["relevant", "keywords", "procurement_types", "naics_codes", "date_range_days", "reasoning"],
+            "required": ["relevant"] + self.QUERY_PARAMS_SCHEMA["required"] + ["reasoning"],
             "additionalProperties": False
         }
 
@@ -219,6 +232,14 @@ class SAMIntegration(DatabaseIntegration):
             "date_range_days": result["date_range_days"]
         }
 
+    def next_page_cursor(self, result: QueryResult, query_params: Dict) -> Optional[int]:
+        """Next zero-based page index, or None once totalRecords is exhausted."""
+        offset = result.metadata.get("offset", 0)
+        page_size = result.metadata.get("page_size") or len(result.results)
+        if (offset + 1) * page_size >= result.total:
+            return None
+        return offset + 1
+
     async def execute_search(self,
                            query_params: Dict,
                            api_key: Optional[str] = None,
@@ -263,7 +284,7 @@ class SAMIntegration(DatabaseIntegration):
                 "postedFrom": from_date.strftime("%m/%d/%Y"),
                 "postedTo": to_date.strftime("%m/%d/%Y"),
                 "limit": min(limit, 1000),  # SAM.gov max is 1000
-                "offset": 0
+                "offset": query_params.get("offset", 0)
             }
 
             # Add keywords if specified
@@ -297,13 +318,13 @@ class SAMIntegration(DatabaseIntegration):
             max_retries = 3
             retry_delays = [2, 4, 8]  # Exponential backoff: 2s, 4s, 8s
 
-            loop = asyncio.get_event_loop()
             for attempt in range(max_retries):
-                # Run blocking requests.get in thread pool
-                response = await loop.run_in_executor(
-                    None,
+                # Run blocking requests.get in thread pool, hedged against SAM.gov's latency tail
+                response = await hedged_call(
+                    "sam",
                     lambda: requests.get(endpoint, params=params,
-                                        timeout=config.get_database_config("sam")["timeout"])
+                                        timeout=config.get_database_config("sam")["timeout"]),
+                    rate_limit_name=self.metadata.name
                 )
 
                 # If HTTP 429 (rate limit), retry with backoff
@@ -413,6 +434,8 @@ class SAMIntegration(DatabaseIntegration):
                 response_time_ms=response_time_ms,
                 metadata={
                     "api_url": endpoint,
+                    "offset": params["offset"],
+                    "page_size": params["limit"],
                     "date_range": {
                         "from": from_date.strftime("%Y-%m-%d"),
                         "to": to_date.strftime("%Y-%m-%d")
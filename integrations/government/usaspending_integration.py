@@ -8,7 +8,7 @@ grants, loans, and other financial assistance from USAspending.gov.
 
 import json
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 import asyncio
 import aiohttp
@@ -22,6 +22,7 @@ from core.database_integration_base import (
     QueryResult
 )
 from core.api_request_tracker import log_request
+from core.local_warehouse import execution_mode, get_local_warehouse
 from core.result_builder import SearchResultBuilder
 from config_loader import config
 
@@ -40,6 +41,9 @@ class USASpendingIntegration(DatabaseIntegration):
     - Historical spending data (post-award)
     - Recipient information, budget data, geographic analysis
     - Supports pagination for large result sets
+    - Optional local mode (databases.usaspending.execution_mode: local|auto)
+      answers the same filters from bulk award archives in core.local_warehouse,
+      including group_by aggregates the API cannot express
 
     Data Coverage:
     - Contract awards (A, B, C, D types)
@@ -58,6 +62,9 @@ class USASpendingIntegration(DatabaseIntegration):
 
     BASE_URL = "https://api.usaspending.gov"
 
+    # spending_by_award pages are 1-based; page_metadata.hasNext marks the last one
+    PAGINATION_PARAM = "page"
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -395,6 +402,10 @@ class USASpendingIntegration(DatabaseIntegration):
             QueryResult with normalized spending data
         """
 
+        mode = execution_mode("usaspending", query_params)
+        if mode == "local" or (mode == "auto" and get_local_warehouse().has_data("usaspending_awards")):
+            return await self._execute_local(query_params, limit or query_params.get("limit", 100))
+
         # Build request body (filter out empty arrays - API rejects them)
         filters = query_params.get("filters", {})
 
@@ -424,7 +435,7 @@ class USASpendingIntegration(DatabaseIntegration):
                 "Description"
             ]),
             "limit": limit or query_params.get("limit", 100),
-            "page": 1,
+            "page": query_params.get("page", 1),
             "sort": "Award Amount",
             "order": "desc"
         }
@@ -456,29 +467,7 @@ class USASpendingIntegration(DatabaseIntegration):
                     data = await response.json()
 
                     # Normalize results using SearchResultBuilder
-                    results = []
-                    for award in data.get("results", []):
-                        # Build title with fallback chain (handle None values)
-                        title = (
-                            SearchResultBuilder.safe_text(award.get("Description"))
-                            or SearchResultBuilder.safe_text(award.get("Award ID"))
-                            or "USAspending Award"
-                        )
-
-                        # Build normalized result using builder pattern
-                        # Three-tier model: preserve full content with build_with_raw()
-                        result = (SearchResultBuilder()
-                            .title(title)
-                            .url(self._build_award_url(award.get("Award ID", "")))
-                            .snippet(self._build_snippet(award))
-                            .raw_content(self._build_snippet(award))  # Full content, never truncated
-                            .date(SearchResultBuilder.safe_text(award.get("Start Date")))
-                            .api_response(award)  # Preserve complete API response
-                            .metadata(award)  # Full award data
-                            .add_metadata("source", "USAspending")
-                            .build_with_raw())
-
-                        results.append(result)
+                    results = [self._award_to_result(award) for award in data.get("results", [])]
 
                     # Track API request
                     log_request(
@@ -528,6 +517,259 @@ class USASpendingIntegration(DatabaseIntegration):
                 http_code=None  # Non-HTTP error
             )
 
+    def next_page_cursor(self, result: QueryResult, query_params: Dict) -> Optional[int]:
+        """Next 1-based page number, or None when page_metadata.hasNext is false."""
+        page_metadata = result.metadata.get("page_metadata", {})
+        if not page_metadata.get("hasNext"):
+            return None
+        return page_metadata.get("page", query_params.get("page", 1)) + 1
+
+    def _award_to_result(self, award: Dict) -> Dict:
+        """Normalize one award row (API response or local warehouse) into a result dict."""
+        # Build title with fallback chain (handle None values)
+        title = (
+            SearchResultBuilder.safe_text(award.get("Description"))
+            or SearchResultBuilder.safe_text(award.get("Award ID"))
+            or "USAspending Award"
+        )
+
+        # Build normalized result using builder pattern
+        # Three-tier model: preserve full content with build_with_raw()
+        return (SearchResultBuilder()
+            .title(title)
+            .url(self._build_award_url(award.get("Award ID", "")))
+            .snippet(self._build_snippet(award))
+            .raw_content(self._build_snippet(award))  # Full content, never truncated
+            .date(SearchResultBuilder.safe_text(award.get("Start Date")))
+            .api_response(award)  # Preserve complete API response
+            .metadata(award)  # Full award data
+            .add_metadata("source", "USAspending")
+            .build_with_raw())
+
+    # =========================================================================
+    # Local warehouse mode
+    # =========================================================================
+
+    # group_by names accepted in local mode -> SQL over the per-award rows
+    LOCAL_GROUP_COLUMNS = {
+        "recipient": "recipient_name",
+        "awarding_agency": "awarding_agency",
+        "awarding_sub_agency": "awarding_sub_agency",
+        "award_type": "award_type_code",
+        "fiscal_year": "fiscal_year",
+    }
+
+    @staticmethod
+    def _local_filters(filters: Dict) -> Tuple[List[str], List]:
+        """
+        Translate USAspending API filters into SQL over usaspending_awards transactions.
+
+        Lists are "any of" (OR) within a filter and AND across filters, like the API.
+        award_amounts is not handled here - it applies to award totals, not transactions.
+        """
+        clauses, params = [], []
+
+        keywords = filters.get("keywords") or []
+        if keywords:
+            clauses.append("(" + " OR ".join(
+                "(description ILIKE ? OR recipient_name ILIKE ? OR award_id ILIKE ?)" for _ in keywords
+            ) + ")")
+            for keyword in keywords:
+                params.extend([f"%{keyword}%"] * 3)
+
+        if filters.get("award_type_codes"):
+            codes = filters["award_type_codes"]
+            clauses.append(f"award_type_code IN ({', '.join('?' for _ in codes)})")
+            params.extend(codes)
+
+        periods = [p for p in filters.get("time_period") or [] if p.get("start_date") or p.get("end_date")]
+        if periods:
+            clauses.append("(" + " OR ".join(
+                "action_date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)" for _ in periods
+            ) + ")")
+            for period in periods:
+                params.extend([period.get("start_date") or "1900-01-01", period.get("end_date") or "2999-12-31"])
+
+        agencies = [a for a in filters.get("agencies") or [] if a.get("name")]
+        if agencies:
+            agency_clauses = []
+            for agency in agencies:
+                if agency.get("type") == "funding":
+                    column = "funding_agency"
+                elif agency.get("tier") == "subtier":
+                    column = "awarding_sub_agency"
+                else:
+                    column = "awarding_agency"
+                agency_clauses.append(f"{column} ILIKE ?")
+                params.append(agency["name"])
+            clauses.append("(" + " OR ".join(agency_clauses) + ")")
+
+        recipients = filters.get("recipient_search_text") or []
+        if recipients:
+            clauses.append("(" + " OR ".join("recipient_name ILIKE ?" for _ in recipients) + ")")
+            params.extend(f"%{name}%" for name in recipients)
+
+        return clauses, params
+
+    async def _execute_local(self, query_params: Dict, limit: int) -> QueryResult:
+        """
+        Answer query_params from the local Parquet/DuckDB warehouse.
+
+        Filters select awards with at least one matching transaction; each
+        award is then rolled up over all its transactions (summed obligations),
+        so amounts, sorting and award_amounts match the API's award-level view.
+        query_params["group_by"] (keys of LOCAL_GROUP_COLUMNS) switches to
+        aggregate rows - e.g. ["recipient", "awarding_agency"] for top
+        recipients per agency - which the API cannot answer.
+        """
+        start_time = datetime.now()
+        filters = query_params.get("filters", {})
+        if filters.get("keywords"):
+            filters["keywords"] = self._validate_and_expand_keywords(filters["keywords"])
+
+        group_by = query_params.get("group_by") or []
+        unknown = [g for g in group_by if g not in self.LOCAL_GROUP_COLUMNS]
+        if unknown:
+            return QueryResult(
+                success=False,
+                source="USAspending",
+                total=0,
+                results=[],
+                query_params=query_params,
+                error=f"Unsupported group_by for local mode: {unknown} (use {sorted(self.LOCAL_GROUP_COLUMNS)})",
+                http_code=None  # Validation error, not HTTP
+            )
+
+        clauses, params = self._local_filters(filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        amount_clauses = []
+        for bounds in filters.get("award_amounts") or []:
+            parts = []
+            if bounds.get("lower_bound") is not None:
+                parts.append("amount >= ?")
+                params.append(bounds["lower_bound"])
+            if bounds.get("upper_bound") is not None:
+                parts.append("amount <= ?")
+                params.append(bounds["upper_bound"])
+            if parts:
+                amount_clauses.append("(" + " AND ".join(parts) + ")")
+        having = f"WHERE {' OR '.join(amount_clauses)}" if amount_clauses else ""
+
+        awards_sql = f"""
+            WITH matched_keys AS (
+                SELECT DISTINCT award_key FROM usaspending_awards {where}
+            ),
+            awards AS (
+                SELECT
+                    award_key,
+                    arg_max(award_id, action_date) AS award_id,
+                    arg_max(recipient_name, action_date) AS recipient_name,
+                    arg_max(awarding_agency, action_date) AS awarding_agency,
+                    arg_max(awarding_sub_agency, action_date) AS awarding_sub_agency,
+                    arg_min(description, action_date) AS description,
+                    arg_max(award_type_code, action_date) AS award_type_code,
+                    MIN(COALESCE(start_date, action_date)) AS start_date,
+                    MAX(end_date) AS end_date,
+                    YEAR(MIN(action_date) + INTERVAL 3 MONTH) AS fiscal_year,
+                    SUM(amount) AS amount
+                FROM usaspending_awards
+                WHERE award_key IN (SELECT award_key FROM matched_keys)
+                GROUP BY award_key
+            ),
+            matched AS (SELECT * FROM awards {having})
+        """
+        if group_by:
+            columns = [self.LOCAL_GROUP_COLUMNS[g] for g in group_by]
+            sql = awards_sql + f"""
+                SELECT {', '.join(columns)},
+                       SUM(amount) AS total_amount,
+                       COUNT(*) AS award_count,
+                       MIN(start_date) AS first_award,
+                       MAX(start_date) AS last_award,
+                       COUNT(*) OVER () AS _total
+                FROM matched
+                GROUP BY {', '.join(columns)}
+                ORDER BY total_amount DESC NULLS LAST
+                LIMIT ?
+            """
+        else:
+            sql = awards_sql + """
+                SELECT
+                    award_id AS "Award ID",
+                    recipient_name AS "Recipient Name",
+                    amount AS "Award Amount",
+                    start_date AS "Start Date",
+                    end_date AS "End Date",
+                    awarding_agency AS "Awarding Agency",
+                    awarding_sub_agency AS "Awarding Sub Agency",
+                    description AS "Description",
+                    award_type_code AS "Award Type",
+                    COUNT(*) OVER () AS _total
+                FROM matched
+                ORDER BY amount DESC NULLS LAST
+                LIMIT ?
+            """
+        params.append(limit)
+
+        try:
+            rows = await get_local_warehouse().aquery(sql, params)
+        except Exception as e:
+            # Catch-all at integration boundary - DuckDB missing or unreadable Parquet
+            logger.error(f"USAspending local query failed: {e}", exc_info=True)
+            return QueryResult(
+                success=False,
+                source="USAspending",
+                total=0,
+                results=[],
+                query_params=query_params,
+                error=f"Local warehouse query failed: {str(e)}",
+                http_code=None  # Non-HTTP error
+            )
+        response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+
+        total = rows[0].pop("_total") if rows else 0
+        for row in rows[1:]:
+            row.pop("_total")
+        if group_by:
+            results = [self._group_to_result(row, group_by) for row in rows]
+        else:
+            results = [self._award_to_result(row) for row in rows]
+
+        return QueryResult(
+            success=True,
+            source="USAspending",
+            total=total,
+            results=results,
+            query_params=query_params,
+            response_time_ms=response_time_ms,
+            metadata={
+                "execution_mode": "local",
+                "request_filters": filters,
+                "group_by": group_by,
+                "spending_level": "award_groups" if group_by else "awards"
+            }
+        )
+
+    def _group_to_result(self, row: Dict, group_by: List[str]) -> Dict:
+        """Normalize one aggregate row from local mode into a result dict."""
+        labels = [str(row.get(self.LOCAL_GROUP_COLUMNS[g]) or "Unknown") for g in group_by]
+        total = SearchResultBuilder.format_amount(row.get("total_amount"))
+        snippet = (f"{total} across {row.get('award_count', 0)} awards"
+                   f" | {row.get('first_award') or '?'} to {row.get('last_award') or '?'}")
+
+        from urllib.parse import quote
+        return (SearchResultBuilder()
+            .title(" / ".join(labels))
+            .url(f"https://www.usaspending.gov/keyword_search/{quote(labels[0], safe='')}")
+            .snippet(snippet)
+            .raw_content(snippet)
+            .date(SearchResultBuilder.safe_text(row.get("last_award")))
+            .api_response(row)
+            .metadata(row)
+            .add_metadata("source", "USAspending")
+            .build_with_raw())
+
     def _build_award_url(self, award_id: str) -> str:
         """Build URL to award detail page on USAspending.gov"""
         if not award_id:
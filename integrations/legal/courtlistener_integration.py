@@ -11,7 +11,6 @@ import logging
 import os
 from typing import Dict, Optional
 from datetime import datetime, timedelta
-import asyncio
 import requests
 from dotenv import load_dotenv
 from llm_utils import acompletion
@@ -25,6 +24,7 @@ from core.database_integration_base import (
 )
 from core.result_builder import SearchResultBuilder
 from core.api_request_tracker import log_request
+from core.http_client import hedged_call
 from config_loader import config
 
 # Set up logger for this module
@@ -319,11 +319,11 @@ Return JSON with your decision:
                 "Accept": "application/json"
             }
 
-            # Run blocking requests in thread pool to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(endpoint, params=params, headers=headers, timeout=30)
+            # Run blocking requests in thread pool (hedged against the latency tail)
+            response = await hedged_call(
+                "courtlistener",
+                lambda: requests.get(endpoint, params=params, headers=headers, timeout=30),
+                rate_limit_name=self.metadata.name
             )
             response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
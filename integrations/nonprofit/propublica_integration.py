@@ -53,6 +53,9 @@ class ProPublicaIntegration(DatabaseIntegration):
     - IRS Annual Extract of Tax-Exempt Organization Financial Data
     """
 
+    # search.json pages are zero-based with a fixed 25 organizations per page
+    PAGINATION_PARAM = "page"
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -197,6 +200,13 @@ class ProPublicaIntegration(DatabaseIntegration):
             "c_code_id": result["c_code_id"]
         }
 
+    def next_page_cursor(self, result: QueryResult, query_params: Dict) -> Optional[int]:
+        """Next zero-based page number, or None on the last of num_pages."""
+        page = result.metadata.get("page", 0)
+        if page + 1 >= result.metadata.get("num_pages", 1):
+            return None
+        return page + 1
+
     async def execute_search(self,
                            query_params: Dict,
                            api_key: Optional[str] = None,
@@ -235,8 +245,8 @@ class ProPublicaIntegration(DatabaseIntegration):
             if query_params.get("c_code_id"):
                 params["c_code[id]"] = query_params["c_code_id"]
 
-            # Pagination - always start at page 0
-            params["page"] = 0
+            # Pagination - zero-based, first page unless iter_results() asks for more
+            params["page"] = query_params.get("page", 0)
 
             # Execute API call
             # Run blocking requests in thread pool to avoid blocking event loop
@@ -326,6 +336,7 @@ class ProPublicaIntegration(DatabaseIntegration):
                 response_time_ms=response_time_ms,
                 metadata={
                     "api_url": endpoint,
+                    "page": params["page"],
                     "num_pages": data.get("num_pages", 1),
                     "per_page": data.get("per_page", 25)
                 }
@@ -60,6 +60,32 @@ class BraveSearchIntegration(DatabaseIntegration):
     - No exact date filtering (only freshness periods)
     """
 
+    QUERY_PARAMS_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query string for Brave Search"
+            },
+            "count": {
+                "type": "integer",
+                "description": "Number of results to return (1-20)",
+                "minimum": 1,
+                "maximum": 20
+            },
+            "freshness": {
+                "type": "string",
+                "description": "Time filter: pd, pw, pm, py (optional)"
+            },
+            "country": {
+                "type": "string",
+                "description": "Country code (e.g., 'us')"
+            }
+        },
+        "required": ["query", "count", "country"],
+        "additionalProperties": False
+    }
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -127,30 +153,13 @@ class BraveSearchIntegration(DatabaseIntegration):
         schema = {
             "type": "object",
             "properties": {
-                                "query": {
-                    "type": "string",
-                    "description": "Search query string for Brave Search"
-                },
-                "count": {
-                    "type": "integer",
-                    "description": "Number of results to return (1-20)",
-                    "minimum": 1,
-                    "maximum": 20
-                },
-                "freshness": {
-                    "type": "string",
-                    "description": "Time filter: pd, pw, pm, py (optional)"
-                },
-                "country": {
-                    "type": "string",
-                    "description": "Country code (e.g., 'us')"
-                },
+                **self.QUERY_PARAMS_SCHEMA["properties"],
                 "reasoning": {
                     "type": "string",
                     "description": "Brief explanation of the query strategy"
                 }
             },
-            "required": ["query", "count", "country", "reasoning"],
+            "required": self.QUERY_PARAMS_SCHEMA["required"] + ["reasoning"],
             "additionalProperties": False
         }
 
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Native async Reddit client using the OAuth JSON endpoints.
+
+Replaces the thread-wrapped PRAW path for high-volume use:
+- Listing calls request every field the integration needs (no lazy fetches)
+- Comment trees for many submissions are expanded concurrently
+- All requests share one budget that respects Reddit's 60 req/min limit
+  and the X-Ratelimit-* headers returned by the API
+- Connections are reused via core.http_client.get_shared_session()
+
+Usage:
+    from integrations.social.reddit_async_client import AsyncRedditClient
+
+    client = AsyncRedditClient.from_env()
+    posts = await client.search(["OSINT", "natsec"], "FISA 702", limit=50)
+    comments = await client.expand_comments([p["id"] for p in posts])
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional
+
+import aiohttp
+
+from core.http_client import HttpClientError, get_shared_session
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+OAUTH_BASE_URL = "https://oauth.reddit.com"
+DEFAULT_USER_AGENT = "SIGINT_Platform/1.0"
+
+# Reddit OAuth clients get 60 requests per minute
+DEFAULT_REQUESTS_PER_MINUTE = 60
+LISTING_PAGE_SIZE = 100  # Reddit max per listing page
+DEFAULT_MAX_CONCURRENT = 8
+
+
+class RedditRequestBudget:
+    """
+    Sliding-window request budget shared by all calls of one client.
+
+    Enforces at most `max_requests` per `period_seconds` locally, and also
+    honours the server's view of the budget via update_from_headers() so that
+    other processes using the same credentials are accounted for.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = DEFAULT_REQUESTS_PER_MINUTE,
+        period_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_requests = max_requests
+        self.period_seconds = period_seconds
+        self._clock = clock
+        self._sent: Deque[float] = deque()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._sent and now - self._sent[0] >= self.period_seconds:
+            self._sent.popleft()
+
+    async def acquire(self) -> None:
+        """Wait until one more request fits in the budget, then reserve it."""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._prune(now)
+                wait = 0.0
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif len(self._sent) >= self.max_requests:
+                    wait = self.period_seconds - (now - self._sent[0])
+                if wait <= 0:
+                    self._sent.append(now)
+                    return
+                logger.debug(f"Reddit budget exhausted, waiting {wait:.2f}s")
+                await asyncio.sleep(wait)
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Block further requests when the server reports no budget left."""
+        remaining = headers.get("X-Ratelimit-Remaining") or headers.get("x-ratelimit-remaining")
+        reset = headers.get("X-Ratelimit-Reset") or headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining_f = float(remaining)
+            reset_s = float(reset)
+        except ValueError:
+            return
+        if remaining_f < 1:
+            self._blocked_until = max(self._blocked_until, self._clock() + reset_s)
+            logger.warning(f"Reddit rate limit budget exhausted, pausing {reset_s:.0f}s")
+
+    def block_for(self, seconds: float) -> None:
+        """Pause all requests for `seconds` (e.g. after a 429)."""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+def normalize_post(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce a Reddit `t3` listing payload to the fields the platform uses.
+
+    The same shape is produced from PRAW submissions by
+    RedditIntegration._submission_to_dict so both backends share one
+    transformation step.
+    """
+    return {
+        "id": data.get("id", ""),
+        "title": data.get("title", ""),
+        "selftext": data.get("selftext", ""),
+        "author": data.get("author") or "[deleted]",
+        "score": data.get("score", 0),
+        "num_comments": data.get("num_comments", 0),
+        "upvote_ratio": data.get("upvote_ratio", 0),
+        "subreddit": data.get("subreddit", ""),
+        "permalink": data.get("permalink", ""),
+        "url": data.get("url"),
+        "created_utc": data.get("created_utc", 0),
+        "is_self": data.get("is_self", False),
+        "link_flair_text": data.get("link_flair_text"),
+    }
+
+
+def _flatten_comments(children: List[Dict[str, Any]], post_id: str, out: List[Dict[str, Any]]) -> None:
+    """Depth-first walk of a comment listing, skipping 'more' stubs."""
+    for child in children:
+        if child.get("kind") != "t1":
+            continue
+        data = child.get("data", {})
+        out.append({
+            "id": data.get("id", ""),
+            "post_id": post_id,
+            "parent_id": data.get("parent_id"),
+            "author": data.get("author") or "[deleted]",
+            "score": data.get("score", 0),
+            "created_utc": data.get("created_utc", 0),
+            "depth": data.get("depth", 0),
+            "body": data.get("body", ""),
+        })
+        replies = data.get("replies")
+        if isinstance(replies, dict):
+            _flatten_comments(replies.get("data", {}).get("children", []), post_id, out)
+
+
+class AsyncRedditClient:
+    """
+    Async Reddit API client (script-app OAuth, password grant).
+
+    Args:
+        client_id, client_secret, username, password: Reddit app credentials
+        user_agent: User-Agent sent with every request (Reddit requires one)
+        budget: Shared request budget (default: 60 requests/minute)
+        session: aiohttp session to use (default: shared pooled session)
+        max_concurrent: Max in-flight requests for fan-out helpers
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        username: str,
+        password: str,
+        user_agent: str = DEFAULT_USER_AGENT,
+        budget: Optional[RedditRequestBudget] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT
+    ) -> None:
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.username = username
+        self.password = password
+        self.user_agent = user_agent
+        self.budget = budget or RedditRequestBudget()
+        self.max_concurrent = max_concurrent
+        self._session = session
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+        self.request_count = 0
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "AsyncRedditClient":
+        """Build a client from REDDIT_* environment variables."""
+        client_id = os.getenv("REDDIT_CLIENT_ID")
+        client_secret = os.getenv("REDDIT_CLIENT_SECRET")
+        username = os.getenv("REDDIT_USERNAME")
+        password = os.getenv("REDDIT_PASSWORD")
+
+        if not all([client_id, client_secret, username, password]):
+            raise ValueError("Reddit credentials not found in environment variables (.env file)")
+
+        return cls(client_id, client_secret, username, password, **kwargs)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is not None:
+            return self._session
+        return await get_shared_session()
+
+    async def _get_token(self) -> str:
+        """Fetch (or reuse) an OAuth bearer token."""
+        async with self._token_lock:
+            if self._token and time.monotonic() < self._token_expires_at:
+                return self._token
+
+            session = await self._get_session()
+            await self.budget.acquire()
+            self.request_count += 1
+            async with session.post(
+                TOKEN_URL,
+                data={
+                    "grant_type": "password",
+                    "username": self.username,
+                    "password": self.password,
+                },
+                auth=aiohttp.BasicAuth(self.client_id, self.client_secret),
+                headers={"User-Agent": self.user_agent},
+            ) as resp:
+                if resp.status != 200:
+                    raise HttpClientError(f"Reddit OAuth failed: HTTP {resp.status}", resp.status)
+                payload = await resp.json()
+
+            if "access_token" not in payload:
+                raise HttpClientError(f"Reddit OAuth failed: {payload.get('error', 'no token')}", 401)
+
+            self._token = payload["access_token"]
+            # Refresh a minute early to avoid using a token that expires mid-request
+            self._token_expires_at = time.monotonic() + float(payload.get("expires_in", 3600)) - 60
+            return self._token
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET an OAuth endpoint, respecting the shared budget."""
+        token = await self._get_token()
+        session = await self._get_session()
+        query = {"raw_json": 1}
+        if params:
+            query.update({k: v for k, v in params.items() if v is not None})
+
+        for attempt in range(2):
+            await self.budget.acquire()
+            self.request_count += 1
+            async with session.get(
+                f"{OAUTH_BASE_URL}{path}",
+                params=query,
+                headers={"Authorization": f"bearer {token}", "User-Agent": self.user_agent},
+            ) as resp:
+                self.budget.update_from_headers(resp.headers)
+                if resp.status == 429 and attempt == 0:
+                    retry_after = float(resp.headers.get("X-Ratelimit-Reset", resp.headers.get("Retry-After", 60)))
+                    self.budget.block_for(retry_after)
+                    continue
+                if resp.status != 200:
+                    raise HttpClientError(f"Reddit API error: HTTP {resp.status} for {path}", resp.status)
+                return await resp.json()
+
+        raise HttpClientError(f"Reddit API rate limited for {path}", 429)
+
+    async def _paginate_listing(self, path: str, params: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """Walk a listing via its `after` cursor until `limit` posts are collected."""
+        posts: List[Dict[str, Any]] = []
+        after = None
+        while len(posts) < limit:
+            page_params = dict(params, limit=min(LISTING_PAGE_SIZE, limit - len(posts)), after=after)
+            listing = await self._get_json(path, page_params)
+            data = listing.get("data", {})
+            for child in data.get("children", []):
+                if child.get("kind") == "t3":
+                    posts.append(normalize_post(child.get("data", {})))
+            after = data.get("after")
+            if not after or not data.get("children"):
+                break
+        return posts[:limit]
+
+    async def search(
+        self,
+        subreddits: List[str],
+        query: str,
+        sort: str = "relevance",
+        time_filter: str = "month",
+        limit: int = 25
+    ) -> List[Dict[str, Any]]:
+        """
+        Search one or more subreddits.
+
+        Returns normalized post dicts (see normalize_post); every field is
+        populated from the listing response, so no per-post fetches occur.
+        """
+        subreddit_string = "+".join(subreddits or ["all"])
+        params = {"q": query, "sort": sort, "t": time_filter, "restrict_sr": 1}
+        return await self._paginate_listing(f"/r/{subreddit_string}/search", params, limit)
+
+    async def new_posts(self, subreddit: str, limit: int = 100) -> List[Dict[str, Any]]:
+        """Return the newest posts in a subreddit."""
+        return await self._paginate_listing(f"/r/{subreddit}/new", {}, limit)
+
+    async def fetch_comments(
+        self,
+        post_id: str,
+        depth: Optional[int] = None,
+        limit: Optional[int] = None,
+        sort: str = "top"
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the comment tree for one submission as a flat list.
+
+        `depth=1` returns top-level comments only (equivalent to the
+        replace_more(limit=0) + top-level policy of the daily scraper).
+        """
+        payload = await self._get_json(
+            f"/comments/{post_id}",
+            {"depth": depth, "limit": limit, "sort": sort}
+        )
+        comments: List[Dict[str, Any]] = []
+        if isinstance(payload, list) and len(payload) > 1:
+            _flatten_comments(payload[1].get("data", {}).get("children", []), post_id, comments)
+        return comments
+
+    async def expand_comments(
+        self,
+        post_ids: List[str],
+        depth: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Expand comment trees for many submissions concurrently.
+
+        Concurrency is capped by max_concurrent and every request still goes
+        through the shared budget, so large fan-outs queue rather than 429.
+        Failures are logged per submission and yield an empty list.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def _one(post_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self.fetch_comments(post_id, depth=depth, limit=limit)
+                except Exception as e:
+                    logger.warning(f"Reddit comment fetch failed for {post_id}: {e}")
+                    return []
+
+        results = await asyncio.gather(*(_one(pid) for pid in post_ids))
+        return dict(zip(post_ids, results))
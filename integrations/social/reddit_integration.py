@@ -25,6 +25,7 @@ from core.api_request_tracker import log_request
 from config_loader import config
 from llm_utils import acompletion
 from core.prompt_loader import render_prompt
+from integrations.social.reddit_async_client import AsyncRedditClient
 
 # Load environment variables
 load_dotenv()
@@ -62,11 +63,28 @@ class RedditIntegration(DatabaseIntegration):
     Rate Limits:
     - Reddit API: 60 requests per minute
     - PRAW handles rate limiting automatically
+    - The async backend enforces the budget itself (RedditRequestBudget)
+
+    Backends (config: databases.reddit.backend):
+    - "praw": synchronous PRAW run in a worker thread (default)
+    - "async": native OAuth JSON client over the shared aiohttp pool
     """
 
     def __init__(self) -> None:
         """Initialize Reddit client with lazy loading."""
         self._reddit_client = None
+        self._async_client: Optional[AsyncRedditClient] = None
+
+    @staticmethod
+    def _backend() -> str:
+        """Configured search backend ("praw" or "async")."""
+        return config.get_database_config("reddit").get("backend", "praw")
+
+    def _get_async_client(self) -> AsyncRedditClient:
+        """Lazy initialize the native async client on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncRedditClient.from_env()
+        return self._async_client
 
     def _get_reddit_client(self) -> Optional[object]:
         """Lazy initialize Reddit client on first use."""
@@ -91,6 +109,94 @@ class RedditIntegration(DatabaseIntegration):
 
         return self._reddit_client
 
+    @staticmethod
+    def _submission_to_dict(submission) -> Dict:
+        """
+        Read every field we need from a PRAW submission.
+
+        Must run in the worker thread: PRAW attribute access can trigger
+        lazy network fetches, which would otherwise block the event loop.
+        Produces the same shape as reddit_async_client.normalize_post().
+        """
+        return {
+            "id": submission.id,
+            "title": getattr(submission, 'title', ''),
+            "selftext": getattr(submission, 'selftext', ''),
+            "author": submission.author.name if submission.author else "[deleted]",
+            "score": getattr(submission, 'score', 0),
+            "num_comments": getattr(submission, 'num_comments', 0),
+            "upvote_ratio": getattr(submission, 'upvote_ratio', 0),
+            "subreddit": submission.subreddit.display_name,
+            "permalink": submission.permalink,
+            "url": getattr(submission, 'url', None),
+            "created_utc": submission.created_utc,
+            "is_self": getattr(submission, 'is_self', False),
+            "link_flair_text": getattr(submission, 'link_flair_text', None),
+        }
+
+    async def _search_praw(self, subreddit_list: List[str], query: str,
+                           sort: str, time_filter: str, limit: int) -> List[Dict]:
+        """Search via PRAW in a worker thread, returning normalized post dicts."""
+        reddit = self._get_reddit_client()
+
+        # Build subreddit string (e.g., "Intelligence+natsec+OSINT")
+        subreddit = reddit.subreddit("+".join(subreddit_list))
+
+        # PRAW search is synchronous, run listing AND field extraction in thread pool
+        return await asyncio.to_thread(
+            lambda: [
+                self._submission_to_dict(submission)
+                for submission in subreddit.search(
+                    query=query,
+                    sort=sort,
+                    time_filter=time_filter,
+                    limit=limit
+                )
+            ]
+        )
+
+    @staticmethod
+    def _post_to_result(post: Dict) -> Dict:
+        """Build a standardized result from a normalized post dict."""
+        created_dt = datetime.fromtimestamp(post["created_utc"])
+        title = SearchResultBuilder.safe_text(post.get("title"), default="Reddit Post")
+        selftext = SearchResultBuilder.safe_text(post.get("selftext"))
+        score = int(SearchResultBuilder.safe_amount(post.get("score", 0)))
+        num_comments = int(SearchResultBuilder.safe_amount(post.get("num_comments", 0)))
+        author_name = post.get("author") or "[deleted]"
+
+        # Three-tier model: preserve full content with build_with_raw()
+        return (SearchResultBuilder()
+            .title(title, default="Reddit Post")
+            .url(f"https://reddit.com{post['permalink']}")
+            .snippet(selftext[:500] if selftext else "")
+            .raw_content(selftext)  # Full content, never truncated
+            .date(created_dt.strftime("%Y-%m-%d"))
+            .api_response({
+                "id": post["id"],
+                "title": title,
+                "selftext": selftext,
+                "author": author_name,
+                "score": score,
+                "subreddit": post["subreddit"],
+                "permalink": post["permalink"],
+                "created_utc": post["created_utc"]
+            })  # Preserve submission data
+            .metadata({
+                "description": selftext[:500] if selftext else "",
+                "subreddit": post["subreddit"],
+                "author": author_name,
+                "score": score,
+                "upvote_ratio": post.get("upvote_ratio", 0),
+                "num_comments": num_comments,
+                "created_utc": post["created_utc"],
+                "post_id": post["id"],
+                "is_self": post.get("is_self", False),
+                "link_flair_text": post.get("link_flair_text"),
+                "engagement_total": score + num_comments
+            })
+            .build_with_raw())
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -268,79 +374,30 @@ class RedditIntegration(DatabaseIntegration):
             QueryResult with standardized format
         """
         start_time = datetime.now()
+        backend = self._backend()
+        api_name = "Reddit (async)" if backend == "async" else "Reddit (PRAW)"
 
         try:
-            # Get Reddit client
-            reddit = self._get_reddit_client()
-
-            # Build subreddit string (e.g., "Intelligence+natsec+OSINT")
             subreddit_list = query_params.get("subreddits", ["all"])
-            subreddit_string = "+".join(subreddit_list)
-            subreddit = reddit.subreddit(subreddit_string)
-
-            # Execute search (sync operation, wrap in thread)
             query = query_params.get("query", "")
             sort = query_params.get("sort", "relevance")
             time_filter = query_params.get("time_filter", "month")
 
-            # PRAW search is synchronous, run in thread pool
-            search_results = await asyncio.to_thread(
-                lambda: list(subreddit.search(
-                    query=query,
-                    sort=sort,
-                    time_filter=time_filter,
-                    limit=limit
-                ))
-            )
+            if backend == "async":
+                posts = await self._get_async_client().search(
+                    subreddit_list, query, sort=sort, time_filter=time_filter, limit=limit
+                )
+            else:
+                posts = await self._search_praw(subreddit_list, query, sort, time_filter, limit)
 
             response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
-            # Transform Reddit API format to SIGINT common format using defensive builder
-            standardized_results = []
-            for submission in search_results:
-                # Extract post data (PRAW uses attributes, not dict access)
-                author_name = submission.author.name if submission.author else "[deleted]"
-                created_dt = datetime.fromtimestamp(submission.created_utc)
-                title = SearchResultBuilder.safe_text(getattr(submission, 'title', ''), default="Reddit Post")
-                selftext = SearchResultBuilder.safe_text(getattr(submission, 'selftext', ''))
-                score = int(SearchResultBuilder.safe_amount(getattr(submission, 'score', 0)))
-                num_comments = int(SearchResultBuilder.safe_amount(getattr(submission, 'num_comments', 0)))
-
-                # Three-tier model: preserve full content with build_with_raw()
-                standardized_results.append(SearchResultBuilder()
-                    .title(title, default="Reddit Post")
-                    .url(f"https://reddit.com{submission.permalink}")
-                    .snippet(selftext[:500] if selftext else "")
-                    .raw_content(selftext)  # Full content, never truncated
-                    .date(created_dt.strftime("%Y-%m-%d"))
-                    .api_response({
-                        "id": submission.id,
-                        "title": title,
-                        "selftext": selftext,
-                        "author": author_name,
-                        "score": score,
-                        "subreddit": submission.subreddit.display_name,
-                        "permalink": submission.permalink,
-                        "created_utc": submission.created_utc
-                    })  # Preserve submission data
-                    .metadata({
-                        "description": selftext[:500] if selftext else "",
-                        "subreddit": submission.subreddit.display_name,
-                        "author": author_name,
-                        "score": score,
-                        "upvote_ratio": getattr(submission, 'upvote_ratio', 0),
-                        "num_comments": num_comments,
-                        "created_utc": submission.created_utc,
-                        "post_id": submission.id,
-                        "is_self": getattr(submission, 'is_self', False),
-                        "link_flair_text": getattr(submission, 'link_flair_text', None),
-                        "engagement_total": score + num_comments
-                    })
-                    .build_with_raw())
+            # Transform Reddit post dicts to SIGINT common format using defensive builder
+            standardized_results = [self._post_to_result(post) for post in posts]
 
             # Log successful request
             log_request(
-                api_name="Reddit (PRAW)",
+                api_name=api_name,
                 endpoint="search",
                 status_code=200,
                 response_time_ms=response_time_ms,
@@ -356,6 +413,7 @@ class RedditIntegration(DatabaseIntegration):
                 query_params=query_params,
                 response_time_ms=response_time_ms,
                 metadata={
+                    "backend": backend,
                     "subreddits_searched": subreddit_list,
                     "sort": sort,
                     "time_filter": time_filter,
@@ -369,7 +427,7 @@ class RedditIntegration(DatabaseIntegration):
             response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
             log_request(
-                api_name="Reddit (PRAW)",
+                api_name=api_name,
                 endpoint="search",
                 status_code=0,
                 response_time_ms=response_time_ms,
@@ -398,7 +456,7 @@ class RedditIntegration(DatabaseIntegration):
 
             # Log failed request
             log_request(
-                api_name="Reddit (PRAW)",
+                api_name=api_name,
                 endpoint="search",
                 status_code=0,
                 response_time_ms=response_time_ms,
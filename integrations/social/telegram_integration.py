@@ -5,6 +5,11 @@ Telegram integration for the multi-database research system.
 Uses Telethon library to search public Telegram channels, get messages from
 specific channels, and track discussions. Provides OSINT capabilities for
 Telegram-based news sources, leak channels, and community discussions.
+
+Connection lifecycle: one long-lived client per session file, shared across
+integration instances. Call `await integration.start()` / `await
+integration.stop()` (or `async with TelegramIntegration() as tg:`), or
+`close_shared_clients()` at application shutdown.
 """
 
 import json
@@ -27,7 +32,16 @@ from core.database_integration_base import (
 )
 from core.result_builder import SearchResultBuilder
 from core.prompt_loader import render_prompt
+from config_loader import config
 from llm_utils import acompletion
+from integrations.social.telegram_session import (
+    FloodWaitScheduler,
+    TelegramMessageCache,
+    close_shared_client,
+    get_shared_client,
+    DEFAULT_MAX_CONCURRENT_CHANNELS,
+    DEFAULT_MAX_FLOOD_WAIT
+)
 
 # Load environment variables
 load_dotenv()
@@ -35,6 +49,9 @@ load_dotenv()
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+# Older-message fetches per call when the cached range holds fewer than `limit` matches
+MAX_BACKFILL_ROUNDS = 3
+
 # Lazy import Telethon (only when needed)
 TelegramClient = None
 functions = None
@@ -96,9 +113,16 @@ class TelegramIntegration(DatabaseIntegration):
 
         self.session_dir = Path("data/telegram_sessions")
         self.session_dir.mkdir(parents=True, exist_ok=True)
+        self.session_file = self.session_dir / "sigint_research"
+
+        telegram_config = config.get_database_config("telegram")
+        self.scheduler = FloodWaitScheduler(
+            max_concurrent=telegram_config.get("max_concurrent_channels", DEFAULT_MAX_CONCURRENT_CHANNELS),
+            max_flood_wait=telegram_config.get("max_flood_wait", DEFAULT_MAX_FLOOD_WAIT)
+        )
+        self.message_cache = TelegramMessageCache(self.session_dir / "message_cache.db")
 
         self.client = None
-        self._authenticated = False
 
     @property
     def metadata(self) -> DatabaseMetadata:
@@ -115,24 +139,41 @@ class TelegramIntegration(DatabaseIntegration):
             description="Telegram channels and messages: news sources, leak channels, OSINT communities"
         )
 
-    async def _ensure_client(self) -> None:
-        """Ensure Telegram client is connected and authenticated."""
-        if self.client is not None and self._authenticated:
-            return
+    def _build_client(self, session_path: str):
+        """Create an unstarted Telethon client for the session file."""
+        # flood_sleep_threshold=0: every FloodWaitError reaches the scheduler,
+        # which pauses all channels instead of one coroutine sleeping silently
+        return TelegramClient(
+            session_path,
+            int(self.api_id),
+            self.api_hash,
+            flood_sleep_threshold=0
+        )
 
+    async def start(self) -> None:
+        """Connect (or attach to) the shared client for this session file."""
         if not self.api_id or not self.api_hash:
             raise ValueError("TELEGRAM_API_ID and TELEGRAM_API_HASH must be set in .env")
 
-        session_file = self.session_dir / "sigint_research"
+        self.client = await get_shared_client(self.session_file, self._build_client, phone=self.phone)
 
-        self.client = TelegramClient(
-            str(session_file),
-            int(self.api_id),
-            self.api_hash
-        )
+    async def stop(self) -> None:
+        """Disconnect the shared client for this session file."""
+        await close_shared_client(self.session_file)
+        self.client = None
+
+    async def __aenter__(self) -> "TelegramIntegration":
+        await self.start()
+        return self
 
-        await self.client.start(phone=self.phone)
-        self._authenticated = True
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def _ensure_client(self) -> None:
+        """Ensure Telegram client is connected and authenticated."""
+        if self.client is not None and self.client.is_connected():
+            return
+        await self.start()
 
     async def is_relevant(self, research_question: str) -> bool:
         """
@@ -224,6 +265,10 @@ Return JSON:
                     "properties": {
                         "query": {"type": "string"},
                         "channel_username": {"type": "string"},
+                        "channel_usernames": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        },
                         "keywords": {
                             "type": "array",
                             "items": {"type": "string"}
@@ -350,10 +395,10 @@ Return JSON:
 
         try:
             # Search for channels using Telegram's global search
-            search_result = await self.client(functions.contacts.SearchRequest(
+            search_result = await self.scheduler.run(lambda: self.client(functions.contacts.SearchRequest(
                 q=query,
                 limit=limit
-            ))
+            )))
 
             # Extract channel information using defensive builder
             for chat in search_result.chats:
@@ -388,121 +433,170 @@ Return JSON:
 
         return results
 
-    async def _get_channel_messages(self, params: Dict, limit: int) -> List[Dict]:
-        """Get recent messages from a specific channel."""
-        channel_username = params.get("channel_username", "").replace("@", "")
+    @staticmethod
+    def _message_to_dict(msg, channel_username: str) -> Dict:
+        """Extract the cached fields from a Telethon message."""
+        return {
+            "id": msg.id,
+            "message": SearchResultBuilder.safe_text(msg.message),
+            "date": msg.date.isoformat() if msg.date else None,
+            "channel": channel_username,
+            "views": getattr(msg, 'views', None),
+            "forwards": getattr(msg, 'forwards', None)
+        }
 
-        if not channel_username:
-            return []
+    @staticmethod
+    def _message_to_result(message: Dict, extra_metadata: Optional[Dict] = None) -> Dict:
+        """Build a standardized result from a cached message dict."""
+        channel_username = message["channel"]
+        msg_text = message["message"]
+        metadata = {
+            "message_id": message["id"],
+            "channel": channel_username,
+            "views": message.get("views"),
+            "forwards": message.get("forwards")
+        }
+        metadata.update(extra_metadata or {})
+        # Three-tier model: preserve full content with build_with_raw()
+        return (SearchResultBuilder()
+            .title(f"@{channel_username}: {msg_text[:100]}..." if msg_text else "Telegram Message",
+                   default="Telegram Message")
+            .url(f"https://t.me/{channel_username}/{message['id']}")
+            .snippet(msg_text[:500] if msg_text else "")
+            .raw_content(msg_text)  # Full content, never truncated
+            .date(message.get("date"))
+            .api_response({
+                "id": message["id"],
+                "message": msg_text,
+                "date": message.get("date"),
+                "channel": channel_username
+            })  # Preserve message data
+            .metadata(metadata)
+            .build_with_raw())
+
+    async def _fetch_channel_messages(
+        self,
+        entity,
+        channel_username: str,
+        limit: int,
+        search: str = ""
+    ) -> List[Dict]:
+        """
+        Fetch messages newer than the cached range, backfill below it, then serve from cache.
 
-        results = []
+        A capped fetch of new messages may skip some just above the old
+        range; the cache then only trusts the new range, and older messages
+        are backfilled (max_id below the range) until `limit` matches are
+        cached or the channel's start is reached.
 
-        try:
-            # Get channel entity
-            channel = await self.client.get_entity(channel_username)
+        Args:
+            entity: Channel entity or username accepted by get_messages
+            channel_username: Username used as the cache key
+            limit: Maximum messages to return
+            search: Optional keyword (Telegram server-side search)
 
-            # Get recent messages
-            messages = await self.client.get_messages(channel, limit=limit)
+        Returns:
+            Newest `limit` cached message dicts (matching `search` if given)
+        """
+        def _fetch(**bounds):
+            return self.scheduler.run(lambda: self.client.get_messages(
+                entity, limit=limit, search=search or None, **bounds
+            ))
 
-            for msg in messages:
-                if msg.message:  # Skip empty messages
-                    msg_text = SearchResultBuilder.safe_text(msg.message)
-                    # Three-tier model: preserve full content with build_with_raw()
-                    results.append(SearchResultBuilder()
-                        .title(f"@{channel_username}: {msg_text[:100]}..." if msg_text else "Telegram Message",
-                               default="Telegram Message")
-                        .url(f"https://t.me/{channel_username}/{msg.id}")
-                        .snippet(msg_text[:500] if msg_text else "")
-                        .raw_content(msg_text)  # Full content, never truncated
-                        .date(msg.date.isoformat() if msg.date else None)
-                        .api_response({
-                            "id": msg.id,
-                            "message": msg_text,
-                            "date": msg.date.isoformat() if msg.date else None,
-                            "channel": channel_username
-                        })  # Preserve message data
-                        .metadata({
-                            "message_id": msg.id,
-                            "channel": channel_username,
-                            "views": getattr(msg, 'views', None),
-                            "forwards": getattr(msg, 'forwards', None)
-                        })
-                        .build_with_raw())
+        def _dicts(messages) -> List[Dict]:
+            return [self._message_to_dict(msg, channel_username) for msg in messages if msg.message]
+
+        cache = self.message_cache
+        min_id = cache.high_water_mark(channel_username, search)
+        messages = await _fetch(min_id=min_id)
+        if messages:
+            ids = [msg.id for msg in messages]
+            low = min(ids) if len(messages) >= limit else min_id
+            cache.store(channel_username, _dicts(messages), search, covered=(low, max(ids)))
+        elif cache.coverage(channel_username, search) is None:
+            cache.store(channel_username, [], search, covered=(0, 0))  # Empty channel
+        logger.debug(f"Telegram @{channel_username}: {len(messages)} new messages above id {min_id}")
+
+        for _ in range(MAX_BACKFILL_ROUNDS):
+            low, high = cache.coverage(channel_username, search)
+            if low == 0 or len(cache.get(channel_username, limit, search)) >= limit:
+                break
+            older = await _fetch(max_id=low)
+            oldest = min(msg.id for msg in older) if len(older) >= limit else 0
+            cache.store(channel_username, _dicts(older), search, covered=(oldest, low))
+            logger.debug(f"Telegram @{channel_username}: backfilled {len(older)} messages below id {low}")
+
+        return cache.get(channel_username, limit, search)
 
-        except Exception as e:
-            # Catch-all at integration boundary - acceptable to return empty results instead of crashing
-            logger.error(f"Telegram failed to get messages from @{channel_username}: {e}", exc_info=True)
-            print(f"[WARN] Failed to get messages from @{channel_username}: {e}")
+    async def _get_channel_messages(self, params: Dict, limit: int) -> List[Dict]:
+        """Get recent messages from one or more channels (fetched concurrently)."""
+        usernames = list(params.get("channel_usernames") or [])
+        if params.get("channel_username"):
+            usernames.insert(0, params["channel_username"])
+        usernames = list(dict.fromkeys(u.replace("@", "") for u in usernames if u))
 
-        return results
+        if not usernames:
+            return []
+
+        async def _one_channel(channel_username: str) -> List[Dict]:
+            try:
+                # Get channel entity
+                channel = await self.scheduler.run(lambda: self.client.get_entity(channel_username))
+                messages = await self._fetch_channel_messages(channel, channel_username, limit)
+                return [self._message_to_result(m) for m in messages]
+            except Exception as e:
+                # Catch-all at integration boundary - acceptable to return empty results instead of crashing
+                logger.error(f"Telegram failed to get messages from @{channel_username}: {e}", exc_info=True)
+                print(f"[WARN] Failed to get messages from @{channel_username}: {e}")
+                return []
+
+        per_channel = await asyncio.gather(*(_one_channel(u) for u in usernames))
+        return [result for channel_results in per_channel for result in channel_results]
 
     async def _global_search(self, params: Dict, limit: int) -> List[Dict]:
         """Search for messages across channels by keywords."""
-        keywords = params.get("keywords", [])
+        keywords = params.get("keywords", [])[:3]  # Limit to first 3 keywords to avoid overload
 
         if not keywords:
             return []
 
         # Telegram doesn't have a direct global message search API
         # Strategy: Search for channels related to keywords, then get messages
-        results = []
-        channels_checked = set()
-
-        for keyword in keywords[:3]:  # Limit to first 3 keywords to avoid overload
+        async def _channels_for(keyword: str) -> List:
             try:
-                # Search for channels matching keyword
-                search_result = await self.client(functions.contacts.SearchRequest(
+                search_result = await self.scheduler.run(lambda: self.client(functions.contacts.SearchRequest(
                     q=keyword,
                     limit=5
-                ))
-
-                # Get messages from found channels
-                for chat in search_result.chats:
-                    if hasattr(chat, 'username') and chat.username and chat.username not in channels_checked:
-                        channels_checked.add(chat.username)
-
-                        try:
-                            messages = await self.client.get_messages(chat, limit=10, search=keyword)
-
-                            for msg in messages:
-                                if msg.message and any(kw.lower() in msg.message.lower() for kw in keywords):
-                                    msg_text = SearchResultBuilder.safe_text(msg.message)
-                                    # Three-tier model: preserve full content with build_with_raw()
-                                    results.append(SearchResultBuilder()
-                                        .title(f"@{chat.username}: {msg_text[:100]}..." if msg_text else "Telegram Message",
-                                               default="Telegram Message")
-                                        .url(f"https://t.me/{chat.username}/{msg.id}")
-                                        .snippet(msg_text[:500] if msg_text else "")
-                                        .raw_content(msg_text)  # Full content, never truncated
-                                        .date(msg.date.isoformat() if msg.date else None)
-                                        .api_response({
-                                            "id": msg.id,
-                                            "message": msg_text,
-                                            "date": msg.date.isoformat() if msg.date else None,
-                                            "channel": chat.username
-                                        })  # Preserve message data
-                                        .metadata({
-                                            "message_id": msg.id,
-                                            "channel": chat.username,
-                                            "keyword_match": keyword,
-                                            "views": getattr(msg, 'views', None)
-                                        })
-                                        .build_with_raw())
-
-                                    if len(results) >= limit:
-                                        break
-                        except Exception as e:
-                            # Catch-all for individual channel failures - acceptable to continue with other channels
-                            logger.error(f"Telegram failed to search channel {chat.username}: {e}", exc_info=True)
-                            continue
-
-                    if len(results) >= limit:
-                        break
+                )))
+                return [chat for chat in search_result.chats if getattr(chat, 'username', None)]
             except Exception as e:
                 # Catch-all for keyword search failures - acceptable to continue with other keywords
                 logger.error(f"Telegram failed to search keyword {keyword}: {e}", exc_info=True)
-                continue
+                return []
+
+        channel_lists = await asyncio.gather(*(_channels_for(kw) for kw in keywords))
+
+        # Each channel is searched once, for the first keyword that found it
+        targets = {}
+        for keyword, chats in zip(keywords, channel_lists):
+            for chat in chats:
+                targets.setdefault(chat.username, (chat, keyword))
 
+        async def _search_channel(chat, keyword: str) -> List[Dict]:
+            try:
+                messages = await self._fetch_channel_messages(chat, chat.username, 10, search=keyword)
+                return [
+                    self._message_to_result(m, {"keyword_match": keyword})
+                    for m in messages
+                    if any(kw.lower() in m["message"].lower() for kw in keywords)
+                ]
+            except Exception as e:
+                # Catch-all for individual channel failures - acceptable to continue with other channels
+                logger.error(f"Telegram failed to search channel {chat.username}: {e}", exc_info=True)
+                return []
+
+        per_channel = await asyncio.gather(*(_search_channel(chat, kw) for chat, kw in targets.values()))
+        results = [result for channel_results in per_channel for result in channel_results]
         return results[:limit]
 
     async def _get_channel_info(self, params: Dict) -> List[Dict]:
@@ -513,12 +607,12 @@ Return JSON:
             return []
 
         try:
-            channel = await self.client.get_entity(channel_username)
+            channel = await self.scheduler.run(lambda: self.client.get_entity(channel_username))
 
             # Get full channel info
-            full_channel = await self.client(functions.channels.GetFullChannelRequest(
+            full_channel = await self.scheduler.run(lambda: self.client(functions.channels.GetFullChannelRequest(
                 channel=channel
-            ))
+            )))
 
             channel_title = SearchResultBuilder.safe_text(getattr(channel, 'title', ''), default=channel_username)
             description = SearchResultBuilder.safe_text(full_channel.full_chat.about, default="No description")
@@ -551,12 +645,3 @@ Return JSON:
             logger.error(f"Telegram failed to get info for @{channel_username}: {e}", exc_info=True)
             print(f"[WARN] Failed to get info for @{channel_username}: {e}")
             return []
-
-    def __del__(self) -> None:
-        """Cleanup: disconnect Telegram client."""
-        if self.client and self._authenticated:
-            try:
-                asyncio.get_event_loop().run_until_complete(self.client.disconnect())
-            except Exception as e:
-                # Don't raise in __del__ - can cause interpreter crashes
-                logging.error(f"Telegram client disconnect failed in __del__: {e}", exc_info=True)
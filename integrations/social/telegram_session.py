@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Telegram connection lifecycle, flood-wait scheduling and message caching.
+
+Support code for TelegramIntegration that does not itself import Telethon:
+- get_shared_client() / close_shared_clients(): one long-lived, connected
+  client per session file (Telethon session files cannot be opened twice)
+- FloodWaitScheduler: bounded concurrency for per-channel requests; a
+  FloodWaitError pauses every queued request and retries instead of failing
+- TelegramMessageCache: SQLite cache keyed by (channel, message id) with a
+  per-(channel, search) covered id range, so repeat searches only fetch
+  messages newer than the range and backfill older ones below it
+
+Usage:
+    scheduler = FloodWaitScheduler(max_concurrent=4)
+    cache = TelegramMessageCache("data/telegram_sessions/message_cache.db")
+
+    low, high = cache.coverage("bellingcat") or (0, 0)
+    messages = await scheduler.run(lambda: client.get_messages("bellingcat", limit=50, min_id=high))
+    cache.store("bellingcat", [message_to_dict(m) for m in messages],
+                covered=(high if len(messages) < 50 else min(m.id for m in messages), max(m.id for m in messages)))
+    recent = cache.get("bellingcat", limit=50)
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENT_CHANNELS = 4
+DEFAULT_MAX_FLOOD_WAIT = 300.0  # seconds; longer waits fail the request instead of stalling research
+
+# Shared clients keyed by resolved session file path
+_shared_clients: Dict[str, Any] = {}
+_client_locks: Dict[str, asyncio.Lock] = {}
+
+
+def flood_wait_seconds(exc: BaseException) -> Optional[float]:
+    """Return the wait Telegram requested if exc is a flood/slow-mode wait, else None."""
+    try:
+        from telethon.errors import FloodWaitError, SlowModeWaitError
+    except ImportError:
+        return None
+    if isinstance(exc, (FloodWaitError, SlowModeWaitError)):
+        return float(exc.seconds)
+    return None
+
+
+async def get_shared_client(
+    session_file: Union[str, Path],
+    client_factory: Callable[[str], Any],
+    phone: Optional[str] = None
+) -> Any:
+    """
+    Return the started client for a session file, creating it on first use.
+
+    Args:
+        session_file: Telethon session path (without .session suffix)
+        client_factory: Builds an unstarted client for the session path
+        phone: Phone number for first-run authentication
+
+    Returns:
+        Connected, authenticated client shared by every caller of this session
+    """
+    key = str(Path(session_file).resolve())
+    lock = _client_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        client = _shared_clients.get(key)
+        if client is not None and client.is_connected():
+            return client
+        client = client_factory(str(session_file))
+        await client.start(phone=phone)
+        _shared_clients[key] = client
+        logger.info(f"Telegram client started for session {key}")
+        return client
+
+
+async def close_shared_client(session_file: Union[str, Path]) -> None:
+    """Disconnect and forget the shared client for one session file."""
+    key = str(Path(session_file).resolve())
+    client = _shared_clients.pop(key, None)
+    if client is not None:
+        await client.disconnect()
+        logger.info(f"Telegram client stopped for session {key}")
+
+
+async def close_shared_clients() -> None:
+    """Disconnect every shared client (call once at application shutdown)."""
+    for key in list(_shared_clients):
+        await close_shared_client(key)
+
+
+class FloodWaitScheduler:
+    """
+    Run Telegram requests with bounded concurrency and shared flood-wait backoff.
+
+    A FloodWaitError from any request pauses all requests routed through the
+    scheduler for the requested time, then the failed request is retried.
+    Waits longer than max_flood_wait are re-raised so callers can skip the
+    channel.
+
+    Args:
+        max_concurrent: Max requests in flight
+        max_flood_wait: Longest wait (seconds) honoured before giving up
+        wait_seconds: Maps an exception to a requested wait, or None
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_CHANNELS,
+        max_flood_wait: float = DEFAULT_MAX_FLOOD_WAIT,
+        wait_seconds: Callable[[BaseException], Optional[float]] = flood_wait_seconds
+    ) -> None:
+        self.max_flood_wait = max_flood_wait
+        self._wait_seconds = wait_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._paused_until = 0.0
+        self.flood_waits = 0
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Await call() once capacity is free and no flood wait is active."""
+        while True:
+            delay = self._paused_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            async with self._semaphore:
+                try:
+                    return await call()
+                except Exception as e:
+                    seconds = self._wait_seconds(e)
+                    if seconds is None or seconds > self.max_flood_wait:
+                        raise
+                    self.flood_waits += 1
+                    self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+                    logger.warning(f"Telegram flood wait: pausing requests for {seconds:.0f}s")
+
+
+class TelegramMessageCache:
+    """
+    SQLite message cache keyed by (channel, message id).
+
+    Coverage is tracked per (channel, search) pair as one contiguous id range
+    [low, high] known to hold every message (or every *matching* message,
+    for a keyword search); low == 0 means the range reaches the start of the
+    channel. An unfiltered fetch and each keyword search advance
+    independently. get() only serves ids inside the range, so a capped fetch
+    that skipped messages never leaves a silent gap in the results.
+
+    Args:
+        path: Database file, or ":memory:"
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS messages (
+                channel TEXT NOT NULL,
+                message_id INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (channel, message_id)
+            );
+            CREATE TABLE IF NOT EXISTS coverage (
+                channel TEXT NOT NULL,
+                search TEXT NOT NULL,
+                low_id INTEGER NOT NULL,
+                high_id INTEGER NOT NULL,
+                PRIMARY KEY (channel, search)
+            );
+        """)
+
+    @staticmethod
+    def _channel_key(channel: str) -> str:
+        return channel.lstrip("@").lower()
+
+    def coverage(self, channel: str, search: str = "") -> Optional[Tuple[int, int]]:
+        """(low, high) id range fully fetched for this channel/search, or None."""
+        row = self._conn.execute(
+            "SELECT low_id, high_id FROM coverage WHERE channel = ? AND search = ?",
+            (self._channel_key(channel), search.lower())
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def high_water_mark(self, channel: str, search: str = "") -> int:
+        """Highest message id of the covered range (0 if never fetched)."""
+        covered = self.coverage(channel, search)
+        return covered[1] if covered else 0
+
+    def store(
+        self,
+        channel: str,
+        messages: List[Dict],
+        search: str = "",
+        covered: Optional[Tuple[int, int]] = None
+    ) -> None:
+        """
+        Upsert messages (dicts with at least "id" and "message").
+
+        Args:
+            covered: (low, high) id range the fetch proved complete. It is
+                merged with the existing range when the two touch; a disjoint
+                newer range replaces it (messages between them are unknown).
+        """
+        key = self._channel_key(channel)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO messages (channel, message_id, text, data) VALUES (?, ?, ?, ?)",
+                [(key, m["id"], (m.get("message") or "").lower(), json.dumps(m, default=str)) for m in messages]
+            )
+            if covered is None:
+                return
+            low, high = covered
+            existing = self.coverage(channel, search)
+            if existing and low <= existing[1] and high >= existing[0]:
+                low, high = min(low, existing[0]), max(high, existing[1])
+            elif existing and high < existing[0]:
+                return  # Older island below the range: keep the newer range
+            self._conn.execute(
+                "INSERT OR REPLACE INTO coverage (channel, search, low_id, high_id) VALUES (?, ?, ?, ?)",
+                (key, search.lower(), low, high)
+            )
+
+    def get(self, channel: str, limit: int, search: str = "") -> List[Dict]:
+        """Newest cached messages inside the covered range, optionally filtered by substring."""
+        query = "SELECT data FROM messages WHERE channel = ?"
+        args: List[Any] = [self._channel_key(channel)]
+        covered = self.coverage(channel, search)
+        if covered and covered[0] > 0:
+            query += " AND message_id >= ?"
+            args.append(covered[0])
+        if search:
+            query += " AND instr(text, ?) > 0"
+            args.append(search.lower())
+        query += " ORDER BY message_id DESC LIMIT ?"
+        args.append(limit)
+        return [json.loads(row[0]) for row in self._conn.execute(query, args)]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Native async client for the RapidAPI twitter-api45 endpoints.
+
+Replaces the thread-wrapped, sleep-based
+experiments.twitterexplorer_sigint.api_client.execute_api_step for the
+integration:
+- Cursor pagination that stops as soon as `limit` items are collected
+- Non-blocking backoff driven by the RapidAPI rate-limit headers
+- Connection reuse via core.http_client.get_shared_session()
+- Concurrent execution of multi-endpoint steps (fetch_many)
+
+The return shape matches execute_api_step so existing transformation code
+works unchanged:
+    {"endpoint": ..., "executed_params": {...}, "data": {...}}
+    {"endpoint": ..., "error": "...", "status_code": 429}
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Mapping, Optional
+
+import aiohttp
+
+from core.http_client import get_shared_session
+
+logger = logging.getLogger(__name__)
+
+RAPIDAPI_TWITTER_HOST = "twitter-api45.p.rapidapi.com"
+RAPIDAPI_BASE_URL = f"https://{RAPIDAPI_TWITTER_HOST}"
+API_TIMEOUT_SECONDS = 30  # Requests regularly take 10-13s
+
+# Keys under which twitter-api45 returns list payloads (same order as api_client)
+LIST_KEYS = [
+    'timeline', 'followers', 'following', 'users', 'trends', 'retweets',
+    'affilates', 'members', 'sharings', 'results', 'data'
+]
+
+MAX_RATE_LIMIT_RETRIES = 4
+MAX_SERVER_RETRIES = 3
+DEFAULT_RATE_LIMIT_WAIT = 2.0  # seconds, when a 429 carries no reset header
+MAX_RATE_LIMIT_WAIT = 60.0
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+class AsyncTwitterClient:
+    """
+    Async RapidAPI twitter-api45 client.
+
+    One instance should be shared per API key: rate-limit state learned from
+    response headers pauses every in-flight pagination loop, not just the
+    one that saw the 429.
+
+    Args:
+        api_key: RapidAPI key
+        session: aiohttp session to use (default: shared pooled session)
+        timeout_seconds: Per-request timeout
+        max_concurrent: Max in-flight requests across fetch_many()
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout_seconds: float = API_TIMEOUT_SECONDS,
+        max_concurrent: int = 4
+    ) -> None:
+        self.api_key = api_key
+        self._session = session
+        self.timeout = aiohttp.ClientTimeout(total=timeout_seconds)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._paused_until = 0.0
+        self.request_count = 0
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is not None:
+            return self._session
+        return await get_shared_session()
+
+    def _update_rate_limit(self, headers: Mapping[str, str], status: int) -> None:
+        """Pause all requests when the quota is exhausted or a 429 arrives."""
+        remaining = _header_float(headers, "x-ratelimit-requests-remaining", "X-RateLimit-Requests-Remaining")
+        reset = _header_float(
+            headers, "Retry-After", "retry-after",
+            "x-ratelimit-requests-reset", "X-RateLimit-Requests-Reset"
+        )
+        if status == 429 or (remaining is not None and remaining < 1):
+            wait = min(reset if reset is not None else DEFAULT_RATE_LIMIT_WAIT, MAX_RATE_LIMIT_WAIT)
+            self._paused_until = max(self._paused_until, time.monotonic() + wait)
+            logger.warning(f"Twitter rate limit reached, pausing requests for {wait:.1f}s")
+
+    async def _wait_if_paused(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _get_page(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch one page with retries.
+
+        Returns {"status": 200, "data": ...} or {"status": code, "error": msg}.
+        """
+        url = f"{RAPIDAPI_BASE_URL}/{endpoint}"
+        headers = {"X-RapidAPI-Key": self.api_key, "X-RapidAPI-Host": RAPIDAPI_TWITTER_HOST}
+        rate_limit_retries = 0
+        server_retries = 0
+
+        while True:
+            await self._wait_if_paused()
+            session = await self._get_session()
+            try:
+                async with self._semaphore:
+                    self.request_count += 1
+                    async with session.get(url, params=params, headers=headers, timeout=self.timeout) as resp:
+                        self._update_rate_limit(resp.headers, resp.status)
+                        if resp.status == 200:
+                            return {"status": 200, "data": await resp.json(content_type=None)}
+                        body = (await resp.text())[:500]
+                        status = resp.status
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if server_retries < MAX_SERVER_RETRIES:
+                    server_retries += 1
+                    await asyncio.sleep(2 ** server_retries)
+                    continue
+                return {"status": 0, "error": f"Request failed after {MAX_SERVER_RETRIES} retries: {e}"}
+            except ValueError as e:
+                return {"status": 200, "error": f"Invalid JSON response from API: {e}"}
+
+            if status == 429:
+                rate_limit_retries += 1
+                if rate_limit_retries > MAX_RATE_LIMIT_RETRIES:
+                    return {"status": 429, "error": "Rate limit exceeded after multiple retries."}
+                continue  # _update_rate_limit already scheduled the pause
+            if status >= 500 and server_retries < MAX_SERVER_RETRIES:
+                server_retries += 1
+                await asyncio.sleep(server_retries)
+                continue
+            return {"status": status, "error": f"HTTP Error {status}: {body}"}
+
+    async def fetch(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: int = 1,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Call an endpoint, following `next_cursor` until max_pages or limit.
+
+        Args:
+            endpoint: Endpoint file name (e.g. "search.php")
+            params: Endpoint parameters
+            max_pages: Upper bound on pages fetched
+            limit: Stop paginating once this many list items are collected
+
+        Returns:
+            Dict in the execute_api_step result shape
+        """
+        params = dict(params or {})
+        items: List[Any] = []
+        data_key: Optional[str] = None
+        page_data: Any = None
+        cursor = None
+        pages = 0
+
+        while pages < max_pages:
+            page_params = dict(params, cursor=cursor) if cursor else params
+            page = await self._get_page(endpoint, page_params)
+            if "error" in page:
+                return {"endpoint": endpoint, "error": page["error"], "status_code": page["status"]}
+
+            page_data = page["data"]
+            pages += 1
+
+            if isinstance(page_data, list):
+                items.extend(page_data)
+            elif isinstance(page_data, dict):
+                if data_key is None:
+                    data_key = next((k for k in LIST_KEYS if isinstance(page_data.get(k), list)), None)
+                if data_key is not None and isinstance(page_data.get(data_key), list):
+                    items.extend(page_data[data_key])
+                elif pages == 1:
+                    items.append(page_data)  # Single-object endpoint (profile, tweet)
+
+            cursor = None
+            if isinstance(page_data, dict):
+                cursor = page_data.get("next_cursor") or (
+                    page_data.get("cursor") if isinstance(page_data.get("cursor"), str) else None
+                )
+            if not cursor or (limit is not None and len(items) >= limit):
+                break
+
+        if data_key:
+            final: Dict[str, Any] = {data_key: items}
+            if isinstance(page_data, dict):
+                final.update({k: v for k, v in page_data.items() if k not in (data_key, "next_cursor", "cursor")})
+        elif len(items) == 1 and isinstance(items[0], dict):
+            final = items[0]
+        elif items:
+            final = {"results": items}
+        else:
+            final = {}
+
+        return {
+            "endpoint": endpoint,
+            "executed_params": params,
+            "pages_fetched": pages,
+            "data": final
+        }
+
+    async def fetch_many(self, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several independent steps concurrently.
+
+        Each step is {"endpoint", "params", "max_pages", "limit"}; results are
+        returned in the same order. Concurrency is bounded by max_concurrent.
+        """
+        return await asyncio.gather(*(
+            self.fetch(
+                step["endpoint"],
+                step.get("params"),
+                max_pages=step.get("max_pages", 1),
+                limit=step.get("limit")
+            )
+            for step in steps
+        ))
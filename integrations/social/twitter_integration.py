@@ -7,8 +7,7 @@ Provides access to Twitter search for social media intelligence gathering.
 
 import json
 import logging
-import asyncio
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from llm_utils import acompletion
 from core.prompt_loader import render_prompt
@@ -23,8 +22,8 @@ from core.result_builder import SearchResultBuilder
 from core.api_request_tracker import log_request
 from config_loader import config
 
-# Import Twitter API client
-from experiments.twitterexplorer_sigint.api_client import execute_api_step
+# Native async RapidAPI client (replaces thread-wrapped execute_api_step)
+from integrations.social.twitter_async_client import AsyncTwitterClient
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
@@ -52,7 +51,12 @@ class TwitterIntegration(DatabaseIntegration):
 
     Rate Limits:
     - Managed by RapidAPI (varies by subscription plan)
-    - Exponential backoff for 429 errors built into api_client
+    - Non-blocking backoff driven by RapidAPI rate-limit headers (AsyncTwitterClient)
+
+    Multi-endpoint patterns:
+    - RELATIONSHIP_TYPES whose endpoints share the same inputs (e.g.
+      follower_network = followers.php + following.php) can be requested as
+      a pattern; their endpoints run concurrently and results are merged.
     """
 
     # Query pattern templates - map high-level intents to endpoints
@@ -233,6 +237,17 @@ class TwitterIntegration(DatabaseIntegration):
         }
     }
 
+    def __init__(self) -> None:
+        """Initialize with a per-API-key client cache."""
+        self._clients: Dict[str, AsyncTwitterClient] = {}
+
+    def _get_client(self, api_key: str) -> AsyncTwitterClient:
+        """One client per key so rate-limit pauses are shared across calls."""
+        if api_key not in self._clients:
+            timeout = config.get_database_config("twitter").get("timeout", 30)
+            self._clients[api_key] = AsyncTwitterClient(api_key, timeout_seconds=timeout)
+        return self._clients[api_key]
+
     @property
     def metadata(self) -> DatabaseMetadata:
         """Return metadata describing this integration."""
@@ -345,7 +360,8 @@ class TwitterIntegration(DatabaseIntegration):
                         "trending_topics", "user_media", "list_timeline",
                         "user_affiliates", "check_follow_relationship", "check_retweet_status",
                         "bulk_user_lookup", "list_members", "list_followers",
-                        "community_timeline", "spaces_details"
+                        "community_timeline", "spaces_details",
+                        "follower_network", "author_deep_dive"
                     ],
                     "description": "Query pattern to use"
                 },
@@ -412,6 +428,93 @@ class TwitterIntegration(DatabaseIntegration):
             "reasoning": result["reasoning"]
         }
 
+    def _relationship_steps(self, relationship: str, params: Dict, max_pages: int, limit: int) -> List[Dict]:
+        """
+        Build concurrent step plans for a multi-endpoint relationship pattern.
+
+        Only endpoints whose required params are all present in `params` are
+        included (e.g. author_deep_dive with a screenname runs profile,
+        timeline, followers and following; search-dependent endpoints are
+        skipped because they need output from an earlier step).
+        """
+        by_endpoint = {p["endpoint"]: name for name, p in self.QUERY_PATTERNS.items()}
+        steps = []
+        for endpoint in self.RELATIONSHIP_TYPES[relationship]["endpoints"]:
+            pattern = by_endpoint.get(endpoint)
+            if pattern is None:
+                continue
+            spec = self.QUERY_PATTERNS[pattern]
+            if not all(params.get(p) for p in spec["required_params"]):
+                continue
+            allowed = set(spec["required_params"]) | set(spec["optional_params"])
+            steps.append({
+                "pattern": pattern,
+                "endpoint": endpoint,
+                "params": {k: v for k, v in params.items() if k in allowed},
+                "max_pages": max_pages,
+                "limit": limit
+            })
+        return steps
+
+    def _transform_response(self, pattern: str, data: Dict, limit: int) -> List[Dict]:
+        """Transform an endpoint response to standardized results based on pattern."""
+        standardized_results = []
+
+        # Handle different response types
+        if pattern in ["search_tweets", "user_timeline", "tweet_replies", "user_media", "list_timeline"]:
+            # These return timeline arrays
+            timeline = data.get("timeline", [])
+            for tweet in timeline[:limit]:
+                standardized_results.append(self._transform_tweet_to_standard(tweet))
+
+        elif pattern in ["user_followers", "user_following"]:
+            # These return user arrays
+            users = data.get("followers", data.get("following", []))
+            for user in users[:limit]:
+                standardized_results.append(self._transform_user_to_standard(user))
+
+        elif pattern == "user_profile":
+            # Returns single user object
+            if data:
+                standardized_results.append(self._transform_user_to_standard(data))
+
+        elif pattern in ["tweet_details", "tweet_thread"]:
+            # Returns single tweet or thread
+            if pattern == "tweet_details" and data:
+                standardized_results.append(self._transform_tweet_to_standard(data))
+            elif pattern == "tweet_thread":
+                thread = data.get("thread", [])
+                for tweet in thread[:limit]:
+                    standardized_results.append(self._transform_tweet_to_standard(tweet))
+
+        elif pattern == "retweet_users":
+            # Returns users who retweeted
+            retweeters = data.get("retweets", [])
+            for user in retweeters[:limit]:
+                standardized_results.append(self._transform_user_to_standard(user))
+
+        elif pattern == "trending_topics":
+            # Returns trending topics
+            trends = data.get("trends", [])
+            for trend in trends[:limit]:
+                trend_name = SearchResultBuilder.safe_text(trend.get("name"))
+                url = f"https://twitter.com/search?q={trend_name}" if trend_name else ""
+                snippet_text = trend.get("description") or trend.get("context")
+                # Three-tier model: preserve full content with build_with_raw()
+                standardized_results.append(SearchResultBuilder()
+                    .title(trend_name, default="Trending Topic")
+                    .url(url)
+                    .snippet(snippet_text)
+                    .raw_content(snippet_text)  # Full content
+                    .api_response(trend)  # Preserve complete API response
+                    .metadata({
+                        "trend_name": trend_name,
+                        "trend_context": trend.get("context", "")
+                    })
+                    .build_with_raw())
+
+        return standardized_results
+
     def _transform_tweet_to_standard(self, tweet: Dict) -> Dict:
         """
         Transform a tweet object to standardized SIGINT format using defensive builder.
@@ -540,21 +643,24 @@ class TwitterIntegration(DatabaseIntegration):
             if param_hints:
                 params.update(param_hints)
 
-            # Prepare step plan for api_client
-            step_plan = {
-                "endpoint": endpoint,
-                "params": params,
-                "max_pages": max_pages,
-                "reason": query_params.get("reasoning", f"Twitter {pattern}")
-            }
+            client = self._get_client(api_key)
 
-            # Execute using api_client (synchronous, so wrap in thread)
-            result = await asyncio.to_thread(execute_api_step, step_plan, [], api_key)
+            if pattern in self.RELATIONSHIP_TYPES:
+                # Multi-endpoint pattern: run independent endpoints concurrently
+                steps = self._relationship_steps(pattern, params, max_pages, limit)
+                if not steps:
+                    raise ValueError(f"No executable endpoints for relationship '{pattern}' with params {params}")
+                results = await client.fetch_many(steps)
+            else:
+                steps = [{"pattern": pattern, "endpoint": endpoint}]
+                results = [await client.fetch(endpoint, params, max_pages=max_pages, limit=limit)]
 
             response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
-            # Check for errors
-            if "error" in result:
+            # Check for errors (multi-endpoint: fail only if every endpoint failed)
+            errors = [r for r in results if "error" in r]
+            if len(errors) == len(results):
+                result = errors[0]
                 log_request(
                     api_name="Twitter (RapidAPI)",
                     endpoint=endpoint,
@@ -576,61 +682,18 @@ class TwitterIntegration(DatabaseIntegration):
                 )
 
             # Transform results based on pattern/endpoint type
-            data = result.get("data", {})
             standardized_results = []
-
-            # Handle different response types
-            if pattern in ["search_tweets", "user_timeline", "tweet_replies", "user_media", "list_timeline"]:
-                # These return timeline arrays
-                timeline = data.get("timeline", [])
-                for tweet in timeline[:limit]:
-                    standardized_results.append(self._transform_tweet_to_standard(tweet))
-
-            elif pattern in ["user_followers", "user_following"]:
-                # These return user arrays
-                users = data.get("followers", data.get("following", []))
-                for user in users[:limit]:
-                    standardized_results.append(self._transform_user_to_standard(user))
-
-            elif pattern == "user_profile":
-                # Returns single user object
-                if data:
-                    standardized_results.append(self._transform_user_to_standard(data))
-
-            elif pattern in ["tweet_details", "tweet_thread"]:
-                # Returns single tweet or thread
-                if pattern == "tweet_details" and data:
-                    standardized_results.append(self._transform_tweet_to_standard(data))
-                elif pattern == "tweet_thread":
-                    thread = data.get("thread", [])
-                    for tweet in thread[:limit]:
-                        standardized_results.append(self._transform_tweet_to_standard(tweet))
-
-            elif pattern == "retweet_users":
-                # Returns users who retweeted
-                retweeters = data.get("retweets", [])
-                for user in retweeters[:limit]:
-                    standardized_results.append(self._transform_user_to_standard(user))
-
-            elif pattern == "trending_topics":
-                # Returns trending topics
-                trends = data.get("trends", [])
-                for trend in trends[:limit]:
-                    trend_name = SearchResultBuilder.safe_text(trend.get("name"))
-                    url = f"https://twitter.com/search?q={trend_name}" if trend_name else ""
-                    snippet_text = trend.get("description") or trend.get("context")
-                    # Three-tier model: preserve full content with build_with_raw()
-                    standardized_results.append(SearchResultBuilder()
-                        .title(trend_name, default="Trending Topic")
-                        .url(url)
-                        .snippet(snippet_text)
-                        .raw_content(snippet_text)  # Full content
-                        .api_response(trend)  # Preserve complete API response
-                        .metadata({
-                            "trend_name": trend_name,
-                            "trend_context": trend.get("context", "")
-                        })
-                        .build_with_raw())
+            pages_fetched = 0
+            for step, result in zip(steps, results):
+                if "error" in result:
+                    logger.warning(f"Twitter {step['endpoint']} failed: {result['error']}")
+                    continue
+                pages_fetched += result.get("pages_fetched", 0)
+                step_results = self._transform_response(step["pattern"], result.get("data", {}), limit)
+                if len(steps) > 1:
+                    for item in step_results:
+                        item["metadata"]["relationship_endpoint"] = step["endpoint"]
+                standardized_results.extend(step_results)
 
             # Log successful request
             log_request(
@@ -652,7 +715,8 @@ class TwitterIntegration(DatabaseIntegration):
                 metadata={
                     "pattern": pattern,
                     "endpoint": endpoint,
-                    "pages_fetched": max_pages,
+                    "pages_fetched": pages_fetched,
+                    "endpoints_called": [step["endpoint"] for step in steps],
                     "params_used": params
                 }
             )
@@ -17,6 +17,7 @@ Features:
 - Provider fallback support (try alternative models if primary fails)
 - Configuration integration
 - Cost tracking (LiteLLM built-in)
+- Call metrics per model/role: latency, tokens, cost (core.metrics)
 """
 
 import litellm
@@ -25,8 +26,12 @@ import json
 import math
 from typing import List, Dict, Any, Optional, Union
 import logging
+import time
 from datetime import datetime
 
+from core import metrics
+from core.deadline import clamp_timeout, with_deadline
+
 # ============================================================================
 # Temporal Context Injection
 # ============================================================================
@@ -482,6 +487,7 @@ async def acompletion(
     messages: List[Dict[str, str]],
     timeout: Optional[float] = None,
     temporal_context: Optional[bool] = None,
+    role: Optional[str] = None,
     **kwargs
 ) -> Any:
     """
@@ -493,11 +499,13 @@ async def acompletion(
     Args:
         model: Model name
         messages: List of message dicts
-        timeout: Timeout in seconds (default: from config or 60s)
+        timeout: Timeout in seconds (default: from config or 60s), clamped to
+                 the time left before the active run deadline (core.deadline)
         temporal_context: Override temporal context injection
                          None = use config (default: enabled)
                          True = force enable
                          False = force disable
+        role: Task role for call metrics (core.metrics); None = "default"
         **kwargs: Additional parameters
 
     Returns:
@@ -517,13 +525,26 @@ async def acompletion(
         else:
             timeout = 60  # Fallback default
 
+    # Never outlive the run deadline (see core.deadline); raises once it has passed
+    timeout = clamp_timeout(timeout)
+
     # Inject temporal context (current date) into messages
     messages_with_context = _inject_temporal_context(messages, temporal_context)
 
     start_time = datetime.now()
-    response = await UnifiedLLM.acompletion(model, messages_with_context, timeout=timeout, **kwargs)
+    started = time.perf_counter()
+    try:
+        # with_deadline also bounds the 503 retry and fallback-model attempts as a whole
+        response = await with_deadline(
+            UnifiedLLM.acompletion(model, messages_with_context, timeout=timeout, **kwargs)
+        )
+    except BaseException:
+        metrics.record_llm_call(model, role, time.perf_counter() - started, status="error")
+        raise
+    duration_seconds = time.perf_counter() - started
 
     # Calculate and track cost using LiteLLM's built-in function
+    cost = None
     try:
         cost = litellm.completion_cost(completion_response=response)
         if cost > 0:
@@ -533,9 +554,27 @@ async def acompletion(
         # This is best-effort only and shouldn't fail the LLM request
         logger.debug(f"Cost tracking failed: {e}", exc_info=True)
 
+    prompt_tokens, completion_tokens = _usage_tokens(response)
+    metrics.record_llm_call(model, role, duration_seconds, prompt_tokens=prompt_tokens,
+                            completion_tokens=completion_tokens, cost_dollars=cost)
+
     return response
 
 
+def _usage_tokens(response: Any) -> tuple:
+    """(prompt_tokens, completion_tokens) from a response's usage (dict or object), None if absent."""
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None, None
+    get = usage.get if isinstance(usage, dict) else lambda key: getattr(usage, key, None)
+    prompt_tokens = get("prompt_tokens") or get("input_tokens")
+    completion_tokens = get("completion_tokens") or get("output_tokens")
+    return (
+        prompt_tokens if isinstance(prompt_tokens, int) else None,
+        completion_tokens if isinstance(completion_tokens, int) else None,
+    )
+
+
 # ============================================================================
 # Cost Tracking Functions
 # ============================================================================
@@ -676,4 +715,4 @@ async def acompletion_with_role(
     logging.debug(f"LLM call with role={role}, model={model}")
 
     # Delegate to standard acompletion
-    return await acompletion(model=model, messages=messages, **kwargs)
+    return await acompletion(model=model, messages=messages, role=role, **kwargs)
@@ -10,15 +10,19 @@ Key differences vs BooleanMonitor:
 - Multiple search phases per keyword
 - Quality-driven iteration
 - Entity discovery tracking
+- Keywords run concurrently (bounded by keyword_concurrency) and share one
+  engine state: seen URLs, entity extraction cache, cross-keyword entity seeding
 
 Usage:
     monitor = AdaptiveBooleanMonitor("data/monitors/configs/surveillance_fisa_monitor.yaml")
     await monitor.run()
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+import asyncio
 import logging
+import time
 import yaml
 from pathlib import Path
 import sys
@@ -28,6 +32,7 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from core.metrics import MeteredSemaphore
 from monitoring.boolean_monitor import BooleanMonitor, MonitorConfig
 
 logger = logging.getLogger('AdaptiveBooleanMonitor')
@@ -42,6 +47,7 @@ class AdaptiveConfig:
     phase2_per_query: int = 10       # Results per follow-up search
     max_iterations: int = 3          # Maximum refinement iterations
     min_quality: float = 0.6         # Quality threshold to stop iterating
+    keyword_concurrency: int = 4     # Keywords searched at the same time
 
 
 class AdaptiveBooleanMonitor(BooleanMonitor):
@@ -76,6 +82,9 @@ class AdaptiveBooleanMonitor(BooleanMonitor):
         # Load adaptive configuration
         self.adaptive_config = self._load_adaptive_config(config_path)
         self.adaptive_enabled = self.adaptive_config is not None
+        self._adaptive_databases: Optional[Tuple[List[Tuple[str, Any]], Dict[str, str]]] = None
+        # Per-keyword and per-phase timing of the latest adaptive run
+        self.last_search_timing: Dict[str, Any] = {}
 
         if self.adaptive_enabled:
             logger.info(f"Adaptive search ENABLED for '{self.config.name}'")
@@ -111,17 +120,66 @@ class AdaptiveBooleanMonitor(BooleanMonitor):
             phase2_queries=adaptive_data.get('phase2_queries', 4),
             phase2_per_query=adaptive_data.get('phase2_per_query', 10),
             max_iterations=adaptive_data.get('max_iterations', 3),
-            min_quality=adaptive_data.get('min_quality', 0.6)
+            min_quality=adaptive_data.get('min_quality', 0.6),
+            keyword_concurrency=adaptive_data.get('keyword_concurrency', 4)
         )
 
+    def _get_adaptive_databases(self) -> Tuple[List, Dict[str, str]]:
+        """
+        Database integrations and API keys for the configured sources.
+
+        Built once per monitor and reused across runs and keywords. Under a
+        MonitorScheduler the integrations are wrapped by the shared
+        SearchCoalescer, so adaptive searches count against the same
+        per-source cap as every other monitor's searches.
+        """
+        if self._adaptive_databases is None:
+            self._adaptive_databases = self._load_adaptive_databases()
+        sources, api_keys = self._adaptive_databases
+        if self.search_coalescer is not None:
+            return [self.search_coalescer.throttle(source_id, db) for source_id, db in sources], api_keys
+        return [db for _, db in sources], api_keys
+
+    def _load_adaptive_databases(self) -> Tuple[List[Tuple[str, Any]], Dict[str, str]]:
+        """Instantiate ((source_id, integration) pairs, API keys) for the configured sources."""
+        from integrations.registry import registry
+        from dotenv import load_dotenv
+        import os
+
+        load_dotenv()
+
+        databases = []
+        api_keys = {}
+
+        for source_id in self.config.sources:
+            integration_class = registry.get(source_id)
+            if integration_class:
+                integration = integration_class()
+                databases.append((source_id, integration))
+
+                # Get API key if needed
+                if integration.metadata.requires_api_key:
+                    api_key_var = f"{source_id.upper().replace('-', '_')}_API_KEY"
+                    api_key = os.getenv(api_key_var, '')
+                    if api_key:
+                        api_keys[source_id] = api_key
+            else:
+                logger.warning(f"Unknown source in config: {source_id}")
+
+        logger.info(f"Loaded {len(databases)} database integrations")
+        return databases, api_keys
+
     async def execute_search(self, keywords: List[str]) -> List[Dict]:
         """
         Execute searches - uses adaptive or standard based on config.
 
         If adaptive_search enabled:
-        - Uses AdaptiveSearchEngine for each keyword
+        - Runs AdaptiveSearchEngine for all keywords concurrently (at most
+          keyword_concurrency at a time) with one SharedSearchState, so URLs
+          are reported once and entities found for one keyword can seed
+          follow-up searches for the others
         - Collects all results from all phases
-        - Returns combined results
+        - Records per-keyword/per-phase timing in last_search_timing
 
         If adaptive_search disabled:
         - Falls back to parent BooleanMonitor.execute_search()
@@ -138,16 +196,12 @@ class AdaptiveBooleanMonitor(BooleanMonitor):
             return await super().execute_search(keywords)
 
         # Use adaptive search
-        logger.info(f"Using ADAPTIVE search for {len(keywords)} keywords")
+        logger.info(f"Using ADAPTIVE search for {len(keywords)} keywords "
+                    f"({self.adaptive_config.keyword_concurrency} concurrent)")
 
         # Import adaptive search engine
-        from core.adaptive_search_engine import AdaptiveSearchEngine
+        from core.adaptive_search_engine import AdaptiveSearchEngine, SharedSearchState
         from core.parallel_executor import ParallelExecutor
-        from integrations.registry import registry
-        from dotenv import load_dotenv
-        import os
-
-        load_dotenv()
 
         # Initialize AdaptiveSearchEngine
         engine = AdaptiveSearchEngine(
@@ -159,77 +213,79 @@ class AdaptiveBooleanMonitor(BooleanMonitor):
             max_iterations=self.adaptive_config.max_iterations,
             min_quality=self.adaptive_config.min_quality
         )
+        databases, api_keys = self._get_adaptive_databases()
+        shared_state = SharedSearchState()
+        semaphore = MeteredSemaphore(max(1, self.adaptive_config.keyword_concurrency), name="monitor_keywords")
+
+        async def search_keyword(keyword: str):
+            async with semaphore:
+                logger.info(f"ADAPTIVE SEARCH: '{keyword}'")
+                try:
+                    return await engine.adaptive_search(
+                        initial_query=keyword,
+                        databases=databases,
+                        api_keys=api_keys,
+                        shared_state=shared_state
+                    )
+                except Exception as e:
+                    logger.error(f"Adaptive search failed for '{keyword}': {str(e)}", exc_info=True)
+                    # Continue with other keywords even if one fails
+                    return None
+
+        run_start = time.monotonic()
+        adaptive_results = await asyncio.gather(*(search_keyword(k) for k in keywords))
+        wall_seconds = time.monotonic() - run_start
 
-        # Load database integrations for configured sources
-        databases = []
-        api_keys = {}
-
-        for source_id in self.config.sources:
-            integration_class = registry.get(source_id)
-            if integration_class:
-                integration = integration_class()
-                databases.append(integration)
-
-                # Get API key if needed
-                if integration.metadata.requires_api_key:
-                    api_key_var = f"{source_id.upper().replace('-', '_')}_API_KEY"
-                    api_key = os.getenv(api_key_var, '')
-                    if api_key:
-                        api_keys[source_id] = api_key
-            else:
-                logger.warning(f"Unknown source in config: {source_id}")
-
-        logger.info(f"Loaded {len(databases)} database integrations")
-
-        # Execute adaptive search for each keyword
         all_results = []
         all_entities = []
-
-        for keyword in keywords:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"ADAPTIVE SEARCH: '{keyword}'")
-            logger.info(f"{'='*60}")
-
-            try:
-                # Run adaptive search
-                adaptive_result = await engine.adaptive_search(
-                    initial_query=keyword,
-                    databases=databases,
-                    api_keys=api_keys
-                )
-
-                # Log adaptive search summary
-                logger.info(f"\nAdaptive search complete for '{keyword}':")
-                logger.info(f"  Total results: {adaptive_result.total_results}")
-                logger.info(f"  Unique results: {adaptive_result.unique_results}")
-                logger.info(f"  Phases: {adaptive_result.iterations}")
-                logger.info(f"  Entities discovered: {len(adaptive_result.entities_discovered)}")
-                logger.info(f"  Quality: {adaptive_result.quality_metrics.get('overall_quality', 0):.2f}")
-
-                if adaptive_result.quality_metrics.get('warnings'):
-                    logger.info(f"  Warnings: {adaptive_result.quality_metrics['warnings']}")
-
-                # Log entities discovered
-                if adaptive_result.entities_discovered:
-                    logger.info(f"  Entities: {adaptive_result.entities_discovered[:5]}...")
-                    all_entities.extend(adaptive_result.entities_discovered)
-
-                # Collect results from all phases
-                for phase in adaptive_result.phases:
-                    for result in phase.results:
-                        # Add keyword field for tracking
-                        result['keyword'] = keyword
-                        # Add phase information
-                        result['adaptive_phase'] = phase.phase_num
-                        result['adaptive_quality'] = phase.quality_score
-
-                        all_results.append(result)
-
-                logger.info(f"Collected {len([r for r in all_results if r['keyword'] == keyword])} results for '{keyword}'")
-
-            except Exception as e:
-                logger.error(f"Adaptive search failed for '{keyword}': {str(e)}", exc_info=True)
-                # Continue with other keywords even if one fails
+        timing = {"wall_seconds": wall_seconds, "keywords": {}}
+
+        for keyword, adaptive_result in zip(keywords, adaptive_results):
+            if adaptive_result is None:
+                continue
+
+            # Log adaptive search summary
+            logger.info(f"\nAdaptive search complete for '{keyword}':")
+            logger.info(f"  Total results: {adaptive_result.total_results}")
+            logger.info(f"  Phases: {adaptive_result.iterations}")
+            logger.info(f"  Entities discovered: {len(adaptive_result.entities_discovered)}")
+            logger.info(f"  Quality: {adaptive_result.quality_metrics.get('overall_quality', 0):.2f}")
+            dedup = adaptive_result.quality_metrics.get('dedup') or {}
+            if dedup.get('seen'):
+                logger.info(f"  Duplicates collapsed: {dedup['url_duplicates'] + dedup['content_duplicates']}/{dedup['seen']} "
+                            f"({dedup['dedup_ratio']:.0%}, {dedup['content_duplicates']} by content)")
+            logger.info(f"  Time: {adaptive_result.duration_seconds:.1f}s "
+                        f"(phases: {', '.join(f'{p.duration_seconds:.1f}s' for p in adaptive_result.phases)})")
+
+            if adaptive_result.quality_metrics.get('warnings'):
+                logger.info(f"  Warnings: {adaptive_result.quality_metrics['warnings']}")
+
+            # Log entities discovered
+            if adaptive_result.entities_discovered:
+                logger.info(f"  Entities: {adaptive_result.entities_discovered[:5]}...")
+                all_entities.extend(adaptive_result.entities_discovered)
+
+            timing["keywords"][keyword] = {
+                "seconds": adaptive_result.duration_seconds,
+                "phases": [
+                    {"phase": p.phase_num, "seconds": p.duration_seconds, "results": len(p.results)}
+                    for p in adaptive_result.phases
+                ]
+            }
+
+            # Collect results from all phases
+            for phase in adaptive_result.phases:
+                for result in phase.results:
+                    # Add keyword field for tracking
+                    result['keyword'] = keyword
+                    # Add phase information
+                    result['adaptive_phase'] = phase.phase_num
+                    result['adaptive_quality'] = phase.quality_score
+
+                    all_results.append(result)
+
+        self.last_search_timing = timing
+        keyword_seconds = sum(k["seconds"] for k in timing["keywords"].values())
 
         # Log summary
         logger.info(f"\n{'='*60}")
@@ -238,6 +294,7 @@ class AdaptiveBooleanMonitor(BooleanMonitor):
         logger.info(f"Keywords searched: {len(keywords)}")
         logger.info(f"Total results: {len(all_results)}")
         logger.info(f"Unique entities discovered: {len(set(all_entities))}")
+        logger.info(f"Time: {wall_seconds:.1f}s wall, {keyword_seconds:.1f}s summed across keywords")
 
         return all_results
 
@@ -22,6 +22,9 @@ import json
 import yaml
 import logging
 
+from core import metrics
+from core.content_dedup import ContentDeduplicator
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -74,6 +77,10 @@ class BooleanMonitor:
         self.config: MonitorConfig = self.load_config(config_path)
         self.storage_path: Path = Path(f"data/monitors/{self.config.name.replace(' ', '_')}_results.json")
         self.previous_results: Set[str] = self._load_previous_results()
+        # Set by MonitorScheduler to share identical searches across monitors
+        self.search_coalescer = None
+        # Duplicate collapsing stats of the last deduplicate_results() call
+        self.last_dedup_stats: Dict = {}
         logger.info(f"Monitor '{self.config.name}' initialized")
         logger.info(f"  Keywords: {len(self.config.keywords)}")
         logger.info(f"  Sources: {self.config.sources}")
@@ -172,7 +179,7 @@ class BooleanMonitor:
         for source in self.config.sources:
             for keyword in keywords:
                 # Create a task for each keyword+source combination
-                task = self._search_single_source(source, keyword)
+                task = self._search(source, keyword)
                 search_tasks.append(task)
 
         # Execute ALL searches in parallel
@@ -192,6 +199,17 @@ class BooleanMonitor:
         logger.info(f"Parallel search complete: {len(all_results)} total results from {len(search_tasks)} searches ({errors} errors)")
         return all_results
 
+    async def _search(self, source: str, keyword: str) -> List[Dict]:
+        """
+        Search one source for one keyword, through the shared coalescer if set.
+
+        With a coalescer, a search another monitor already ran (or is running)
+        in this scheduling window is reused instead of being issued again.
+        """
+        if self.search_coalescer is None:
+            return await self._search_single_source(source, keyword)
+        return await self.search_coalescer.search(source, keyword, self._search_single_source)
+
     async def _search_single_source(self, source: str, keyword: str) -> List[Dict]:
         """
         Search a single source for a single keyword using registry.
@@ -308,9 +326,12 @@ class BooleanMonitor:
 
     def deduplicate_results(self, results: List[Dict]) -> List[Dict]:
         """
-        Remove duplicate results based on URL hash.
+        Remove duplicate results (canonical URL, then content SimHash).
 
-        Strategy: Hash each result URL, keep only unique hashes
+        Strategy: URL variants (tracking params, mobile/AMP, archive.org
+        copies) and near-identical articles from different sources collapse
+        into the first result, which keeps every copy's source in its
+        'provenance' list. Results without a URL are dropped.
 
         Args:
             results: List of search results
@@ -320,22 +341,12 @@ class BooleanMonitor:
         """
         logger.info(f"Deduplicating {len(results)} results")
 
-        seen_hashes = set()
-        unique_results = []
-
-        for result in results:
-            url = result.get('url', '')
-            if not url:
-                continue
-
-            # Create hash of URL
-            url_hash = hashlib.sha256(url.encode()).hexdigest()
-
-            if url_hash not in seen_hashes:
-                seen_hashes.add(url_hash)
-                unique_results.append(result)
+        dedup = ContentDeduplicator()
+        unique_results = dedup.deduplicate(result for result in results if result.get('url'))
+        self.last_dedup_stats = dedup.summary()
 
-        logger.info(f"Deduplication complete: {len(unique_results)} unique results (removed {len(results) - len(unique_results)} duplicates)")
+        logger.info(f"Deduplication complete: {len(unique_results)} unique results (removed {len(results) - len(unique_results)} duplicates, "
+                    f"{dedup.stats['content_duplicates']} by content, ratio {dedup.dedup_ratio:.0%})")
         return unique_results
 
     def check_for_new_results(self, current_results: List[Dict]) -> List[Dict]:
@@ -715,39 +726,41 @@ Found {len(new_results)} new results:
             logger.warning(f"Monitor '{self.config.name}' is disabled, skipping")
             return
 
-        try:
-            # 1. Execute searches
-            results = await self.execute_search(self.config.keywords)
-
-            # 2. Deduplicate
-            unique_results = self.deduplicate_results(results)
+        with metrics.monitor_run(self.config.name):
+            try:
+                # 1. Execute searches
+                results = await self.execute_search(self.config.keywords)
 
-            # 3. Check for new results
-            new_results = self.check_for_new_results(unique_results)
+                # 2. Deduplicate
+                unique_results = self.deduplicate_results(results)
 
-            # 4. Filter by LLM relevance
-            if new_results:
-                relevant_results = await self.filter_by_relevance(new_results)
-            else:
-                relevant_results = []
+                # 3. Check for new results
+                new_results = self.check_for_new_results(unique_results)
 
-            # 5. Send alert if relevant results found
-            if relevant_results:
-                await self.send_alert(relevant_results)
-            else:
+                # 4. Filter by LLM relevance
                 if new_results:
-                    logger.info(f"Found {len(new_results)} new results, but all filtered out as not relevant")
+                    relevant_results = await self.filter_by_relevance(new_results)
                 else:
-                    logger.info("No new results found, skipping alert")
+                    relevant_results = []
 
-            # 6. Save results for next run
-            self._save_results(unique_results)
+                # 5. Send alert if relevant results found
+                if relevant_results:
+                    await self.send_alert(relevant_results)
+                else:
+                    if new_results:
+                        logger.info(f"Found {len(new_results)} new results, but all filtered out as not relevant")
+                    else:
+                        logger.info("No new results found, skipping alert")
 
-            logger.info(f"Monitor run complete: {len(unique_results)} total results, {len(new_results)} new")
+                # 6. Save results for next run
+                self._save_results(unique_results)
 
-        except Exception as e:
-            logger.error(f"Monitor run failed: {str(e)}", exc_info=True)
-            raise
+                logger.info(f"Monitor run complete: {len(unique_results)} total results, {len(new_results)} new, "
+                            f"dedup ratio {self.last_dedup_stats.get('dedup_ratio', 0.0):.0%}")
+
+            except Exception as e:
+                logger.error(f"Monitor run failed: {str(e)}", exc_info=True)
+                raise
 
 
 # Example usage
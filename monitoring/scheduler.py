@@ -3,13 +3,15 @@
 Monitor Scheduler - Automated execution of Boolean monitors.
 
 This module provides scheduling functionality for running monitors at
-specified intervals (daily, hourly, etc.).
+specified intervals (daily, hourly, etc.). Monitors due at the same time
+are staggered and share identical searches (see SearchCoalescer).
 """
 
 import asyncio
 import logging
+import random
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -21,7 +23,9 @@ project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from core import metrics
 from monitoring.adaptive_boolean_monitor import AdaptiveBooleanMonitor
+from monitoring.search_coalescer import SearchCoalescer
 
 # Configure logging
 logging.basicConfig(
@@ -40,14 +44,63 @@ class MonitorScheduler:
     - hourly: Every hour
     - every_30min: Every 30 minutes
     - manual: No automatic execution
+
+    Monitors sharing a schedule form one window: a single job fires for the
+    window and starts its monitors staggered across stagger_window_seconds
+    instead of all at once. Every monitor searches through one shared
+    SearchCoalescer, so identical (source, keyword) searches run once per
+    window and no source sees more than max_concurrent_per_source searches
+    at a time across all monitors.
     """
 
-    def __init__(self):
-        """Initialize the scheduler."""
+    def __init__(self, stagger_window_seconds: float = 300, max_concurrent_per_source: int = 2,
+                 coalesce_ttl_seconds: float = 900):
+        """
+        Initialize the scheduler.
+
+        Args:
+            stagger_window_seconds: Spread monitor start times in a window over this many seconds
+            max_concurrent_per_source: Concurrent searches allowed per source across all monitors
+            coalesce_ttl_seconds: How long a finished search is reused by other monitors
+        """
         self.scheduler = AsyncIOScheduler()
         self.monitors: List[AdaptiveBooleanMonitor] = []
+        self.windows: Dict[str, List[AdaptiveBooleanMonitor]] = {}
+        self.stagger_window_seconds = stagger_window_seconds
+        self.coalescer = SearchCoalescer(
+            max_concurrent_per_source=max_concurrent_per_source,
+            ttl_seconds=coalesce_ttl_seconds
+        )
         logger.info("MonitorScheduler initialized")
 
+    def _parse_schedule(self, schedule: str) -> Tuple[Any, str]:
+        """
+        Build the APScheduler trigger for a schedule string.
+
+        Returns:
+            (trigger, human-readable description)
+
+        Raises:
+            ValueError: If the schedule format is not recognized
+        """
+        if schedule == "daily_6am":
+            return CronTrigger(hour=6, minute=0), "Daily at 6:00 AM"
+        if schedule == "hourly":
+            return IntervalTrigger(hours=1), "Hourly"
+        if schedule == "every_30min":
+            return IntervalTrigger(minutes=30), "Every 30 minutes"
+        if schedule.startswith("daily_"):
+            # daily_HHam or daily_HHpm format
+            time_part = schedule.replace("daily_", "")
+            if time_part.endswith("am"):
+                hour = int(time_part.replace("am", ""))
+            elif time_part.endswith("pm"):
+                hour = int(time_part.replace("pm", "")) + 12
+            else:
+                raise ValueError(f"Invalid daily schedule format: {schedule}")
+            return CronTrigger(hour=hour, minute=0), f"Daily at {hour}:00"
+        raise ValueError(f"Unknown schedule format: {schedule}")
+
     def add_monitor(self, config_path: str):
         """
         Add a monitor to the scheduler.
@@ -62,6 +115,7 @@ class MonitorScheduler:
                 logger.info(f"Monitor '{monitor.config.name}' is disabled, skipping")
                 return
 
+            monitor.search_coalescer = self.coalescer
             self.monitors.append(monitor)
 
             # Parse schedule and add job
@@ -71,73 +125,108 @@ class MonitorScheduler:
                 logger.info(f"Monitor '{monitor.config.name}' set to manual - no automatic scheduling")
                 return
 
-            elif schedule == "daily_6am":
-                # Every day at 6:00 AM
-                trigger = CronTrigger(hour=6, minute=0)
-                self.scheduler.add_job(
-                    self._run_monitor,
-                    trigger,
-                    args=[monitor],
-                    id=f"monitor_{monitor.config.name}",
-                    name=monitor.config.name
-                )
-                logger.info(f"Scheduled '{monitor.config.name}' - Daily at 6:00 AM")
-
-            elif schedule == "hourly":
-                # Every hour
-                trigger = IntervalTrigger(hours=1)
-                self.scheduler.add_job(
-                    self._run_monitor,
-                    trigger,
-                    args=[monitor],
-                    id=f"monitor_{monitor.config.name}",
-                    name=monitor.config.name
-                )
-                logger.info(f"Scheduled '{monitor.config.name}' - Hourly")
+            try:
+                trigger, description = self._parse_schedule(schedule)
+            except ValueError as e:
+                # Invalid schedule format - skip this monitor
+                logger.error(f"Invalid schedule format '{schedule}' for monitor '{monitor.config.name}': {e}", exc_info=True)
+                return
 
-            elif schedule == "every_30min":
-                # Every 30 minutes
-                trigger = IntervalTrigger(minutes=30)
+            if schedule not in self.windows:
+                self.windows[schedule] = []
                 self.scheduler.add_job(
-                    self._run_monitor,
+                    self._run_window,
                     trigger,
-                    args=[monitor],
-                    id=f"monitor_{monitor.config.name}",
-                    name=monitor.config.name
+                    args=[schedule],
+                    id=f"window_{schedule}",
+                    name=f"{schedule} monitors"
                 )
-                logger.info(f"Scheduled '{monitor.config.name}' - Every 30 minutes")
-
-            elif schedule.startswith("daily_"):
-                # daily_HHam or daily_HHpm format
-                try:
-                    time_part = schedule.replace("daily_", "")
-                    if time_part.endswith("am"):
-                        hour = int(time_part.replace("am", ""))
-                    elif time_part.endswith("pm"):
-                        hour = int(time_part.replace("pm", "")) + 12
-                    else:
-                        raise ValueError(f"Invalid daily schedule format: {schedule}")
-
-                    trigger = CronTrigger(hour=hour, minute=0)
-                    self.scheduler.add_job(
-                        self._run_monitor,
-                        trigger,
-                        args=[monitor],
-                        id=f"monitor_{monitor.config.name}",
-                        name=monitor.config.name
-                    )
-                    logger.info(f"Scheduled '{monitor.config.name}' - Daily at {hour}:00")
-
-                except ValueError as e:
-                    # Invalid schedule format - skip this monitor
-                    logger.error(f"Invalid schedule format '{schedule}' for monitor '{monitor.config.name}': {e}", exc_info=True)
-
-            else:
-                logger.warning(f"Unknown schedule format '{schedule}' for monitor '{monitor.config.name}'")
+            self.windows[schedule].append(monitor)
+            logger.info(
+                f"Scheduled '{monitor.config.name}' - {description} "
+                f"({len(self.windows[schedule])} monitors in window)"
+            )
 
         except Exception as e:
             logger.error(f"Failed to add monitor from {config_path}: {str(e)}")
 
+    def _planned_searches(self, monitor: AdaptiveBooleanMonitor) -> Set[Tuple[str, ...]]:
+        """(source, keyword) searches a monitor will issue, in coalescer key form."""
+        if getattr(monitor, "adaptive_enabled", False):
+            # Adaptive searches share the per-source slots, and identical generated
+            # queries are shared, but their LLM-built queries can't be planned per keyword
+            return {
+                (monitor.config.name, source, keyword)
+                for source in monitor.config.sources for keyword in monitor.config.keywords
+            }
+        return {
+            self.coalescer.search_key(source, keyword)
+            for source in monitor.config.sources for keyword in monitor.config.keywords
+        }
+
+    def _stagger_offsets(self, monitors: List[AdaptiveBooleanMonitor], window_seconds: float) -> List[float]:
+        """
+        Start delay for each monitor, spread by search load.
+
+        Each monitor gets a slot of the window proportional to the searches
+        it adds that earlier monitors in the window don't already cover, and
+        starts at a random point in the first half of its slot. Monitors whose
+        searches are all covered start immediately after their predecessors
+        and simply subscribe to the shared results.
+        """
+        seen: Set[Tuple[str, ...]] = set()
+        loads = []
+        for monitor in monitors:
+            planned = self._planned_searches(monitor)
+            loads.append(len(planned - seen))
+            seen |= planned
+
+        total = sum(loads)
+        if total == 0 or window_seconds <= 0:
+            return [0.0] * len(monitors)
+
+        offsets = []
+        cumulative = 0
+        for load in loads:
+            slot = window_seconds * load / total
+            offsets.append(window_seconds * cumulative / total + random.uniform(0, slot / 2))
+            cumulative += load
+        return offsets
+
+    async def _run_window(self, schedule: str):
+        """Run all monitors of one schedule window (called by scheduler)."""
+        await self.run_window(self.windows.get(schedule, []))
+
+    async def run_window(self, monitors: List[AdaptiveBooleanMonitor], stagger_seconds: Optional[float] = None):
+        """
+        Run monitors staggered, sharing searches through the coalescer.
+
+        Args:
+            monitors: Monitors to run
+            stagger_seconds: Spread start times over this window (default: stagger_window_seconds)
+        """
+        if not monitors:
+            return
+        window = self.stagger_window_seconds if stagger_seconds is None else stagger_seconds
+        offsets = self._stagger_offsets(monitors, window)
+        executed_before = self.coalescer.stats["executed"]
+        coalesced_before = self.coalescer.stats["coalesced"]
+
+        async def start_after(monitor: AdaptiveBooleanMonitor, delay: float):
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._run_monitor(monitor)
+
+        logger.info(f"Running window of {len(monitors)} monitors staggered over {window:.0f}s")
+        for monitor in monitors:
+            monitor.search_coalescer = self.coalescer
+        await asyncio.gather(*(start_after(m, delay) for m, delay in zip(monitors, offsets)))
+
+        logger.info(
+            f"Window complete: {self.coalescer.stats['executed'] - executed_before} searches executed, "
+            f"{self.coalescer.stats['coalesced'] - coalesced_before} shared across monitors"
+        )
+
     async def _run_monitor(self, monitor: AdaptiveBooleanMonitor):
         """
         Run a monitor (called by scheduler).
@@ -202,8 +291,37 @@ async def main():
         action="store_true",
         help="Run all monitors once and exit (no scheduling)"
     )
+    parser.add_argument(
+        "--stagger-window",
+        type=float,
+        default=300,
+        help="Seconds over which monitors due at the same time are spread (default: 300)"
+    )
+    parser.add_argument(
+        "--max-per-source",
+        type=int,
+        default=2,
+        help="Concurrent searches per source across all monitors (default: 2)"
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics at http://<metrics-host>:PORT/metrics (default: metrics config)"
+    )
+    parser.add_argument(
+        "--metrics-host",
+        default="127.0.0.1",
+        help="Interface for --metrics-port (use 0.0.0.0 inside Docker)"
+    )
     args = parser.parse_args()
 
+    # Optional /metrics endpoint (LLM, integration, semaphore and monitor-run telemetry)
+    if args.metrics_port is not None:
+        metrics.start_metrics_server(port=args.metrics_port, host=args.metrics_host)
+    else:
+        metrics.start_metrics_server_from_config()
+
     # Find all config files
     config_dir = Path(args.config_dir)
     if not config_dir.exists():
@@ -217,26 +335,30 @@ async def main():
 
     logger.info(f"Found {len(config_files)} configuration files")
 
+    scheduler = MonitorScheduler(
+        stagger_window_seconds=args.stagger_window,
+        max_concurrent_per_source=args.max_per_source
+    )
+
     if args.run_once:
-        # Run all monitors once and exit
+        # Run all monitors once and exit, sharing identical searches
         logger.info("Running all monitors once (no scheduling)")
+        monitors = []
         for config_file in config_files:
             try:
                 monitor = AdaptiveBooleanMonitor(str(config_file))
                 if monitor.config.enabled:
-                    logger.info(f"Running monitor: {monitor.config.name}")
-                    await monitor.run()
+                    monitors.append(monitor)
                 else:
                     logger.info(f"Skipping disabled monitor: {monitor.config.name}")
             except Exception as e:
-                # Monitor execution error - continue with other monitors
-                logger.error(f"Error running {config_file.name}: {str(e)}", exc_info=True)
+                # Monitor config error - continue with other monitors
+                logger.error(f"Error loading {config_file.name}: {str(e)}", exc_info=True)
 
+        await scheduler.run_window(monitors, stagger_seconds=0)
         logger.info("All monitors completed")
     else:
         # Start scheduler
-        scheduler = MonitorScheduler()
-
         for config_file in config_files:
             scheduler.add_monitor(str(config_file))
 
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Search Coalescer - share identical monitor searches across monitors.
+
+Monitors that fire in the same scheduling window often track overlapping
+keywords ("FISA 702" in several monitors) against the same sources. The
+coalescer runs each (source, normalized keyword) search once, hands the
+results to every monitor that asks for it within ttl_seconds, and caps how
+many searches run against any one source at a time across all monitors.
+
+Adaptive monitors query integrations directly (LLM-generated parameters);
+throttle() wraps those integrations so their searches take the same
+per-source slots and identical (source, params, limit) calls are shared.
+
+Usage:
+    coalescer = SearchCoalescer(max_concurrent_per_source=2, ttl_seconds=900)
+    monitor.search_coalescer = coalescer
+    await monitor.run()  # execute_search() now goes through the coalescer
+
+    db = coalescer.throttle("sam", SAMIntegration())
+    result = await db.execute_search(params, api_key, limit)
+"""
+
+import asyncio
+import copy
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core.metrics import MeteredSemaphore
+
+logger = logging.getLogger('SearchCoalescer')
+
+SearchFn = Callable[[str, str], Awaitable[List[Dict]]]
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Keyword form used for coalescing: case-folded, whitespace collapsed."""
+    return " ".join(keyword.split()).casefold()
+
+
+class SearchCoalescer:
+    """
+    Deduplicates (source, keyword) searches and enforces per-source concurrency.
+
+    A search is shared while it is in flight and for ttl_seconds after it
+    starts. Failed searches are not cached, so the next subscriber retries.
+    """
+
+    def __init__(self, max_concurrent_per_source: int = 2, ttl_seconds: float = 900):
+        """
+        Initialize the coalescer.
+
+        Args:
+            max_concurrent_per_source: Searches allowed in flight per source, across all monitors
+            ttl_seconds: How long a completed search is reused by later subscribers
+        """
+        self.max_concurrent_per_source = max_concurrent_per_source
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, str], Tuple[float, asyncio.Future]] = {}
+        self._source_slots: Dict[str, MeteredSemaphore] = {}
+        self.stats = {"executed": 0, "coalesced": 0}
+
+    def search_key(self, source: str, keyword: str) -> Tuple[str, str]:
+        return (source, normalize_keyword(keyword))
+
+    def is_pending(self, source: str, keyword: str) -> bool:
+        """True if this search is already running or cached."""
+        self._expire()
+        return self.search_key(source, keyword) in self._entries
+
+    async def search(self, source: str, keyword: str, search_fn: SearchFn) -> List[Dict]:
+        """
+        Return results for (source, keyword), running search_fn only if needed.
+
+        Each subscriber gets its own copies of the result dicts with 'keyword'
+        set to the keyword it asked for.
+
+        Args:
+            source: Source ID
+            keyword: Keyword as written in the subscribing monitor's config
+            search_fn: Coroutine function (source, keyword) -> results
+
+        Returns:
+            List of standardized results
+        """
+        results = await self._shared(self.search_key(source, keyword), self._run(source, search_fn, keyword),
+                                     f"{source} / '{keyword}'")
+        return [{**result, "keyword": keyword} for result in results]
+
+    def throttle(self, source: str, integration: Any) -> "ThrottledIntegration":
+        """Wrap a database integration so its searches share source's slots and results."""
+        return ThrottledIntegration(self, source, integration)
+
+    async def _shared(self, key: Tuple[str, str], run: Awaitable, label: str) -> Any:
+        """Await the entry for key, starting `run` if there is none (else `run` is discarded)."""
+        self._expire()
+        entry = self._entries.get(key)
+        if entry is None:
+            loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(run)
+            task.add_done_callback(lambda t, key=key: self._forget_failed(key, t))
+            entry = self._entries[key] = (loop.time(), task)
+            self.stats["executed"] += 1
+        else:
+            run.close()
+            self.stats["coalesced"] += 1
+            logger.info(f"  Coalesced search {label} with another monitor")
+
+        # Shield: one subscriber being cancelled must not cancel the shared search
+        return await asyncio.shield(entry[1])
+
+    def source_slots(self, source: str) -> MeteredSemaphore:
+        """Semaphore capping concurrent searches against source, across all monitors."""
+        slots = self._source_slots.get(source)
+        if slots is None:
+            slots = self._source_slots[source] = MeteredSemaphore(self.max_concurrent_per_source,
+                                                                  name=f"coalescer:{source}")
+        return slots
+
+    async def _run(self, source: str, search_fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        async with self.source_slots(source):
+            return await search_fn(source, *args)
+
+    def forget(self, key: Tuple[str, str]) -> None:
+        """Drop a finished entry so the next subscriber runs the search again."""
+        self._entries.pop(key, None)
+
+    def _forget_failed(self, key: Tuple[str, str], task: asyncio.Future) -> None:
+        if task.cancelled() or task.exception() is not None:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is task:
+                del self._entries[key]
+
+    def _expire(self) -> None:
+        try:
+            now = asyncio.get_running_loop().time()
+        except RuntimeError:
+            return
+        expired = [
+            key for key, (started, task) in self._entries.items()
+            if task.done() and now - started > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._entries[key]
+
+
+class ThrottledIntegration:
+    """
+    A DatabaseIntegration whose execute_search() goes through a SearchCoalescer.
+
+    Searches take one of the coalescer's slots for the source, and identical
+    (params, limit) searches from any monitor share one QueryResult for
+    ttl_seconds (unsuccessful results are not shared). Every other attribute
+    (metadata, is_relevant, generate_query_with_reasoning, ...) is delegated
+    to the wrapped integration.
+    """
+
+    def __init__(self, coalescer: SearchCoalescer, source: str, integration: Any):
+        self._coalescer = coalescer
+        self._source = source
+        self._integration = integration
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._integration, name)
+
+    async def _search(self, source: str, query_params: Dict, api_key: Optional[str], limit: int) -> Any:
+        return await self._integration.execute_search(query_params, api_key, limit)
+
+    async def execute_search(self, query_params: Dict, api_key: Optional[str] = None, limit: int = 10) -> Any:
+        key = (self._source, "params:" + json.dumps([query_params, limit], sort_keys=True, default=str))
+        run = self._coalescer._run(self._source, self._search, query_params, api_key, limit)
+        result = await self._coalescer._shared(key, run, f"{self._source} {query_params}")
+        if not getattr(result, "success", True):
+            self._coalescer.forget(key)
+        # Each caller gets its own result dicts (callers annotate them in place)
+        if isinstance(getattr(result, "results", None), list):
+            result = copy.copy(result)
+            result.results = [dict(r) for r in result.results]
+        return result
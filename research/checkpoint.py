@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Checkpoint and resume for recursive research runs.
+
+A run that dies (OOM kill, timeout, Ctrl-C) used to lose every completed
+sub-goal. RunCheckpoint records the run's progress under
+<run_dir>/checkpoint/ so `apps/recursive_research.py --resume <run_dir>`
+can pick it up again:
+
+- journal.jsonl: one record appended (and flushed) per state change - goal
+  started, goal assessed, goal decomposed, goal completed (its result, with
+  new evidence records), follow-up goals and coverage per loop iteration
+- snapshot.json: the full state, rewritten atomically (temp file + fsync +
+  rename) every `snapshot_every` journal records. On an event loop the write
+  runs in a worker thread: the journal is first rotated to journal.<n>.jsonl
+  and new records go to a fresh journal.jsonl; rotated journals are deleted
+  once a snapshot covering them lands. Replaying a journal over a snapshot
+  is idempotent, so a crash between the rename and the delete is harmless;
+  a torn last journal line is skipped.
+
+Goals are keyed by their path (ancestor goals + goal). Evidence is stored
+once, keyed by research.result_format.evidence_id(), and completed results
+reference it by id; restored evidence comes back as EvidenceRecords.
+
+On resume, completed goals are restored (whole subtrees, with their evidence
+re-added to the run index) instead of re-executed; goals that were started
+but never completed are in flight and run again. Recorded assessments,
+decompositions, follow-ups and coverage checks are replayed, so the re-run
+goals hang off the same tree without repeating those LLM calls.
+
+Usage:
+    checkpoint = RunCheckpoint.create(run_dir, question, asdict(constraints))
+    checkpoint.goal_started(path)
+    checkpoint.goal_completed(path, result)
+
+    checkpoint = RunCheckpoint.load(run_dir)       # resume
+    restored = checkpoint.completed_result(path)   # GoalResult or None
+
+    RunCheckpoint.read(run_dir).summary()          # inspect without resuming
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from core.evidence_record import EvidenceRecord
+from research.result_format import evidence_id
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_DIR = "checkpoint"
+
+
+def _path_key(path: List[str]) -> str:
+    return json.dumps(path, ensure_ascii=False)
+
+
+def _generation(journal: Path) -> int:
+    """Rotation number of journal.<n>.jsonl."""
+    return int(journal.name.split(".")[1])
+
+
+class RunCheckpoint:
+    """
+    Journal + snapshot of a research run's goal tree, evidence and loop state.
+
+    Use create() for a new run and load() to resume one.
+
+    Args:
+        run_dir: The run's output directory
+        snapshot_every: Journal records between snapshots
+    """
+
+    def __init__(self, run_dir: Union[str, Path], snapshot_every: int = 50):
+        self.dir = Path(run_dir) / CHECKPOINT_DIR
+        self.journal_path = self.dir / "journal.jsonl"
+        self.snapshot_path = self.dir / "snapshot.json"
+        self.snapshot_every = max(1, snapshot_every)
+        self.state: Dict[str, Any] = {
+            "version": CHECKPOINT_VERSION,
+            "question": None,
+            "constraints": {},
+            "evidence": {},
+            "started": {},
+            "completed": {},
+            "assessments": {},
+            "decompositions": {},
+            "follow_ups": {},
+            "coverage": {},
+            "resumed": 0,
+        }
+        self._journal = None
+        self._since_snapshot = 0
+        self._generation = 0  # Last journal rotation number
+        self._written = 0  # Highest generation folded into snapshot.json
+        self._write_lock = threading.Lock()
+        self._pending: Optional[asyncio.Future] = None
+        self._replayed = 0  # Journal records replayed by read()
+
+    # === Create / Load ===
+
+    @classmethod
+    def create(cls, run_dir: Union[str, Path], question: str, constraints: Dict[str, Any],
+               snapshot_every: int = 50) -> "RunCheckpoint":
+        """Start a fresh checkpoint (discarding any previous one in run_dir)."""
+        checkpoint = cls(run_dir, snapshot_every)
+        checkpoint.dir.mkdir(parents=True, exist_ok=True)
+        checkpoint.journal_path.unlink(missing_ok=True)
+        for journal in checkpoint._rotated_journals():
+            journal.unlink(missing_ok=True)
+        checkpoint.state["question"] = question
+        checkpoint.state["constraints"] = constraints
+        checkpoint.snapshot()
+        return checkpoint
+
+    @classmethod
+    def read(cls, run_dir: Union[str, Path], snapshot_every: int = 50) -> "RunCheckpoint":
+        """
+        Read a run's checkpoint (latest snapshot plus journal replay) without
+        resuming it: nothing is written and `resumed` is unchanged.
+
+        Raises:
+            FileNotFoundError: run_dir has no checkpoint
+        """
+        checkpoint = cls(run_dir, snapshot_every)
+        if not checkpoint.snapshot_path.exists():
+            raise FileNotFoundError(f"No checkpoint in {checkpoint.dir}")
+        with open(checkpoint.snapshot_path, "r", encoding="utf-8") as f:
+            checkpoint.state.update(json.load(f))
+
+        replayed = 0
+        rotated = checkpoint._rotated_journals()
+        for journal in [*rotated, checkpoint.journal_path]:
+            if not journal.exists():
+                continue
+            with open(journal, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping torn checkpoint journal line (run died mid-write)")
+                        continue
+                    checkpoint._apply(record)
+                    replayed += 1
+        checkpoint._generation = _generation(rotated[-1]) if rotated else 0
+        checkpoint._replayed = replayed
+        return checkpoint
+
+    @classmethod
+    def load(cls, run_dir: Union[str, Path], snapshot_every: int = 50) -> "RunCheckpoint":
+        """
+        Load a run's checkpoint to resume it: read() it, count the resume and
+        compact the replayed journals into a new snapshot.
+
+        Raises:
+            FileNotFoundError: run_dir has no checkpoint
+        """
+        checkpoint = cls.read(run_dir, snapshot_every)
+        checkpoint.state["resumed"] += 1
+        checkpoint.snapshot()  # Compact: fold the replayed journals into the snapshot
+        logger.info(f"Loaded checkpoint {checkpoint.dir}: {len(checkpoint.state['completed'])} completed goals, "
+                    f"{len(checkpoint.in_flight())} in flight ({checkpoint._replayed} journal records replayed)")
+        return checkpoint
+
+    @staticmethod
+    def exists(run_dir: Union[str, Path]) -> bool:
+        return (Path(run_dir) / CHECKPOINT_DIR / "snapshot.json").exists()
+
+    @property
+    def question(self) -> str:
+        return self.state["question"]
+
+    @property
+    def constraints(self) -> Dict[str, Any]:
+        return self.state["constraints"]
+
+    # === Journal / Snapshot ===
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        kind = record["type"]
+        if kind == "started":
+            self.state["started"][record["path"]] = record["at"]
+        elif kind == "assessed":
+            self.state["assessments"][record["path"]] = record["assessment"]
+        elif kind == "decomposed":
+            self.state["decompositions"][record["path"]] = record["sub_goals"]
+        elif kind == "completed":
+            self.state["evidence"].update(record["evidence"])
+            self.state["completed"][record["path"]] = record["result"]
+        elif kind == "follow_ups":
+            self.state["follow_ups"][str(record["iteration"])] = record["goals"]
+        elif kind == "coverage":
+            self.state["coverage"][str(record["iteration"])] = record["coverage"]
+        else:
+            logger.warning(f"Unknown checkpoint record type: {kind}")
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        """Apply a record to the in-memory state and append it to the journal."""
+        self._apply(record)
+        if self._journal is None:
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        # Flushed, not fsynced: a killed process loses nothing the OS has;
+        # snapshots are fsynced for power loss
+        self._journal.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+        self._journal.flush()
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self._snapshot_soon()
+
+    def _rotated_journals(self) -> List[Path]:
+        return sorted(self.dir.glob("journal.*.jsonl"), key=_generation)
+
+    def _rotate(self) -> Tuple[Dict[str, Any], int]:
+        """
+        Freeze the current state and start a new journal generation.
+
+        Returns (state copy, generation it covers). Records are never mutated
+        after _apply(), so copying each section's dict is a consistent copy.
+        """
+        state = {k: dict(v) if isinstance(v, dict) else v for k, v in self.state.items()}
+        state["updated_at"] = datetime.now().isoformat()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self._generation += 1
+        if self.journal_path.exists():
+            os.replace(self.journal_path, self.dir / f"journal.{self._generation}.jsonl")
+        self._since_snapshot = 0
+        return state, self._generation
+
+    def _write(self, state: Dict[str, Any], generation: int) -> None:
+        """Atomically write a state copy, then delete the journals it covers."""
+        with self._write_lock:
+            if generation <= self._written:
+                return  # A newer snapshot already landed
+            tmp_path = self.snapshot_path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, default=str, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            self._written = generation
+            for journal in self._rotated_journals():
+                if _generation(journal) <= generation:
+                    journal.unlink(missing_ok=True)
+
+    def _snapshot_soon(self) -> None:
+        """Snapshot in a worker thread when on an event loop, else inline."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self.snapshot()
+            return
+        if self._pending is not None and not self._pending.done():
+            return  # Still writing the previous one; retried on the next record
+        self._pending = asyncio.ensure_future(asyncio.to_thread(self._write, *self._rotate()))
+        self._pending.add_done_callback(self._log_write_failure)
+
+    @staticmethod
+    def _log_write_failure(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            # The rotated journals are kept, so nothing recorded is lost
+            logger.error(f"Checkpoint snapshot failed: {future.exception()}")
+
+    def snapshot(self) -> None:
+        """Atomically write the full state now, then clear the journal."""
+        self._write(*self._rotate())
+
+    async def flush(self) -> None:
+        """Wait for a snapshot being written in the background."""
+        if self._pending is not None:
+            await asyncio.wait([self._pending])
+
+    def close(self) -> None:
+        """Write a final snapshot and release the journal."""
+        self.snapshot()
+
+    # === Goals ===
+
+    def goal_started(self, path: List[str]) -> None:
+        self._record({"type": "started", "path": _path_key(path), "at": datetime.now().isoformat()})
+
+    def goal_completed(self, path: List[str], result: Any) -> None:
+        """Record a completed goal's result (whole subtree) and its new evidence."""
+        new_evidence: Dict[str, Dict[str, Any]] = {}
+        serialized = self._result_to_dict(result, new_evidence)
+        self._record({"type": "completed", "path": _path_key(path), "result": serialized,
+                      "evidence": new_evidence})
+
+    def completed_result(self, path: List[str]):
+        """The recorded GoalResult for a completed goal, or None."""
+        data = self.state["completed"].get(_path_key(path))
+        return self._result_from_dict(data) if data is not None else None
+
+    def in_flight(self) -> List[List[str]]:
+        """Paths of goals that were started but never completed."""
+        return [json.loads(key) for key in self.state["started"] if key not in self.state["completed"]]
+
+    def record_assessment(self, path: List[str], assessment: Any) -> None:
+        action = assessment.action
+        self._record({"type": "assessed", "path": _path_key(path), "assessment": {
+            "directly_executable": assessment.directly_executable,
+            "reasoning": assessment.reasoning,
+            "decomposition_rationale": assessment.decomposition_rationale,
+            "action": None if action is None else {
+                "type": action.type.value,
+                "source": action.source,
+                "params": action.params,
+                "prompt": action.prompt,
+                "query_params": action.query_params,
+            },
+        }})
+
+    def assessment(self, path: List[str]):
+        """The recorded Assessment for a goal, or None."""
+        from research.recursive_agent import Action, ActionType, Assessment
+
+        data = self.state["assessments"].get(_path_key(path))
+        if data is None:
+            return None
+        action = data["action"]
+        return Assessment(
+            directly_executable=data["directly_executable"],
+            reasoning=data["reasoning"],
+            decomposition_rationale=data["decomposition_rationale"],
+            action=None if action is None else Action(
+                type=ActionType(action["type"]),
+                source=action["source"],
+                params=action["params"],
+                prompt=action["prompt"],
+                query_params=action["query_params"],
+            ),
+        )
+
+    def record_decomposition(self, path: List[str], sub_goals: List[Any]) -> None:
+        self._record({"type": "decomposed", "path": _path_key(path), "sub_goals": [
+            {
+                "description": sg.description,
+                "rationale": sg.rationale,
+                "dependencies": sg.dependencies,
+                "estimated_complexity": sg.estimated_complexity,
+            }
+            for sg in sub_goals
+        ]})
+
+    def decomposition(self, path: List[str]):
+        """The recorded sub-goals for a goal, or None."""
+        from research.recursive_agent import SubGoal
+
+        data = self.state["decompositions"].get(_path_key(path))
+        return None if data is None else [SubGoal(**sg) for sg in data]
+
+    # === Research loop ===
+
+    def record_follow_ups(self, iteration: int, goals: List[str]) -> None:
+        self._record({"type": "follow_ups", "iteration": iteration, "goals": goals})
+
+    def follow_ups(self, iteration: int) -> Optional[List[str]]:
+        return self.state["follow_ups"].get(str(iteration))
+
+    def record_coverage(self, iteration: int, coverage: Dict[str, Any]) -> None:
+        self._record({"type": "coverage", "iteration": iteration, "coverage": coverage})
+
+    def coverage(self, iteration: int) -> Optional[Dict[str, Any]]:
+        return self.state["coverage"].get(str(iteration))
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "completed_goals": len(self.state["completed"]),
+            "in_flight_goals": len(self.in_flight()),
+            "evidence_records": len(self.state["evidence"]),
+            "iterations_recorded": len(self.state["coverage"]),
+            "resumed": self.state["resumed"],
+        }
+
+    # === Serialization ===
+
+    def _result_to_dict(self, result: Any, new_evidence: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        evidence_ids = []
+        for e in result.evidence:
+            if not isinstance(e, EvidenceRecord):
+                e = EvidenceRecord.from_evidence(e)
+            record = asdict(e)
+            eid = evidence_id(record)
+            if eid not in self.state["evidence"]:
+                new_evidence[eid] = record
+            evidence_ids.append(eid)
+        return {
+            "goal": result.goal,
+            "status": result.status.value,
+            "evidence_ids": evidence_ids,
+            "sub_results": [self._result_to_dict(sub, new_evidence) for sub in result.sub_results],
+            "synthesis": result.synthesis,
+            "confidence": result.confidence,
+            "reasoning": result.reasoning,
+            "error": result.error,
+            "depth": result.depth,
+            "duration_seconds": result.duration_seconds,
+            "cost_dollars": result.cost_dollars,
+            "reused_from": result.reused_from,
+        }
+
+    def _result_from_dict(self, data: Dict[str, Any]):
+        from research.recursive_agent import GoalResult, GoalStatus
+
+        fields = {k: v for k, v in data.items() if k not in ("evidence_ids", "sub_results", "status")}
+        return GoalResult(
+            status=GoalStatus(data["status"]),
+            evidence=[EvidenceRecord(**self.state["evidence"][eid]) for eid in data["evidence_ids"]],
+            sub_results=[self._result_from_dict(sub) for sub in data["sub_results"]],
+            **fields
+        )
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Critical-path analysis of a recursive research run from execution_log.jsonl.
+
+scripts/analyze_execution_log.py and scripts/analyze_performance.py report
+totals (time per source, per call type), but totals do not say which chain
+of goal -> sub-goal -> API call -> LLM call set the run's wall-clock time:
+an API call taking 40s in parallel with a 60s sibling costs nothing.
+
+This module rebuilds the timed goal tree from the log events:
+
+- goal_started / goal_completed give each goal's interval,
+- llm_call (duration_ms) and api_response (response_time_ms) give leaf
+  intervals ending at their log timestamp,
+
+then walks it backwards from the end of the run: inside every span, the child
+that finished last before the cursor is critical, the cursor moves to that
+child's start, and so on. Everything else has slack (how much later it could
+have finished without moving the run's end), reported per depth level.
+
+what_if() re-times the tree with some leaves made faster. Children that
+overlapped in the log run in parallel, and gaps between them are kept as the
+parent's own time. For example, every filter LLM call made 2x faster:
+
+    what_if(tree, {"llm:filter_results": 2.0})
+
+Usage:
+    from research.critical_path import load_events, build_tree, analyze, format_report
+
+    tree = build_tree(load_events("data/research_output/.../execution_log.jsonl"))
+    analysis = analyze(tree)
+    analysis.critical_path        # [Span] run -> ... -> leaf, chronological
+    analysis.level_slack          # {depth: {"goals", "critical", "min", "median", "max"}}
+    print(format_report(analysis))
+"""
+
+import fnmatch
+import json
+import logging
+import statistics
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Log timestamps have microsecond resolution but leaf starts are derived from
+# durations measured with another clock; treat this much overlap as touching
+EPSILON = 0.005
+
+
+@dataclass
+class Span:
+    """A timed node of the run: the run itself, a goal, or an LLM/API call."""
+    kind: str  # "run" | "goal" | "llm" | "api"
+    label: str  # Goal text, "llm:<call_type>" or "api:<source>"
+    start: float  # Seconds since the first event
+    end: Optional[float] = None
+    depth: int = 0
+    parent: Optional["Span"] = field(default=None, repr=False)
+    children: List["Span"] = field(default_factory=list, repr=False)
+    parent_goal: Optional[str] = field(default=None, repr=False)
+    critical: bool = False
+    slack: float = 0.0  # Total slack: seconds it could finish later without delaying the run
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, (self.end if self.end is not None else self.start) - self.start)
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.kind in ("llm", "api")
+
+    def walk(self) -> Iterable["Span"]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+
+@dataclass
+class Analysis:
+    """Result of analyze()."""
+    tree: Span
+    critical_path: List[Span]
+    level_slack: Dict[int, Dict[str, Any]]
+    self_time: Dict[int, float]  # id(goal span) -> own time on the critical path (gaps between children)
+    what_ifs: List[Tuple[str, float, float]]  # (label pattern, factor, new wall seconds)
+
+    @property
+    def wall_seconds(self) -> float:
+        return self.tree.duration
+
+
+def load_events(log_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Load a JSONL execution log (skips blank and malformed lines)."""
+    events = []
+    with open(log_path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.warning(f"{log_path}:{line_no}: skipping malformed line")
+    return events
+
+
+def build_tree(events: List[Dict[str, Any]]) -> Span:
+    """
+    Rebuild the timed goal tree from recursive-agent log events.
+
+    Goals are matched by (goal text, parent goal); calls attach to the latest
+    goal with their text that was running when they finished. Goals that never
+    logged goal_completed end with their last child.
+    """
+    timed = [(datetime.fromisoformat(e["timestamp"]), e) for e in events if e.get("timestamp")]
+    if not timed:
+        raise ValueError("No timestamped events in log")
+    timed.sort(key=lambda pair: pair[0])
+    t0 = timed[0][0]
+
+    run = Span(kind="run", label="run", start=0.0, depth=-1)
+    goals: Dict[str, List[Span]] = {}  # goal text -> spans in start order
+
+    def find_goal(text: Optional[str], at: float, parent_goal: Any = ...) -> Optional[Span]:
+        candidates = [g for g in goals.get(text, []) if g.start <= at + EPSILON]
+        if parent_goal is not ...:
+            matching = [g for g in candidates if g.parent_goal == parent_goal]
+            candidates = matching or candidates
+        running = [g for g in candidates if g.end is None or g.end >= at - EPSILON]
+        pool = running or candidates
+        return pool[-1] if pool else None
+
+    for ts, event in timed:
+        at = (ts - t0).total_seconds()
+        event_type = event.get("event_type")
+        goal_text = event.get("goal")
+        parent_goal = event.get("parent_goal")
+        data = event.get("data") or {}
+
+        if event_type == "run_start":
+            run.label = goal_text or "run"
+        elif event_type == "run_complete":
+            run.end = at
+        elif event_type == "goal_started":
+            parent = find_goal(parent_goal, at) if parent_goal is not None else None
+            parent = parent or run
+            span = Span(kind="goal", label=goal_text, start=at, depth=event.get("depth", 0),
+                        parent=parent, parent_goal=parent_goal)
+            parent.children.append(span)
+            goals.setdefault(goal_text, []).append(span)
+        elif event_type == "goal_completed":
+            span = find_goal(goal_text, at, parent_goal)
+            if span is not None:
+                span.end = at
+        elif event_type in ("llm_call", "api_response"):
+            if event_type == "llm_call":
+                kind, label, duration_ms = "llm", f"llm:{data.get('call_type', '?')}", data.get("duration_ms")
+            else:
+                kind, label, duration_ms = "api", f"api:{data.get('source', '?')}", data.get("response_time_ms")
+            start = max(0.0, at - (duration_ms or 0) / 1000)
+            parent = find_goal(goal_text, at) or run
+            leaf = Span(kind=kind, label=label, start=start, end=at,
+                        depth=event.get("depth", 0), parent=parent)
+            parent.children.append(leaf)
+
+    _close(run)
+    return run
+
+
+def _close(span: Span) -> None:
+    """Give open spans an end and make every span cover its children."""
+    for child in span.children:
+        _close(child)
+    child_end = max((c.end for c in span.children), default=span.start)
+    span.end = max(span.end if span.end is not None else span.start, child_end)
+    span.start = min([span.start] + [c.start for c in span.children])
+    span.children.sort(key=lambda c: (c.start, c.end))
+
+
+def _local_chain(span: Span) -> List[Span]:
+    """Critical children of `span`, latest first: the chain that set its end time."""
+    chain = []
+    cursor = span.end
+    remaining = list(span.children)
+    while remaining:
+        finished = [c for c in remaining if c.end <= cursor + EPSILON]
+        if not finished:
+            break
+        # Latest finisher; on ties the longer one (it started earlier, covers more)
+        child = max(finished, key=lambda c: (c.end, c.duration))
+        chain.append(child)
+        cursor = child.start
+        remaining = [c for c in remaining if c.end <= cursor + EPSILON]
+    return chain
+
+
+def _mark(span: Span, on_path: bool, inherited_slack: float, path: List[Span], self_time: Dict[int, float]) -> None:
+    span.critical = on_path
+    span.slack = 0.0 if on_path else inherited_slack
+    if on_path:
+        path.append(span)
+    chain = _local_chain(span)
+    chain_ids = {id(c) for c in chain}
+    chain_starts = sorted(c.start for c in chain)
+    if on_path and span.children:
+        self_time[id(span)] = max(0.0, span.duration - sum(c.duration for c in chain))
+
+    for child in span.children:  # chronological, so the path comes out in order
+        if id(child) in chain_ids:
+            _mark(child, on_path, span.slack, path, self_time)
+        else:
+            # Could finish as late as the next critical sibling starts (or the parent ends)
+            limit = next((s for s in chain_starts if s >= child.end - EPSILON), span.end)
+            _mark(child, False, span.slack + max(0.0, limit - child.end), path, self_time)
+
+
+def _level_slack(tree: Span) -> Dict[int, Dict[str, Any]]:
+    levels: Dict[int, List[Span]] = {}
+    for span in tree.walk():
+        if span.kind == "goal":
+            levels.setdefault(span.depth, []).append(span)
+    table = {}
+    for depth, spans in sorted(levels.items()):
+        slacks = [s.slack for s in spans]
+        table[depth] = {
+            "goals": len(spans),
+            "critical": sum(1 for s in spans if s.critical),
+            "min": min(slacks),
+            "median": statistics.median(slacks),
+            "max": max(slacks),
+        }
+    return table
+
+
+def what_if(tree: Span, speedups: Dict[str, float]) -> float:
+    """
+    Wall-clock seconds of the run if matching leaves ran `factor`x faster.
+
+    Args:
+        speedups: Leaf label pattern (fnmatch, e.g. "llm:filter*", "api:sam") -> factor
+    """
+    def factor(span: Span) -> float:
+        for pattern, value in speedups.items():
+            if fnmatch.fnmatchcase(span.label, pattern):
+                return value
+        return 1.0
+
+    def retime(span: Span) -> float:
+        if span.is_leaf or not span.children:
+            return span.duration / factor(span) if span.is_leaf else span.duration
+        # Overlapping children ran in parallel: one phase, offsets kept
+        phases: List[List[Span]] = []
+        phase_end = None
+        for child in span.children:
+            if phases and child.start < phase_end - EPSILON:
+                phases[-1].append(child)
+                phase_end = max(phase_end, child.end)
+            else:
+                phases.append([child])
+                phase_end = child.end
+        old = new = 0.0
+        for phase in phases:
+            phase_start = phase[0].start
+            old += max(c.end for c in phase) - phase_start
+            new += max(c.start - phase_start + retime(c) for c in phase)
+        return max(0.0, span.duration - old) + new
+
+    return retime(tree)
+
+
+def leaf_categories(tree: Span) -> List[str]:
+    """Distinct leaf labels ("llm:<call_type>", "api:<source>"), sorted."""
+    return sorted({s.label for s in tree.walk() if s.is_leaf})
+
+
+def analyze(tree: Span, speedups: Optional[List[Tuple[str, float]]] = None) -> Analysis:
+    """
+    Critical path, slack and what-if estimates for a tree from build_tree().
+
+    Args:
+        speedups: (label pattern, factor) scenarios; default: every leaf
+                  category 2x faster, one at a time
+    """
+    path: List[Span] = []
+    self_time: Dict[int, float] = {}
+    _mark(tree, True, 0.0, path, self_time)
+    scenarios = speedups if speedups is not None else [(label, 2.0) for label in leaf_categories(tree)]
+    what_ifs = [(pattern, factor, what_if(tree, {pattern: factor})) for pattern, factor in scenarios]
+    what_ifs.sort(key=lambda w: w[2])
+    return Analysis(
+        tree=tree,
+        critical_path=path,
+        level_slack=_level_slack(tree),
+        self_time=self_time,
+        what_ifs=what_ifs,
+    )
+
+
+def format_report(analysis: Analysis, top: int = 15) -> str:
+    """Human-readable critical path, per-level slack and what-if table."""
+    wall = analysis.wall_seconds
+    lines = [f"Run wall-clock: {wall:.1f}s", ""]
+
+    lines.append("CRITICAL PATH")
+    lines.append("-" * 80)
+    for span in analysis.critical_path:
+        if span.kind == "run":
+            continue
+        indent = "  " * max(0, span.depth)
+        own = analysis.self_time.get(id(span))
+        own_text = f"  (own {own:.1f}s)" if own else ""
+        lines.append(f"{span.start:>8.1f}s {span.duration:>7.1f}s  {indent}{span.label[:60]}{own_text}")
+
+    lines.append("")
+    lines.append("SLACK BY LEVEL (goals)")
+    lines.append("-" * 80)
+    lines.append(f"{'Depth':>5} {'Goals':>6} {'Critical':>8} {'Min':>8} {'Median':>8} {'Max':>8}")
+    for depth, row in analysis.level_slack.items():
+        lines.append(
+            f"{depth:>5} {row['goals']:>6} {row['critical']:>8} "
+            f"{row['min']:>7.1f}s {row['median']:>7.1f}s {row['max']:>7.1f}s"
+        )
+
+    lines.append("")
+    lines.append("WHAT-IF SPEEDUPS")
+    lines.append("-" * 80)
+    for pattern, factor, new_wall in analysis.what_ifs[:top]:
+        saved = wall - new_wall
+        pct = saved / wall * 100 if wall else 0.0
+        lines.append(f"{pattern[:40]:<40} {factor:>4.1f}x faster -> {new_wall:>7.1f}s  (saves {saved:.1f}s, {pct:.0f}%)")
+    return "\n".join(lines)
@@ -72,6 +72,7 @@ from research.mixins import (
     ResultFilterMixin,
     SourceExecutorMixin
 )
+from research.mixins.source_executor_mixin import merge_hypothesis_attribution
 
 # Services (extracted from mixins - composition over inheritance)
 from research.services import QueryReformulator, EntityAnalyzer
@@ -95,6 +96,7 @@ RESEARCH_DEFAULTS = {
 
     # Query saturation (per-source limits)
     "max_time_per_source_seconds": 300,
+    "max_continuation_pages": 3,  # Extra pages of a productive query (paginated sources)
     "max_queries_per_source": {
         'SAM.gov': 10,
         'DVIDS': 5,
@@ -260,6 +262,7 @@ class SimpleDeepResearch(
         self.query_saturation_enabled = saturation_config.get("enabled", False)  # Feature flag
         self.max_queries_per_source = max_queries_per_source or saturation_config.get("max_queries_per_source", RESEARCH_DEFAULTS["max_queries_per_source"])
         self.max_time_per_source_seconds = max_time_per_source_seconds if max_time_per_source_seconds is not None else saturation_config.get("max_time_per_source_seconds", RESEARCH_DEFAULTS["max_time_per_source_seconds"])
+        self.max_continuation_pages = saturation_config.get("max_continuation_pages", RESEARCH_DEFAULTS["max_continuation_pages"])
 
         self.progress_callback = progress_callback
         self.save_output = save_output
@@ -278,6 +281,8 @@ class SimpleDeepResearch(
         self.critical_source_failures: List[str] = []  # Track failed critical sources
         self.rate_limited_sources: set = set()  # Track rate-limited sources (circuit breaker)
         self.logger = None  # Initialized later in research() if save_output=True
+        # Run-level duplicate collapsing counters (see _collapse_duplicate_results)
+        self.evidence_dedup_stats: Dict[str, int] = {"seen": 0, "unique": 0, "url_duplicates": 0, "content_duplicates": 0}
 
         # Services (extracted from mixins - composition over inheritance)
         self.query_reformulator = QueryReformulator()
@@ -944,6 +949,7 @@ class SimpleDeepResearch(
             "entity_relationships": self.entity_analyzer.get_entity_graph(),
             "sources_searched": list(set(r.get('source', 'Unknown') for r in all_results)),
             "total_results": len(all_results),
+            "evidence_dedup": self._evidence_dedup_summary(),
             "elapsed_minutes": (datetime.now() - self.start_time).total_seconds() / 60
         }
 
@@ -1248,6 +1254,8 @@ class SimpleDeepResearch(
 
         Results from hypotheses may duplicate existing task results.
         Multi-tag duplicates with hypothesis_ids=[1,2,3] to show validation.
+        Duplicates are matched on canonical URL and content SimHash
+        (core.content_dedup), not just the raw URL string.
 
         Args:
             results: New results from hypothesis execution
@@ -1256,40 +1264,20 @@ class SimpleDeepResearch(
         Returns:
             Deduplicated results with multi-attribution tags
         """
-        # For each new result, check if URL already exists in task.accumulated_results
-        # If exists: Add hypothesis_id to existing result's hypothesis_ids array
-        # If new: Tag with hypothesis_id field
-
-        # Use dict for O(1) URL lookup instead of O(n) linear search
-        url_to_result = {}  # Maps URL -> result dict
-        deduplicated = []
-
+        # Tag every result with the current hypothesis; copies of the same document
+        # (URL variants, near-identical content) collapse into the first one
         for result in results:
-            url = result.get("url")
-            if not url:
-                # No URL to deduplicate on, keep as-is
-                result["hypothesis_id"] = hypothesis_id
-                deduplicated.append(result)
-                continue
-
-            # Check for duplicate URL in current batch (O(1) dict lookup)
-            existing = url_to_result.get(url)
-
-            if existing:
-                # Duplicate within batch - add to hypothesis_ids
-                if "hypothesis_ids" not in existing:
-                    # Convert single hypothesis_id to array
-                    existing["hypothesis_ids"] = [existing.pop("hypothesis_id", hypothesis_id), hypothesis_id]
-                elif hypothesis_id not in existing["hypothesis_ids"]:
-                    existing["hypothesis_ids"].append(hypothesis_id)
-            else:
-                # New result - tag with hypothesis_id and add to index
-                result["hypothesis_id"] = hypothesis_id
-                deduplicated.append(result)
-                url_to_result[url] = result  # Index by URL for O(1) lookup
+            result["hypothesis_id"] = hypothesis_id
+        deduplicated = self._collapse_duplicate_results(results, on_duplicate=merge_hypothesis_attribution)
 
         return deduplicated
 
+    def _evidence_dedup_summary(self) -> Dict[str, Any]:
+        """Run-level duplicate collapsing counters plus dedup_ratio."""
+        stats = self.evidence_dedup_stats
+        collapsed = stats["url_duplicates"] + stats["content_duplicates"]
+        return {**stats, "dedup_ratio": round(collapsed / stats["seen"], 3) if stats["seen"] else 0.0}
+
     def _compute_hypothesis_delta(
         self,
         task: ResearchTask,
@@ -1564,6 +1552,11 @@ class SimpleDeepResearch(
                 # Note: brave_search is now handled like any other integration in _search_mcp_tools_selected
                 combined_total = len(all_results)
 
+                # Collapse cross-source copies of the same document before LLM relevance filtering
+                all_results = self._collapse_duplicate_results(all_results)
+                if len(all_results) < combined_total:
+                    print(f"🧹 Collapsed {combined_total - len(all_results)} duplicate results across sources")
+
                 # Validate result relevance, filter to relevant results, decide if continue
                 # LLM makes 3 decisions: ACCEPT/REJECT, which indices to keep, continue searching?
                 # Gemini 2.5 Flash has 65K token context - evaluate ALL results, no sampling needed
@@ -0,0 +1,264 @@
+"""
+Run-level near-duplicate index over research goal texts.
+
+LLM decompositions often produce paraphrased copies of the same sub-goal in
+sibling and cousin branches ("Find DoD AI contracts 2024" vs "Identify 2024
+Defense Department AI awards"). GoalIndex lets the recursive agent spot such
+goals and reuse the original goal's in-flight or completed result instead of
+spawning a second assess/decompose/API subtree.
+
+Goals are reduced to a set of content terms (task verbs and stopwords
+dropped, common agency/domain synonyms folded, plurals stripped), MinHash
+signatures are bucketed with LSH so lookups touch only likely matches, and
+candidates are confirmed with the exact Jaccard similarity of their terms.
+
+Usage:
+    index = GoalIndex(threshold=0.85)
+    entry = index.register("Find DoD AI contracts 2024")
+    match = index.find_duplicate("Identify 2024 Defense Department AI awards")
+    # -> (entry, 1.0)
+    index.complete(entry, result)
+"""
+
+import asyncio
+import hashlib
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+# Words that carry no topic: task verbs, stopwords, filler
+GOAL_STOPWORDS = frozenset("""
+    a about across all an and any are as at be by can do does for from get gather give how i
+    identify in information into is it its list locate look lookup me obtain of on or out
+    related regarding research retrieve search show some than that the their there these this
+    those to up via what when where which who whose with find determine collect details
+    """.split())
+
+# Multi-word phrases folded to one term before tokenizing
+GOAL_PHRASES = [
+    (re.compile(r"\b(department of defen[cs]e|defen[cs]e department|pentagon)\b"), "dod"),
+    (re.compile(r"\b(department of homeland security|homeland security department)\b"), "dhs"),
+    (re.compile(r"\b(department of justice|justice department)\b"), "doj"),
+    (re.compile(r"\bartificial intelligence\b"), "ai"),
+    (re.compile(r"\bfiscal year\b"), "fy"),
+    (re.compile(r"\bmachine learning\b"), "ml"),
+]
+
+# Single-term synonyms (after plural stripping)
+GOAL_SYNONYMS = {
+    "award": "contract",
+    "procurement": "contract",
+    "defense": "dod",
+    "company": "contractor",
+    "vendor": "contractor",
+    "firm": "contractor",
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def goal_terms(goal: str) -> FrozenSet[str]:
+    """Normalized content terms of a goal text."""
+    text = goal.lower()
+    for pattern, replacement in GOAL_PHRASES:
+        text = pattern.sub(replacement, text)
+    terms = set()
+    for token in _TOKEN.findall(text):
+        if token in GOAL_STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.add(GOAL_SYNONYMS.get(token, token))
+    return frozenset(terms)
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@dataclass
+class GoalEntry:
+    """An indexed goal and the (eventual) result of pursuing it."""
+    entry_id: int
+    goal: str
+    terms: FrozenSet[str]
+    result: "asyncio.Future"
+    reuse_count: int = 0
+
+
+@dataclass
+class _Waiter:
+    """A goal waiting on an in-flight original (for deadlock checks)."""
+    ancestors: Set[str]
+    original_goal: str
+
+
+class GoalIndex:
+    """
+    MinHash/LSH index of goals pursued in one research run.
+
+    Entries stay reusable until discard() or complete(..., reusable=False)
+    removes them - callers do that for results that should not be shared
+    (constrained, failed, cancelled).
+    """
+
+    def __init__(self, threshold: float = 0.85, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Minimum Jaccard similarity of goal terms to count as duplicate
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be divisible by bands)
+            seed: Seed for the MinHash permutations
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[int]] = {}
+        self._entries: Dict[int, GoalEntry] = {}
+        self._waiters: List[_Waiter] = []
+        self._next_id = 0
+        self.stats = {"indexed": 0, "reused": 0, "candidates_checked": 0}
+
+    # =========================================================================
+    # MinHash / LSH
+    # =========================================================================
+
+    def _signature(self, terms: FrozenSet[str]) -> List[int]:
+        hashes = [int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "big") for t in terms]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [
+            (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    # =========================================================================
+    # Public API
+    # =========================================================================
+
+    def find_duplicate(self, goal: str) -> Optional[Tuple[GoalEntry, float]]:
+        """
+        Most similar indexed goal at or above the threshold, if any.
+
+        Returns:
+            (entry, similarity) or None
+        """
+        terms = goal_terms(goal)
+        if not terms or not self._entries:
+            return None
+        candidates: Set[int] = set()
+        for key in self._band_keys(self._signature(terms)):
+            candidates |= self._buckets.get(key, set())
+
+        best: Optional[Tuple[GoalEntry, float]] = None
+        for entry_id in candidates:
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                continue
+            self.stats["candidates_checked"] += 1
+            similarity = jaccard(terms, entry.terms)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (entry, similarity)
+        return best
+
+    def is_similar(self, goal_a: str, goal_b: str) -> bool:
+        """Pairwise check with the index's threshold (no lookup)."""
+        return jaccard(goal_terms(goal_a), goal_terms(goal_b)) >= self.threshold
+
+    def register(self, goal: str) -> Optional[GoalEntry]:
+        """
+        Index a goal that is about to be pursued.
+
+        Returns:
+            The entry to complete() or discard() later, or None if the goal
+            has no content terms to index
+        """
+        terms = goal_terms(goal)
+        if not terms:
+            return None
+        entry = GoalEntry(
+            entry_id=self._next_id,
+            goal=goal,
+            terms=terms,
+            result=asyncio.get_running_loop().create_future()
+        )
+        self._next_id += 1
+        self._entries[entry.entry_id] = entry
+        for key in self._band_keys(self._signature(terms)):
+            self._buckets.setdefault(key, set()).add(entry.entry_id)
+        self.stats["indexed"] += 1
+        return entry
+
+    def complete(self, entry: GoalEntry, result: Any, reusable: bool = True) -> None:
+        """Publish an entry's result to waiters; drop it from the index unless reusable."""
+        if not entry.result.done():
+            entry.result.set_result(result)
+        if not reusable:
+            self.discard(entry)
+
+    def discard(self, entry: GoalEntry) -> None:
+        """Remove an entry so later goals don't match it; pending waiters get None."""
+        if not entry.result.done():
+            entry.result.set_result(None)
+        if self._entries.pop(entry.entry_id, None) is None:
+            return
+        for key in self._band_keys(self._signature(entry.terms)):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry.entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    async def wait_for(self, entry: GoalEntry, ancestors: List[str], goal: str) -> Optional[Any]:
+        """
+        Wait for entry's result on behalf of goal (whose ancestry is ancestors).
+
+        Returns None without waiting when the wait could deadlock: the
+        original is one of goal's ancestors, or the original's subtree is
+        itself (transitively) waiting on one of them.
+
+        Returns:
+            The original's result, or None if it can't or shouldn't be reused
+        """
+        waiter = _Waiter(ancestors={*ancestors, goal}, original_goal=entry.goal)
+        if self._would_deadlock(entry.goal, waiter.ancestors):
+            return None
+        self._waiters.append(waiter)
+        try:
+            result = await asyncio.shield(entry.result)
+        finally:
+            self._waiters.remove(waiter)
+        if result is not None:
+            entry.reuse_count += 1
+            self.stats["reused"] += 1
+        return result
+
+    def _would_deadlock(self, original_goal: str, ancestors: Set[str]) -> bool:
+        pending = [original_goal]
+        visited: Set[str] = set()
+        while pending:
+            goal = pending.pop()
+            if goal in ancestors:
+                return True
+            if goal in visited:
+                continue
+            visited.add(goal)
+            # Anything waiting inside goal's subtree makes goal wait on its original too
+            pending.extend(w.original_goal for w in self._waiters if goal in w.ancestors)
+        return False
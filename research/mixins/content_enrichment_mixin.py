@@ -205,16 +205,18 @@ class ContentEnrichmentMixin:
                 max_content_length=50000
             )
 
-            # Count successes
+            # Count successes (pages fetched by earlier tasks/runs come from the Jina page cache)
             successful = sum(1 for pc in page_contents if pc.success)
+            cached = sum(1 for pc in page_contents if pc.cached)
             total_chars = sum(pc.content_length for pc in page_contents if pc.success)
 
             self._emit_progress(
                 "content_fetch_complete",
-                f"Fetched {successful}/{len(urls_to_fetch)} pages ({total_chars:,} chars)",
+                f"Fetched {successful}/{len(urls_to_fetch)} pages ({total_chars:,} chars, {cached} cached)",
                 data={
                     "successful": successful,
                     "failed": len(urls_to_fetch) - successful,
+                    "cached": cached,
                     "total_chars": total_chars
                 }
             )
@@ -224,6 +226,7 @@ class ContentEnrichmentMixin:
                 self.execution_logger.log_event("content_fetch_complete", {
                     "urls_requested": len(urls_to_fetch),
                     "urls_successful": successful,
+                    "urls_cached": cached,
                     "total_content_chars": total_chars,
                     "fetch_details": [
                         {
@@ -231,6 +234,7 @@ class ContentEnrichmentMixin:
                             "success": pc.success,
                             "content_length": pc.content_length,
                             "fetch_time_ms": pc.fetch_time_ms,
+                            "cached": pc.cached,
                             "error": pc.error
                         }
                         for pc in page_contents
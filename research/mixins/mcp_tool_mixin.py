@@ -145,6 +145,33 @@ class MCPToolMixin:
             # Fallback: return all MCP tools (downstream filtering will still apply)
             return ([tool["name"] for tool in self.mcp_tools], f"Error during source selection: {type(e).__name__}")
 
+    @staticmethod
+    def _page_continuation(
+        integration_id: str,
+        integration: Any,
+        query_result: Any,
+        query_params: Dict
+    ) -> Optional[Dict]:
+        """
+        Describe how to fetch the page after query_result, if the source has one.
+
+        Returns:
+            Dict with 'integration_id', 'query_params', 'next_cursor', or None
+            when the search failed, the source is unpaginated, or this was the last page
+        """
+        if not query_result.success or not query_result.results:
+            return None
+        if not getattr(integration, "supports_pagination", False):
+            return None
+        next_cursor = integration.next_page_cursor(query_result, query_params)
+        if next_cursor is None:
+            return None
+        return {
+            "integration_id": integration_id,
+            "query_params": query_params,
+            "next_cursor": next_cursor
+        }
+
     async def _call_mcp_tool(
         self: "SimpleDeepResearch",
         tool_config: Dict,
@@ -327,7 +354,8 @@ class MCPToolMixin:
                             "source": query_result.source,
                             "total": query_result.total,
                             "results": query_result.results,
-                            "error": query_result.error
+                            "error": query_result.error,
+                            "continuation": self._page_continuation(integration_id, integration, query_result, query_params)
                         }
 
                         # 4. ERROR REFORMULATION: If validation error, try to fix and retry
@@ -372,7 +400,8 @@ class MCPToolMixin:
                                             "source": retry_result.source,
                                             "total": retry_result.total,
                                             "results": retry_result.results,
-                                            "error": None
+                                            "error": None,
+                                            "continuation": self._page_continuation(integration_id, integration, retry_result, fixed_params)
                                         }
                                         print(f"✅ {source_name}: Reformulation successful - {retry_result.total} results")
                                         logger.info(f"[RETRY] {source_name}: Reformulation successful - {retry_result.total} results")
@@ -467,7 +496,7 @@ class MCPToolMixin:
                     logger.info(f"ℹ️  {source_name} rate limited (will retry after ~{cooldown_secs}s)")
                     print(f"ℹ️  {source_name} rate limited (will retry after ~{cooldown_secs}s)")
 
-            return {
+            tool_result = {
                 "tool": tool_name,
                 "success": success,
                 "source": source_name,  # Pass through source from wrapper
@@ -475,6 +504,10 @@ class MCPToolMixin:
                 "total": result_data.get("total", 0),
                 "error": error
             }
+            # Paginated sources: where to resume for more of the same query
+            if result_data.get("continuation"):
+                tool_result["continuation"] = result_data["continuation"]
+            return tool_result
 
         # Exception caught - error logged, execution continues
         except Exception as e:
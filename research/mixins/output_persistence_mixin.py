@@ -12,6 +12,9 @@ import re
 from pathlib import Path
 from typing import Dict, TYPE_CHECKING
 
+from core.content_dedup import ContentDeduplicator
+from research.mixins.source_executor_mixin import merge_hypothesis_attribution
+
 if TYPE_CHECKING:
     from research.deep_research import SimpleDeepResearch
 
@@ -126,32 +129,11 @@ class OutputPersistenceMixin:
         for r in aggregated_results_by_task.values():
             aggregated_results_list.extend(r.get('results', []))
 
-        # Codex Fix: Deduplicate results by (url, title) to avoid inflated counts
-        seen = {}
-        deduplicated_results_list = []
-        for result_item in aggregated_results_list:
-            # Create unique key from URL and title (both normalized)
-            url = (result_item.get('url') or '').strip().lower()
-            title = (result_item.get('title') or '').strip().lower()
-            key = (url, title)
-
-            # Merge attribution if duplicate encountered
-            if (url or title) and key in seen:
-                existing = seen[key]
-                # Normalize attribution fields
-                attrs = set()
-                for res in (existing, result_item):
-                    if "hypothesis_ids" in res:
-                        attrs.update(res.get("hypothesis_ids") or [])
-                    if "hypothesis_id" in res:
-                        attrs.add(res["hypothesis_id"])
-                if attrs:
-                    existing["hypothesis_ids"] = sorted(list(attrs))
-                    existing.pop("hypothesis_id", None)
-            else:
-                if url or title:
-                    seen[key] = result_item
-                deduplicated_results_list.append(result_item)
+        # Codex Fix: Deduplicate results to avoid inflated counts (canonical URL + content
+        # SimHash, so URL variants and syndicated copies across tasks are counted once)
+        deduplicated_results_list = ContentDeduplicator().deduplicate(
+            aggregated_results_list, on_duplicate=merge_hypothesis_attribution
+        )
 
         # Log deduplication stats (Codex Fix #2: Add console output for visibility)
         duplicates_removed = len(aggregated_results_list) - len(deduplicated_results_list)
@@ -268,7 +250,8 @@ class OutputPersistenceMixin:
                 "sources_searched": result["sources_searched"],
                 "entities_discovered_count": len(result["entities_discovered"]),
                 "duplicates_removed": duplicates_removed,
-                "results_before_dedup": len(aggregated_results_list) + duplicates_removed
+                "results_before_dedup": len(aggregated_results_list) + duplicates_removed,
+                "evidence_dedup": result.get("evidence_dedup", {})
             }
         }
 
@@ -10,9 +10,11 @@ import asyncio
 import logging
 import time
 from dataclasses import asdict
-from typing import Any, Dict, List, Set, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, List, Set, Tuple, TYPE_CHECKING
 
 from config_loader import config
+from core.content_dedup import ContentDeduplicator
+from core.database_integration_base import PageFetchError
 from integrations.registry import registry
 
 if TYPE_CHECKING:
@@ -20,12 +22,34 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# A query must keep at least this share of its results before further pages
+# of it are pulled (and each further page must keep meeting it)
+CONTINUATION_MIN_EFFECTIVENESS = 0.5
+
 
 def _normalize_query(query: str) -> str:
     """Normalize query for comparison: lowercase, strip, remove extra spaces."""
     return ' '.join(query.lower().strip().split())
 
 
+def merge_hypothesis_attribution(existing: Dict, duplicate: Dict) -> None:
+    """
+    Fold a duplicate result's hypothesis attribution into the surviving result.
+
+    A result found by one hypothesis keeps a single hypothesis_id; once more
+    than one hypothesis has found it, it carries hypothesis_ids=[...] instead.
+    """
+    ids = []
+    for result in (existing, duplicate):
+        found = result.get("hypothesis_ids") or ([result["hypothesis_id"]] if "hypothesis_id" in result else [])
+        ids.extend(hid for hid in found if hid not in ids)
+    if len(ids) > 1 or "hypothesis_ids" in existing:
+        existing["hypothesis_ids"] = ids
+        existing.pop("hypothesis_id", None)
+    elif ids:
+        existing["hypothesis_id"] = ids[0]
+
+
 def _is_duplicate_query(new_query: str, existing_queries: List[str], threshold: float = 0.8) -> bool:
     """
     Check if new_query is too similar to any existing query.
@@ -66,6 +90,16 @@ def _is_duplicate_query(new_query: str, existing_queries: List[str], threshold:
     return False
 
 
+async def _take(items: AsyncIterator[Dict], count: int) -> List[Dict]:
+    """Pull up to count items from an async iterator (fewer if it is exhausted)."""
+    taken = []
+    async for item in items:
+        taken.append(item)
+        if len(taken) >= count:
+            break
+    return taken
+
+
 class SourceExecutorMixin:
     """
     Mixin providing source and hypothesis execution.
@@ -74,12 +108,14 @@ class SourceExecutorMixin:
         - self.logger: ExecutionLogger instance
         - self.max_queries_per_source: Dict[str, int]
         - self.max_time_per_source_seconds: int
+        - self.max_continuation_pages: int
         - self.query_saturation_enabled: bool
         - self.coverage_mode: bool
         - self.max_hypotheses_to_execute: int
         - self.max_time_per_task_seconds: int
         - self.mcp_tools: List[Dict]
         - self.integrations: List[str]
+        - self.evidence_dedup_stats: Dict[str, int] (optional, run-level dedup counters)
         - Methods from other mixins:
             - _generate_initial_query (QueryGenerationMixin)
             - _generate_next_query_or_stop (QueryGenerationMixin)
@@ -280,6 +316,7 @@ class SourceExecutorMixin:
 
                 # Execute based on source type
                 results = []
+                continuation = None
                 if tool_name in [t["name"] for t in self.mcp_tools]:
                     # MCP tool path (SAM, DVIDS, USAJobs, etc.)
                     mcp_tool = next(t for t in self.mcp_tools if t["name"] == tool_name)
@@ -294,6 +331,7 @@ class SourceExecutorMixin:
                     )
                     if tool_result.get("success"):
                         results = tool_result.get("results", [])
+                        continuation = tool_result.get("continuation")
                     else:
                         error_msg = tool_result.get('error', 'Unknown error')
                         logger.error(f"MCP tool {source_name} failed: {error_msg}")
@@ -371,6 +409,29 @@ class SourceExecutorMixin:
                 'effectiveness': len(new_results) / len(results) if results else 0
             })
 
+            # Productive query on a paginated source: pull further pages of the
+            # same query (one HTTP request each) before asking the LLM for a new one
+            if continuation and query_history[-1]['effectiveness'] >= CONTINUATION_MIN_EFFECTIVENESS:
+                more_results, page_stats = await self._fetch_continuation_pages(
+                    task=task,
+                    hypothesis=hypothesis,
+                    source_name=source_name,
+                    continuation=continuation,
+                    api_key_name=mcp_tool.get("api_key_name"),
+                    page_size=limit,
+                    seen_result_urls=seen_result_urls,
+                    deadline=start_time + max_time
+                )
+                all_results.extend(more_results)
+                last = query_history[-1]
+                last['pages_fetched'] = 1 + page_stats['pages']
+                last['results_total'] += page_stats['results_total']
+                last['results_accepted'] += page_stats['results_accepted']
+                last['results_rejected'] += page_stats['results_rejected']
+                last['results_duplicate'] += page_stats['results_duplicate']
+                if last['results_total']:
+                    last['effectiveness'] = last['results_accepted'] / last['results_total']
+
             # SECONDARY EXIT: User-configured query limit
             if len(query_history) >= max_queries:
                 if self.logger:
@@ -402,6 +463,88 @@ class SourceExecutorMixin:
 
         return all_results
 
+    async def _fetch_continuation_pages(
+        self: "SimpleDeepResearch",
+        task: "ResearchTask",
+        hypothesis: Dict[str, Any],
+        source_name: str,
+        continuation: Dict[str, Any],
+        api_key_name: Any,
+        page_size: int,
+        seen_result_urls: Set[str],
+        deadline: float
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Walk further pages of an already-productive query via iter_results().
+
+        The next page is prefetched while the current one is relevance-filtered.
+        Stops at max_continuation_pages, the source deadline, a failed page, or
+        the first page whose effectiveness drops below CONTINUATION_MIN_EFFECTIVENESS.
+
+        Args:
+            task: Research task
+            hypothesis: Hypothesis dictionary
+            source_name: Name of the source
+            continuation: Dict from _call_mcp_tool (integration_id, query_params, next_cursor)
+            api_key_name: Key into self.api_keys (None for public sources)
+            page_size: Results per page
+            seen_result_urls: URLs already accepted for this source (updated in place)
+            deadline: time.time() value after which no further page is requested
+
+        Returns:
+            Tuple of (new accepted results, page stats dict)
+        """
+        stats = {'pages': 0, 'results_total': 0, 'results_accepted': 0, 'results_rejected': 0, 'results_duplicate': 0}
+        accepted_results = []
+        integration = self.integrations.get(continuation['integration_id'])
+        if not integration or self.max_continuation_pages <= 0:
+            return accepted_results, stats
+
+        pages = integration.iter_results(
+            continuation['query_params'],
+            api_key=self.api_keys.get(api_key_name) if api_key_name else None,
+            page_size=page_size,
+            max_pages=self.max_continuation_pages,
+            start_cursor=continuation['next_cursor']
+        )
+        try:
+            while time.time() < deadline:
+                page = await _take(pages, page_size)
+                if not page:
+                    break
+                page = [{**r, 'source': r.get('source') or source_name} for r in page]
+
+                should_accept, _, relevant_indices, _, _, _ = await self._validate_result_relevance(
+                    task_query=hypothesis['statement'],
+                    research_question=task.query,
+                    sample_results=page
+                )
+                accepted = [page[i] for i in relevant_indices if i < len(page)] if should_accept else []
+
+                new_results = []
+                for result in accepted:
+                    result_url = result.get('url', '') or result.get('id', '')
+                    if result_url and result_url not in seen_result_urls:
+                        new_results.append(result)
+                        seen_result_urls.add(result_url)
+
+                accepted_results.extend(new_results)
+                stats['pages'] += 1
+                stats['results_total'] += len(page)
+                stats['results_accepted'] += len(new_results)
+                stats['results_rejected'] += len(page) - len(accepted)
+                stats['results_duplicate'] += len(accepted) - len(new_results)
+                print(f"   {source_name}: page {stats['pages'] + 1} of same query → {len(new_results)}/{len(page)} new")
+
+                if len(new_results) / len(page) < CONTINUATION_MIN_EFFECTIVENESS:
+                    break
+        except PageFetchError as e:
+            logger.warning(f"{source_name}: stopped paging: {e}")
+        finally:
+            await pages.aclose()
+
+        return accepted_results, stats
+
     async def _execute_hypothesis(
         self: "SimpleDeepResearch",
         hypothesis: Dict,
@@ -559,6 +702,34 @@ class SourceExecutorMixin:
 
         return deduplicated
 
+    def _collapse_duplicate_results(
+        self: "SimpleDeepResearch",
+        results: List[Dict],
+        on_duplicate=None,
+        dedup: ContentDeduplicator = None
+    ) -> List[Dict]:
+        """
+        Drop URL-variant and near-identical copies of results (first copy wins).
+
+        Duplicates' sources are recorded on the surviving result's provenance;
+        counts are added to self.evidence_dedup_stats when the host has it.
+
+        Args:
+            results: Results to deduplicate
+            on_duplicate: Optional callback(survivor, duplicate) for extra merging
+            dedup: Deduplicator to continue with (default: fresh one for this batch)
+
+        Returns:
+            Surviving results, in input order
+        """
+        dedup = dedup or ContentDeduplicator()
+        before = dict(dedup.stats)
+        unique = dedup.deduplicate(results, on_duplicate=on_duplicate)
+        run_stats = getattr(self, "evidence_dedup_stats", None)
+        if run_stats is not None:
+            for key, value in dedup.stats.items():
+                run_stats[key] = run_stats.get(key, 0) + value - before[key]
+        return unique
 
     async def _execute_hypotheses(
         self: "SimpleDeepResearch",
@@ -629,42 +800,8 @@ class SourceExecutorMixin:
                     all_results.extend(result)
 
             # Cross-hypothesis deduplication (results may appear across hypotheses)
-            # This is already handled by _deduplicate_with_attribution in _execute_hypothesis
-            # But we need to deduplicate across hypotheses too
-            deduplicated = []
-            url_map = {}  # url -> result with hypothesis_ids
-
-            for result in all_results:
-                url = result.get("url")
-                if not url:
-                    deduplicated.append(result)
-                    continue
-
-                if url in url_map:
-                    # Merge hypothesis attribution
-                    existing = url_map[url]
-                    if "hypothesis_ids" in existing:
-                        # Already multi-attributed
-                        if "hypothesis_id" in result:
-                            if result["hypothesis_id"] not in existing["hypothesis_ids"]:
-                                existing["hypothesis_ids"].append(result["hypothesis_id"])
-                        elif "hypothesis_ids" in result:
-                            for hid in result["hypothesis_ids"]:
-                                if hid not in existing["hypothesis_ids"]:
-                                    existing["hypothesis_ids"].append(hid)
-                    else:
-                        # Convert to multi-attribution
-                        existing["hypothesis_ids"] = [existing.pop("hypothesis_id")]
-                        if "hypothesis_id" in result:
-                            if result["hypothesis_id"] not in existing["hypothesis_ids"]:
-                                existing["hypothesis_ids"].append(result["hypothesis_id"])
-                        elif "hypothesis_ids" in result:
-                            for hid in result["hypothesis_ids"]:
-                                if hid not in existing["hypothesis_ids"]:
-                                    existing["hypothesis_ids"].append(hid)
-                else:
-                    url_map[url] = result
-                    deduplicated.append(result)
+            # _deduplicate_with_attribution only covers each hypothesis's own batch
+            deduplicated = self._collapse_duplicate_results(all_results, on_duplicate=merge_hypothesis_attribution)
 
             print(f"\n   Hypothesis execution complete: {len(deduplicated)} total unique results")
             return deduplicated
@@ -697,7 +834,7 @@ class SourceExecutorMixin:
 
         start_time = time.time()
         all_results = []
-        url_map = {}  # For cross-hypothesis deduplication
+        dedup = ContentDeduplicator()  # For cross-hypothesis deduplication
         coverage_decisions = []  # Store all coverage decisions
 
         for i, hypothesis in enumerate(hypotheses):
@@ -719,34 +856,10 @@ class SourceExecutorMixin:
             try:
                 hypothesis_results = await self._execute_hypothesis(hypothesis, task, research_question)
 
-                # Cross-hypothesis deduplication
-                for result in hypothesis_results:
-                    url = result.get("url")
-                    if not url:
-                        all_results.append(result)
-                        continue
-
-                    if url in url_map:
-                        # Merge attribution (same logic as parallel mode)
-                        existing = url_map[url]
-                        if "hypothesis_ids" in existing:
-                            if "hypothesis_id" in result and result["hypothesis_id"] not in existing["hypothesis_ids"]:
-                                existing["hypothesis_ids"].append(result["hypothesis_id"])
-                            elif "hypothesis_ids" in result:
-                                for hid in result["hypothesis_ids"]:
-                                    if hid not in existing["hypothesis_ids"]:
-                                        existing["hypothesis_ids"].append(hid)
-                        else:
-                            existing["hypothesis_ids"] = [existing.pop("hypothesis_id")]
-                            if "hypothesis_id" in result and result["hypothesis_id"] not in existing["hypothesis_ids"]:
-                                existing["hypothesis_ids"].append(result["hypothesis_id"])
-                            elif "hypothesis_ids" in result:
-                                for hid in result["hypothesis_ids"]:
-                                    if hid not in existing["hypothesis_ids"]:
-                                        existing["hypothesis_ids"].append(hid)
-                    else:
-                        url_map[url] = result
-                        all_results.append(result)
+                # Cross-hypothesis deduplication (same merging as parallel mode)
+                all_results.extend(self._collapse_duplicate_results(
+                    hypothesis_results, on_duplicate=merge_hypothesis_attribution, dedup=dedup
+                ))
 
                 print(f"   Results: {len(hypothesis_results)} from hypothesis ({len(all_results)} total unique)")
 
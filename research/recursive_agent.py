@@ -15,12 +15,21 @@ import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
 from enum import Enum
 
 from dotenv import load_dotenv
 from research.services.entity_analyzer import EntityAnalyzer
+from research.services.hierarchical_synthesizer import HierarchicalSynthesizer, PartialSummary
+from research.checkpoint import RunCheckpoint
+from research.goal_index import GoalIndex
+from core.blob_store import BlobStore, blob_store_scope, offload_async, preload_blob_texts
+from core.content_dedup import ContentDeduplicator
+from core.deadline import Deadline, deadline_scope, with_deadline
+from core.metrics import MeteredSemaphore
+from core.prompt_packer import PackItem, PackResult, PromptPacker, packing_enabled, prompt_budget
 from core.database_integration_base import Evidence
+from core.evidence_record import EvidenceRecord
 from core.error_classifier import ErrorClassifier, ErrorCategory
 
 load_dotenv()
@@ -99,6 +108,10 @@ class ResearchRun:
     evidence_store: Dict[str, Evidence] = field(default_factory=dict)
     lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     max_index_items_for_selection: int = 50  # Limit shown to LLM
+    goal_index: Optional[GoalIndex] = None  # Near-duplicate goal detection (None = disabled)
+    content_dedup: Optional[ContentDeduplicator] = None  # Cross-source evidence collapsing (None = disabled)
+    blob_store: Optional[BlobStore] = None  # Disk-backed raw payloads (None = keep raw content in memory)
+    checkpoint: Optional[RunCheckpoint] = None  # Journal of completed goals for --resume (None = disabled)
 
 
 @dataclass
@@ -111,7 +124,7 @@ class Constraints:
     """
     # === Core Limits ===
     max_depth: int = 15
-    max_time_seconds: int = 1800  # 30 minutes
+    max_time_seconds: int = 1800  # 30 minutes (enforced as a run-wide deadline, see core.deadline)
     max_cost_dollars: float = 5.0
     max_goals: int = 50
     max_results_per_source: int = 20
@@ -122,10 +135,10 @@ class Constraints:
     max_sources_in_prompt: int = 20  # Sources shown to LLM in assessment
     max_evidence_in_prompt: int = 10  # Recent evidence pieces shown
     max_evidence_for_analysis: int = 20  # Evidence included in analysis
-    max_sources_in_decompose: int = 15  # Sources shown in decomposition
-    max_goals_in_prompt: int = 10  # Existing goals shown (for redundancy check)
-    max_evidence_for_synthesis: int = 30  # Evidence pieces for synthesis
-    max_content_chars_in_synthesis: int = 500  # Content truncation in synthesis
+    max_sources_in_decompose: int = 15  # Sources shown in decomposition (when prompt packing is off)
+    max_goals_in_prompt: int = 10  # Existing goals shown (for redundancy check; when prompt packing is off)
+    max_evidence_for_synthesis: int = 30  # Evidence pieces for synthesis (more -> hierarchical synthesis)
+    max_content_chars_in_synthesis: int = 500  # Content truncation in synthesis (when prompt packing is off)
 
     # === LLM Cost Estimates (per call, in dollars) ===
     # These are rough estimates - override if using different models
@@ -149,11 +162,68 @@ class Constraints:
     summary_target_chars: int = 150  # Target summary length
     cost_per_summarization: float = 0.0003  # Cost per batch summarization
 
+    # === Post-Retrieval Evidence Processing ===
+    # "fused": one LLM call returns relevance indices, summaries and entities together
+    # "staged": separate filter -> entity extraction -> summarization calls (fallback mode)
+    evidence_processing_mode: str = "fused"
+    cost_per_fused_processing: float = 0.0005  # Cost per fused filter+summarize+extract call
+    max_content_for_processing: int = 2000  # Content chars per result in the fused call when prompt packing is off
+
+    # === Deadline ===
+    # Share of max_time_seconds held back for the final synthesis: research work
+    # (and every LLM/API call in it) is cut off at max_time * (1 - reserve)
+    synthesis_reserve_fraction: float = 0.1
+    deadline_grace_seconds: float = 2.0  # Wait for sub-goals to wind down before cancelling them
+
+    # === Assess-and-Plan ===
+    # Assessment also fills in execute_search() params for sources that declare
+    # QUERY_PARAMS_SCHEMA; valid params skip the per-source generate_query call
+    enable_assess_query_params: bool = True
+    max_param_schemas_in_assess: int = 8  # Source param schemas shown in assessment
+
+    # === Evidence Representation ===
+    # API results QueryResult already validated are kept as slotted
+    # EvidenceRecords instead of re-validated Pydantic Evidence models
+    enable_fast_evidence: bool = True
+
+    # === Raw Payload Store ===
+    # Full raw content above the threshold is written to a compressed,
+    # content-addressed store under output_dir/blobs and loaded on demand
+    enable_blob_store: bool = True
+    blob_offload_min_bytes: int = 4096
+
+    # === Checkpointing ===
+    # Completed goals, decompositions and loop state are journaled under
+    # output_dir/checkpoint so a crashed run can be resumed (research(resume=True))
+    enable_checkpointing: bool = True
+    checkpoint_snapshot_every: int = 50  # Journal records between full snapshots
+
+    # === Hierarchical Synthesis ===
+    # When evidence exceeds max_evidence_for_synthesis, summarize clusters
+    # concurrently (map) and merge summaries in a tree (reduce) before the
+    # final synthesis call, instead of dropping the overflow
+    enable_hierarchical_synthesis: bool = True
+    synthesis_cluster_by: str = "goal"  # "goal" (one cluster per sub-goal) or "source"
+    synthesis_map_concurrency: int = 4  # Concurrent map/reduce LLM calls
+    synthesis_fan_in: int = 4  # Partial summaries merged per reduce call
+    synthesis_token_budget: int = 3000  # Estimated tokens of evidence/summaries per map/reduce prompt
+    cost_per_synthesis_map: float = 0.0003  # Cost per map or reduce call
+
     # === Output Limits ===
     max_evidence_in_saved_result: int = 50  # Evidence saved to JSON
     max_evidence_per_source_in_report: int = 5  # Per-source in markdown report
     max_content_chars_in_report: int = 200  # Content truncation in report
 
+    # === Near-Duplicate Goals ===
+    # Paraphrased goals reuse the original goal's result instead of re-executing
+    enable_goal_dedup: bool = True
+    goal_similarity_threshold: float = 0.85  # Jaccard similarity of normalized goal terms
+
+    # === Near-Duplicate Evidence ===
+    # Same document from several sources/URL variants is filtered and summarized once
+    enable_content_dedup: bool = True
+    content_dedup_max_distance: int = 6  # SimHash Hamming distance (of 64 bits) for near-duplicates
+
     # === Iterative Research Loop ===
     max_iterations: int = 10  # Maximum follow-up iterations (safety limit only)
     cost_per_coverage_check: float = 0.0003  # Cost per coverage assessment
@@ -177,6 +247,7 @@ class Action:
     source: Optional[str] = None  # For API_CALL
     params: Dict[str, Any] = field(default_factory=dict)
     prompt: Optional[str] = None  # For ANALYZE/SYNTHESIZE
+    query_params: Optional[Dict[str, Any]] = None  # Ready-to-execute API params planned at assessment
 
 
 @dataclass
@@ -211,6 +282,7 @@ class GoalResult:
     depth: int = 0
     duration_seconds: float = 0.0
     cost_dollars: float = 0.0
+    reused_from: Optional[str] = None  # Original goal whose result this near-duplicate reused
 
 
 @dataclass
@@ -239,6 +311,9 @@ class GoalContext:
     # All goals seen (for cycle detection and redundancy)
     all_goals: List[str] = field(default_factory=list)
 
+    # Run-wide deadline for research work (None = only the elapsed-time check)
+    deadline: Optional[Deadline] = None
+
     # === BRANCH-LOCAL STATE (copied per context) ===
 
     # Never lost
@@ -267,6 +342,7 @@ class GoalContext:
             available_sources=self.available_sources,
             constraints=self.constraints,
             all_goals=self.all_goals,
+            deadline=self.deadline,
 
             # Branch-local state (copied)
             original_objective=self.original_objective,
@@ -289,6 +365,7 @@ class GoalContext:
             available_sources=self.available_sources,
             constraints=self.constraints,
             all_goals=self.all_goals,
+            deadline=self.deadline,
 
             # Branch-local state (copied/updated)
             original_objective=self.original_objective,
@@ -311,6 +388,7 @@ class GoalContext:
             available_sources=self.available_sources,
             constraints=self.constraints,
             all_goals=self.all_goals,
+            deadline=self.deadline,
 
             # Branch-local state
             original_objective=self.original_objective,
@@ -389,6 +467,8 @@ class ExecutionLogger:
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.log_path = self.output_dir / "execution_log.jsonl"
         self.events: List[GoalEvent] = []
+        # Called with every event after it is written (e.g. background job progress)
+        self.listeners: List[Callable[[GoalEvent], None]] = []
 
     def _write_entry(self, event_type: str, goal: str, depth: int,
                      parent_goal: Optional[str], data: Dict[str, Any]):
@@ -408,6 +488,13 @@ class ExecutionLogger:
         with open(self.log_path, 'a') as f:
             f.write(json.dumps(asdict(event)) + '\n')
 
+        for listener in self.listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                # Observers must never break the research run
+                logger.warning(f"Execution log listener failed: {e}", exc_info=True)
+
         # Console logging
         prefix = "  " * depth
         logger.info(f"{prefix}[{event_type}] {goal[:60]}...")
@@ -430,14 +517,18 @@ class ExecutionLogger:
 
     def log_run_complete(self, objective: str, status: str,
                          total_evidence: int, total_goals: int,
-                         elapsed_seconds: float, total_cost: float):
+                         elapsed_seconds: float, total_cost: float,
+                         duplicate_goals_reused: int = 0,
+                         evidence_dedup: Optional[Dict[str, Any]] = None):
         """Log research run completion."""
         self._write_entry("run_complete", objective, 0, None, {
             "status": status,
             "total_evidence": total_evidence,
             "total_goals": total_goals,
             "elapsed_seconds": elapsed_seconds,
-            "total_cost_dollars": total_cost
+            "total_cost_dollars": total_cost,
+            "duplicate_goals_reused": duplicate_goals_reused,
+            "evidence_dedup": evidence_dedup or {}
         })
 
     # === Goal-Level Events ===
@@ -633,6 +724,15 @@ class ExecutionLogger:
             "goal_stack": goal_stack
         })
 
+    def log_duplicate_goal(self, goal: str, depth: int, parent_goal: Optional[str],
+                           original_goal: str, similarity: float, subtrees_saved: int):
+        """Log a near-duplicate goal that reused another goal's result."""
+        self._write_entry("duplicate_goal_reused", goal, depth, parent_goal, {
+            "original_goal": original_goal,
+            "similarity": round(similarity, 3),
+            "subtrees_saved": subtrees_saved
+        })
+
     # === LLM Call Tracing Events ===
 
     def log_llm_call(self, goal: str, depth: int, parent_goal: Optional[str],
@@ -719,13 +819,14 @@ class ExecutionLogger:
 
     def log_generate_query(self, goal: str, depth: int, parent_goal: Optional[str],
                            source: str, query_params: Optional[Dict[str, Any]],
-                           success: bool, duration_ms: float):
-        """Log integration generate_query() output."""
+                           success: bool, duration_ms: float, planned_at_assessment: bool = False):
+        """Log integration generate_query() output (or params planned at assessment instead)."""
         self._write_entry("generate_query", goal, depth, parent_goal, {
             "source": source,
             "success": success,
             "query_params": query_params if query_params else None,
-            "duration_ms": duration_ms
+            "duration_ms": duration_ms,
+            "planned_at_assessment": planned_at_assessment
         })
 
     # === Utility Methods ===
@@ -809,14 +910,15 @@ class RecursiveResearchAgent:
                         "id": source_id,
                         "name": meta.name,
                         "description": meta.description,
-                        "category": str(meta.category.value) if hasattr(meta.category, 'value') else str(meta.category)
+                        "category": str(meta.category.value) if hasattr(meta.category, 'value') else str(meta.category),
+                        "query_params_schema": getattr(integration, "QUERY_PARAMS_SCHEMA", None)
                     })
             except Exception as e:
                 logger.warning(f"Could not load source {source_id}: {e}")
 
         logger.info(f"Initialized with {len(self.available_sources)} sources")
 
-    async def research(self, question: str) -> GoalResult:
+    async def research(self, question: str, resume: bool = False) -> GoalResult:
         """
         Main entry point for research.
 
@@ -828,6 +930,9 @@ class RecursiveResearchAgent:
 
         Args:
             question: The research question/objective
+            resume: Continue the run checkpointed in output_dir (see
+                research.checkpoint): completed goals are restored, goals in
+                flight when it died run again. The time budget starts over.
 
         Returns:
             GoalResult with all findings
@@ -837,12 +942,44 @@ class RecursiveResearchAgent:
 
         # Initialize global evidence index for cross-branch sharing
         research_run = ResearchRun()
+        if self.constraints.enable_goal_dedup:
+            research_run.goal_index = GoalIndex(threshold=self.constraints.goal_similarity_threshold)
+        if self.constraints.enable_content_dedup:
+            research_run.content_dedup = ContentDeduplicator(max_distance=self.constraints.content_dedup_max_distance)
+        if self.constraints.enable_blob_store:
+            research_run.blob_store = BlobStore(
+                self.output_dir / "blobs", min_offload_bytes=self.constraints.blob_offload_min_bytes
+            )
+        # Checkpoint files are written off the event loop (see research.checkpoint)
+        if resume:
+            research_run.checkpoint = await asyncio.to_thread(
+                RunCheckpoint.load, self.output_dir,
+                snapshot_every=self.constraints.checkpoint_snapshot_every
+            )
+            if research_run.checkpoint.question != question:
+                raise ValueError(f"Checkpoint in {self.output_dir} is for a different question: "
+                                 f"{research_run.checkpoint.question!r}")
+        elif self.constraints.enable_checkpointing:
+            research_run.checkpoint = await asyncio.to_thread(
+                RunCheckpoint.create, self.output_dir, question, asdict(self.constraints),
+                snapshot_every=self.constraints.checkpoint_snapshot_every
+            )
+        checkpoint = research_run.checkpoint
+
+        # Research work stops at work_deadline; the rest of the budget is kept
+        # for the final synthesis. Every LLM/HTTP/integration call made inside
+        # deadline_scope() gets min(own timeout, time remaining).
+        run_deadline = Deadline.after(self.constraints.max_time_seconds)
+        work_deadline = run_deadline.reserve(
+            self.constraints.max_time_seconds * self.constraints.synthesis_reserve_fraction
+        )
 
         context = GoalContext(
             original_objective=question,
             research_run=research_run,
             available_sources=self.available_sources,
             constraints=self.constraints,
+            deadline=work_deadline,
             start_time=datetime.now()
         )
 
@@ -863,6 +1000,11 @@ class RecursiveResearchAgent:
             constraints=asdict(self.constraints),
             sources_available=len(self.available_sources)
         )
+        if resume:
+            summary = checkpoint.summary()
+            self.logger.log("run_resumed", question, 0, None, summary)
+            print(f"Resuming: {summary['completed_goals']} completed goals restored, "
+                  f"{summary['in_flight_goals']} in-flight goals re-queued")
 
         # === ITERATIVE RESEARCH LOOP ===
         all_evidence: List[Evidence] = []
@@ -872,79 +1014,108 @@ class RecursiveResearchAgent:
         start_time = datetime.now()
         coverage: Dict[str, Any] = {}  # Will hold coverage assessment between iterations
 
-        while iteration < self.constraints.max_iterations:
-            iteration += 1
-            print(f"\n--- Iteration {iteration}/{self.constraints.max_iterations} ---")
-
-            # Check budget constraints
-            elapsed = (datetime.now() - start_time).total_seconds()
-            if elapsed > self.constraints.max_time_seconds:
-                print(f"  ⏱️ Time limit reached ({elapsed:.0f}s > {self.constraints.max_time_seconds}s)")
-                break
-            if total_cost > self.constraints.max_cost_dollars:
-                print(f"  💰 Cost limit reached (${total_cost:.4f} > ${self.constraints.max_cost_dollars})")
-                break
-
-            if iteration == 1:
-                # First iteration: pursue the main goal
-                result = await self.pursue_goal(question, context)
-                all_evidence.extend(result.evidence)
-                all_sub_results.append(result)
-                total_cost += result.cost_dollars
-            else:
-                # Subsequent iterations: generate and pursue follow-ups
-                # Pass coverage reasoning so follow-ups address identified gaps
-                follow_ups = await self._generate_follow_ups(
-                    question, all_evidence, context,
-                    coverage_reasoning=coverage  # From previous iteration
-                )
-                total_cost += self.constraints.cost_per_follow_up_generation
+        # Integrations building results inside blob_store_scope() offload raw payloads
+        with deadline_scope(work_deadline), blob_store_scope(research_run.blob_store):
+            while iteration < self.constraints.max_iterations:
+                iteration += 1
+                print(f"\n--- Iteration {iteration}/{self.constraints.max_iterations} ---")
 
-                if not follow_ups:
-                    print("  ✓ No more follow-ups needed - research exhausted")
+                # Check budget constraints
+                if work_deadline.expired:
+                    elapsed = (datetime.now() - start_time).total_seconds()
+                    print(f"  ⏱️ Time limit reached ({elapsed:.0f}s, "
+                          f"{run_deadline.remaining():.0f}s reserved for synthesis)")
+                    break
+                if total_cost > self.constraints.max_cost_dollars:
+                    print(f"  💰 Cost limit reached (${total_cost:.4f} > ${self.constraints.max_cost_dollars})")
                     break
 
-                print(f"  📋 Generated {len(follow_ups)} follow-up goals")
-                for fu in follow_ups:
-                    print(f"    - {fu[:60]}...")
-
-                # Pursue follow-ups (with fresh context but accumulated evidence)
-                for follow_up in follow_ups:
-                    # Check constraints before each follow-up
-                    elapsed = (datetime.now() - start_time).total_seconds()
-                    if elapsed > self.constraints.max_time_seconds:
-                        break
-                    if total_cost > self.constraints.max_cost_dollars:
+                if iteration == 1:
+                    # First iteration: pursue the main goal
+                    result = await self.pursue_goal(question, context)
+                    all_evidence.extend(result.evidence)
+                    all_sub_results.append(result)
+                    total_cost += result.cost_dollars
+                else:
+                    # Subsequent iterations: generate and pursue follow-ups
+                    # Pass coverage reasoning so follow-ups address identified gaps
+                    follow_ups = checkpoint.follow_ups(iteration) if checkpoint else None
+                    if follow_ups is None:
+                        follow_ups = await self._generate_follow_ups(
+                            question, all_evidence, context,
+                            coverage_reasoning=coverage  # From previous iteration
+                        )
+                        if checkpoint:
+                            checkpoint.record_follow_ups(iteration, follow_ups)
+                    total_cost += self.constraints.cost_per_follow_up_generation
+
+                    if not follow_ups:
+                        print("  ✓ No more follow-ups needed - research exhausted")
                         break
 
-                    fu_context = context.with_evidence(all_evidence)
-                    fu_result = await self.pursue_goal(follow_up, fu_context)
-                    all_evidence.extend(fu_result.evidence)
-                    all_sub_results.append(fu_result)
-                    total_cost += fu_result.cost_dollars
+                    print(f"  📋 Generated {len(follow_ups)} follow-up goals")
+                    for fu in follow_ups:
+                        print(f"    - {fu[:60]}...")
+
+                    # Pursue follow-ups (with fresh context but accumulated evidence)
+                    for follow_up in follow_ups:
+                        # Check constraints before each follow-up
+                        if work_deadline.expired:
+                            break
+                        if total_cost > self.constraints.max_cost_dollars:
+                            break
+
+                        fu_context = context.with_evidence(all_evidence)
+                        fu_result = await self.pursue_goal(follow_up, fu_context)
+                        if fu_result.reused_from:
+                            # Reused evidence is usually already accumulated - skip repeats
+                            known_urls = {e.url for e in all_evidence if e.url}
+                            all_evidence.extend(e for e in fu_result.evidence if not e.url or e.url not in known_urls)
+                        else:
+                            all_evidence.extend(fu_result.evidence)
+                        all_sub_results.append(fu_result)
+                        total_cost += fu_result.cost_dollars
+
+                # Out of time: go straight to synthesis with what was gathered
+                if work_deadline.expired:
+                    print(f"  ⏱️ Time limit reached, {run_deadline.remaining():.0f}s reserved for synthesis")
+                    break
 
-            # Assess coverage after each iteration - LLM reasons through completeness
-            coverage = await self._assess_coverage(question, all_evidence, context)
-            total_cost += self.constraints.cost_per_coverage_check
+                # Assess coverage after each iteration - LLM reasons through completeness
+                recorded_coverage = checkpoint.coverage(iteration) if checkpoint else None
+                if recorded_coverage is not None:
+                    coverage = recorded_coverage
+                else:
+                    coverage = await self._assess_coverage(question, all_evidence, context)
+                    if checkpoint:
+                        checkpoint.record_coverage(iteration, coverage)
+                total_cost += self.constraints.cost_per_coverage_check
 
-            # Show reasoning-based assessment
-            print(f"  📊 Assessment: {len(all_evidence)} evidence from "
-                  f"{len(set(e.source for e in all_evidence))} sources")
+                # Show reasoning-based assessment
+                print(f"  📊 Assessment: {len(all_evidence)} evidence from "
+                      f"{len(set(e.source for e in all_evidence))} sources")
 
-            if coverage.get('sufficient', False):
-                print(f"  ✓ Research exhausted: {coverage.get('reasoning', '')[:80]}...")
-                break
+                if coverage.get('sufficient', False):
+                    print(f"  ✓ Research exhausted: {coverage.get('reasoning', '')[:80]}...")
+                    break
 
-            # Show what LLM identified as untried strategies
-            gaps = coverage.get('gaps', [])
-            if gaps:
-                print(f"  🔍 Untried strategies: {', '.join(str(g)[:40] for g in gaps[:3])}")
+                # Show what LLM identified as untried strategies
+                gaps = coverage.get('gaps', [])
+                if gaps:
+                    print(f"  🔍 Untried strategies: {', '.join(str(g)[:40] for g in gaps[:3])}")
 
         # === FINAL SYNTHESIS ===
         print(f"\n--- Final Synthesis ---")
         print(f"Total iterations: {iteration}")
         print(f"Total evidence: {len(all_evidence)}")
         print(f"Total cost: ${total_cost:.4f}")
+        duplicate_goals_reused = research_run.goal_index.stats["reused"] if research_run.goal_index else 0
+        if duplicate_goals_reused:
+            print(f"Near-duplicate goals: {duplicate_goals_reused} subtrees reused instead of re-executed")
+        evidence_dedup = research_run.content_dedup.summary() if research_run.content_dedup else None
+        if evidence_dedup and evidence_dedup["seen"]:
+            print(f"Duplicate evidence collapsed: {evidence_dedup['url_duplicates'] + evidence_dedup['content_duplicates']}"
+                  f"/{evidence_dedup['seen']} ({evidence_dedup['dedup_ratio']:.0%})")
 
         # Create final result combining all iterations
         final_result = GoalResult(
@@ -959,8 +1130,9 @@ class RecursiveResearchAgent:
             cost_dollars=total_cost
         )
 
-        # Generate synthesis
-        synthesis = await self._synthesize(question, all_sub_results, context)
+        # Generate synthesis (within the reserved slice of the time budget)
+        with deadline_scope(run_deadline):
+            synthesis = await self._synthesize(question, all_sub_results, context)
         final_result.synthesis = synthesis.text if hasattr(synthesis, 'text') else str(synthesis)
         final_result.confidence = synthesis.confidence if hasattr(synthesis, 'confidence') else coverage.get('confidence', 0.5)
 
@@ -971,11 +1143,15 @@ class RecursiveResearchAgent:
             total_evidence=len(final_result.evidence),
             total_goals=context.goals_created,
             elapsed_seconds=final_result.duration_seconds,
-            total_cost=final_result.cost_dollars
+            total_cost=final_result.cost_dollars,
+            duplicate_goals_reused=duplicate_goals_reused,
+            evidence_dedup=evidence_dedup
         )
 
         # Save final result (async for LLM-based report synthesis)
         await self._save_result(final_result)
+        if checkpoint:
+            await asyncio.to_thread(checkpoint.close)
 
         return final_result
 
@@ -984,7 +1160,132 @@ class RecursiveResearchAgent:
         The core recursive loop.
 
         This is the ONLY entry point for pursuing any goal at any depth.
+        A goal completed before a resumed run died is restored from the
+        checkpoint; a near-duplicate of a goal already pursued in this run
+        (see GoalIndex) reuses that goal's in-flight or completed result
+        instead of spawning its own subtree.
+        """
+        checkpoint = context.research_run.checkpoint if context.research_run else None
+        if checkpoint is None:
+            return await self._pursue_deduplicated(goal, context)
+
+        path = [*context.goal_stack, goal]
+        restored = checkpoint.completed_result(path)
+        if restored is not None:
+            await self._restore_goal(restored, context)
+            return restored
+
+        checkpoint.goal_started(path)
+        result = await self._pursue_deduplicated(goal, context)
+        if result.status == GoalStatus.COMPLETED:
+            checkpoint.goal_completed(path, result)
+        return result
+
+    async def _pursue_deduplicated(self, goal: str, context: GoalContext) -> GoalResult:
+        """Pursue a goal, reusing a near-duplicate goal's result when there is one."""
+        goal_index = context.research_run.goal_index if context.research_run else None
+        if goal_index is None:
+            return await self._pursue_goal(goal, context)
+
+        reused = await self._reuse_duplicate_goal(goal, context, goal_index)
+        if reused is not None:
+            return reused
+
+        entry = goal_index.register(goal)
+        if entry is None:
+            return await self._pursue_goal(goal, context)
+
+        result: Optional[GoalResult] = None
+        try:
+            result = await self._pursue_goal(goal, context)
+        finally:
+            # Only completed results are worth sharing; waiters on anything else pursue their own goal
+            if result is not None and result.status == GoalStatus.COMPLETED:
+                goal_index.complete(entry, result)
+            else:
+                goal_index.discard(entry)
+        return result
+
+    async def _restore_goal(self, result: GoalResult, context: GoalContext) -> None:
         """
+        Rebuild the run state a restored goal's subtree would have left behind:
+        goals seen, evidence in the run index, and a completed GoalIndex entry
+        so later near-duplicates reuse it.
+        """
+        research_run = context.research_run
+        if research_run.goal_index is not None:
+            entry = research_run.goal_index.register(result.goal)
+            if entry is not None:
+                research_run.goal_index.complete(entry, result)
+
+        async def restore(node: GoalResult, node_context: GoalContext) -> None:
+            node_context.add_goal(node.goal)
+            if node.sub_results:
+                child_context = node_context.with_parent(node.goal)
+                for sub_result in node.sub_results:
+                    await restore(sub_result, child_context)
+            elif node.evidence and not node.reused_from:
+                await self._add_to_run_index(node.evidence, node.goal, node_context)
+
+        await restore(result, context)
+
+        parent_goal = context.goal_stack[-1] if context.goal_stack else None
+        self.logger.log("goal_restored", result.goal, context.depth, parent_goal, {
+            "status": result.status.value,
+            "evidence_count": len(result.evidence),
+            "confidence": result.confidence,
+            "sub_goals": len(result.sub_results),
+            "cost_dollars": result.cost_dollars
+        })
+
+    async def _reuse_duplicate_goal(
+        self,
+        goal: str,
+        context: GoalContext,
+        goal_index: GoalIndex
+    ) -> Optional[GoalResult]:
+        """
+        Answer goal from a near-duplicate goal's result, waiting if it is in flight.
+
+        Returns:
+            GoalResult built from the original's result, or None if there is no
+            usable duplicate (none found, original failed, or waiting could deadlock)
+        """
+        match = goal_index.find_duplicate(goal)
+        if match is None:
+            return None
+        original, similarity = match
+
+        start_time = datetime.now()
+        original_result = await goal_index.wait_for(original, context.goal_stack, goal)
+        if original_result is None:
+            return None
+
+        parent_goal = context.goal_stack[-1] if context.goal_stack else None
+        subtrees_saved = goal_index.stats["reused"]
+        self.logger.log_duplicate_goal(
+            goal, context.depth, parent_goal,
+            original_goal=original.goal,
+            similarity=similarity,
+            subtrees_saved=subtrees_saved
+        )
+        logger.info(f"Near-duplicate goal reused result of '{original.goal[:60]}' "
+                    f"(similarity {similarity:.2f}, {subtrees_saved} subtrees saved so far)")
+
+        return GoalResult(
+            goal=goal,
+            status=original_result.status,
+            evidence=list(original_result.evidence),
+            synthesis=original_result.synthesis,
+            confidence=original_result.confidence,
+            reasoning=f"Near-duplicate of '{original.goal}' (similarity {similarity:.2f}) - reused its result",
+            depth=context.depth,
+            duration_seconds=(datetime.now() - start_time).total_seconds(),
+            reused_from=original.goal
+        )
+
+    async def _pursue_goal(self, goal: str, context: GoalContext) -> GoalResult:
+        """Pursue a goal: constraint/cycle checks, then execute or decompose."""
         start_time = datetime.now()
         parent_goal = context.goal_stack[-1] if context.goal_stack else None
 
@@ -1020,7 +1321,14 @@ class RecursiveResearchAgent:
             )
 
         # === ASSESSMENT: Execute or Decompose? ===
-        assessment = await self._assess(goal, context)
+        # A resumed run replays the checkpointed decision instead of asking again
+        checkpoint = context.research_run.checkpoint if context.research_run else None
+        path = [*context.goal_stack, goal]
+        assessment = checkpoint.assessment(path) if checkpoint else None
+        if assessment is None:
+            assessment = await self._assess(goal, context)
+            if checkpoint:
+                checkpoint.record_assessment(path, assessment)
         self.logger.log_goal_assessed(
             goal, context.depth, parent_goal,
             directly_executable=assessment.directly_executable,
@@ -1049,7 +1357,11 @@ class RecursiveResearchAgent:
         context_with_rationale = context.with_decomposition_rationale(
             assessment.decomposition_rationale
         )
-        sub_goals = await self._decompose(goal, context_with_rationale)
+        sub_goals = checkpoint.decomposition(path) if checkpoint else None
+        if sub_goals is None:
+            sub_goals = await self._decompose(goal, context_with_rationale)
+            if checkpoint and sub_goals:
+                checkpoint.record_decomposition(path, sub_goals)
 
         self.logger.log_goal_decomposed(
             goal, context.depth, parent_goal,
@@ -1071,8 +1383,7 @@ class RecursiveResearchAgent:
         child_context = context.with_parent(goal)
         sub_results: List[GoalResult] = []
         all_evidence: List[Evidence] = []
-        seen_urls: set = set()  # Track URLs for deduplication
-        duplicate_count: int = 0  # Track duplicates for logging
+        merge_dedup = ContentDeduplicator(max_distance=context.constraints.content_dedup_max_distance)
 
         # Group by dependency for parallelism
         goal_groups = self._group_by_dependency(sub_goals)
@@ -1083,7 +1394,7 @@ class RecursiveResearchAgent:
             self.logger.log_dependency_groups(goal, context.depth, parent_goal, goal_groups)
 
         # Bug fix: Add semaphore to limit concurrent tasks
-        semaphore = asyncio.Semaphore(context.constraints.max_concurrent_tasks)
+        semaphore = MeteredSemaphore(context.constraints.max_concurrent_tasks, name="sub_goals")
 
         async def limited_pursue(sg_description: str, ctx: GoalContext) -> GoalResult:
             """Pursue a goal with concurrency limiting."""
@@ -1099,22 +1410,14 @@ class RecursiveResearchAgent:
                 )
                 for sg in group
             ]
-            group_results = await asyncio.gather(*group_tasks)
+            group_results = await self._gather_within_deadline(
+                [sg.description for sg in group], group_tasks, child_context
+            )
 
             for result in group_results:
                 sub_results.append(result)
-                # Deduplicate evidence by URL before accumulating
-                for evidence in result.evidence:
-                    url = evidence.url
-                    if url:
-                        if url not in seen_urls:
-                            seen_urls.add(url)
-                            all_evidence.append(evidence)
-                        else:
-                            duplicate_count += 1
-                    else:
-                        # No URL - can't deduplicate, keep it
-                        all_evidence.append(evidence)
+                # Deduplicate evidence (URL variants, near-identical content) before accumulating
+                all_evidence.extend(merge_dedup.deduplicate(result.evidence))
 
             # === CHECK IF GOAL ACHIEVED ===
             # Skip early exit for comparative/synthesis goals to ensure all dependency groups complete
@@ -1138,10 +1441,9 @@ class RecursiveResearchAgent:
                     break
 
         # Log deduplication stats if any duplicates were found
-        if duplicate_count > 0:
-            total_before_dedup = len(all_evidence) + duplicate_count
-            logger.info(f"Deduplication: {total_before_dedup} → {len(all_evidence)} "
-                       f"({duplicate_count} duplicates removed)")
+        if merge_dedup.duplicates > 0:
+            logger.info(f"Deduplication: {merge_dedup.stats['seen']} → {len(all_evidence)} "
+                       f"({merge_dedup.duplicates} duplicates removed)")
 
         # === SYNTHESIZE RESULTS ===
         synthesis = await self._synthesize(goal, sub_results, context)
@@ -1198,9 +1500,22 @@ class RecursiveResearchAgent:
             for s in context.available_sources[:context.constraints.max_sources_in_prompt]
         ])
 
+        # Parameter schemas let the assessment plan the API call itself
+        # (see _execute_api_call), saving the generate_query round trip
+        param_schemas_text = ""
+        if context.constraints.enable_assess_query_params:
+            planned_sources = [
+                s for s in context.available_sources[:context.constraints.max_sources_in_prompt]
+                if s.get("query_params_schema")
+            ][:context.constraints.max_param_schemas_in_assess]
+            param_schemas_text = "\n".join([
+                f"- {s['name']} (id: {s['id']}): {json.dumps(s['query_params_schema']['properties'])}"
+                for s in planned_sources
+            ])
+
         # Format evidence summary
         evidence_text = "None yet." if not context.accumulated_evidence else "\n".join([
-            f"- [{e.source}] {e.title}: {e.content[:100]}..."
+            f"- [{e.source}] {e.title}: {e.preview(100)}..."
             for e in context.accumulated_evidence[-context.constraints.max_evidence_in_prompt:]
         ])
 
@@ -1214,6 +1529,7 @@ class RecursiveResearchAgent:
             goal_stack=context.goal_stack,
             evidence_text=evidence_text,
             sources_text=sources_text,
+            param_schemas_text=param_schemas_text,
             depth=context.depth,
             max_depth=context.constraints.max_depth,
             elapsed_seconds=int(context.elapsed_seconds),
@@ -1260,7 +1576,8 @@ class RecursiveResearchAgent:
                     type=ActionType(action_data.get("type", "api_call")),
                     source=action_data.get("source"),
                     params=action_data.get("params", {}),
-                    prompt=action_data.get("prompt")
+                    prompt=action_data.get("prompt"),
+                    query_params=action_data.get("query_params")
                 )
 
             return Assessment(
@@ -1345,25 +1662,44 @@ class RecursiveResearchAgent:
                     depth=context.depth
                 )
 
-            # Use integration's generate_query to get proper API parameters
-            # This leverages the existing LLM-driven query generation per source
-            query_text = action.params.get("query", goal)
+            # Params planned during assessment are used as-is when they validate
+            # against the source's schema; otherwise fall back to the integration's
+            # own LLM-driven query generation
+            query_params = None
+            if action.query_params and context.constraints.enable_assess_query_params:
+                query_params = integration.validate_query_params(action.query_params)
+                if query_params is None:
+                    logger.info(f"{source_id}: assessment query params invalid, falling back to generate_query")
 
-            gen_query_start = time.time()
-            query_params = await integration.generate_query(query_text)
-            gen_query_duration = (time.time() - gen_query_start) * 1000
-
-            # Log generate_query result (this is an LLM call inside integration)
             parent_goal = context.goal_stack[-1] if context.goal_stack else None
-            self.logger.log_generate_query(
-                goal=goal,
-                depth=context.depth,
-                parent_goal=parent_goal,
-                source=source_id,
-                query_params=query_params,
-                success=query_params is not None,
-                duration_ms=gen_query_duration
-            )
+            if query_params is not None:
+                self.logger.log_generate_query(
+                    goal=goal,
+                    depth=context.depth,
+                    parent_goal=parent_goal,
+                    source=source_id,
+                    query_params=query_params,
+                    success=True,
+                    duration_ms=0.0,
+                    planned_at_assessment=True
+                )
+            else:
+                query_text = action.params.get("query", goal)
+
+                gen_query_start = time.time()
+                query_params = await with_deadline(integration.generate_query(query_text))
+                gen_query_duration = (time.time() - gen_query_start) * 1000
+
+                # Log generate_query result (this is an LLM call inside integration)
+                self.logger.log_generate_query(
+                    goal=goal,
+                    depth=context.depth,
+                    parent_goal=parent_goal,
+                    source=source_id,
+                    query_params=query_params,
+                    success=query_params is not None,
+                    duration_ms=gen_query_duration
+                )
 
             if not query_params:
                 logger.warning(f"No query params generated for {source_id}")
@@ -1393,11 +1729,11 @@ class RecursiveResearchAgent:
                 start_time = datetime.now()
                 # Bug fix: Get API key from registry (was missing, causing 16+ source failures)
                 api_key = self.registry.get_api_key(source_id)
-                result = await integration.execute_search(
+                result = await with_deadline(integration.execute_search(
                     current_params,
                     api_key=api_key,
                     limit=context.constraints.max_results_per_source
-                )
+                ))
                 response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
 
                 # Classify error if present (for structured logging and error handling)
@@ -1473,16 +1809,34 @@ class RecursiveResearchAgent:
                     else:
                         break
 
-            # Convert to evidence using factory method (Pydantic validation + type safety)
+            # Convert to evidence. Results QueryResult already validated become
+            # slotted EvidenceRecords (no second Pydantic pass); anything else is
+            # validated via the Evidence factory method.
             evidence = []
             if result and result.success and result.results:
-                for item in result.results:
-                    evidence.append(Evidence.from_dict(item, source_id))
-
-            # Filter for relevance
+                if context.constraints.enable_fast_evidence and getattr(result, "validated", False):
+                    evidence = [EvidenceRecord.from_trusted(item, source_id) for item in result.results]
+                else:
+                    evidence = [Evidence.from_dict(item, source_id) for item in result.results]
+
+            # Copies of evidence another goal already kept (any source/branch) reuse that
+            # processed item instead of being filtered and summarized again. Only kept
+            # items are registered, so a result rejected for one goal is still judged
+            # on its own merits for the next.
+            content_dedup = context.research_run.content_dedup if context.research_run else None
+            reused: List[Evidence] = []
+            if evidence and content_dedup is not None:
+                evidence, reused = content_dedup.partition(evidence)
+                if reused:
+                    print(f"    ⧉ {source_id}: {len(reused)} results already collected from other sources")
+
+            # Filter for relevance, extract entities, summarize long content
             original_count = len(evidence)
+            entities: List[str] = []
             if evidence:
-                evidence = await self._filter_results(goal, evidence, context)
+                # Payloads the integration offloaded are read in full below: load them off the loop
+                await preload_blob_texts(e.raw_content_ref for e in evidence)
+                evidence, entities = await self._process_evidence(goal, evidence, context)
 
                 # Log filter decision
                 if original_count != len(evidence):
@@ -1496,33 +1850,42 @@ class RecursiveResearchAgent:
 
             filtered_msg = f" (filtered {original_count}→{len(evidence)})" if len(evidence) != original_count else ""
             print(f"    ✓ {source_id}: {len(evidence)} results{filtered_msg}")
+            if entities:
+                print(f"    📊 Extracted {len(entities)} entities: {', '.join(entities[:5])}")
+
+            if evidence and content_dedup is not None:
+                # Register what was kept; a concurrent goal may have kept a copy meanwhile
+                kept = []
+                for e in evidence:
+                    survivor = content_dedup.check(e)
+                    if survivor is None:
+                        kept.append(e)
+                    elif not any(r is survivor for r in reused):
+                        reused.append(survivor)
+                evidence = kept
+
+            # Keep large raw payloads of kept results on disk, not in memory for the rest of the run
+            blob_store = context.research_run.blob_store if context.research_run else None
+            if evidence and blob_store is not None:
+                refs = await offload_async(blob_store, (e.raw_content for e in evidence))
+                for e, ref in zip(evidence, refs):
+                    if ref:
+                        e.raw_content, e.raw_content_ref = None, ref
 
-            # Extract entities from results (builds relationship graph)
             if evidence:
-                results_for_extraction = [
-                    {"title": e.title, "snippet": e.content[:300], "url": e.url}
-                    for e in evidence
-                ]
-                entities = await self.entity_analyzer.extract_and_update(
-                    results=results_for_extraction,
-                    research_question=context.original_objective,
-                    task_query=goal
-                )
-                if entities:
-                    print(f"    📊 Extracted {len(entities)} entities: {', '.join(entities[:5])}")
-
-                # Summarize long content to preserve key info in fewer tokens
-                evidence = await self._summarize_evidence(evidence, goal, context)
-
                 # Add to global research index for cross-branch sharing
                 await self._add_to_run_index(evidence, goal, context)
 
+            reasoning = f"Searched {source_id}, found {len(evidence) + len(reused)} relevant results"
+            if reused:
+                reasoning += f" ({len(reused)} already collected by other goals)"
+            evidence = evidence + reused
             return GoalResult(
                 goal=goal,
                 status=GoalStatus.COMPLETED if evidence else GoalStatus.FAILED,
                 evidence=evidence,
                 confidence=0.8 if evidence else 0.3,
-                reasoning=f"Searched {source_id}, found {len(evidence)} relevant results",
+                reasoning=reasoning,
                 depth=context.depth
             )
 
@@ -1630,29 +1993,42 @@ class RecursiveResearchAgent:
         from llm_utils import acompletion
         from core.prompt_loader import render_prompt
 
-        sources_text = "\n".join([
-            f"- {s['name']}: {s['description']}"
-            for s in context.available_sources[:context.constraints.max_sources_in_decompose]
-        ])
-
-        existing_goals = "\n".join([
-            f"  - {g}" for g in context.all_goals[-context.constraints.max_goals_in_prompt:]
-        ]) or "  (none yet)"
-
-        prompt = render_prompt(
-            "recursive_agent/goal_decomposition.j2",
+        prompt_args = dict(
             temporal_context=_get_temporal_context(),
             original_objective=context.original_objective,
             goal=goal,
             decomposition_rationale=context.decomposition_rationale or "Goal is too broad for direct execution",
             goal_stack=context.goal_stack,
             evidence_summary=context.evidence_summary,
-            sources_text=sources_text,
-            existing_goals=existing_goals,
+            sources_text="",
+            existing_goals="  (none yet)",
             remaining_depth=context.constraints.max_depth - context.depth,
             remaining_goals=context.constraints.max_goals - context.goals_created
         )
 
+        if packing_enabled():
+            # Sources first (in registry order), then the most recent goals in what is left
+            overhead = render_prompt("recursive_agent/goal_decomposition.j2", **prompt_args)
+            budget = prompt_budget("decomposition", self.model, overhead)
+            sources = PromptPacker(budget, separator="\n", keep_order=True).pack([
+                PackItem(title=f"- {s['name']}: {s['description']}") for s in context.available_sources
+            ])
+            goals = PromptPacker(budget - sources.tokens - 1, separator="\n", keep_order=True).pack([
+                PackItem(title=f"  - {g}", priority=i) for i, g in enumerate(context.all_goals)
+            ])
+            prompt_args["sources_text"] = sources.text
+            prompt_args["existing_goals"] = goals.text or "  (none yet)"
+        else:
+            prompt_args["sources_text"] = "\n".join([
+                f"- {s['name']}: {s['description']}"
+                for s in context.available_sources[:context.constraints.max_sources_in_decompose]
+            ])
+            prompt_args["existing_goals"] = "\n".join([
+                f"  - {g}" for g in context.all_goals[-context.constraints.max_goals_in_prompt:]
+            ]) or "  (none yet)"
+
+        prompt = render_prompt("recursive_agent/goal_decomposition.j2", **prompt_args)
+
         try:
             start_time = time.time()
 
@@ -2087,10 +2463,19 @@ class RecursiveResearchAgent:
 
         # Format for synthesis
         max_content = context.constraints.max_content_chars_in_synthesis
-        evidence_text = "\n\n".join([
-            f"[{e.source}] {e.title}\n{e.content[:max_content]}"
-            for e in all_evidence[:context.constraints.max_evidence_for_synthesis]
-        ])
+        partials = None
+        if (context.constraints.enable_hierarchical_synthesis
+                and len(all_evidence) > context.constraints.max_evidence_for_synthesis):
+            # Too much to show directly: map-reduce it down to partial summaries
+            partials = await self._summarize_hierarchically(goal, sub_results, all_evidence, context)
+            evidence_text = "\n\n".join(p.to_text() for p in partials)
+        elif not packing_enabled():
+            evidence_text = "\n\n".join([
+                f"[{e.source}] {e.title}\n{e.preview(max_content)}"
+                for e in all_evidence[:context.constraints.max_evidence_for_synthesis]
+            ])
+        else:
+            evidence_text = ""  # Packed to the token budget once the rest of the prompt is known
 
         sub_syntheses = "\n".join([
             f"- {r.goal}: {r.synthesis or r.reasoning or 'No synthesis'}"
@@ -2113,8 +2498,7 @@ class RecursiveResearchAgent:
                         break  # Only add first match per failed goal
         sources_with_errors = list(set(sources_with_errors))  # Deduplicate
 
-        prompt = render_prompt(
-            "recursive_agent/evidence_synthesis.j2",
+        prompt_args = dict(
             temporal_context=_get_temporal_context(),
             goal=goal,
             original_objective=context.original_objective,
@@ -2125,6 +2509,13 @@ class RecursiveResearchAgent:
             sources_with_errors=sources_with_errors,
             rate_limited_sources=list(self.rate_limited_sources)
         )
+        if partials is None and packing_enabled():
+            overhead = render_prompt("recursive_agent/evidence_synthesis.j2", **prompt_args)
+            prompt_args["evidence_text"] = self._pack_prompt_section("synthesis", [
+                PackItem(title=f"[{e.source}] {e.title}", body=e.content, priority=e.relevance_score or 0.0)
+                for e in all_evidence
+            ], overhead).text
+        prompt = render_prompt("recursive_agent/evidence_synthesis.j2", **prompt_args)
 
         try:
             start_time = time.time()
@@ -2179,6 +2570,89 @@ class RecursiveResearchAgent:
                 depth=context.depth
             )
 
+    def _pack_prompt_section(
+        self,
+        call_site: str,
+        items: List[PackItem],
+        overhead_prompt: str,
+        keep_order: bool = False
+    ) -> PackResult:
+        """Pack `items` into what the model's context leaves after `overhead_prompt`."""
+        budget = prompt_budget(call_site, self.model, overhead_prompt)
+        packed = PromptPacker(budget, keep_order=keep_order).pack(items)
+        if packed.dropped:
+            logger.info(
+                f"Prompt packing ({call_site}): {len(packed.included)}/{len(items)} items "
+                f"in {packed.tokens}/{budget} tokens"
+            )
+        return packed
+
+    async def _summarize_hierarchically(
+        self,
+        goal: str,
+        sub_results: List[GoalResult],
+        all_evidence: List[Evidence],
+        context: GoalContext
+    ) -> List[PartialSummary]:
+        """
+        Map-reduce all evidence into a few partial summaries for _synthesize().
+
+        Sub-goals that were themselves synthesized contribute their synthesis
+        as a partial; only evidence of directly executed sub-goals is mapped.
+        Otherwise every ancestor would re-map all descendant evidence and the
+        LLM calls would grow with tree depth x evidence. See
+        research.services.hierarchical_synthesizer.
+        """
+        from llm_utils import acompletion
+
+        constraints = context.constraints
+        parent_goal = context.goal_stack[-1] if context.goal_stack else None
+
+        async def llm_json(call_type: str, prompt: str) -> Dict:
+            start_time = time.time()
+            response = await acompletion(
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"}
+            )
+            context.add_cost(constraints.cost_per_synthesis_map)
+            response_text = response.choices[0].message.content
+            self.logger.log_llm_call(
+                goal=goal,
+                depth=context.depth,
+                parent_goal=parent_goal,
+                call_type=call_type,
+                prompt=prompt,
+                response=response_text,
+                cost_dollars=constraints.cost_per_synthesis_map,
+                model=self.model,
+                duration_ms=(time.time() - start_time) * 1000
+            )
+            return json.loads(response_text)
+
+        synthesizer = HierarchicalSynthesizer(
+            llm_json,
+            max_concurrency=constraints.synthesis_map_concurrency,
+            fan_in=constraints.synthesis_fan_in,
+            token_budget=constraints.synthesis_token_budget,
+            max_content_chars=constraints.max_content_chars_in_synthesis,
+        )
+        synthesized = [r for r in sub_results if r.sub_results and r.synthesis]
+        executed = [r for r in sub_results if not (r.sub_results and r.synthesis)]
+        existing = [
+            PartialSummary(label=r.goal, summary=r.synthesis, confidence=r.confidence, evidence_count=len(r.evidence))
+            for r in synthesized
+        ]
+        if constraints.synthesis_cluster_by == "source":
+            clusters = HierarchicalSynthesizer.cluster_by_source([e for r in executed for e in r.evidence])
+        else:
+            clusters = HierarchicalSynthesizer.cluster_by_goal(executed)
+
+        partials = await synthesizer.summarize(goal, context.original_objective, clusters, partials=existing)
+        print(f"  🧩 Hierarchical synthesis: {len(all_evidence)} evidence ({len(existing)} sub-syntheses reused) → "
+              f"{synthesizer.stats['map_calls']} map + {synthesizer.stats['reduce_calls']} reduce calls")
+        return partials
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -2188,7 +2662,8 @@ class RecursiveResearchAgent:
         if context.depth >= context.constraints.max_depth:
             return f"Max depth ({context.constraints.max_depth}) reached"
 
-        if context.elapsed_seconds >= context.constraints.max_time_seconds:
+        if context.elapsed_seconds >= context.constraints.max_time_seconds or (
+                context.deadline is not None and context.deadline.expired):
             return f"Time limit ({context.constraints.max_time_seconds}s) reached"
 
         if context.cost_incurred >= context.constraints.max_cost_dollars:
@@ -2199,15 +2674,274 @@ class RecursiveResearchAgent:
 
         return None
 
+    async def _gather_within_deadline(
+        self,
+        goals: List[str],
+        coros: List[Any],
+        context: GoalContext
+    ) -> List[GoalResult]:
+        """
+        asyncio.gather() for sub-goal pursuits that stops at the run deadline.
+
+        Sub-goals still running when the deadline passes get deadline_grace_seconds
+        to return what they have (their own LLM/API calls fail fast once it has
+        passed); any still running after that are cancelled and reported as
+        CONSTRAINED so the parent can synthesize from the completed siblings.
+        """
+        deadline = context.deadline
+        if deadline is None:
+            return list(await asyncio.gather(*coros))
+
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            _, pending = await asyncio.wait(
+                tasks, timeout=deadline.remaining() + context.constraints.deadline_grace_seconds
+            )
+        except asyncio.CancelledError:
+            # Parent subtree cancelled: take the children down with it
+            for task in tasks:
+                task.cancel()
+            raise
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.info(f"Run deadline reached: cancelled {len(pending)} of {len(tasks)} sub-goals")
+
+        results = []
+        for goal, task in zip(goals, tasks):
+            if task.cancelled():
+                results.append(GoalResult(
+                    goal=goal,
+                    status=GoalStatus.CONSTRAINED,
+                    reasoning="Cancelled at run deadline",
+                    depth=context.depth
+                ))
+            else:
+                results.append(task.result())  # re-raises like gather() would
+        return results
+
     def _detect_cycle(self, goal: str, context: GoalContext) -> bool:
         """Detect if pursuing this goal would create a cycle."""
         # Exact match in ancestry
         if goal in context.goal_stack:
             return True
 
-        # Could add semantic similarity check here
+        # Paraphrase of an ancestor (same normalized terms as the goal index uses)
+        goal_index = context.research_run.goal_index if context.research_run else None
+        if goal_index is not None:
+            return any(goal_index.is_similar(goal, ancestor) for ancestor in context.goal_stack)
         return False
 
+    async def _process_evidence(
+        self,
+        goal: str,
+        evidence: List[Evidence],
+        context: GoalContext
+    ) -> Tuple[List[Evidence], List[str]]:
+        """
+        Post-retrieval processing of fresh API results.
+
+        Filters for relevance, extracts entities into the entity graph and
+        summarizes long content. In "fused" mode (default) all three come
+        back from one structured-output LLM call; if that call fails, or in
+        "staged" mode, the separate filter / extraction / summarization
+        calls are used.
+
+        Returns:
+            (kept evidence, extracted entity names)
+        """
+        if context.constraints.evidence_processing_mode == "fused":
+            try:
+                return await self._process_evidence_fused(goal, evidence, context)
+            except Exception as e:
+                logger.warning(f"Fused evidence processing failed: {e}, falling back to staged processing")
+        return await self._process_evidence_staged(goal, evidence, context)
+
+    async def _process_evidence_staged(
+        self,
+        goal: str,
+        evidence: List[Evidence],
+        context: GoalContext
+    ) -> Tuple[List[Evidence], List[str]]:
+        """Filter, extract entities and summarize with one LLM call each."""
+        evidence = await self._filter_results(goal, evidence, context)
+        if not evidence:
+            return evidence, []
+
+        # Extract entities from results (builds relationship graph)
+        results_for_extraction = [
+            {"title": e.title, "snippet": e.preview(300), "url": e.url}
+            for e in evidence
+        ]
+        entities = await self.entity_analyzer.extract_and_update(
+            results=results_for_extraction,
+            research_question=context.original_objective,
+            task_query=goal
+        )
+
+        # Summarize long content to preserve key info in fewer tokens
+        evidence = await self._summarize_evidence(evidence, goal, context)
+        return evidence, entities
+
+    async def _process_evidence_fused(
+        self,
+        goal: str,
+        evidence: List[Evidence],
+        context: GoalContext
+    ) -> Tuple[List[Evidence], List[str]]:
+        """
+        Filter, summarize and extract entities in a single LLM call.
+
+        Only kept items are summarized and only kept items contribute
+        entities. Raises on LLM/parse errors so the caller can fall back.
+        """
+        from llm_utils import acompletion
+        from core.prompt_loader import render_prompt
+
+        constraints = context.constraints
+        filter_results = len(evidence) > constraints.min_results_to_filter
+        summarize = constraints.enable_summarization
+        needs_summary = {
+            i for i, e in enumerate(evidence)
+            if summarize and len(e.content) > constraints.max_content_before_summarize
+        }
+
+        prompt_args = dict(
+            temporal_context=_get_temporal_context(),
+            original_objective=context.original_objective,
+            goal=goal,
+            evidence_text="",
+            filter_results=filter_results,
+            summarize=bool(needs_summary),
+            summary_target_chars=constraints.summary_target_chars
+        )
+
+        # Packed results keep their original index; any that did not fit are
+        # kept unevaluated (not filtered, summarized or mined for entities)
+        unevaluated: List[int] = []
+        if packing_enabled():
+            packed = self._pack_prompt_section("filter", [
+                PackItem(title=f"Result #{i}{' [SUMMARIZE]' if i in needs_summary else ''}:\nTitle: {e.title}",
+                         body=f"Content: {e.content}", key=i)
+                for i, e in enumerate(evidence)
+            ], render_prompt("recursive_agent/evidence_processing.j2", **prompt_args), keep_order=True)
+            prompt_args["evidence_text"] = packed.text
+            unevaluated = [item.key for item in packed.dropped]
+            needs_summary.difference_update(unevaluated)
+            prompt_args["summarize"] = bool(needs_summary)
+        else:
+            prompt_args["evidence_text"] = "\n\n".join([
+                f"Result #{i}{' [SUMMARIZE]' if i in needs_summary else ''}:\n"
+                f"Title: {e.title}\nContent: {e.content[:constraints.max_content_for_processing]}"
+                for i, e in enumerate(evidence)
+            ])
+
+        prompt = render_prompt("recursive_agent/evidence_processing.j2", **prompt_args)
+
+        schema = {
+            "type": "object",
+            "properties": {
+                "relevant_indices": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Result indices relevant to the goal"
+                },
+                "filtering_rationale": {"type": "string"},
+                "summaries": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "item_index": {"type": "integer"},
+                            "summary": {"type": "string"}
+                        },
+                        "required": ["item_index", "summary"],
+                        "additionalProperties": False
+                    }
+                },
+                "entities": EntityAnalyzer.EXTRACTION_SCHEMA["properties"]["entities"]
+            },
+            "required": ["relevant_indices", "filtering_rationale", "summaries", "entities"],
+            "additionalProperties": False
+        }
+
+        start_time = time.time()
+        response = await acompletion(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "strict": True,
+                    "name": "evidence_processing",
+                    "schema": schema
+                }
+            }
+        )
+        duration_ms = (time.time() - start_time) * 1000
+
+        response_text = response.choices[0].message.content
+        result = json.loads(response_text)
+        context.add_cost(constraints.cost_per_fused_processing)
+
+        parent_goal = context.goal_stack[-1] if context.goal_stack else None
+        self.logger.log_llm_call(
+            goal=goal,
+            depth=context.depth,
+            parent_goal=parent_goal,
+            call_type="process_evidence",
+            prompt=prompt,
+            response=response_text,
+            cost_dollars=constraints.cost_per_fused_processing,
+            model=self.model,
+            duration_ms=duration_ms
+        )
+
+        # 1. Relevance
+        if filter_results:
+            relevant = {i for i in result.get("relevant_indices", []) if 0 <= i < len(evidence)}
+            for i in relevant:
+                evidence[i].relevance_score = 1.0  # Marked as relevant by LLM
+            kept_indices = sorted(relevant.union(unevaluated))
+            logger.info(f"Filtered {len(evidence)} → {len(kept_indices)} results")
+        else:
+            kept_indices = list(range(len(evidence)))
+        kept = set(kept_indices)
+
+        # 2. Summaries (kept items that asked for one only)
+        summarized_count = 0
+        for item in result.get("summaries", []):
+            i, summary = item.get("item_index"), item.get("summary")
+            if i not in kept or i not in needs_summary or not summary:
+                continue
+            e = evidence[i]
+            e.metadata["original_content"] = e.content
+            e.snippet = summary  # Use snippet (writable), not content (read-only property)
+            summarized_count += 1
+            self.logger.log_summarization(
+                goal=goal,
+                depth=context.depth,
+                parent_goal=parent_goal,
+                original_length=len(e.metadata["original_content"]),
+                summarized_length=len(summary),
+                result_index=i,
+                source=e.source
+            )
+        if summarized_count > 0:
+            logger.info(f"Summarized {summarized_count} evidence items")
+
+        # 3. Entities grounded in kept items
+        entities = [
+            entity for entity in result.get("entities", [])
+            if isinstance(entity, dict) and entity.get("name")
+            and (not entity.get("source_indices") or kept.intersection(entity["source_indices"]))
+        ]
+        if entities:
+            await self.entity_analyzer.update_entity_graph(entities)
+
+        return [evidence[i] for i in kept_indices], [entity["name"] for entity in entities]
+
     async def _filter_results(
         self,
         goal: str,
@@ -2227,20 +2961,31 @@ class RecursiveResearchAgent:
         from llm_utils import acompletion
         from core.prompt_loader import render_prompt
 
-        # Format evidence for evaluation
-        evidence_text = "\n\n".join([
-            f"Result #{i}:\nTitle: {e.title}\nContent: {e.content[:300]}..."
-            for i, e in enumerate(evidence)
-        ])
-
-        prompt = render_prompt(
-            "recursive_agent/result_filtering.j2",
+        prompt_args = dict(
             temporal_context=_get_temporal_context(),
             original_objective=context.original_objective,
             goal=goal,
-            evidence_text=evidence_text
+            evidence_text=""
         )
 
+        # Format evidence for evaluation. Packed results keep their original
+        # index; any that did not fit are kept unevaluated rather than dropped.
+        unevaluated: List[int] = []
+        if packing_enabled():
+            packed = self._pack_prompt_section("filter", [
+                PackItem(title=f"Result #{i}:\nTitle: {e.title}", body=f"Content: {e.content}", key=i)
+                for i, e in enumerate(evidence)
+            ], render_prompt("recursive_agent/result_filtering.j2", **prompt_args), keep_order=True)
+            prompt_args["evidence_text"] = packed.text
+            unevaluated = [item.key for item in packed.dropped]
+        else:
+            prompt_args["evidence_text"] = "\n\n".join([
+                f"Result #{i}:\nTitle: {e.title}\nContent: {e.preview(300)}..."
+                for i, e in enumerate(evidence)
+            ])
+
+        prompt = render_prompt("recursive_agent/result_filtering.j2", **prompt_args)
+
         try:
             start_time = time.time()
 
@@ -2279,6 +3024,8 @@ class RecursiveResearchAgent:
             # Assign relevance scores
             for i, e in enumerate(filtered):
                 e.relevance_score = 1.0  # Marked as relevant by LLM
+            evaluated = set(relevant_indices)
+            filtered.extend(evidence[i] for i in unevaluated if i not in evaluated)
 
             logger.info(f"Filtered {len(evidence)} → {len(filtered)} results")
             return filtered
@@ -2429,7 +3176,7 @@ class RecursiveResearchAgent:
                 goal=goal,
                 source=e.source,
                 title=e.title,
-                snippet=e.content[:200] if e.content else "",
+                snippet=e.preview(200),
                 goal_ancestry=context.goal_stack.copy()
             )
             entries_to_add.append((evidence_id, entry, e))
@@ -2665,14 +3412,26 @@ class RecursiveResearchAgent:
 
     async def _save_result(self, result: GoalResult):
         """Save the final result to disk."""
-        # Save JSON result (includes entity graph)
-        result_dict = self._result_to_dict(result)
-        result_dict["entity_graph"] = self.entity_analyzer.get_entity_graph()
-        result_dict["entities_discovered"] = len(self.entity_analyzer.get_all_entities())
+        # Save JSON result (normalized format: evidence table + goal tree by ID)
+        from research.result_format import write_result
 
+        max_saved = self.constraints.max_evidence_in_saved_result
         result_path = self.output_dir / "result.json"
         with open(result_path, 'w') as f:
-            json.dump(result_dict, f, indent=2, default=str)
+            stats = write_result(
+                f, result, self._evidence_to_dict, max_saved,
+                extra={
+                    "rate_limited_sources": list(self.rate_limited_sources),
+                    "entities_discovered": len(self.entity_analyzer.get_all_entities()),
+                    "entity_graph": self.entity_analyzer.get_entity_graph(),
+                },
+            )
+        if stats["evidence_truncated"]:
+            logger.warning(
+                f"Evidence truncated: {stats['evidence_truncated']} evidence references beyond "
+                f"max_evidence_in_saved_result={max_saved} per goal were not saved to result.json. "
+                f"Increase max_evidence_in_saved_result to preserve all evidence."
+            )
 
         # Save entity graph separately for easy access
         entity_path = self.output_dir / "entities.json"
@@ -2691,9 +3450,26 @@ class RecursiveResearchAgent:
 
         print(f"\nResults saved to: {self.output_dir}")
 
+    def _evidence_to_dict(self, e: Evidence) -> Dict:
+        """Serialize one Evidence for result.json (both formats)."""
+        return {
+            "source": e.source,
+            "title": e.title,
+            # Backward compatible: truncated content for existing tools
+            "content": e.preview(self.constraints.max_content_chars_in_synthesis),
+            "url": e.url,
+            # Three-tier model fields
+            "raw_content": e.full_content,  # Full content, never truncated
+            "date": e.date,  # Structured date from API
+            "relevance_score": e.relevance_score,  # LLM-assigned score
+        }
+
     def _result_to_dict(self, result: GoalResult) -> Dict:
         """
-        Convert GoalResult to serializable dict.
+        Convert GoalResult to the legacy nested dict (result.json format 1).
+
+        _save_result() now writes the normalized format via
+        research.result_format; research.result_format.load_result() reads both.
 
         Three-tier model preservation:
         - raw_content: Full content, never truncated (for reprocessing)
@@ -2727,17 +3503,7 @@ class RecursiveResearchAgent:
             "cost_dollars": result.cost_dollars,
             "rate_limited_sources": list(self.rate_limited_sources),
             "evidence": [
-                {
-                    "source": e.source,
-                    "title": e.title,
-                    # Backward compatible: truncated content for existing tools
-                    "content": e.content[:self.constraints.max_content_chars_in_synthesis],
-                    "url": e.url,
-                    # NEW: Three-tier model fields
-                    "raw_content": e.full_content,  # Full content, never truncated
-                    "date": e.date,  # Structured date from API
-                    "relevance_score": e.relevance_score,  # LLM-assigned score
-                }
+                self._evidence_to_dict(e)
                 for e in result.evidence[:self.constraints.max_evidence_in_saved_result]
             ],
             "sub_results": [
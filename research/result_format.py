@@ -0,0 +1,186 @@
+"""
+Normalized, evidence-by-reference result.json format.
+
+The legacy result.json (format 1) nests each goal's evidence inline, and
+since evidence is merged upward every piece is repeated once per ancestor,
+so a deep tree serializes the same raw_content many times. Format 2 stores
+each evidence record once in a top-level table keyed by a stable,
+content-derived ID; the goal tree carries only `evidence_ids`.
+
+write_result() streams format 2 straight to a file handle, one evidence
+record and one goal node at a time, without building the whole document as
+a dict. load_result() reads either format and returns the normalized
+(format 2) shape, so consumers only handle one layout.
+
+Usage:
+    with open(output_dir / "result.json", "w") as f:
+        stats = write_result(f, result, evidence_to_dict, max_evidence_per_goal=50,
+                             extra={"rate_limited_sources": [...], "entity_graph": {...}})
+
+    data = load_result(output_dir / "result.json")      # format 1 or 2
+    for record in goal_evidence(data, data["goal_tree"]):
+        print(record["title"], record["url"])
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Union
+
+RESULT_FORMAT_VERSION = 2
+
+# Scalar per-goal fields kept in both formats (format 1 also has derivable
+# counts such as evidence_saved/sub_results_count, dropped on normalization)
+GOAL_FIELDS = (
+    "goal",
+    "status",
+    "synthesis",
+    "confidence",
+    "evidence_count",
+    "evidence_truncated",
+    "depth",
+    "duration_seconds",
+    "cost_dollars",
+)
+
+# Format 1 repeats these on every node; format 2 keeps them top-level
+_LEGACY_TOP_LEVEL_FIELDS = ("rate_limited_sources", "entity_graph", "entities_discovered")
+
+
+def evidence_id(record: Dict[str, Any]) -> str:
+    """Stable ID for a serialized evidence record (same content -> same ID)."""
+    canonical = json.dumps(record, sort_keys=True, default=str, separators=(",", ":"))
+    return "ev_" + hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+def write_result(
+    fp: TextIO,
+    result: Any,
+    evidence_to_dict: Callable[[Any], Dict[str, Any]],
+    max_evidence_per_goal: int,
+    extra: Optional[Dict[str, Any]] = None,
+) -> Dict[str, int]:
+    """
+    Stream a GoalResult tree to `fp` as format 2.
+
+    Args:
+        fp: Text file handle to write to
+        result: Root GoalResult (anything with goal/status/evidence/sub_results)
+        evidence_to_dict: Serializes one Evidence to its saved record
+        max_evidence_per_goal: Evidence IDs kept per goal (rest counted as truncated)
+        extra: Additional top-level fields (entity graph, rate-limited sources, ...)
+
+    Returns:
+        {"evidence_records": unique records written, "evidence_truncated": IDs
+        dropped across all goals by max_evidence_per_goal}
+    """
+    fp.write('{\n  "format_version": %d' % RESULT_FORMAT_VERSION)
+    for key, value in (extra or {}).items():
+        fp.write(f",\n  {_dumps(key)}: {_dumps(value)}")
+
+    # Pass 1: evidence table. Each Evidence object is serialized once; only
+    # its ID is remembered for the tree pass.
+    ids: Dict[int, str] = {}
+    written = set()
+    truncated = 0
+    fp.write(',\n  "evidence": {')
+    for node in _walk(result):
+        truncated += max(0, len(node.evidence) - max_evidence_per_goal)
+        for evidence in node.evidence[:max_evidence_per_goal]:
+            if id(evidence) in ids:
+                continue
+            record = evidence_to_dict(evidence)
+            eid = evidence_id(record)
+            ids[id(evidence)] = eid
+            if eid in written:
+                continue
+            fp.write(("," if written else "") + f"\n    {_dumps(eid)}: {_dumps(record)}")
+            written.add(eid)
+    fp.write("\n  },\n")
+
+    # Pass 2: goal tree referencing evidence by ID
+    fp.write('  "goal_tree": ')
+    _write_goal(fp, result, ids, max_evidence_per_goal)
+    fp.write("\n}\n")
+
+    return {"evidence_records": len(written), "evidence_truncated": truncated}
+
+
+def _walk(result: Any) -> Iterator[Any]:
+    yield result
+    for sub_result in result.sub_results:
+        yield from _walk(sub_result)
+
+
+def _write_goal(fp: TextIO, result: Any, ids: Dict[int, str], max_evidence: int) -> None:
+    status = getattr(result.status, "value", result.status)
+    fields = {
+        "goal": result.goal,
+        "status": status,
+        "synthesis": result.synthesis,
+        "confidence": result.confidence,
+        "evidence_count": len(result.evidence),
+        "evidence_truncated": max(0, len(result.evidence) - max_evidence),
+        "depth": result.depth,
+        "duration_seconds": result.duration_seconds,
+        "cost_dollars": result.cost_dollars,
+        "evidence_ids": [ids[id(e)] for e in result.evidence[:max_evidence]],
+    }
+    fp.write("{" + ", ".join(f"{_dumps(k)}: {_dumps(v)}" for k, v in fields.items()))
+    fp.write(', "sub_results": [')
+    for i, sub_result in enumerate(result.sub_results):
+        fp.write(", " if i else "")
+        _write_goal(fp, sub_result, ids, max_evidence)
+    fp.write("]}")
+
+
+def load_result(source: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Load a result.json of either format, normalized to format 2.
+
+    Args:
+        source: Path to result.json, or an already-parsed dict
+
+    Returns:
+        {"format_version": 2, <top-level fields>, "evidence": {id: record},
+        "goal_tree": {GOAL_FIELDS..., "evidence_ids": [...], "sub_results": [...]}}
+    """
+    if isinstance(source, dict):
+        data = source
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+    if data.get("format_version") == RESULT_FORMAT_VERSION:
+        return data
+
+    evidence: Dict[str, Dict[str, Any]] = {}
+    normalized: Dict[str, Any] = {"format_version": RESULT_FORMAT_VERSION}
+    for key in _LEGACY_TOP_LEVEL_FIELDS:
+        if key in data:
+            normalized[key] = data[key]
+    normalized["evidence"] = evidence
+    normalized["goal_tree"] = _normalize_legacy_goal(data, evidence)
+    return normalized
+
+
+def _normalize_legacy_goal(node: Dict[str, Any], evidence: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    goal = {key: node.get(key) for key in GOAL_FIELDS}
+    goal["evidence_truncated"] = node.get("evidence_truncated", 0)
+    evidence_ids = []
+    for record in node.get("evidence", []):
+        eid = evidence_id(record)
+        evidence.setdefault(eid, record)
+        evidence_ids.append(eid)
+    goal["evidence_ids"] = evidence_ids
+    goal["sub_results"] = [_normalize_legacy_goal(sub, evidence) for sub in node.get("sub_results", [])]
+    return goal
+
+
+def goal_evidence(data: Dict[str, Any], goal: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Resolve a normalized goal node's evidence IDs to their records."""
+    return [data["evidence"][eid] for eid in goal["evidence_ids"]]
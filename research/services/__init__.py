@@ -12,16 +12,21 @@ Services (Phase 1 - Complete):
 Services (Phase 2 - Complete):
 - ResultFilter: Stateless service for result validation and filtering
 - QueryGenerator: Stateless service for hypothesis query generation
+
+Services (Performance):
+- HierarchicalSynthesizer: Map-reduce synthesis for large evidence sets
 """
 
 from research.services.query_reformulator import QueryReformulator
 from research.services.entity_analyzer import EntityAnalyzer
 from research.services.result_filter import ResultFilter
 from research.services.query_generator import QueryGenerator
+from research.services.hierarchical_synthesizer import HierarchicalSynthesizer
 
 __all__ = [
     "QueryReformulator",
     "EntityAnalyzer",
     "ResultFilter",
     "QueryGenerator",
+    "HierarchicalSynthesizer",
 ]
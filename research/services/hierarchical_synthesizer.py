@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Hierarchical (map-reduce) synthesis service for large evidence sets.
+
+A single synthesis call can only see max_evidence_for_synthesis truncated
+items, so most findings of a large run never reach the LLM, and the prompt
+(and latency) grows with the evidence. HierarchicalSynthesizer instead:
+
+1. Clusters evidence by sub-goal or by source, splitting clusters so each
+   map prompt stays inside a token budget.
+2. Map: summarizes every cluster part concurrently (bounded semaphore).
+   Every evidence item goes to exactly one map call.
+3. Reduce: merges partial summaries in a tree, fan_in at a time, until the
+   survivors fit one prompt; the caller's final synthesis runs on those.
+   Summaries that already exist (a sub-goal's own synthesis) enter the
+   reduce directly, so evidence summarized lower in a goal tree is not
+   mapped again at every ancestor.
+
+Wall-clock time grows with tree depth (1 map level + log_fan_in reduce
+levels), not with the evidence count, as long as concurrency covers a level.
+
+Usage:
+    async def llm_json(call_type: str, prompt: str) -> dict:
+        ...  # acompletion(..., response_format=json) -> json.loads
+
+    synthesizer = HierarchicalSynthesizer(llm_json, max_concurrency=4, fan_in=4, token_budget=3000)
+    clusters = HierarchicalSynthesizer.cluster_by_goal(sub_results)
+    partials = await synthesizer.summarize(goal, objective, clusters)
+    # partials: <= fan_in PartialSummary objects for the final synthesis prompt
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.metrics import MeteredSemaphore
+from core.prompt_loader import render_prompt
+
+logger = logging.getLogger(__name__)
+
+# Rough token estimate for prompt budgeting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of `text`."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+@dataclass
+class EvidenceCluster:
+    """Evidence grouped under one label (a sub-goal or a source)."""
+    label: str
+    evidence: List[Any]
+
+
+@dataclass
+class PartialSummary:
+    """Output of a map or reduce call."""
+    label: str
+    summary: str
+    key_findings: List[str] = field(default_factory=list)
+    confidence: float = 0.5
+    evidence_count: int = 0
+
+    def to_text(self) -> str:
+        findings = "".join(f"\n- {f}" for f in self.key_findings)
+        return f"[{self.label}] ({self.evidence_count} pieces)\n{self.summary}{findings}"
+
+
+@dataclass
+class _MapTask:
+    label: str
+    part: int
+    part_count: int
+    evidence_text: str
+    evidence_count: int
+
+
+class HierarchicalSynthesizer:
+    """
+    Map-reduce synthesis over evidence clusters.
+
+    The LLM is injected as `llm_json(call_type, prompt) -> dict` so the caller
+    owns model choice, cost tracking and logging (and tests can pass a fake).
+    """
+
+    def __init__(
+        self,
+        llm_json: Callable[[str, str], Awaitable[Dict[str, Any]]],
+        max_concurrency: int = 4,
+        fan_in: int = 4,
+        token_budget: int = 3000,
+        max_content_chars: int = 500,
+    ):
+        if fan_in < 2:
+            raise ValueError(f"fan_in must be >= 2, got {fan_in}")
+        self.llm_json = llm_json
+        self.fan_in = fan_in
+        self.token_budget = token_budget
+        self.max_content_chars = max_content_chars
+        self._semaphore = MeteredSemaphore(max_concurrency, name="synthesis")
+        self.stats = {"map_calls": 0, "reduce_calls": 0, "reduce_levels": 0, "failed_calls": 0}
+
+    # -------------------------------------------------------------------------
+    # Clustering
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def cluster_by_goal(sub_results: List[Any]) -> List[EvidenceCluster]:
+        """One cluster per sub-result that has evidence."""
+        return [EvidenceCluster(label=r.goal, evidence=list(r.evidence)) for r in sub_results if r.evidence]
+
+    @staticmethod
+    def cluster_by_source(evidence: List[Any]) -> List[EvidenceCluster]:
+        """One cluster per evidence source, in first-seen order."""
+        clusters: Dict[str, EvidenceCluster] = {}
+        for e in evidence:
+            clusters.setdefault(e.source, EvidenceCluster(label=e.source, evidence=[])).evidence.append(e)
+        return list(clusters.values())
+
+    def _format_evidence(self, e: Any) -> str:
+        return f"[{e.source}] {e.title}\n{e.content[:self.max_content_chars]}"
+
+    def _plan_map(self, clusters: List[EvidenceCluster]) -> List[_MapTask]:
+        """Split clusters into budget-sized parts; each item lands in exactly one part."""
+        tasks = []
+        for cluster in clusters:
+            parts: List[List[str]] = []
+            current: List[str] = []
+            current_tokens = 0
+            for e in cluster.evidence:
+                text = self._format_evidence(e)
+                tokens = estimate_tokens(text)
+                if current and current_tokens + tokens > self.token_budget:
+                    parts.append(current)
+                    current, current_tokens = [], 0
+                current.append(text)
+                current_tokens += tokens
+            if current:
+                parts.append(current)
+            for i, part in enumerate(parts, 1):
+                tasks.append(_MapTask(cluster.label, i, len(parts), "\n\n".join(part), len(part)))
+        return tasks
+
+    # -------------------------------------------------------------------------
+    # Map / reduce
+    # -------------------------------------------------------------------------
+
+    async def summarize(
+        self,
+        goal: str,
+        original_objective: str,
+        clusters: List[EvidenceCluster],
+        partials: Optional[List[PartialSummary]] = None
+    ) -> List[PartialSummary]:
+        """
+        Map every cluster, then reduce until the partials fit one prompt.
+
+        Args:
+            partials: Summaries that already exist (e.g. syntheses of sub-goals
+                      that were themselves synthesized); they join the reduce
+                      without a map call
+
+        Returns:
+            At most fan_in partial summaries (fewer if they already fit)
+        """
+        tasks = self._plan_map(clusters)
+        mapped = await asyncio.gather(*(self._map(goal, original_objective, t) for t in tasks))
+        partials = list(partials or []) + list(mapped)
+
+        while len(partials) > 1 and not self._fits(partials):
+            groups = self._group(partials)
+            self.stats["reduce_levels"] += 1
+            partials = list(await asyncio.gather(*(
+                self._reduce(goal, original_objective, g) if len(g) > 1 else _passthrough(g[0])
+                for g in groups
+            )))
+
+        logger.info(
+            f"Hierarchical synthesis: {sum(t.evidence_count for t in tasks)} mapped evidence, "
+            f"{self.stats['map_calls']} map + {self.stats['reduce_calls']} reduce calls, "
+            f"{self.stats['reduce_levels']} reduce levels -> {len(partials)} partials"
+        )
+        return partials
+
+    def _fits(self, partials: List[PartialSummary]) -> bool:
+        return len(partials) <= self.fan_in and sum(estimate_tokens(p.to_text()) for p in partials) <= self.token_budget
+
+    def _group(self, partials: List[PartialSummary]) -> List[List[PartialSummary]]:
+        """Pack neighbours into groups of <= fan_in within the token budget."""
+        groups: List[List[PartialSummary]] = []
+        current: List[PartialSummary] = []
+        current_tokens = 0
+        for p in partials:
+            tokens = estimate_tokens(p.to_text())
+            if current and (len(current) >= self.fan_in or current_tokens + tokens > self.token_budget):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(p)
+            current_tokens += tokens
+        groups.append(current)
+
+        if all(len(g) == 1 for g in groups):
+            # Oversized partials: the budget cannot be met, merge by fan_in anyway to make progress
+            groups = [partials[i:i + self.fan_in] for i in range(0, len(partials), self.fan_in)]
+        return groups
+
+    async def _map(self, goal: str, original_objective: str, task: _MapTask) -> PartialSummary:
+        label = task.label if task.part_count == 1 else f"{task.label} (part {task.part}/{task.part_count})"
+        prompt = render_prompt(
+            "recursive_agent/synthesis_map.j2",
+            goal=goal,
+            original_objective=original_objective,
+            cluster_label=task.label,
+            part=task.part,
+            part_count=task.part_count,
+            evidence_count=task.evidence_count,
+            evidence_text=task.evidence_text,
+        )
+        self.stats["map_calls"] += 1
+        try:
+            async with self._semaphore:
+                result = await self.llm_json("synthesize_map", prompt)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Synthesis map failed for '{label}': {e}")
+            self.stats["failed_calls"] += 1
+            # Degrade to the raw (truncated) evidence so its facts are not lost
+            return PartialSummary(label, task.evidence_text[:self.max_content_chars * 2], [], 0.3, task.evidence_count)
+        return _partial(label, result, task.evidence_count)
+
+    async def _reduce(self, goal: str, original_objective: str, group: List[PartialSummary]) -> PartialSummary:
+        label = " + ".join(p.label for p in group)
+        evidence_count = sum(p.evidence_count for p in group)
+        prompt = render_prompt(
+            "recursive_agent/synthesis_reduce.j2",
+            goal=goal,
+            original_objective=original_objective,
+            partials=group,
+            evidence_count=evidence_count,
+        )
+        self.stats["reduce_calls"] += 1
+        try:
+            async with self._semaphore:
+                result = await self.llm_json("synthesize_reduce", prompt)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Synthesis reduce failed for {len(group)} partials: {e}")
+            self.stats["failed_calls"] += 1
+            return PartialSummary(
+                label,
+                "\n\n".join(p.summary for p in group),
+                [f for p in group for f in p.key_findings],
+                min(p.confidence for p in group),
+                evidence_count,
+            )
+        return _partial(label, result, evidence_count)
+
+
+def _partial(label: str, result: Dict[str, Any], evidence_count: int) -> PartialSummary:
+    return PartialSummary(
+        label=label,
+        summary=result.get("summary", ""),
+        key_findings=list(result.get("key_findings") or []),
+        confidence=result.get("confidence", 0.5),
+        evidence_count=evidence_count,
+    )
+
+
+async def _passthrough(partial: PartialSummary) -> PartialSummary:
+    return partial
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Critical-Path Analysis of a Research Run
+
+Rebuilds the timed goal tree from execution_log.jsonl and reports which chain
+of goals, API calls and LLM calls set the run's wall-clock time, the slack
+per goal depth, and what-if speedups (see research/critical_path.py).
+
+Examples:
+    # Critical path, per-level slack, every call type 2x faster (one at a time)
+    python3 scripts/analyze_critical_path.py data/research_output/.../execution_log.jsonl
+
+    # Specific scenarios: filter LLM calls 2x faster, all SAM.gov calls 3x faster
+    python3 scripts/analyze_critical_path.py data/research_output/.../execution_log.jsonl \\
+        --what-if "llm:filter*=2" --what-if "api:sam=3"
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from research.critical_path import analyze, build_tree, format_report, load_events
+
+
+def parse_what_if(spec: str):
+    """'llm:filter*=2' -> ('llm:filter*', 2.0)"""
+    pattern, sep, factor = spec.rpartition("=")
+    if not sep or not pattern:
+        raise argparse.ArgumentTypeError(f"Expected PATTERN=FACTOR, got {spec!r}")
+    try:
+        value = float(factor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Factor must be a number: {spec!r}")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"Factor must be > 0: {spec!r}")
+    return pattern, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Critical-path analysis of a research execution log")
+    parser.add_argument("log_path", help="Path to execution_log.jsonl (or its run directory)")
+    parser.add_argument("--what-if", action="append", type=parse_what_if, default=None,
+                        metavar="PATTERN=FACTOR",
+                        help="Leaf label pattern and speedup, e.g. 'llm:filter*=2' (repeatable)")
+    parser.add_argument("--top", type=int, default=15, help="Rows in the what-if table")
+    args = parser.parse_args()
+
+    log_path = Path(args.log_path)
+    if log_path.is_dir():
+        log_path = log_path / "execution_log.jsonl"
+    if not log_path.exists():
+        print(f"❌ No execution log found at {log_path}")
+        sys.exit(1)
+
+    analysis = analyze(build_tree(load_events(log_path)), speedups=args.what_if)
+    print(format_report(analysis, top=args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Refresh or load the local USAspending/FEC warehouse.
+
+Downloads bulk archives that changed since the last run (ETag/Last-Modified,
+USAspending monthly file listings) and normalizes them into Parquet. Sources
+are configured under local_warehouse in config.yaml.
+
+Usage:
+    # Monthly refresh (e.g. from cron: 0 4 2 * * python scripts/refresh_local_warehouse.py refresh)
+    python scripts/refresh_local_warehouse.py refresh
+
+    # Load an archive that was downloaded by hand
+    python scripts/refresh_local_warehouse.py ingest indiv24.zip --dataset fec_contributions --cycle 2024
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.local_warehouse import DATASETS, get_local_warehouse
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Refresh or load the local USAspending/FEC warehouse')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('refresh', help='Download changed bulk archives and ingest them')
+
+    ingest = subparsers.add_parser('ingest', help='Ingest a local bulk archive')
+    ingest.add_argument('path', help='CSV/TXT file or ZIP archive')
+    ingest.add_argument('--dataset', required=True, choices=sorted(DATASETS), help='Target dataset')
+    ingest.add_argument('--cycle', type=int, help='Election cycle for FEC files (e.g. 2024)')
+
+    args = parser.parse_args()
+    warehouse = get_local_warehouse()
+
+    if args.command == 'ingest':
+        stats = warehouse.ingest_file(Path(args.path), args.dataset, args.cycle)
+        print(f"Ingested {stats.rows} rows into {stats.dataset} ({stats.parquet_path})")
+        if stats.replaced:
+            print(f"Replaced older archives: {', '.join(stats.replaced)}")
+        return 0
+
+    summary = asyncio.run(warehouse.refresh())
+    for stats in summary["ingested"]:
+        print(f"Ingested {stats.rows} rows into {stats.dataset} from {Path(stats.source).name}")
+    print(f"{len(summary['ingested'])} ingested, {summary['unchanged']} unchanged, {summary['failed']} failed")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: raw payloads kept in memory vs offloaded to the blob store.
+
+Each run is a fresh subprocess that builds N results with 1MB raw payloads
+via SearchResultBuilder.build_with_raw(), keeps one EvidenceRecord per
+result (as a research run keeps its evidence) and reports peak RSS. With
+the store, peak RSS must stay flat as N grows; afterwards every lazy
+reference must load back byte-identical.
+
+Run with -s to see the comparison table.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent.parent
+PAYLOAD_BYTES = 1_000_000
+
+CHILD = r"""
+import hashlib, json, os, resource, sys
+sys.path.insert(0, sys.argv[1])
+from core.blob_store import BlobStore, blob_store_scope
+from core.evidence_record import EvidenceRecord
+from core.result_builder import SearchResultBuilder
+
+count, use_store, blob_dir, size = int(sys.argv[2]), sys.argv[3] == "1", sys.argv[4], int(sys.argv[5])
+store = BlobStore(blob_dir) if use_store else None
+
+def payload(i):
+    block = hashlib.sha256(str(i).encode()).hexdigest()
+    return (block * (size // len(block) + 1))[:size]
+
+records = []
+with blob_store_scope(store):
+    for i in range(count):
+        item = (SearchResultBuilder().title(f"Doc {i}").url(f"https://x.gov/{i}")
+                .snippet("Summary").raw_content(payload(i)).build_with_raw())
+        records.append(EvidenceRecord.from_trusted(item, "fake"))
+
+def peak_kb():
+    # VmHWM belongs to this process image; ru_maxrss can carry the parent's peak across fork/exec
+    try:
+        with open("/proc/self/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+peak_mb = peak_kb() / 1024
+identical = all(r.full_content == payload(i) for i, r in enumerate(records))
+print(json.dumps({"peak_mb": peak_mb, "identical": identical,
+                  "offloaded": sum(r.raw_content_ref is not None for r in records)}))
+"""
+
+
+def _run(count, use_store, tmp_path):
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, str(ROOT), str(count), "1" if use_store else "0",
+         str(tmp_path / f"blobs-{count}"), str(PAYLOAD_BYTES)],
+        capture_output=True, text=True, check=True, env={**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"},
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses resource.getrusage")
+def test_peak_rss_flat_with_blob_store(tmp_path):
+    counts = (20, 100)
+    runs = {(c, s): _run(c, s, tmp_path) for c in counts for s in (False, True)}
+
+    print(f"\n{'payloads':>9} {'in-memory':>10} {'blob store':>11}")
+    for c in counts:
+        print(f"{c:>9} {runs[(c, False)]['peak_mb']:>8.0f}MB {runs[(c, True)]['peak_mb']:>9.0f}MB")
+
+    assert all(r["identical"] for r in runs.values())
+    assert runs[(100, True)]["offloaded"] == 100
+    in_memory_growth = runs[(100, False)]["peak_mb"] - runs[(20, False)]["peak_mb"]
+    store_growth = runs[(100, True)]["peak_mb"] - runs[(20, True)]["peak_mb"]
+    assert in_memory_growth > 60  # ~80 extra 1MB payloads
+    assert store_growth < 10
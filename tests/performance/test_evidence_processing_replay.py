@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark: fused vs staged post-retrieval evidence processing.
+
+Replays one recorded API result batch (fixtures/evidence_processing_replay.json)
+through RecursiveResearchAgent._process_evidence in both modes. The LLM is a
+fake that returns the recorded responses with a simulated latency of a fixed
+round-trip plus a per-prompt-token cost, so the comparison measures only the
+number and size of calls:
+
+- staged: filter -> entity extraction -> summarization (3 calls)
+- fused:  one structured-output call returning all three
+
+Run with -s to see the comparison table.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import llm_utils
+import research.services.entity_analyzer as entity_analyzer_module
+from core.database_integration_base import Evidence
+from research.recursive_agent import Constraints, GoalContext, RecursiveResearchAgent, ResearchRun
+
+FIXTURE = Path(__file__).parent / "fixtures" / "evidence_processing_replay.json"
+ROUND_TRIP = 0.02  # simulated seconds per LLM call
+PER_TOKEN = 0.00002  # simulated seconds per prompt token
+
+
+class ReplayLLM:
+    """Fake acompletion serving recorded responses; counts calls and prompt tokens."""
+
+    def __init__(self, responses, fail_fused=False):
+        self.responses = responses
+        self.fail_fused = fail_fused
+        self.calls = []
+
+    async def __call__(self, model, messages, response_format=None, **kwargs):
+        prompt = messages[-1]["content"]
+        name = (response_format or {}).get("json_schema", {}).get("name")
+        if name == "evidence_processing":
+            kind = "fused"
+        elif name == "entity_extraction":
+            kind = "entities"
+        elif "ITEMS TO SUMMARIZE" in prompt:
+            kind = "summarize"
+        else:
+            kind = "filter"
+        tokens = len(prompt) // 4
+        self.calls.append((kind, tokens))
+        await asyncio.sleep(ROUND_TRIP + tokens * PER_TOKEN)
+        if kind == "fused" and self.fail_fused:
+            raise RuntimeError("schema not supported")
+        content = json.dumps(self.responses[kind])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    @property
+    def prompt_tokens(self):
+        return sum(tokens for _, tokens in self.calls)
+
+
+@pytest.fixture
+def replay():
+    return json.loads(FIXTURE.read_text())
+
+
+async def _run(mode, replay, monkeypatch, tmp_path, fail_fused=False):
+    llm = ReplayLLM(replay["responses"], fail_fused=fail_fused)
+    monkeypatch.setattr(llm_utils, "acompletion", llm)
+    monkeypatch.setattr(entity_analyzer_module, "acompletion", llm)
+
+    constraints = Constraints(evidence_processing_mode=mode)
+    agent = RecursiveResearchAgent(constraints=constraints, output_dir=tmp_path / mode)
+    context = GoalContext(
+        original_objective=replay["objective"],
+        constraints=constraints,
+        start_time=datetime.now(),
+        research_run=ResearchRun(),
+    )
+    evidence = [Evidence.from_dict(dict(r), replay["source_id"]) for r in replay["results"]]
+
+    start = time.perf_counter()
+    kept, entities = await agent._process_evidence(replay["goal"], evidence, context)
+    elapsed = time.perf_counter() - start
+    return SimpleNamespace(llm=llm, kept=kept, entities=entities, seconds=elapsed, agent=agent)
+
+
+@pytest.mark.asyncio
+async def test_fused_matches_staged_with_fewer_calls_tokens_and_latency(replay, monkeypatch, tmp_path):
+    staged = await _run("staged", replay, monkeypatch, tmp_path)
+    fused = await _run("fused", replay, monkeypatch, tmp_path)
+
+    print(f"\n{'mode':<8} {'calls':>5} {'prompt tok':>10} {'latency':>9}")
+    for name, run in (("staged", staged), ("fused", fused)):
+        print(f"{name:<8} {len(run.llm.calls):>5} {run.llm.prompt_tokens:>10} {run.seconds * 1000:>7.0f}ms")
+
+    # Same outcome...
+    assert [e.url for e in fused.kept] == [e.url for e in staged.kept]
+    assert [e.snippet for e in fused.kept] == [e.snippet for e in staged.kept]
+    assert sorted(fused.entities) == sorted(staged.entities)
+    assert set(fused.agent.entity_analyzer.get_all_entities()) == set(staged.agent.entity_analyzer.get_all_entities())
+
+    # ...for less LLM work
+    assert [kind for kind, _ in staged.llm.calls] == ["filter", "entities", "summarize"]
+    assert [kind for kind, _ in fused.llm.calls] == ["fused"]
+    assert fused.llm.prompt_tokens < staged.llm.prompt_tokens
+    assert fused.seconds < staged.seconds
+
+
+@pytest.mark.asyncio
+async def test_fused_never_summarizes_dropped_items(replay, monkeypatch, tmp_path):
+    fused = await _run("fused", replay, monkeypatch, tmp_path)
+
+    assert "https://entertainment.example.com/drone-videos" not in {e.url for e in fused.kept}
+    assert all("must be ignored" not in e.snippet for e in fused.kept)
+    summarized = [e.url for e in fused.kept if "original_content" in e.metadata]
+    assert summarized == [replay["results"][i]["url"] for i in (0, 2, 5)]
+
+
+@pytest.mark.asyncio
+async def test_fused_failure_falls_back_to_staged(replay, monkeypatch, tmp_path):
+    run = await _run("fused", replay, monkeypatch, tmp_path, fail_fused=True)
+
+    assert [kind for kind, _ in run.llm.calls] == ["fused", "filter", "entities", "summarize"]
+    assert len(run.kept) == 4 and len(run.entities) == 4
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: Pydantic Evidence vs slotted EvidenceRecord at 100k results.
+
+Both paths start from the dicts QueryResult holds after validation, build one
+evidence object per dict, touch it the way the agent does (content, source),
+and serialize it with to_dict():
+
+- pydantic: Evidence.from_dict() (SearchResult + Evidence validation)
+- record:   EvidenceRecord.from_trusted() (no validation)
+
+The 100k timing comparison is marked slow; run it with -m slow -s to see the
+comparison table. The default run only checks both paths serialize alike.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.database_integration_base import Evidence
+from core.evidence_record import EvidenceRecord
+
+RECORDS = 100_000
+SMOKE_RECORDS = 1_000
+
+
+def _items(count):
+    return [
+        {
+            "title": f"Contract award {i}",
+            "url": f"https://sam.gov/opp/{i}",
+            "snippet": "Notice of award for data analytics services. " * 4,
+            "date": "2024-05-01",
+            "metadata": {"notice_id": str(i), "agency": "Army"},
+            "raw_content": None,
+        }
+        for i in range(count)
+    ]
+
+
+def _run(build, items):
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [build(item, "sam") for item in items]
+    built = time.perf_counter()
+    chars = sum(len(e.content) + len(e.source) for e in objects)
+    payload = [e.to_dict() for e in objects]
+    done = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert chars and len(payload) == len(items)
+    return {"build": built - start, "serialize": done - built, "total": done - start, "peak_mb": peak / 2**20,
+            "payload": payload}
+
+
+def test_record_serializes_like_pydantic():
+    items = _items(SMOKE_RECORDS)
+    assert _run(EvidenceRecord.from_trusted, items)["payload"] == _run(Evidence.from_dict, items)["payload"]
+
+
+@pytest.mark.slow
+def test_record_builds_and_serializes_faster_than_pydantic():
+    items = _items(RECORDS)
+    pydantic = _run(Evidence.from_dict, items)
+    record = _run(EvidenceRecord.from_trusted, items)
+
+    print(f"\n{RECORDS:,} evidence  {'build':>8} {'to_dict':>8} {'total':>8} {'peak':>8}")
+    for name, run in (("pydantic", pydantic), ("record", record)):
+        print(f"{name:<16} {run['build']:>7.2f}s {run['serialize']:>7.2f}s {run['total']:>7.2f}s {run['peak_mb']:>6.0f}MB")
+    print(f"speedup          {pydantic['build'] / record['build']:>7.1f}x "
+          f"{pydantic['serialize'] / record['serialize']:>7.1f}x {pydantic['total'] / record['total']:>7.1f}x")
+
+    assert record["payload"][123] == pydantic["payload"][123]
+    assert record["total"] < pydantic["total"] / 2
+    assert record["peak_mb"] < pydantic["peak_mb"]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hedged vs plain requests to a source with a heavy latency tail.
+
+The fake source answers in 5-9ms except every 25th request, which takes
+250ms (a 4% tail, like SAM.gov/GovInfo/CourtListener stalls). The same
+request sequence is replayed with hedging off and on; hedging must cut p99
+while staying inside the per-source hedge budget.
+
+Run with -s to see the comparison table.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.http_client import HEDGE_MAX_FRACTION, HedgeTracker, hedged_call
+
+REQUESTS = 200
+CONCURRENCY = 4
+SLOW_EVERY = 25
+SLOW_SECONDS = 0.25
+
+
+class TailSource:
+    """Blocking fake source: every SLOW_EVERY-th attempt is slow."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            n = self.calls
+            self.calls += 1
+        time.sleep(SLOW_SECONDS if n % SLOW_EVERY == 7 else 0.005 + (n % 5) * 0.001)
+        return SimpleNamespace(status_code=200)
+
+
+async def _run(hedge: bool):
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
+    tracker = HedgeTracker()
+    source = TailSource()
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            await hedged_call("tail_src", source, tracker=tracker, enabled=hedge)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(REQUESTS)))
+    return SimpleNamespace(stats=tracker.stats("tail_src"), calls=source.calls, seconds=time.perf_counter() - start)
+
+
+@pytest.mark.asyncio
+async def test_hedging_cuts_p99_within_budget():
+    plain = await _run(hedge=False)
+    hedged = await _run(hedge=True)
+
+    print(f"\n{'mode':<7} {'p50':>7} {'p95':>7} {'p99':>7} {'hedge%':>7} {'win%':>6} {'calls':>6} {'total':>7}")
+    for name, run in (("plain", plain), ("hedged", hedged)):
+        s = run.stats
+        print(f"{name:<7} {s['p50_ms']:>5.0f}ms {s['p95_ms']:>5.0f}ms {s['p99_ms']:>5.0f}ms "
+              f"{s['hedge_rate']:>6.1%} {s['win_rate']:>5.0%} {run.calls:>6} {run.seconds:>6.2f}s")
+
+    assert plain.stats["p99_ms"] >= SLOW_SECONDS * 1000
+    assert hedged.stats["p99_ms"] < plain.stats["p99_ms"] / 2
+    assert 0 < hedged.stats["hedge_rate"] <= HEDGE_MAX_FRACTION
+    assert hedged.stats["win_rate"] > 0.5
+    assert hedged.calls == REQUESTS + hedged.stats["hedged"]
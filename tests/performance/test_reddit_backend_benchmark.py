@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark: async Reddit client vs thread-wrapped PRAW path.
+
+Both backends are driven by fakes with the same simulated per-request
+latency, so the comparison measures only the execution model:
+
+- PRAW path: listing and field extraction in asyncio.to_thread, then one
+  comment expansion per submission, sequentially (as in the daily scraper)
+- Async path: one listing call, comment trees expanded concurrently under
+  the shared request budget
+
+Run with -s to see the timing table.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from integrations.social.reddit_async_client import AsyncRedditClient
+from integrations.social.reddit_integration import RedditIntegration
+
+LATENCY = 0.02  # simulated seconds per Reddit HTTP request
+N_POSTS = 20
+
+
+class _FakeSubmission:
+    """PRAW-like submission whose comment tree costs one blocking request."""
+
+    def __init__(self, i: int):
+        self.id = f"p{i}"
+        self.title = f"Post {i}"
+        self.selftext = "body"
+        self.author = type("A", (), {"name": "alice"})()
+        self.score = i
+        self.num_comments = 3
+        self.upvote_ratio = 0.9
+        self.subreddit = type("S", (), {"display_name": "OSINT"})()
+        self.permalink = f"/r/OSINT/comments/p{i}/"
+        self.url = None
+        self.created_utc = 1700000000 + i
+        self.is_self = True
+        self.link_flair_text = None
+
+    def expand_comments(self):
+        time.sleep(LATENCY)  # replace_more / comments.list() round-trip
+        return [{"id": f"{self.id}c{j}"} for j in range(3)]
+
+
+class _FakeSubreddit:
+    def search(self, **kwargs):
+        time.sleep(LATENCY)  # listing request
+        return [_FakeSubmission(i) for i in range(N_POSTS)]
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self.status = 200
+        self.headers = {}
+        self._payload = payload
+
+    async def __aenter__(self):
+        await asyncio.sleep(LATENCY)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    def post(self, url, **kwargs):
+        return _FakeResponse({"access_token": "tok", "expires_in": 3600})
+
+    def get(self, url, params=None, headers=None):
+        if "/search" in url:
+            children = [{"kind": "t3", "data": {
+                "id": f"p{i}", "title": f"Post {i}", "selftext": "body", "author": "alice",
+                "score": i, "num_comments": 3, "subreddit": "OSINT",
+                "permalink": f"/r/OSINT/comments/p{i}/", "created_utc": 1700000000 + i,
+            }} for i in range(N_POSTS)]
+            return _FakeResponse({"data": {"children": children, "after": None}})
+        comments = [{"kind": "t1", "data": {"id": f"c{j}", "body": "x"}} for j in range(3)]
+        return _FakeResponse([{"data": {"children": []}}, {"data": {"children": comments}}])
+
+
+async def _run_praw_path() -> float:
+    integration = RedditIntegration()
+    integration._get_reddit_client = lambda: type("R", (), {"subreddit": lambda self, name: _FakeSubreddit()})()
+    start = time.perf_counter()
+    posts = await integration._search_praw(["OSINT"], "q", "relevance", "month", N_POSTS)
+
+    def _expand_sequentially():
+        return [_FakeSubmission(i).expand_comments() for i in range(len(posts))]
+
+    comments = await asyncio.to_thread(_expand_sequentially)
+    assert len(posts) == N_POSTS and len(comments) == N_POSTS
+    return time.perf_counter() - start
+
+
+async def _run_async_path() -> float:
+    client = AsyncRedditClient("id", "secret", "user", "pw", session=_FakeSession(), max_concurrent=10)
+    start = time.perf_counter()
+    posts = await client.search(["OSINT"], "q", limit=N_POSTS)
+    comments = await client.expand_comments([p["id"] for p in posts])
+    assert len(posts) == N_POSTS and all(len(c) == 3 for c in comments.values())
+    return time.perf_counter() - start
+
+
+@pytest.mark.asyncio
+async def test_async_backend_faster_than_thread_wrapped_praw():
+    """Listing + comment expansion for 20 posts: async path should win clearly."""
+    praw_seconds = await _run_praw_path()
+    async_seconds = await _run_async_path()
+
+    print(f"\nReddit backend benchmark ({N_POSTS} posts, {LATENCY * 1000:.0f}ms/request)")
+    print(f"  thread-wrapped PRAW: {praw_seconds * 1000:7.1f} ms")
+    print(f"  async client:        {async_seconds * 1000:7.1f} ms")
+    print(f"  speedup:             {praw_seconds / async_seconds:7.1f}x")
+
+    # PRAW path is ~(1 + N_POSTS) * LATENCY; async path is ~(3 + N_POSTS/10) * LATENCY
+    assert async_seconds * 2 < praw_seconds
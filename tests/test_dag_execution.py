@@ -134,7 +134,7 @@ class TestGroupByDependency:
 class TestDAGIntegration:
     """Integration tests for DAG execution with timing verification."""
 
-    async def test_forced_dependencies_execution_order(self):
+    async def test_forced_dependencies_execution_order(self, tmp_path):
         """
         Force dependencies in code and verify execution order via timing.
 
@@ -142,11 +142,9 @@ class TestDAGIntegration:
         the DAG execution respects dependency order.
         """
         import asyncio
-        from pathlib import Path
         from research.recursive_agent import Constraints, GoalContext, ResearchRun
 
-        output_dir = Path("data/test_dag_integration")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = tmp_path
 
         constraints = Constraints(
             max_depth=1,  # No decomposition, direct execution only
@@ -197,7 +195,7 @@ class TestDAGEndToEnd:
     Currently expected to FAIL until Phase 3 (prompt enhancement) is complete.
     """
 
-    async def test_comparative_query_triggers_dependencies(self):
+    async def test_comparative_query_triggers_dependencies(self, tmp_path):
         """
         Test that a comparative query triggers dependency-aware decomposition.
 
@@ -209,10 +207,8 @@ class TestDAGEndToEnd:
         EXPECTED: Currently FAILS (LLM doesn't declare dependencies yet)
         Will PASS after Phase 3 (prompt enhancement).
         """
-        from pathlib import Path
 
-        output_dir = Path("data/test_dag_comparative")
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = tmp_path
 
         constraints = Constraints(
             max_depth=3,
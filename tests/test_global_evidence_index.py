@@ -8,12 +8,11 @@ Validates that P0 #2 is resolved: sub-goals can see evidence from sibling/cousin
 import asyncio
 import json
 import pytest
-from pathlib import Path
 from research.recursive_agent import RecursiveResearchAgent, Constraints, GoalStatus
 
 
 @pytest.mark.asyncio
-async def test_cross_branch_evidence_sharing():
+async def test_cross_branch_evidence_sharing(tmp_path):
     """
     Validates that Branch B can access evidence collected by Branch A.
 
@@ -26,9 +25,8 @@ async def test_cross_branch_evidence_sharing():
     - Verify: Global index populated with evidence from multiple branches
     """
 
-    # Create output directory for test artifacts
-    output_dir = Path("data/test_global_evidence_index")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Test artifacts go to a per-test temporary directory
+    output_dir = tmp_path
 
     # Configure for multi-level decomposition
     constraints = Constraints(
@@ -122,7 +120,7 @@ async def test_cross_branch_evidence_sharing():
 
 
 @pytest.mark.asyncio
-async def test_global_index_populated():
+async def test_global_index_populated(tmp_path):
     """
     Verifies that the global evidence index is actually populated during research.
 
@@ -130,8 +128,7 @@ async def test_global_index_populated():
     is being added to the global index.
     """
 
-    output_dir = Path("data/test_global_index_population")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = tmp_path
 
     constraints = Constraints(
         max_depth=3,
@@ -7,21 +7,28 @@ Tests:
 - Multiple page fetch with rate limiting
 - Error handling (timeouts, bad URLs)
 - Content enrichment helper
+- Page cache, revalidation, in-flight coalescing and adaptive concurrency (offline)
 """
 
 import asyncio
 import pytest
 import sys
 import os
+import threading
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import core.jina_reader as jina_reader
 from core.jina_reader import (
     fetch_page_content,
     fetch_multiple_pages,
     enrich_search_results,
+    PageCache,
     PageContent
 )
+from core.rate_limiter import AdaptiveConcurrencyLimiter
+from core.url_utils import canonicalize_url
 
 
 class TestJinaReader:
@@ -99,6 +106,242 @@ class TestContentEnrichmentMixin:
         print("[PASS] Content enrichment methods available")
 
 
+class FakeJinaResponse:
+    def __init__(self, status, body="", headers=None, delay=0.0):
+        self.status = status
+        self.reason = {200: "OK", 304: "Not Modified", 429: "Too Many Requests", 500: "Server Error"}.get(status, "")
+        self.headers = headers or {}
+        self._body = body
+        self._delay = delay
+
+    async def __aenter__(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def text(self):
+        return self._body
+
+
+class FakeJinaSession:
+    """Answers Jina requests from a callable(url, headers) -> FakeJinaResponse."""
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        return self.responder(url, headers or {})
+
+
+@pytest.fixture
+def offline_jina(tmp_path, monkeypatch):
+    """Isolated page cache + limiter; returns a function that installs a fake session."""
+    monkeypatch.setattr(jina_reader, "_page_cache", PageCache(cache_dir=tmp_path))
+    monkeypatch.setattr(jina_reader, "_limiter", AdaptiveConcurrencyLimiter(initial=4, maximum=8, cooldown_seconds=0))
+
+    def install(responder):
+        session = FakeJinaSession(responder)
+
+        async def fake_shared_session():
+            return session
+
+        monkeypatch.setattr(jina_reader, "get_shared_session", fake_shared_session)
+        return session
+
+    return install
+
+
+class TestJinaPageCache:
+    """Offline tests for the cached, coalesced, adaptive fetch pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_canonical_url_hits_cache(self, offline_jina):
+        session = offline_jina(lambda url, h: FakeJinaResponse(200, "# Title\nbody"))
+
+        first = await fetch_page_content("https://www.example.com/a/?utm_source=x")
+        second = await fetch_page_content("https://example.com/a")
+
+        assert len(session.requests) == 1
+        assert first.title == "Title" and not first.cached
+        assert second.cached and second.content == first.content
+        assert second.url == "https://example.com/a"  # caller's URL preserved
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_new_run(self, offline_jina):
+        session = offline_jina(lambda url, h: FakeJinaResponse(200, "body"))
+        await fetch_page_content("https://example.com/a")
+
+        jina_reader._page_cache.clear_run()
+        page = await fetch_page_content("https://example.com/a")
+
+        assert page.cached and len(session.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_etag(self, offline_jina):
+        def responder(url, headers):
+            if headers.get("If-None-Match") == '"v1"':
+                return FakeJinaResponse(304)
+            return FakeJinaResponse(200, "body v1", {"ETag": '"v1"'})
+
+        session = offline_jina(responder)
+        jina_reader._page_cache.fresh_seconds = 0  # every entry is stale
+
+        await fetch_page_content("https://example.com/a")
+        page = await fetch_page_content("https://example.com/a")
+
+        assert len(session.requests) == 2
+        assert session.requests[1][1]["If-None-Match"] == '"v1"'
+        assert page.cached and page.content == "body v1"
+
+    @pytest.mark.asyncio
+    async def test_no_validator_invented_when_server_sent_none(self, offline_jina):
+        session = offline_jina(lambda url, h: FakeJinaResponse(200, "body"))
+        jina_reader._page_cache.fresh_seconds = 0
+
+        await fetch_page_content("https://example.com/a")
+        await fetch_page_content("https://example.com/a")
+
+        assert "If-Modified-Since" not in session.requests[1][1]
+        assert "If-None-Match" not in session.requests[1][1]
+
+    @pytest.mark.asyncio
+    async def test_disk_io_runs_off_the_event_loop(self, offline_jina, monkeypatch):
+        offline_jina(lambda url, h: FakeJinaResponse(200, "body"))
+        cache = jina_reader._page_cache
+        threads = []
+        for name in ("_load", "_store"):
+            original = getattr(cache, name)
+
+            def recording(*args, _original=original):
+                threads.append(threading.current_thread())
+                return _original(*args)
+
+            monkeypatch.setattr(cache, name, recording)
+
+        await fetch_page_content("https://example.com/a")
+
+        assert len(threads) == 2 and threading.main_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesce(self, offline_jina):
+        session = offline_jina(lambda url, h: FakeJinaResponse(200, "body", delay=0.05))
+
+        pages = await asyncio.gather(*(fetch_page_content("https://example.com/a") for _ in range(5)))
+
+        assert len(session.requests) == 1
+        assert all(p.success for p in pages)
+
+    @pytest.mark.asyncio
+    async def test_failures_keep_position_and_truncation_is_per_caller(self, offline_jina):
+        offline_jina(lambda url, h: FakeJinaResponse(500) if "bad" in url else FakeJinaResponse(200, "x" * 100))
+
+        results = await fetch_multiple_pages(
+            ["https://example.com/ok", "https://example.com/bad", "https://example.com/ok2"],
+            max_content_length=10
+        )
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].url == "https://example.com/bad" and "HTTP 500" in results[1].error
+        assert results[0].content.startswith("x" * 10 + "\n\n[Content truncated")
+
+    @pytest.mark.asyncio
+    async def test_429_pauses_halves_limit_and_retries(self, offline_jina):
+        responses = iter([FakeJinaResponse(429, headers={"Retry-After": "0.1"}), FakeJinaResponse(200, "body")])
+        session = offline_jina(lambda url, h: next(responses))
+
+        start = time.monotonic()
+        page = await fetch_page_content("https://example.com/a")
+
+        assert page.success and len(session.requests) == 2
+        assert time.monotonic() - start >= 0.08
+        assert jina_reader._limiter.limit < 4
+
+
+class TestPageCacheBounds:
+    def test_memory_layer_is_lru(self, tmp_path):
+        cache = PageCache(cache_dir=tmp_path, memory_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, {"content": key, "fetched_at": time.time()})
+        cache.get("a")  # Most recently used
+        cache.put("c", {"content": "c", "fetched_at": time.time()})
+
+        assert list(cache._memory) == ["a", "c"]
+        assert cache.get("b")["content"] == "b"  # Still on disk
+
+    def test_expired_disk_entry_is_deleted(self, tmp_path):
+        cache = PageCache(cache_dir=tmp_path, max_age_seconds=60)
+        cache.put("old", {"content": "x", "fetched_at": time.time() - 120})
+        cache.clear_run()
+
+        assert cache.get("old") is None
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_disk_layer_pruned_past_max_bytes(self, tmp_path):
+        cache = PageCache(cache_dir=tmp_path, max_bytes=2500)
+        for i in range(5):
+            cache.put(f"page{i}", {"content": "x" * 1000, "fetched_at": time.time()})
+            os.utime(cache._path(f"page{i}"), (i, i))  # Deterministic write order
+        cache.clear_run()
+
+        assert sum(p.stat().st_size for p in tmp_path.glob("*.json")) <= 2500
+        assert cache.get("page4") is not None and cache.get("page0") is None
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_additive_increase_multiplicative_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=6, latency_target_ms=1000, cooldown_seconds=0)
+
+        for _ in range(5):  # +1/limit each: about one slot per window of `limit` responses
+            limiter.record_response(200, 50)
+        assert int(limiter.limit) == 5
+
+        limiter.record_response(200, 5000)  # slow response counts as congestion
+        assert int(limiter.limit) == 2
+
+        for _ in range(100):
+            limiter.record_response(200, 50)
+        assert limiter.limit == 6
+
+    @pytest.mark.asyncio
+    async def test_slots_bound_in_flight(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_min_interval_spaces_request_starts(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, min_interval_seconds=0.05)
+        starts = []
+
+        async def work():
+            async with limiter.slot():
+                starts.append(time.monotonic())
+
+        await asyncio.gather(*(work() for _ in range(4)))
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert all(gap >= 0.04 for gap in gaps)
+
+
+class TestCanonicalizeUrl:
+    def test_equivalent_urls_share_a_key(self):
+        assert canonicalize_url("HTTPS://www.Example.com:443/a/?utm_source=x&b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+        assert canonicalize_url("http://example.com:8080/") == "http://example.com:8080/"
+        assert canonicalize_url("not a url") == "not a url"
+
+
 if __name__ == "__main__":
     # Run quick smoke test
     async def smoke_test():
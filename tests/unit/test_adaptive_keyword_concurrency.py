@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for concurrent adaptive keyword searches with shared engine state.
+
+No network or LLM: search phases and entity extraction are replaced with fakes.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.adaptive_search_engine import AdaptiveSearchEngine, SharedSearchState
+from monitoring.adaptive_boolean_monitor import AdaptiveBooleanMonitor
+
+ENTITIES = {
+    "FISA 702": ["NSA", "Section 702"],
+    "surveillance": ["NSA", "FISC"],
+}
+
+
+class FakeBackend:
+    """Replaces _search_phase/_extract_entities; records queries and concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.queries = []
+        self.extractions = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(AdaptiveSearchEngine, "_search_phase", lambda engine, *a, **kw: self.search_phase(*a, **kw))
+        monkeypatch.setattr(AdaptiveSearchEngine, "_extract_entities", lambda engine, *a: self.extract_entities(*a))
+
+    async def search_phase(self, query, limit, databases=None, api_keys=None):
+        self.queries.append(query)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        slug = query.replace(" ", "_")
+        return [{"title": query, "url": f"https://example.gov/{slug}/{i}", "source": "Fake"} for i in range(2)]
+
+    async def extract_entities(self, results, original_query):
+        self.extractions += 1
+        await asyncio.sleep(self.delay)
+        if any("AND" in r["title"] for r in results):
+            return []
+        return list(ENTITIES.get(original_query, []))
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeBackend()
+    fake.install(monkeypatch)
+    return fake
+
+
+def _engine(**kwargs):
+    defaults = dict(parallel_executor=None, phase2_queries=3, max_iterations=1, min_quality=1.1)
+    defaults.update(kwargs)
+    return AdaptiveSearchEngine(**defaults)
+
+
+class TestSharedSearchState:
+    @pytest.mark.asyncio
+    async def test_entities_seed_other_keywords(self, backend):
+        engine = _engine()
+        state = SharedSearchState()
+
+        await engine.adaptive_search("FISA 702", shared_state=state)
+        result = await engine.adaptive_search("surveillance", shared_state=state)
+
+        # Own entities first, then "Section 702" seeded from the other keyword
+        assert "surveillance AND NSA" in backend.queries
+        assert "surveillance AND FISC" in backend.queries
+        assert "surveillance AND Section 702" in backend.queries
+        assert result.phases[1].duration_seconds > 0 and result.duration_seconds >= result.phases[1].duration_seconds
+
+    @pytest.mark.asyncio
+    async def test_reversed_pairs_and_seen_urls_are_not_repeated(self, backend):
+        engine = _engine()
+        state = SharedSearchState()
+        state.record_entities("Section 702", ["FISA 702"])
+        state.searched_pairs.add(frozenset(("section 702", "fisa 702")))
+
+        result = await engine.adaptive_search("FISA 702", shared_state=state)
+
+        assert "FISA 702 AND Section 702" not in backend.queries
+        assert "FISA 702 AND NSA" in backend.queries
+        assert result.total_results == len(state.seen_urls)
+
+    @pytest.mark.asyncio
+    async def test_identical_result_sets_are_analyzed_once(self, backend):
+        engine = _engine()
+        state = SharedSearchState()
+        results = [{"title": "t", "url": "https://example.gov/1"}]
+
+        first, second = await asyncio.gather(
+            engine._extract_entities_shared(results, "FISA 702", state),
+            engine._extract_entities_shared(results, "FISA 702", state),
+        )
+
+        assert first == second == ["NSA", "Section 702"]
+        assert backend.extractions == 1
+
+    @pytest.mark.asyncio
+    async def test_without_shared_state_behaviour_is_unchanged(self, backend):
+        engine = _engine(phase2_queries=1)
+        await engine.adaptive_search("FISA 702")
+        assert backend.queries == ["FISA 702", "FISA 702 AND NSA"]
+
+
+class TestAdaptiveMonitorConcurrency:
+    @pytest.mark.asyncio
+    async def test_keywords_run_concurrently_with_timing(self, tmp_path, backend, monkeypatch):
+        path = tmp_path / "adaptive.yaml"
+        path.write_text(yaml.safe_dump({
+            "name": "Adaptive Test", "keywords": ["FISA 702", "surveillance", "wiretap", "PCLOB"],
+            "sources": ["dvids"], "schedule": "manual", "alert_email": "alerts@example.com",
+            "adaptive_search": True,
+            "adaptive_config": {"keyword_concurrency": 2, "max_iterations": 1, "min_quality": 1.1},
+        }))
+        monitor = AdaptiveBooleanMonitor(str(path))
+        monkeypatch.setattr(monitor, "_get_adaptive_databases", lambda: ([], {}))
+
+        results = await monitor.execute_search(monitor.config.keywords)
+
+        assert backend.peak == 2
+        assert {r["keyword"] for r in results} == {"FISA 702", "surveillance", "wiretap", "PCLOB"}
+        timing = monitor.last_search_timing
+        assert set(timing["keywords"]) == {"FISA 702", "surveillance", "wiretap", "PCLOB"}
+        assert timing["keywords"]["FISA 702"]["phases"][0]["phase"] == 1
+        assert timing["wall_seconds"] < sum(k["seconds"] for k in timing["keywords"].values())
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Unit tests for assess-and-plan: goal assessment returning ready-to-execute
+query_params that skip the integration's generate_query() LLM call.
+
+No LLM or network calls: acompletion and the integration registry are fakes.
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import llm_utils
+from core.database_integration_base import (
+    DatabaseCategory,
+    DatabaseIntegration,
+    DatabaseMetadata,
+    QueryResult,
+)
+from integrations.social.brave_search_integration import BraveSearchIntegration
+from research.recursive_agent import (
+    Action,
+    ActionType,
+    Constraints,
+    GoalContext,
+    RecursiveResearchAgent,
+    ResearchRun,
+)
+
+
+class FakeIntegration(DatabaseIntegration):
+    QUERY_PARAMS_SCHEMA = BraveSearchIntegration.QUERY_PARAMS_SCHEMA
+
+    def __init__(self):
+        self.generated = []
+        self.executed = []
+
+    @property
+    def metadata(self):
+        return DatabaseMetadata(
+            name="Fake Search", id="fake_search", category=DatabaseCategory.WEB_SEARCH,
+            requires_api_key=False, cost_per_query_estimate=0.0,
+            typical_response_time=0.1, rate_limit_daily=None, description="Fake web search",
+        )
+
+    async def is_relevant(self, research_question):
+        return True
+
+    async def generate_query(self, research_question):
+        self.generated.append(research_question)
+        return {"query": f"generated: {research_question}", "count": 10, "country": "us"}
+
+    async def execute_search(self, query_params, api_key=None, limit=10):
+        self.executed.append(query_params)
+        return QueryResult(success=True, source="Fake Search", total=0, results=[], query_params=query_params)
+
+
+class FakeRegistry:
+    def __init__(self, integration):
+        self.integration = integration
+
+    def normalize_source_name(self, name):
+        return "fake_search"
+
+    def get_instance(self, source_id):
+        return self.integration
+
+    def get_api_key(self, source_id):
+        return None
+
+
+def _agent_and_context(tmp_path, **constraint_overrides):
+    constraints = Constraints(**constraint_overrides)
+    agent = RecursiveResearchAgent(constraints=constraints, output_dir=tmp_path)
+    integration = FakeIntegration()
+    agent.registry = FakeRegistry(integration)
+    agent.available_sources = [{
+        "id": "fake_search", "name": "Fake Search", "description": "Fake web search",
+        "category": "web_search", "query_params_schema": integration.QUERY_PARAMS_SCHEMA,
+    }]
+    context = GoalContext(
+        original_objective="Palantir Army contracts",
+        constraints=constraints,
+        start_time=datetime.now(),
+        available_sources=agent.available_sources,
+        research_run=ResearchRun(),
+    )
+    return agent, integration, context
+
+
+class TestValidateQueryParams:
+    def test_valid_params_are_restricted_to_schema(self):
+        params = {"query": "Palantir Maven", "count": 5, "country": "us", "reasoning": "x"}
+        assert BraveSearchIntegration().validate_query_params(params) == {
+            "query": "Palantir Maven", "count": 5, "country": "us"
+        }
+
+    @pytest.mark.parametrize("params", [
+        {"query": "Palantir Maven", "count": 5},  # missing required country
+        {"query": "Palantir Maven", "count": 50, "country": "us"},  # above maximum
+        {"query": ["Palantir"], "count": 5, "country": "us"},  # wrong type
+        "Palantir Maven",
+        None,
+    ])
+    def test_invalid_params_are_rejected(self, params):
+        assert BraveSearchIntegration().validate_query_params(params) is None
+
+    def test_sources_without_schema_never_validate(self):
+        class NoSchema(FakeIntegration):
+            QUERY_PARAMS_SCHEMA = None
+
+        assert NoSchema().validate_query_params({"query": "x", "count": 1, "country": "us"}) is None
+
+
+class TestExecuteApiCall:
+    @pytest.mark.asyncio
+    async def test_valid_planned_params_skip_generate_query(self, tmp_path):
+        agent, integration, context = _agent_and_context(tmp_path)
+        planned = {"query": "Palantir Army contract 2024", "count": 20, "country": "us"}
+        action = Action(type=ActionType.API_CALL, source="Fake Search", params={"query": "x"}, query_params=planned)
+
+        await agent._execute_api_call("Find Palantir Army contracts", action, context)
+
+        assert integration.generated == []
+        assert integration.executed == [planned]
+
+    @pytest.mark.asyncio
+    async def test_invalid_planned_params_fall_back_to_generate_query(self, tmp_path):
+        agent, integration, context = _agent_and_context(tmp_path)
+        action = Action(type=ActionType.API_CALL, source="Fake Search", params={"query": "Palantir"},
+                        query_params={"query": "Palantir", "count": 500})
+
+        await agent._execute_api_call("Find Palantir Army contracts", action, context)
+
+        assert integration.generated == ["Palantir"]
+        assert integration.executed[0]["query"] == "generated: Palantir"
+
+    @pytest.mark.asyncio
+    async def test_disabled_ignores_planned_params(self, tmp_path):
+        agent, integration, context = _agent_and_context(tmp_path, enable_assess_query_params=False)
+        action = Action(type=ActionType.API_CALL, source="Fake Search", params={"query": "Palantir"},
+                        query_params={"query": "Palantir", "count": 5, "country": "us"})
+
+        await agent._execute_api_call("Find Palantir Army contracts", action, context)
+
+        assert integration.generated == ["Palantir"]
+
+
+class TestAssess:
+    @pytest.mark.asyncio
+    async def test_prompt_carries_schemas_and_action_carries_params(self, tmp_path, monkeypatch):
+        agent, _, context = _agent_and_context(tmp_path)
+        prompts = []
+
+        async def fake_acompletion(model, messages, **kwargs):
+            prompts.append(messages[-1]["content"])
+            content = json.dumps({
+                "directly_executable": True,
+                "reasoning": "Narrow web search",
+                "action": {
+                    "type": "api_call", "source": "fake_search", "params": {"query": "Palantir"},
+                    "query_params": {"query": "Palantir Army contract", "count": 10, "country": "us"},
+                },
+            })
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+        monkeypatch.setattr(llm_utils, "acompletion", fake_acompletion)
+
+        assessment = await agent._assess("Find Palantir Army contracts", context)
+
+        assert "QUERY PARAMETER SCHEMAS" in prompts[0]
+        assert "Fake Search (id: fake_search)" in prompts[0]
+        assert assessment.action.query_params == {"query": "Palantir Army contract", "count": 10, "country": "us"}
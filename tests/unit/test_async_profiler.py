@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the asyncio-aware profiler (core.async_profiler).
+
+The synthetic workload mixes well-behaved coroutines with one task that
+blocks the loop on purpose (time.sleep, like a sync `requests` call) and one
+that burns CPU; the profiler must pin the stall on the blocking one.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core import async_profiler
+from core.async_profiler import AsyncProfiler
+
+BLOCK_SECONDS = 0.3
+
+
+def blocking_fetch():
+    time.sleep(BLOCK_SECONDS)  # Stand-in for requests.get() inside an async integration
+
+
+async def sync_integration():
+    await asyncio.sleep(0.02)
+    blocking_fetch()
+    return "done"
+
+
+async def cpu_parse():
+    await asyncio.sleep(0.01)
+    deadline = time.thread_time() + 0.15
+    while time.thread_time() < deadline:
+        sum(i * i for i in range(1000))
+
+
+async def polite_worker(semaphore, i):
+    async with semaphore:
+        await asyncio.sleep(0.05)
+    return i
+
+
+async def workload(profiler=None):
+    semaphore = asyncio.Semaphore(2)
+    if profiler is not None:
+        profiler.name_semaphore(semaphore, "integration slots")
+    await asyncio.gather(
+        asyncio.create_task(sync_integration(), name="sam_search"),
+        asyncio.create_task(cpu_parse(), name="parse_results"),
+        *(asyncio.create_task(polite_worker(semaphore, i), name=f"worker-{i}") for i in range(6)),
+    )
+
+
+async def _profile(**kwargs):
+    profiler = AsyncProfiler(slow_callback_duration=0.1, **kwargs)
+    async with profiler:
+        await workload(profiler)
+        await asyncio.sleep(0.1)  # Let the heartbeat see the loop recover
+    return profiler
+
+
+class TestAsyncProfiler:
+    @pytest.mark.asyncio
+    async def test_blocking_call_is_attributed_to_its_task_and_frame(self):
+        profiler = await _profile()
+
+        blocking = [r for r in profiler.slow_callbacks if r.task == "sam_search"]
+        assert len(blocking) == 1
+        record = blocking[0]
+        assert record.duration >= BLOCK_SECONDS * 0.9
+        assert record.cpu < 0.05  # Blocked, not computing
+        assert record.culprit.startswith("blocking_fetch (test_async_profiler.py:")
+        assert any(frame.startswith("sync_integration") for frame in record.stack)
+        assert profiler.lag_stats()["max"] >= BLOCK_SECONDS * 0.8
+
+    @pytest.mark.asyncio
+    async def test_busy_versus_cpu_per_task(self):
+        profiler = await _profile()
+        by_name = {s.name: s for s in profiler.tasks.values()}
+
+        sam, parse = by_name["sam_search"], by_name["parse_results"]
+        assert sam.busy >= BLOCK_SECONDS * 0.9 and sam.cpu < 0.05
+        assert parse.busy >= 0.14 and parse.cpu >= 0.14
+        assert by_name["worker-0"].busy < 0.05
+        assert "async-profiler-heartbeat" not in by_name
+
+    @pytest.mark.asyncio
+    async def test_semaphore_waits(self):
+        profiler = await _profile()
+
+        stats = profiler.semaphores["integration slots"]
+        assert stats.acquires == 6
+        assert stats.waits == 4  # 2 slots for 6 workers
+        assert stats.wait_time > 0.1
+
+    @pytest.mark.asyncio
+    async def test_collapsed_stacks_and_summary(self, tmp_path):
+        profiler = await _profile()
+
+        path = profiler.write_collapsed(tmp_path / "profile.folded")
+        lines = path.read_text().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0 and stack
+        blocking_samples = sum(int(l.rsplit(" ", 1)[1]) for l in lines
+                               if l.startswith("sam_search;") and "blocking_fetch" in l)
+        assert blocking_samples >= 10
+
+        table = profiler.summary_table()
+        assert "Event loop lag" in table and "integration slots" in table and "blocking_fetch" in table
+
+    @pytest.mark.asyncio
+    async def test_asyncio_is_restored(self):
+        run, acquire = asyncio.events.Handle._run, asyncio.Semaphore.acquire
+        await _profile()
+        assert asyncio.events.Handle._run is run and asyncio.Semaphore.acquire is acquire
+        assert async_profiler._active is None
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the content-addressed raw payload store (core.blob_store) and
+lazy raw_content references on results, Evidence and EvidenceRecord.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.blob_store import (
+    BlobStore,
+    blob_store_scope,
+    current_blob_store,
+    is_blob_ref,
+    load_blob,
+    load_blob_text,
+    offload_async,
+    preload_blob_texts,
+)
+from core.database_integration_base import Evidence, QueryResult
+from core.evidence_record import EvidenceRecord
+from core.result_builder import SearchResultBuilder
+
+PAYLOAD = "Notice of award – Palantir USG Inc. – données ✓\n" * 500  # ~25KB, non-ASCII
+
+
+def _build(raw):
+    return (SearchResultBuilder()
+            .title("Palantir Army award")
+            .url("https://sam.gov/opp/1")
+            .snippet(raw)
+            .raw_content(raw)
+            .build_with_raw())
+
+
+class TestBlobStore:
+    def test_round_trip_is_byte_identical(self, tmp_path):
+        store = BlobStore(tmp_path)
+        binary = bytes(range(256)) * 64
+        assert load_blob(store.put(binary)) == binary
+        assert load_blob_text(store.put(PAYLOAD)) == PAYLOAD
+
+    def test_content_addressed_writes_once(self, tmp_path):
+        store = BlobStore(tmp_path)
+        assert store.put(PAYLOAD) == store.put(PAYLOAD)
+        assert store.stats["writes"] == 1 and store.stats["puts"] == 2
+        assert [p.name for p in tmp_path.rglob("*") if p.is_file()] == [Path(store.put(PAYLOAD)).name]
+        assert store.get_stats()["compression_ratio"] > 1
+
+    def test_offload_keeps_small_payloads_inline(self, tmp_path):
+        store = BlobStore(tmp_path, min_offload_bytes=100)
+        assert store.offload("short") is None and store.offload(None) is None
+        assert is_blob_ref(store.offload("x" * 100))
+
+    def test_text_is_cached_and_async_helpers_run_off_loop(self, tmp_path):
+        store = BlobStore(tmp_path, min_offload_bytes=100)
+        refs = asyncio.run(offload_async(store, [PAYLOAD, "short", None]))
+        assert is_blob_ref(refs[0]) and refs[1:] == [None, None]
+
+        load_blob_text.cache_clear()
+        asyncio.run(preload_blob_texts(refs))
+        assert load_blob_text.cache_info().currsize == 1
+        assert load_blob_text(refs[0]) == PAYLOAD and load_blob_text.cache_info().hits == 1
+
+    def test_rejects_non_references(self):
+        with pytest.raises(ValueError):
+            load_blob("/etc/passwd")
+
+
+class TestLazyReferences:
+    def test_builder_offloads_only_inside_scope(self, tmp_path):
+        assert current_blob_store() is None
+        assert _build(PAYLOAD)["raw_content"] == PAYLOAD
+
+        with blob_store_scope(BlobStore(tmp_path)):
+            result = _build(PAYLOAD)
+            small = _build("tiny notice")
+        assert result["raw_content"] is None and is_blob_ref(result["raw_content_ref"])
+        assert small["raw_content"] == "tiny notice" and "raw_content_ref" not in small
+
+    @pytest.mark.parametrize("factory", [Evidence.from_dict, EvidenceRecord.from_trusted])
+    def test_evidence_loads_payload_on_demand(self, tmp_path, factory):
+        with blob_store_scope(BlobStore(tmp_path)):
+            item = QueryResult(True, "SAM", 1, [_build(PAYLOAD)], {}).results[0]
+
+        evidence = factory(item, "sam")
+
+        assert evidence.raw_content is None and is_blob_ref(evidence.raw_content_ref)
+        assert evidence.content == PAYLOAD and evidence.full_content == PAYLOAD
+        assert evidence.to_full_dict()["raw_content"] == PAYLOAD  # export materializes
+        assert "raw_content" not in evidence.to_dict()
+
+    def test_record_and_evidence_agree(self, tmp_path):
+        with blob_store_scope(BlobStore(tmp_path)):
+            item = QueryResult(True, "SAM", 1, [_build(PAYLOAD)], {}).results[0]
+        record = EvidenceRecord.from_trusted(item, "sam")
+        assert record.to_dict() == Evidence.from_dict(item, "sam").to_dict()
+        assert record.to_evidence().content == PAYLOAD
+
+    @pytest.mark.parametrize("factory", [Evidence.from_dict, EvidenceRecord.from_trusted])
+    def test_preview_uses_inline_snippet(self, tmp_path, factory):
+        with blob_store_scope(BlobStore(tmp_path)):
+            item = QueryResult(True, "SAM", 1, [_build(PAYLOAD)], {}).results[0]
+        evidence = factory({**item, "snippet": "Award notice"}, "sam")
+        inline = factory(_build(PAYLOAD), "sam")
+
+        Path(evidence.raw_content_ref[len("blob:"):]).unlink()  # Preview must not touch the blob
+        load_blob_text.cache_clear()
+        assert evidence.preview(5) == "Award"
+        assert inline.preview(10) == PAYLOAD[:10]
+        with pytest.raises(FileNotFoundError):
+            evidence.content
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Unit tests for checkpoint/resume of recursive research runs (research.checkpoint).
+
+The agent's LLM-backed steps (assess, decompose, execute, synthesize,
+coverage, follow-ups) are replaced with deterministic fakes. A crash is
+injected after a random number of those calls: the run directory is copied
+at that instant (what a killed process leaves on disk) and the copy is
+resumed. The resumed run must complete the same goals as an uninterrupted
+run without re-executing any goal the checkpoint already had.
+"""
+
+import asyncio
+import json
+import random
+import shutil
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.evidence_record import EvidenceRecord
+from research.checkpoint import RunCheckpoint
+from research.recursive_agent import (
+    Action,
+    ActionType,
+    Assessment,
+    Constraints,
+    GoalResult,
+    GoalStatus,
+    RecursiveResearchAgent,
+    SubGoal,
+)
+
+QUESTION = "Investigate Palantir federal contracts"
+
+
+class Crash(BaseException):
+    """Stands in for an OOM kill: not caught by the agent's error handling."""
+
+
+class FakeLLM:
+    """Deterministic agent steps; optionally crash at the Nth step."""
+
+    def __init__(self, crash_at=None, crash_copy_to=None):
+        self.calls = 0
+        self.executed = []
+        self.crash_at = crash_at
+        self.crash_copy_to = crash_copy_to
+        self.checkpoint = None
+
+    def install(self, agent):
+        self.agent = agent
+        agent.registry = object()  # Skip integration discovery
+        agent._assess = self.assess
+        agent._decompose = self.decompose
+        agent._execute = self.execute
+        agent._synthesize = self.synthesize
+        agent._goal_achieved = self.goal_achieved
+        agent._assess_coverage = self.assess_coverage
+        agent._generate_follow_ups = self.generate_follow_ups
+        agent._save_result = self.save_result
+
+    async def step(self):
+        await asyncio.sleep(0)
+        self.calls += 1
+        if self.calls == self.crash_at:
+            if self.checkpoint:
+                await self.checkpoint.flush()  # Don't copy while a snapshot is mid-rename
+            shutil.copytree(self.agent.output_dir, self.crash_copy_to)
+            raise Crash()
+
+    async def assess(self, goal, context):
+        self.checkpoint = context.research_run.checkpoint
+        await self.step()
+        if context.depth < 2 and not goal.startswith("Follow-up"):
+            return Assessment(directly_executable=False, reasoning="broad", decomposition_rationale="split")
+        return Assessment(directly_executable=True, reasoning="specific",
+                          action=Action(type=ActionType.API_CALL, source="sam"))
+
+    async def decompose(self, goal, context):
+        await self.step()
+        return [SubGoal(description=f"{goal} / part {i}", rationale="coverage") for i in (1, 2, 3)]
+
+    async def execute(self, goal, action, context):
+        await self.step()
+        self.executed.append(goal)
+        if goal.endswith("part 3 / part 3"):
+            return GoalResult(goal=goal, status=GoalStatus.FAILED, reasoning="no results", depth=context.depth)
+        evidence = [
+            EvidenceRecord(title=f"{goal} result {i}", source_id="sam",
+                           url=f"https://sam.gov/{abs(hash((goal, i)))}", snippet=f"Award {i} for {goal}")
+            for i in (1, 2)
+        ]
+        return GoalResult(goal=goal, status=GoalStatus.COMPLETED, evidence=evidence,
+                          confidence=0.8, depth=context.depth)
+
+    async def synthesize(self, goal, sub_results, context):
+        await self.step()
+        text = f"Synthesis of {goal} from {len(sub_results)} sub-goals"
+        return SimpleNamespace(synthesis=text, text=text, confidence=0.7)
+
+    async def goal_achieved(self, goal, sub_results, context):
+        return False
+
+    async def assess_coverage(self, question, evidence, context):
+        await self.step()
+        return {"sufficient": any(e.title.startswith("Follow-up") for e in evidence),
+                "confidence": 0.6, "reasoning": "checked", "gaps": []}
+
+    async def generate_follow_ups(self, question, evidence, context, coverage_reasoning=None):
+        await self.step()
+        return ["Follow-up: subcontract awards", "Follow-up: lobbying disclosures"]
+
+    async def save_result(self, result):
+        pass
+
+
+def constraints():
+    # Near-duplicate detection would make reuse depend on task timing
+    return Constraints(max_goals=100, enable_goal_dedup=False, enable_content_dedup=False,
+                       checkpoint_snapshot_every=7)
+
+
+def run(output_dir, fake, resume=False):
+    agent = RecursiveResearchAgent(constraints=constraints(), output_dir=output_dir)
+    fake.install(agent)
+    return asyncio.run(agent.research(QUESTION, resume=resume))
+
+
+def completed_goals(result):
+    """{goal path} of every COMPLETED goal in a result tree."""
+    found = set()
+
+    def walk(node, ancestors):
+        path = (*ancestors, node.goal)
+        if node.status == GoalStatus.COMPLETED:
+            found.add(path)
+        for sub_result in node.sub_results:
+            walk(sub_result, path)
+
+    for top in result.sub_results:
+        walk(top, ())
+    return found
+
+
+@pytest.fixture(scope="module")
+def baseline(tmp_path_factory):
+    fake = FakeLLM()
+    result = run(tmp_path_factory.mktemp("baseline"), fake)
+    return result, fake.calls
+
+
+class TestResume:
+    def test_baseline_shape(self, baseline):
+        result, calls = baseline
+        goals = completed_goals(result)
+        assert (QUESTION,) in goals and ("Follow-up: lobbying disclosures",) in goals
+        assert (QUESTION, f"{QUESTION} / part 3", f"{QUESTION} / part 3 / part 3") not in goals  # Failed leaf
+        assert len(goals) == 14 and calls > 30
+
+    @pytest.mark.parametrize("crash", range(6))
+    def test_crash_at_random_point_then_resume(self, baseline, tmp_path, crash):
+        expected, total_calls = baseline
+        crash_at = sorted(random.Random(0).sample(range(1, total_calls), 6))[crash]
+        crashed = tmp_path / "crashed"
+
+        with pytest.raises(Crash):
+            run(tmp_path / "run", FakeLLM(crash_at=crash_at, crash_copy_to=crashed))
+        checkpointed = [json.loads(key) for key in RunCheckpoint.load(crashed).state["completed"]]
+
+        fake = FakeLLM()
+        resumed = run(crashed, fake, resume=True)
+
+        assert completed_goals(resumed) == completed_goals(expected)
+        assert {e.title for e in resumed.evidence} == {e.title for e in expected.evidence}
+        # Nothing the checkpoint had was executed again
+        restored_leaves = {path[-1] for path in checkpointed}
+        assert not restored_leaves & set(fake.executed)
+        assert fake.calls < total_calls  # Recorded assessments/decompositions are replayed too
+
+    def test_resume_rejects_other_question(self, tmp_path):
+        RunCheckpoint.create(tmp_path, "Another question", {})
+        agent = RecursiveResearchAgent(constraints=constraints(), output_dir=tmp_path)
+        FakeLLM().install(agent)
+        with pytest.raises(ValueError):
+            asyncio.run(agent.research(QUESTION, resume=True))
+
+
+class TestJournal:
+    def test_snapshot_compaction_and_torn_line(self, tmp_path):
+        checkpoint = RunCheckpoint.create(tmp_path, QUESTION, {"max_depth": 3}, snapshot_every=3)
+        evidence = [EvidenceRecord(title="Award", source_id="sam", url="https://sam.gov/1")]
+        checkpoint.goal_started([QUESTION, "A"])
+        checkpoint.goal_completed([QUESTION, "A"], GoalResult(goal="A", status=GoalStatus.COMPLETED,
+                                                               evidence=evidence, depth=1))
+        checkpoint.goal_started([QUESTION, "B"])  # Third record: snapshot, journal cleared
+        assert not checkpoint.journal_path.exists()
+        checkpoint.record_follow_ups(2, ["Follow-up"])
+        with open(checkpoint.journal_path, "a") as f:
+            f.write('{"type": "started", "path": "[\\"Q\\", \\"C')  # Killed mid-write
+
+        loaded = RunCheckpoint.load(tmp_path)
+        assert loaded.question == QUESTION and loaded.constraints == {"max_depth": 3}
+        assert loaded.follow_ups(2) == ["Follow-up"] and loaded.follow_ups(3) is None
+        assert loaded.in_flight() == [[QUESTION, "B"]]
+        restored = loaded.completed_result([QUESTION, "A"])
+        assert restored.status == GoalStatus.COMPLETED and restored.evidence[0].url == "https://sam.gov/1"
+        assert loaded.summary()["resumed"] == 1
+
+    def test_read_does_not_count_a_resume_or_write(self, tmp_path):
+        checkpoint = RunCheckpoint.create(tmp_path, QUESTION, {})
+        checkpoint.goal_started([QUESTION])
+        written = checkpoint.snapshot_path.read_text()
+
+        assert RunCheckpoint.read(tmp_path).summary()["resumed"] == 0
+        assert checkpoint.snapshot_path.read_text() == written
+        assert RunCheckpoint.load(tmp_path).summary()["resumed"] == 1
+
+
+class TestBackgroundSnapshot:
+    def test_snapshot_written_off_the_loop_without_losing_records(self, tmp_path):
+        checkpoint = RunCheckpoint.create(tmp_path, QUESTION, {}, snapshot_every=2)
+        writers = []
+        release = threading.Event()
+        write = checkpoint._write
+
+        def slow_write(state, generation):
+            writers.append(threading.current_thread())
+            release.wait(5)
+            write(state, generation)
+
+        checkpoint._write = slow_write
+
+        async def main():
+            checkpoint.goal_started([QUESTION, "A"])
+            checkpoint.goal_started([QUESTION, "B"])  # Snapshot due: journal rotated, write in a thread
+            checkpoint.goal_started([QUESTION, "C"])  # Lands in the new journal meanwhile
+            await asyncio.sleep(0.05)
+            # A crash now: old snapshot + rotated journal + new journal
+            assert len(RunCheckpoint.read(tmp_path).in_flight()) == 3
+            release.set()
+            await checkpoint.flush()
+
+        asyncio.run(main())
+        assert writers and threading.main_thread() not in writers
+        assert list(checkpoint.dir.glob("journal.*.jsonl")) == []
+        loaded = RunCheckpoint.read(tmp_path)
+        assert loaded.in_flight() == [[QUESTION, "A"], [QUESTION, "B"], [QUESTION, "C"]]
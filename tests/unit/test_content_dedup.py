@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Unit tests for content-level duplicate collapsing (core.content_dedup) and
+the research/monitor dedup sites that use it.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.content_dedup import ContentDeduplicator, dedup_url_key, hamming, simhash
+from core.database_integration_base import Evidence, QueryResult
+from research.recursive_agent import (
+    Action,
+    ActionType,
+    Constraints,
+    GoalContext,
+    GoalStatus,
+    RecursiveResearchAgent,
+    ResearchRun,
+)
+from research.mixins.source_executor_mixin import SourceExecutorMixin, merge_hypothesis_attribution
+
+REUTERS = {
+    "title": "Pentagon awards $480 million contract to Palantir for Maven Smart System - Reuters",
+    "snippet": "The U.S. Army awarded Palantir Technologies a contract worth up to $480 million to expand "
+               "the Maven Smart System prototype across combatant commands, the Pentagon said on Wednesday.",
+    "url": "https://www.reuters.com/technology/palantir-maven?utm_source=twitter",
+    "source": "brave_search",
+}
+AP = {
+    "title": "Pentagon awards $480 million contract to Palantir for Maven Smart System | AP News",
+    "snippet": "The U.S. Army has awarded Palantir Technologies a contract worth up to $480 million to expand "
+               "the Maven Smart System prototype across combatant commands, the Pentagon said Wednesday.",
+    "url": "https://apnews.com/article/palantir-maven-army",
+    "source": "exa",
+}
+ANDURIL = {
+    "title": "Anduril wins Army contract for counter-drone interceptors",
+    "snippet": "Anduril Industries received a contract from the U.S. Army to supply Roadrunner interceptors "
+               "and Lattice software for counter-drone missions, the company announced.",
+    "url": "https://www.defensenews.com/anduril-roadrunner",
+    "source": "brave_search",
+}
+
+
+class TestUrlKey:
+    @pytest.mark.parametrize("variant", [
+        "https://m.example.com/news/story",
+        "http://www.example.com/news/story/?utm_campaign=x#comments",
+        "https://example.com/news/story/amp",
+        "https://amp.example.com/news/story?amp=1",
+        "https://web.archive.org/web/20240101000000/https://www.example.com/news/story",
+        "https://web.archive.org/web/20240101000000id_/http://example.com/news/story",
+        "https://example-com.cdn.ampproject.org/c/s/example.com/news/story",
+        "https://www.google.com/amp/s/www.example.com/amp/news/story",
+    ])
+    def test_variants_share_key(self, variant):
+        assert dedup_url_key(variant) == dedup_url_key("https://example.com/news/story")
+
+    def test_different_documents_keep_distinct_keys(self):
+        assert dedup_url_key("https://example.com/news/story?id=1") != dedup_url_key("https://example.com/news/story?id=2")
+        assert dedup_url_key("") is None and dedup_url_key(None) is None
+
+
+class TestSimHash:
+    def test_syndicated_copy_is_close_and_unrelated_story_is_far(self):
+        dedup = ContentDeduplicator()
+        reuters, ap, anduril = (dedup.fingerprint(r) for r in (REUTERS, AP, ANDURIL))
+        assert hamming(reuters, ap) <= dedup.max_distance
+        assert hamming(reuters, anduril) > 16
+
+    def test_identical_tokens_identical_hash(self):
+        assert simhash("a b c".split()) == simhash("c b a".split())
+
+
+class TestContentDeduplicator:
+    def test_collapses_across_sources_with_provenance(self):
+        dedup = ContentDeduplicator()
+        mobile = {**REUTERS, "url": "https://mobile.reuters.com/technology/palantir-maven", "source": "newsapi"}
+
+        unique = dedup.deduplicate([dict(REUTERS), dict(AP), dict(ANDURIL), mobile])
+
+        assert [r["url"] for r in unique] == [REUTERS["url"], ANDURIL["url"]]
+        assert unique[0]["provenance"] == [
+            {"source": "brave_search", "url": REUTERS["url"]},
+            {"source": "exa", "url": AP["url"]},
+            {"source": "newsapi", "url": mobile["url"]},
+        ]
+        assert "provenance" not in unique[1]
+        assert dedup.summary() == {"seen": 4, "unique": 2, "url_duplicates": 1,
+                                   "content_duplicates": 1, "dedup_ratio": 0.5}
+
+    def test_evidence_provenance_lives_in_metadata(self):
+        dedup = ContentDeduplicator()
+        first = Evidence.from_dict(dict(REUTERS), "brave_search")
+        second = Evidence.from_dict(dict(AP), "exa")
+
+        assert dedup.deduplicate([first, second]) == [first]
+        assert [p["source"] for p in first.metadata["provenance"]] == ["brave_search", "exa"]
+
+    def test_short_urlless_items_only_match_exactly(self):
+        dedup = ContentDeduplicator()
+        items = [{"title": "Contract award"}, {"title": "Contract  AWARD"}, {"title": "Contract awarded"}]
+        assert len(dedup.deduplicate(items)) == 2
+
+    def test_same_object_twice_is_not_its_own_provenance(self):
+        dedup = ContentDeduplicator()
+        item = dict(REUTERS)
+        assert dedup.deduplicate([item, item]) == [item]
+        assert "provenance" not in item
+
+
+    def test_partition_registers_nothing(self):
+        dedup = ContentDeduplicator()
+        kept = dedup.deduplicate([dict(REUTERS)])
+        new, known = dedup.partition([dict(AP), dict(ANDURIL), dict(ANDURIL)])
+
+        assert known == kept and [r["url"] for r in new] == [ANDURIL["url"]]
+        assert [p["source"] for p in kept[0]["provenance"]] == ["brave_search", "exa"]
+        assert dedup.find(dict(ANDURIL)) is None  # Not registered until kept
+        assert dedup.summary()["seen"] == 3
+
+
+class FakeSource:
+    """Registry + integration returning the same results for every query."""
+
+    def __init__(self, results):
+        self.results = results
+
+    def normalize_source_name(self, name):
+        return "brave_search"
+
+    def get_instance(self, source_id):
+        return self
+
+    def get_api_key(self, source_id):
+        return None
+
+    async def generate_query(self, question):
+        return {"query": question}
+
+    async def execute_search(self, query_params, api_key=None, limit=10):
+        return QueryResult(success=True, source="Brave Search", total=len(self.results),
+                           results=[dict(r) for r in self.results], query_params=query_params)
+
+
+class TestAgentEvidenceDedup:
+    def test_item_rejected_for_one_goal_reaches_the_next(self, tmp_path):
+        constraints = Constraints()
+        agent = RecursiveResearchAgent(constraints=constraints, output_dir=tmp_path)
+        agent.registry = FakeSource([REUTERS, ANDURIL])
+        relevant = {"Palantir Maven award": "Palantir", "Army drone contracts": "Anduril"}
+        processed = []
+
+        async def process_evidence(goal, evidence, context):
+            processed.append((goal, [e.title for e in evidence]))
+            return [e for e in evidence if relevant[goal] in e.title], []
+
+        agent._process_evidence = process_evidence
+        context = GoalContext(
+            original_objective="Defense contracts", constraints=constraints, start_time=datetime.now(),
+            research_run=ResearchRun(content_dedup=ContentDeduplicator()),
+        )
+        action = Action(type=ActionType.API_CALL, source="brave_search")
+
+        first = asyncio.run(agent._execute_api_call("Palantir Maven award", action, context))
+        second = asyncio.run(agent._execute_api_call("Army drone contracts", action, context))
+
+        assert [e.title for e in first.evidence] == [REUTERS["title"]]
+        # Anduril was rejected for the first goal but is kept for the second; the
+        # Palantir result is reused without being filtered again
+        assert sorted(e.title for e in second.evidence) == sorted([REUTERS["title"], ANDURIL["title"]])
+        assert processed[1] == ("Army drone contracts", [ANDURIL["title"]])
+        assert second.evidence[-1] is first.evidence[0]
+
+        # Everything filtered out and nothing reused: no evidence, so not COMPLETED
+        agent.registry = FakeSource([{**ANDURIL, "url": "https://example.com/unrelated", "title": "Weather report",
+                                      "snippet": "Sunny skies expected across the region through the weekend."}])
+        relevant["Weather"] = "Palantir"
+        empty = asyncio.run(agent._execute_api_call("Weather", action, context))
+        assert empty.status == GoalStatus.FAILED and empty.evidence == []
+
+
+class TestHypothesisAttribution:
+    def test_merge_keeps_single_id_until_second_hypothesis(self):
+        existing = {"hypothesis_id": 1}
+        merge_hypothesis_attribution(existing, {"hypothesis_id": 1})
+        assert existing == {"hypothesis_id": 1}
+        merge_hypothesis_attribution(existing, {"hypothesis_ids": [2, 3]})
+        assert existing == {"hypothesis_ids": [1, 2, 3]}
+
+    def test_collapse_records_run_stats(self):
+        class Host(SourceExecutorMixin):
+            evidence_dedup_stats = {"seen": 0, "unique": 0, "url_duplicates": 0, "content_duplicates": 0}
+
+        host = Host()
+        results = [{**REUTERS, "hypothesis_id": 1}, {**AP, "hypothesis_id": 2}]
+        unique = host._collapse_duplicate_results(results, on_duplicate=merge_hypothesis_attribution)
+
+        assert len(unique) == 1 and unique[0]["hypothesis_ids"] == [1, 2]
+        assert host.evidence_dedup_stats == {"seen": 2, "unique": 1, "url_duplicates": 0, "content_duplicates": 1}
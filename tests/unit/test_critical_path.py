@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Unit tests for critical-path analysis of execution logs (research.critical_path).
+
+The fixture log is written in the recursive agent's JSONL event format with
+hand-picked timings, so the critical path, slack and what-if results are known:
+
+    root  [0, 10]
+      llm:assess [0, 1] -> llm:decompose [1, 2]
+      A     [2, 6]   api:sam [2.1, 5.9]                          (slack 3s)
+      B     [2, 9]   llm:assess [2, 3] -> api:usaspending [3, 5]
+                     -> llm:filter_results [5, 8.5]
+      llm:synthesize [9, 10]
+"""
+
+import json
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from research.critical_path import analyze, build_tree, format_report, load_events, what_if
+
+T0 = datetime(2025, 11, 20, 14, 0, 0)
+ROOT, A, B = "Find Palantir contracts", "Search SAM.gov awards", "Search USAspending"
+
+
+def _event(at, event_type, goal, depth, parent_goal, **data):
+    return {
+        "timestamp": (T0 + timedelta(seconds=at)).isoformat(),
+        "schema_version": "2.0",
+        "event_type": event_type,
+        "goal": goal,
+        "depth": depth,
+        "parent_goal": parent_goal,
+        "data": data,
+    }
+
+
+def _llm(start, end, call_type, goal, depth, parent_goal):
+    return _event(end, "llm_call", goal, depth, parent_goal, call_type=call_type,
+                  duration_ms=(end - start) * 1000, cost_dollars=0.001, model="test")
+
+
+def _api(start, end, source, goal, depth, parent_goal):
+    return _event(end, "api_response", goal, depth, parent_goal, source=source, success=True,
+                  result_count=10, response_time_ms=(end - start) * 1000, error=None)
+
+
+def fixture_events():
+    events = [
+        _event(0, "run_start", ROOT, 0, None, constraints={}, sources_available=2),
+        _event(0, "goal_started", ROOT, 0, None),
+        _llm(0, 1, "assess", ROOT, 0, None),
+        _llm(1, 2, "decompose", ROOT, 0, None),
+        _event(2, "goal_started", A, 1, ROOT),
+        _event(2, "goal_started", B, 1, ROOT),
+        _llm(2, 3, "assess", B, 1, ROOT),
+        _event(2.1, "api_call", A, 1, ROOT, source="sam", query_params={}),
+        _api(3, 5, "usaspending", B, 1, ROOT),
+        _api(2.1, 5.9, "sam", A, 1, ROOT),
+        _event(6, "goal_completed", A, 1, ROOT, status="completed", evidence_count=10,
+               confidence=0.8, duration_seconds=4, cost_dollars=0),
+        _llm(5, 8.5, "filter_results", B, 1, ROOT),
+        _event(9, "goal_completed", B, 1, ROOT, status="completed", evidence_count=10,
+               confidence=0.8, duration_seconds=7, cost_dollars=0),
+        _llm(9, 10, "synthesize", ROOT, 0, None),
+        _event(10, "goal_completed", ROOT, 0, None, status="completed", evidence_count=20,
+               confidence=0.9, duration_seconds=10, cost_dollars=0),
+        _event(10, "run_complete", ROOT, 0, None, status="completed", total_evidence=20,
+               total_goals=3, elapsed_seconds=10, total_cost_dollars=0.01),
+    ]
+    events.sort(key=lambda e: e["timestamp"])  # Logged in completion order
+    return events
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / "execution_log.jsonl"
+    path.write_text("".join(json.dumps(e) + "\n" for e in fixture_events()))
+    return path
+
+
+class TestCriticalPath:
+    def test_tree_is_rebuilt_from_log(self, log_path):
+        tree = build_tree(load_events(log_path))
+        root = tree.children[0]
+        assert tree.duration == pytest.approx(10)
+        assert [c.label for c in root.children] == ["llm:assess", "llm:decompose", A, B, "llm:synthesize"]
+        goal_b = root.children[3]
+        assert [c.label for c in goal_b.children] == ["llm:assess", "api:usaspending", "llm:filter_results"]
+        assert goal_b.children[0].start == pytest.approx(2)
+
+    def test_known_critical_path(self, log_path):
+        analysis = analyze(build_tree(load_events(log_path)))
+        labels = [s.label for s in analysis.critical_path if s.kind != "run"]
+        assert labels == [ROOT, "llm:assess", "llm:decompose", B,
+                          "llm:assess", "api:usaspending", "llm:filter_results", "llm:synthesize"]
+        goal_b = next(s for s in analysis.critical_path if s.label == B)
+        assert analysis.self_time[id(goal_b)] == pytest.approx(0.5)  # 8.5 -> 9 after filtering
+
+    def test_slack(self, log_path):
+        analysis = analyze(build_tree(load_events(log_path)))
+        spans = {s.label: s for s in analysis.tree.walk() if s.kind != "llm"}
+        assert spans[A].slack == pytest.approx(3)  # Could end at 9 when B does
+        assert spans["api:sam"].slack == pytest.approx(3)  # Critical within A: inherits A's slack
+        assert spans[B].slack == 0 and spans[ROOT].slack == 0
+        assert analysis.level_slack[1] == {"goals": 2, "critical": 1, "min": 0.0,
+                                           "median": pytest.approx(1.5), "max": pytest.approx(3)}
+
+    def test_what_if_speedups(self, log_path):
+        tree = build_tree(load_events(log_path))
+        # B: 1 + 2 + 1.75 + 0.5 own = 5.25 > A's 4 -> run 10 - 7 + 5.25
+        assert what_if(tree, {"llm:filter_results": 2}) == pytest.approx(8.25)
+        assert what_if(tree, {"api:sam": 2}) == pytest.approx(10)  # Off the critical path
+        assert what_if(tree, {"llm:*": 1000}) == pytest.approx(4, abs=0.01)  # Instant LLM: A now bounds the run
+
+        analysis = analyze(tree)
+        assert analysis.what_ifs[0][0] == "llm:filter_results"
+        assert "saves 1.8s" in format_report(analysis)
+
+    def test_cli(self, log_path):
+        script = Path(__file__).parent.parent.parent / "scripts" / "analyze_critical_path.py"
+        output = subprocess.run(
+            [sys.executable, str(script), str(log_path.parent), "--what-if", "llm:filter*=2"],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        assert "CRITICAL PATH" in output and "llm:filter*" in output and "8.2s" in output
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Unit tests for run-wide deadlines (core.deadline) and their propagation into
+LLM calls, the HTTP client and the recursive agent's goal tree.
+
+No LLM or network calls: the call sites under test are replaced with fakes.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import core.http_client as http_client
+import llm_utils
+from core.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    clamp_timeout,
+    current_deadline,
+    deadline_scope,
+    with_deadline,
+)
+from core.http_client import HttpResponse, http_get
+from research.recursive_agent import (
+    Constraints,
+    GoalContext,
+    GoalResult,
+    GoalStatus,
+    RecursiveResearchAgent,
+)
+
+
+class TestDeadline:
+    def test_clamp_takes_smaller_of_timeout_and_remaining(self):
+        deadline = Deadline.after(10)
+        assert deadline.clamp(3) == 3
+        assert 9 < deadline.clamp(180) <= 10
+        assert 9 < deadline.clamp(None) <= 10
+
+    def test_expired_deadline_refuses_new_work(self):
+        deadline = Deadline.after(-1)
+        assert deadline.expired and deadline.remaining() == 0
+        with pytest.raises(DeadlineExceeded):
+            deadline.clamp(30)
+
+    def test_reserve_ends_earlier(self):
+        deadline = Deadline.after(100)
+        assert deadline.reserve(10).expires_at == deadline.expires_at - 10
+
+    def test_no_scope_leaves_timeouts_alone(self):
+        assert current_deadline() is None
+        assert clamp_timeout(180) == 180
+        assert clamp_timeout(None) is None
+
+    @pytest.mark.asyncio
+    async def test_scope_is_inherited_by_tasks_and_restored(self):
+        deadline = Deadline.after(5)
+        with deadline_scope(deadline):
+            assert await asyncio.ensure_future(_current()) is deadline
+        assert current_deadline() is None
+
+
+async def _current():
+    return current_deadline()
+
+
+class TestWithDeadline:
+    @pytest.mark.asyncio
+    async def test_cancels_call_at_deadline(self):
+        cancelled = asyncio.Event()
+
+        async def slow_call():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        start = time.monotonic()
+        with deadline_scope(Deadline.after(0.05)):
+            with pytest.raises(DeadlineExceeded):
+                await with_deadline(slow_call())
+        assert time.monotonic() - start < 1
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_own_timeout_is_not_reported_as_deadline(self):
+        with deadline_scope(Deadline.after(10)):
+            with pytest.raises(asyncio.TimeoutError) as exc_info:
+                await with_deadline(asyncio.sleep(10), timeout=0.01)
+        assert not isinstance(exc_info.value, DeadlineExceeded)
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_never_starts_call(self):
+        started = []
+
+        async def call():
+            started.append(True)
+
+        with deadline_scope(Deadline.after(-1)):
+            with pytest.raises(DeadlineExceeded):
+                await with_deadline(call())
+        assert started == []
+
+
+class TestCallSites:
+    @pytest.mark.asyncio
+    async def test_llm_timeout_clamped_to_remaining_budget(self, monkeypatch):
+        seen = {}
+
+        async def fake_unified(model, messages, timeout=None, **kwargs):
+            seen["timeout"] = timeout
+            return SimpleNamespace(choices=[])
+
+        monkeypatch.setattr(llm_utils.UnifiedLLM, "acompletion", fake_unified)
+
+        with deadline_scope(Deadline.after(5)):
+            await llm_utils.acompletion("gpt-5-mini", [{"role": "user", "content": "hi"}], timeout=180)
+        assert 4 < seen["timeout"] <= 5
+
+        with deadline_scope(Deadline.after(-1)):
+            with pytest.raises(DeadlineExceeded):
+                await llm_utils.acompletion("gpt-5-mini", [{"role": "user", "content": "hi"}])
+
+    @pytest.mark.asyncio
+    async def test_http_get_clamps_timeout_and_skips_after_deadline(self, monkeypatch):
+        timeouts = []
+
+        def fake_sync_get(url, params, headers, timeout, parse_json):
+            timeouts.append(timeout)
+            return HttpResponse(success=False, status_code=503, error="busy")
+
+        monkeypatch.setattr(http_client, "_sync_get", fake_sync_get)
+
+        with deadline_scope(Deadline.after(1.5)):
+            # First retry (after 1s) fits the budget, the second (after 2s more) does not
+            response = await http_get("https://example.com", timeout=30, max_retries=3, retry_delay=1.0)
+        assert response.status_code == 503
+        assert len(timeouts) == 2 and timeouts[0] <= 1.5 and timeouts[1] <= 0.5
+
+        with deadline_scope(Deadline.after(-1)):
+            response = await http_get("https://example.com")
+        assert not response.success and response.error == "Run deadline exceeded"
+        assert len(timeouts) == 2
+
+
+class TestAgentDeadline:
+    @pytest.mark.asyncio
+    async def test_pending_subgoals_cancelled_completed_kept(self, tmp_path):
+        agent = RecursiveResearchAgent(constraints=Constraints(), output_dir=tmp_path)
+        constraints = Constraints(deadline_grace_seconds=0.05)
+        context = GoalContext(constraints=constraints, deadline=Deadline.after(0.1))
+
+        async def fast():
+            return GoalResult(goal="fast", status=GoalStatus.COMPLETED)
+
+        async def stuck():
+            await asyncio.sleep(10)
+
+        start = time.monotonic()
+        results = await agent._gather_within_deadline(["fast", "stuck"], [fast(), stuck()], context)
+
+        assert time.monotonic() - start < 1
+        assert [r.status for r in results] == [GoalStatus.COMPLETED, GoalStatus.CONSTRAINED]
+        assert results[1].goal == "stuck"
+
+    def test_expired_deadline_is_a_constraint_violation(self, tmp_path):
+        agent = RecursiveResearchAgent(constraints=Constraints(), output_dir=tmp_path)
+        context = GoalContext(deadline=Deadline.after(-1))
+        assert "Time limit" in agent._check_constraints(context)
+
+    @pytest.mark.asyncio
+    async def test_research_stops_at_budget_and_synthesizes_in_reserve(self, tmp_path, monkeypatch):
+        constraints = Constraints(max_time_seconds=1, synthesis_reserve_fraction=0.4)
+        agent = RecursiveResearchAgent(constraints=constraints, output_dir=tmp_path)
+        agent.registry = object()  # skip source discovery
+        synthesis_budget = {}
+
+        async def slow_pursue(goal, context):
+            try:
+                await with_deadline(asyncio.sleep(30))  # e.g. a hung API call
+            except DeadlineExceeded:
+                pass
+            return GoalResult(goal=goal, status=GoalStatus.CONSTRAINED)
+
+        async def fake_synthesize(goal, sub_results, context):
+            synthesis_budget["remaining"] = current_deadline().remaining()
+            return SimpleNamespace(text="done", confidence=0.5)
+
+        async def unexpected(*args, **kwargs):
+            raise AssertionError("no coverage assessment after the deadline")
+
+        async def no_save(result):
+            return None
+
+        monkeypatch.setattr(agent, "pursue_goal", slow_pursue)
+        monkeypatch.setattr(agent, "_synthesize", fake_synthesize)
+        monkeypatch.setattr(agent, "_assess_coverage", unexpected)
+        monkeypatch.setattr(agent, "_save_result", no_save)
+
+        start = time.monotonic()
+        result = await agent.research("Palantir Army contracts")
+
+        assert result.synthesis == "done"
+        assert 0.5 <= time.monotonic() - start < 1
+        assert 0 < synthesis_budget["remaining"] <= 0.4
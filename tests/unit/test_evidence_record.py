@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the slotted, validation-free EvidenceRecord (core.evidence_record)
+and the agent's fast path from validated QueryResult results.
+
+No LLM or network calls: the integration and evidence processing are fakes.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.database_integration_base import (
+    DatabaseCategory,
+    DatabaseIntegration,
+    DatabaseMetadata,
+    Evidence,
+    QueryResult,
+)
+from core.evidence_record import EvidenceRecord
+from core.result_builder import SearchResultBuilder
+from research.recursive_agent import Action, ActionType, Constraints, GoalContext, RecursiveResearchAgent, ResearchRun
+
+ITEM = {
+    "title": "Palantir Army award",
+    "url": "https://sam.gov/opp/1",
+    "snippet": "Award notice",
+    "date": "2024-05-01",
+    "metadata": {"notice_id": "1"},
+    "raw_content": "Full award notice text",
+}
+
+
+class TestEvidenceRecord:
+    @pytest.mark.parametrize("kwargs", [{}, {"include_raw": True}, {"max_content_length": 5}])
+    def test_to_dict_matches_evidence(self, kwargs):
+        record = EvidenceRecord.from_trusted(ITEM, "sam")
+        evidence = Evidence.from_dict(ITEM, "sam")
+        assert record.to_dict(**kwargs) == evidence.to_dict(**kwargs)
+
+    def test_properties_match_evidence(self):
+        record = EvidenceRecord.from_trusted({**ITEM, "raw_content": None}, "sam")
+        evidence = Evidence.from_dict({**ITEM, "raw_content": None}, "sam")
+        for name in ("content", "full_content", "source", "llm_context", "has_raw_data", "has_processed_data"):
+            assert getattr(record, name) == getattr(evidence, name), name
+
+    def test_is_slotted_and_mutable(self):
+        record = EvidenceRecord.from_trusted(ITEM, "sam")
+        record.snippet = "summary"
+        record.relevance_score = 1.0
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unknown_field = 1
+
+    def test_to_evidence_round_trips_and_validates(self):
+        evidence = Evidence.from_dict(ITEM, "sam")
+        assert EvidenceRecord.from_evidence(evidence).to_evidence() == evidence
+
+        record = EvidenceRecord.from_trusted(ITEM, "sam", relevance_score=2.0)  # out of range
+        with pytest.raises(ValidationError):
+            record.to_evidence()
+
+    def test_builder_builds_records_directly(self):
+        record = (SearchResultBuilder()
+                  .title(None)
+                  .url("https://sam.gov/opp/2")
+                  .snippet("x" * 600)
+                  .raw_content("y" * 600)
+                  .build_record("sam"))
+        assert record.title == "Untitled" and len(record.snippet) == 500 and len(record.content) == 600
+        assert record.to_evidence().source == "sam"
+
+
+class TestQueryResultValidated:
+    def test_flag_tracks_validation(self):
+        assert QueryResult(True, "SAM", 1, [ITEM], {}).validated is True
+        assert QueryResult(True, "SAM", 1, [ITEM], {}, validate=False).validated is False
+        assert QueryResult(False, "SAM", 0, [], {}, error="boom").validated is False
+
+
+class FakeIntegration(DatabaseIntegration):
+    @property
+    def metadata(self):
+        return DatabaseMetadata(
+            name="Fake Search", id="fake_search", category=DatabaseCategory.WEB_SEARCH,
+            requires_api_key=False, cost_per_query_estimate=0.0,
+            typical_response_time=0.1, rate_limit_daily=None, description="Fake search",
+        )
+
+    async def is_relevant(self, research_question):
+        return True
+
+    async def generate_query(self, research_question):
+        return {"query": research_question}
+
+    async def execute_search(self, query_params, api_key=None, limit=10):
+        return QueryResult(True, "Fake Search", 2, [ITEM, {**ITEM, "url": "https://sam.gov/opp/2"}], query_params)
+
+
+class FakeRegistry:
+    def normalize_source_name(self, name):
+        return "fake_search"
+
+    def get_instance(self, source_id):
+        return FakeIntegration()
+
+    def get_api_key(self, source_id):
+        return None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("enabled,expected_type", [(True, EvidenceRecord), (False, Evidence)])
+async def test_agent_keeps_validated_results_as_records(tmp_path, monkeypatch, enabled, expected_type):
+    constraints = Constraints(enable_fast_evidence=enabled)
+    agent = RecursiveResearchAgent(constraints=constraints, output_dir=tmp_path)
+    agent.registry = FakeRegistry()
+    context = GoalContext(original_objective="Palantir", constraints=constraints,
+                          start_time=datetime.now(), research_run=ResearchRun())
+    seen = []
+
+    async def fake_process(goal, evidence, context):
+        seen.extend(evidence)
+        return evidence, []
+
+    monkeypatch.setattr(agent, "_process_evidence", fake_process)
+    action = Action(type=ActionType.API_CALL, source="Fake Search", params={"query": "Palantir"})
+
+    result = await agent._execute_api_call("Find Palantir awards", action, context)
+
+    assert [type(e) for e in seen] == [expected_type, expected_type]
+    assert [e.url for e in result.evidence] == ["https://sam.gov/opp/1", "https://sam.gov/opp/2"]
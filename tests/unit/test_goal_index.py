@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for near-duplicate goal detection (GoalIndex) in the recursive agent.
+
+No LLM calls: the agent's per-goal work (_pursue_goal) is replaced with a fake.
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from research.goal_index import GoalIndex, goal_terms
+from research.recursive_agent import (
+    Constraints,
+    GoalContext,
+    GoalResult,
+    GoalStatus,
+    RecursiveResearchAgent,
+    ResearchRun,
+)
+
+
+class TestGoalTerms:
+    def test_paraphrases_normalize_to_same_terms(self):
+        assert goal_terms("Find DoD AI contracts 2024") == goal_terms("Identify 2024 Defense Department AI awards")
+        assert goal_terms("Find DoD AI contracts 2024") == {"dod", "ai", "contract", "2024"}
+
+    def test_different_years_are_not_duplicates(self):
+        assert not GoalIndex().is_similar("Find DoD AI contracts 2024", "Find DoD AI contracts 2023")
+
+
+class TestGoalIndex:
+    @pytest.mark.asyncio
+    async def test_find_register_and_discard(self):
+        index = GoalIndex()
+        entry = index.register("Find DoD AI contracts 2024")
+        index.register("Search SEC filings for Palantir")
+
+        match = index.find_duplicate("Identify 2024 Defense Department artificial intelligence awards")
+        assert match is not None and match[0] is entry and match[1] == 1.0
+        assert index.find_duplicate("Lobbying disclosures for Anduril") is None
+
+        index.discard(entry)
+        assert index.find_duplicate("Find DoD AI contracts 2024") is None
+        assert index.register("the of and") is None  # nothing to index
+
+    @pytest.mark.asyncio
+    async def test_lsh_only_checks_likely_candidates(self):
+        index = GoalIndex()
+        for i in range(200):
+            index.register(f"Find contracts for vendor number {i} in state {i * 7}")
+        index.stats["candidates_checked"] = 0
+
+        assert index.find_duplicate("Summarize FOIA litigation against the FBI") is None
+        assert index.stats["candidates_checked"] < 20
+
+    @pytest.mark.asyncio
+    async def test_waiting_on_own_ancestor_is_refused(self):
+        index = GoalIndex()
+        parent = index.register("Find DoD AI contracts 2024")
+        assert await index.wait_for(parent, ["Find DoD AI contracts 2024"], "DoD AI awards 2024") is None
+
+    @pytest.mark.asyncio
+    async def test_cross_branch_wait_cycle_is_refused(self):
+        index = GoalIndex()
+        a = index.register("Goal A")
+        b = index.register("Goal B")
+        # Something inside A's subtree waits on B...
+        waiting = asyncio.ensure_future(index.wait_for(b, ["Goal A"], "A child"))
+        await asyncio.sleep(0)
+        # ...so something inside B's subtree must not wait on A
+        assert await index.wait_for(a, ["Goal B"], "B child") is None
+
+        index.complete(b, "b result")
+        assert await waiting == "b result"
+        assert index.stats["reused"] == 1
+
+
+@pytest.fixture
+def agent(tmp_path):
+    return RecursiveResearchAgent(constraints=Constraints(max_goals=10), output_dir=tmp_path)
+
+
+def _context(goal_index):
+    return GoalContext(
+        original_objective="Objective",
+        constraints=Constraints(),
+        start_time=datetime.now(),
+        research_run=ResearchRun(goal_index=goal_index),
+        goal_stack=["Objective"],
+    )
+
+
+class TestAgentReuse:
+    @pytest.mark.asyncio
+    async def test_cousin_paraphrase_attaches_to_in_flight_goal(self, agent, monkeypatch):
+        executed = []
+
+        async def fake_pursue(goal, context):
+            executed.append(goal)
+            await asyncio.sleep(0.02)
+            return GoalResult(goal=goal, status=GoalStatus.COMPLETED, synthesis="found 3 awards", confidence=0.8)
+
+        monkeypatch.setattr(agent, "_pursue_goal", fake_pursue)
+        index = GoalIndex()
+        branch_a = _context(index).with_parent("Branch A")
+        branch_b = _context(index).with_parent("Branch B")
+
+        first, second = await asyncio.gather(
+            agent.pursue_goal("Find DoD AI contracts 2024", branch_a),
+            agent.pursue_goal("Identify 2024 Defense Department AI awards", branch_b),
+        )
+
+        assert executed == ["Find DoD AI contracts 2024"]
+        assert second.reused_from == "Find DoD AI contracts 2024"
+        assert second.synthesis == first.synthesis and second.status == GoalStatus.COMPLETED
+        assert index.stats["reused"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_original_is_not_reused(self, agent, monkeypatch):
+        executed = []
+
+        async def fake_pursue(goal, context):
+            executed.append(goal)
+            return GoalResult(goal=goal, status=GoalStatus.FAILED)
+
+        monkeypatch.setattr(agent, "_pursue_goal", fake_pursue)
+        index = GoalIndex()
+
+        await agent.pursue_goal("Find DoD AI contracts 2024", _context(index))
+        await agent.pursue_goal("Identify 2024 Defense Department AI awards", _context(index))
+
+        assert len(executed) == 2
+
+    def test_paraphrased_ancestor_is_a_cycle(self, agent):
+        context = _context(GoalIndex()).with_parent("Find DoD AI contracts 2024")
+        assert agent._detect_cycle("Identify 2024 Defense Department AI awards", context)
+        assert not agent._detect_cycle("Find DoD AI contracts 2023", context)
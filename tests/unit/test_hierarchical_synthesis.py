@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Unit tests for map-reduce synthesis (research.services.hierarchical_synthesizer)
+and its use in RecursiveResearchAgent._synthesize().
+
+Uses a deterministic fake LLM with a fixed per-call latency: it records which
+evidence items each map prompt contains and answers with canned JSON.
+"""
+
+import asyncio
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import llm_utils
+from core.database_integration_base import Evidence
+from research.recursive_agent import Constraints, GoalContext, GoalResult, GoalStatus, RecursiveResearchAgent
+from research.services.hierarchical_synthesizer import EvidenceCluster, HierarchicalSynthesizer
+
+LATENCY = 0.05
+EVIDENCE_TAG = re.compile(r"EV-\d{4}")
+
+
+class FakeLLM:
+    """Deterministic llm_json(call_type, prompt): fixed latency, canned summaries."""
+
+    def __init__(self, latency=LATENCY, fail_on=None):
+        self.latency = latency
+        self.fail_on = fail_on
+        self.calls = []
+        self.map_items = []  # evidence tags seen per map call
+
+    async def __call__(self, call_type, prompt):
+        self.calls.append(call_type)
+        n = len(self.calls)
+        await asyncio.sleep(self.latency)
+        if call_type == "synthesize_map":
+            tags = EVIDENCE_TAG.findall(prompt)
+            self.map_items.append(tags)
+            if self.fail_on == n:
+                raise RuntimeError("LLM unavailable")
+            return {"summary": f"map {n}: {len(tags)} items", "key_findings": [f"finding {n}"], "confidence": 0.8}
+        return {"summary": f"reduce {n}", "key_findings": [], "confidence": 0.7}
+
+
+def _evidence(i, source="sam"):
+    return Evidence(source_id=source, title=f"EV-{i:04d} contract award", url=f"https://x.gov/{i}",
+                    snippet="Award notice " * 20)
+
+
+def _clusters(count, per_cluster=16):
+    items = [_evidence(i) for i in range(count)]
+    return [EvidenceCluster(f"goal {c}", items[c:c + per_cluster]) for c in range(0, count, per_cluster)]
+
+
+def _synthesizer(llm, **kwargs):
+    # ~70 tokens per item: a 600-token budget packs 8 items per map call
+    options = dict(max_concurrency=64, fan_in=4, token_budget=600)
+    options.update(kwargs)
+    return HierarchicalSynthesizer(llm, **options)
+
+
+class TestMapReduce:
+    @pytest.mark.asyncio
+    async def test_every_item_reaches_exactly_one_map_call(self):
+        llm = FakeLLM(latency=0)
+        clusters = _clusters(203, per_cluster=37)
+
+        partials = await _synthesizer(llm).summarize("goal", "objective", clusters)
+
+        seen = [tag for tags in llm.map_items for tag in tags]
+        assert sorted(seen) == [f"EV-{i:04d}" for i in range(203)]
+        assert sum(p.evidence_count for p in partials) == 203
+        assert len(partials) <= 4
+
+    @pytest.mark.asyncio
+    async def test_wall_clock_scales_with_depth_not_evidence(self):
+        timings = {}
+        for count in (64, 512):
+            synthesizer = _synthesizer(FakeLLM())
+            start = time.perf_counter()
+            await synthesizer.summarize("goal", "objective", _clusters(count))
+            levels = 1 + synthesizer.stats["reduce_levels"]
+            timings[count] = (time.perf_counter() - start, levels, synthesizer.stats["map_calls"])
+
+        # 64 items -> 8 map calls -> 2 partials (2 levels); 512 -> 64 -> 16 -> 4 (3 levels)
+        assert [timings[c][1:] for c in (64, 512)] == [(2, 8), (3, 64)]
+        for elapsed, levels, _ in timings.values():
+            assert levels * LATENCY <= elapsed < levels * LATENCY + 0.25
+        assert timings[512][0] < timings[64][0] * 2  # 8x the evidence, 1.5x the time
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        active = peak = 0
+
+        async def llm(call_type, prompt):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"summary": "s", "key_findings": [], "confidence": 0.5}
+
+        await _synthesizer(llm, max_concurrency=3).summarize("goal", "objective", _clusters(128))
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_map_keeps_raw_evidence(self):
+        llm = FakeLLM(latency=0, fail_on=1)
+        synthesizer = _synthesizer(llm, token_budget=10_000)
+
+        partials = await synthesizer.summarize("goal", "objective", _clusters(8, per_cluster=4))
+
+        assert synthesizer.stats["failed_calls"] == 1
+        assert "EV-0000" in partials[0].summary and partials[0].confidence == 0.3
+
+    def test_cluster_by_source(self):
+        evidence = [_evidence(0, "sam"), _evidence(1, "usaspending"), _evidence(2, "sam")]
+        clusters = HierarchicalSynthesizer.cluster_by_source(evidence)
+        assert [(c.label, len(c.evidence)) for c in clusters] == [("sam", 2), ("usaspending", 1)]
+
+
+class TestAgentSynthesize:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("evidence_count,expect_map", [(10, False), (200, True)])
+    async def test_map_reduce_only_when_evidence_overflows(self, tmp_path, monkeypatch, evidence_count, expect_map):
+        constraints = Constraints(max_evidence_for_synthesis=30, synthesis_token_budget=600)
+        agent = RecursiveResearchAgent(constraints=constraints, output_dir=tmp_path)
+        context = GoalContext(constraints=constraints, original_objective="Palantir contracts")
+        prompts = []
+
+        async def fake_acompletion(model, messages, **kwargs):
+            prompt = messages[-1]["content"]
+            prompts.append(prompt)
+            if prompt.startswith("Summarize one slice"):
+                content = {"summary": f"{len(EVIDENCE_TAG.findall(prompt))} awards", "key_findings": [], "confidence": 0.8}
+            elif prompt.startswith("Merge partial"):
+                content = {"summary": "merged awards", "key_findings": [], "confidence": 0.8}
+            else:
+                content = {"synthesis": "final", "confidence": 0.9}
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(content)))])
+
+        monkeypatch.setattr(llm_utils, "acompletion", fake_acompletion)
+        items = [_evidence(i) for i in range(evidence_count)]
+        sub_results = [
+            GoalResult(goal=f"sub {k}", status=GoalStatus.COMPLETED, evidence=items[k::4]) for k in range(4)
+        ]
+
+        result = await agent._synthesize("Find Palantir contracts", sub_results, context)
+
+        assert result.synthesis == "final" and len(result.evidence) == evidence_count
+        final_prompt = prompts[-1]
+        assert "Synthesize research findings" in final_prompt
+        assert any(p.startswith("Summarize one slice") for p in prompts) == expect_map
+        if expect_map:
+            assert "EV-" not in final_prompt  # final call sees summaries, not raw items
+            assert f"KEY EVIDENCE ({evidence_count} total pieces)" in final_prompt
+
+    @pytest.mark.asyncio
+    async def test_ancestors_reduce_sub_syntheses_instead_of_remapping(self, tmp_path, monkeypatch):
+        constraints = Constraints(max_evidence_for_synthesis=30, synthesis_token_budget=600)
+        agent = RecursiveResearchAgent(constraints=constraints, output_dir=tmp_path)
+        context = GoalContext(constraints=constraints, original_objective="Palantir contracts")
+        mapped = []
+
+        async def fake_acompletion(model, messages, **kwargs):
+            prompt = messages[-1]["content"]
+            if prompt.startswith("Summarize one slice"):
+                mapped.extend(EVIDENCE_TAG.findall(prompt))
+                content = {"summary": "awards", "key_findings": [], "confidence": 0.8}
+            elif prompt.startswith("Merge partial"):
+                content = {"summary": "merged awards", "key_findings": [], "confidence": 0.8}
+            else:
+                content = {"synthesis": "synthesis", "confidence": 0.9}
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(content)))])
+
+        monkeypatch.setattr(llm_utils, "acompletion", fake_acompletion)
+
+        # Depth 3: root -> 4 branches -> 4 executed leaves x 10 evidence (160 items)
+        ids = iter(range(10_000))
+
+        def leaf(name):
+            return GoalResult(goal=name, status=GoalStatus.COMPLETED, evidence=[_evidence(next(ids)) for _ in range(10)])
+
+        branches = []
+        for b in range(4):
+            leaves = [leaf(f"branch {b} leaf {k}") for k in range(4)]
+            synthesis = await agent._synthesize(f"branch {b}", leaves, context)
+            branches.append(GoalResult(goal=f"branch {b}", status=GoalStatus.COMPLETED, sub_results=leaves,
+                                       evidence=[e for r in leaves for e in r.evidence], synthesis=synthesis.synthesis))
+        mapped_below_root = list(mapped)
+
+        result = await agent._synthesize("Find Palantir contracts", branches, context)
+
+        assert result.synthesis == "synthesis" and len(result.evidence) == 160
+        # Every item is mapped once, at its branch; the root only reduces the branch syntheses
+        assert sorted(mapped_below_root) == sorted(set(mapped_below_root)) and len(mapped_below_root) == 160
+        assert mapped == mapped_below_root
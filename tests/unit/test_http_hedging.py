@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for hedged requests in core.http_client (HedgeTracker, hedged_call).
+
+No network calls: request functions are blocking fakes run in the executor.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import core.http_client as http_client
+from core.http_client import HedgeTracker, HttpResponse, hedged_call, http_get
+from core.rate_limiter import rate_limiter
+
+
+class FakeSource:
+    """Blocking request function whose n-th call sleeps latencies[n] and returns statuses[n]."""
+
+    def __init__(self, latencies, statuses=None):
+        self.latencies = latencies
+        self.statuses = statuses or [200] * len(latencies)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            n = self.calls
+            self.calls += 1
+        time.sleep(self.latencies[n])
+        return SimpleNamespace(status_code=self.statuses[n], attempt=n)
+
+
+def _warm(tracker, source, latency=0.01, count=20):
+    for _ in range(count):
+        tracker.record_attempt(source, latency)
+        tracker.record_request(source, latency)
+
+
+class TestHedgeTracker:
+    def test_no_delay_until_enough_samples(self):
+        tracker = HedgeTracker(min_samples=5)
+        for latency in (0.01, 0.02, 0.03, 0.04):
+            tracker.record_attempt("src", latency)
+        assert tracker.hedge_delay("src") is None
+        tracker.record_attempt("src", 0.5)
+        assert tracker.hedge_delay("src") == 0.5  # nearest-rank p95 of 5 samples
+
+    def test_budget_caps_hedges_per_source(self):
+        tracker = HedgeTracker(max_hedge_fraction=0.1)
+        _warm(tracker, "src", count=20)
+        assert [tracker.try_spend("src") for _ in range(3)] == [True, True, False]
+        assert tracker.try_spend("other") is False
+
+
+class TestHedgedCall:
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_backup_wins(self):
+        tracker = HedgeTracker()
+        _warm(tracker, "slow_src")
+        source = FakeSource([1.0, 0.01])
+
+        start = time.monotonic()
+        response = await hedged_call("slow_src", source, tracker=tracker, enabled=True)
+
+        assert response.attempt == 1
+        assert time.monotonic() - start < 0.5
+        stats = tracker.stats("slow_src")
+        assert stats["hedged"] == 1 and stats["hedge_wins"] == 1 and stats["win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        tracker = HedgeTracker()
+        _warm(tracker, "fast_src", latency=0.2)
+        source = FakeSource([0.01])
+
+        assert (await hedged_call("fast_src", source, tracker=tracker, enabled=True)).attempt == 0
+        assert source.calls == 1 and tracker.stats("fast_src")["hedged"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_source_never_hedges(self):
+        tracker = HedgeTracker()
+        _warm(tracker, "off_src")
+        source = FakeSource([0.1, 0.01])
+
+        assert (await hedged_call("off_src", source, tracker=tracker, enabled=False)).attempt == 0
+        assert source.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_unusable_first_answer_waits_for_the_other(self):
+        tracker = HedgeTracker()
+        _warm(tracker, "flaky_src")
+        # Primary answers first but with a 503; the backup's 200 is returned
+        source = FakeSource([0.05, 0.1], statuses=[503, 200])
+
+        response = await hedged_call("flaky_src", source, tracker=tracker, enabled=True)
+        assert response.status_code == 200 and response.attempt == 1
+
+    @pytest.mark.asyncio
+    async def test_blocked_source_is_not_hedged(self):
+        tracker = HedgeTracker()
+        _warm(tracker, "blocked_src")
+        source = FakeSource([0.1, 0.01])
+        rate_limiter._get_source_state("blocked_src").is_blocked = True
+        try:
+            assert (await hedged_call("blocked_src", source, tracker=tracker, enabled=True)).attempt == 0
+            assert source.calls == 1
+        finally:
+            rate_limiter.unblock_source("blocked_src")
+
+    @pytest.mark.asyncio
+    async def test_429_opens_breaker_under_display_name_and_suppresses_hedge(self):
+        tracker = HedgeTracker()
+        _warm(tracker, "sam")
+        # First request is rate limited; the second is slow enough to be hedged
+        source = FakeSource([0.001, 0.1, 0.01], statuses=[429, 200, 200])
+        try:
+            first = await hedged_call("sam", source, tracker=tracker, enabled=True, rate_limit_name="SAM.gov")
+            assert first.status_code == 429
+            assert not rate_limiter.is_available("SAM.gov")  # rate_limiting.circuit_breaker_sources
+
+            second = await hedged_call("sam", source, tracker=tracker, enabled=True, rate_limit_name="SAM.gov")
+            assert second.attempt == 1
+            assert source.calls == 2 and tracker.stats("sam")["hedged"] == 0
+        finally:
+            rate_limiter.unblock_source("SAM.gov")
+
+    @pytest.mark.asyncio
+    async def test_http_get_hedges_when_source_given(self, monkeypatch):
+        calls = []
+
+        async def fake_hedged_call(source, request_fn, rate_limit_name=None):
+            calls.append((source, rate_limit_name))
+            return HttpResponse(success=True, status_code=200, data={"ok": True})
+
+        monkeypatch.setattr(http_client, "hedged_call", fake_hedged_call)
+
+        response = await http_get("https://api.sam.gov/opportunities", hedge_source="sam",
+                                  hedge_rate_limit_name="SAM.gov")
+        assert response.data == {"ok": True} and calls == [("sam", "SAM.gov")]
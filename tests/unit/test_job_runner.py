@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the background job runner (core.job_runner).
+
+Jobs run in real worker processes against a temporary SQLite table; the
+targets below are imported by the workers as tests.unit.test_job_runner.
+No Streamlit involved.
+"""
+
+import asyncio
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.job_runner import JobRunner, run_worker
+
+TARGETS = "tests.unit.test_job_runner"
+
+
+# === Job targets (run inside worker processes) ===
+
+async def count_job(params, job):
+    for i in range(params["n"]):
+        job.progress(f"step {i}", step=i)
+        job.partial({"done": i + 1})
+        await asyncio.sleep(0.01)
+    return {"total": params["n"]}
+
+
+async def slow_job(params, job):
+    job.progress("started")
+    Path(params["marker"]).write_text("cancelled?")
+    try:
+        await asyncio.sleep(60)
+    except asyncio.CancelledError:
+        Path(params["marker"]).write_text("cancelled")
+        raise
+
+
+async def crash_once_job(params, job):
+    job.progress(f"attempt {job.attempt}")
+    if job.attempt == 1:
+        os._exit(1)  # Simulate a worker killed mid-job
+    return {"attempt": job.attempt}
+
+
+async def blocking_job(params, job):
+    job.progress("blocking")
+    time.sleep(params["seconds"])  # Blocks the event loop, like a synchronous requests call
+    return {"blocked": params["seconds"]}
+
+
+async def taken_away_job(params, job):
+    # What recover() does to a hung worker's job
+    with sqlite3.connect(params["db"]) as conn:
+        conn.execute("UPDATE jobs SET status = 'failed', pid = NULL WHERE id = ?", (job.job_id,))
+    job.progress("after takeover")
+    job.partial({"stale": True})
+    Path(params["marker"]).write_text(str(job.lost))
+    try:
+        await asyncio.sleep(30)
+    except asyncio.CancelledError:
+        Path(params["marker"]).write_text(f"{job.lost} cancelled")
+        raise
+
+
+def sync_failing_job(params, job):
+    job.progress("about to fail")
+    raise ValueError("bad params")
+
+
+@pytest.fixture
+def runner(tmp_path):
+    return JobRunner(tmp_path / "jobs.sqlite", max_workers=2, heartbeat_timeout=30, poll_interval=0.05)
+
+
+class TestJobLifecycle:
+    def test_submit_progress_and_result(self, runner):
+        job_id = runner.submit(f"{TARGETS}:count_job", {"n": 3}, label="count")
+        job = runner.wait(job_id, timeout=30)
+
+        assert job.status == "succeeded"
+        assert job.result == {"total": 3}
+        assert job.partial == {"done": 3}
+        assert job.attempts == 1 and job.started_at and job.finished_at
+        events = runner.events(job_id)
+        assert [e.message for e in events if e.kind == "progress"] == ["step 0", "step 1", "step 2"]
+        assert [e.message for e in events if e.kind == "status"] == ["queued", "running", "succeeded"]
+        assert next(e for e in events if e.kind == "progress").data == {"step": 0}
+
+        # Streaming from a cursor only yields later events
+        assert [e.message for e in runner.stream(job_id, after=events[-2].id)] == ["succeeded"]
+        assert runner.list_jobs(target=f"{TARGETS}:count_job")[0].label == "count"
+
+    def test_cancel_running_and_queued(self, runner, tmp_path):
+        marker = tmp_path / "marker.txt"
+        running = runner.submit(f"{TARGETS}:slow_job", {"marker": str(marker)}, max_attempts=1)
+        deadline = time.monotonic() + 30
+        while runner.get(running).status != "running" or not marker.exists():
+            assert time.monotonic() < deadline, "Job never started"
+            time.sleep(0.05)
+
+        assert runner.cancel(running)
+        job = runner.wait(running, timeout=30)
+        assert job.status == "cancelled" and marker.read_text() == "cancelled"
+        assert not runner.cancel(running)  # Already finished
+
+        # A queued job is cancelled without ever running
+        queued_runner = JobRunner(tmp_path / "queued.sqlite", max_workers=0)
+        queued = queued_runner.submit(f"{TARGETS}:count_job", {"n": 1})
+        assert queued_runner.cancel(queued)
+        assert queued_runner.get(queued).status == "cancelled"
+        assert run_worker(queued_runner.db_path) == 0
+
+    def test_crashed_worker_is_recovered(self, runner):
+        job_id = runner.submit(f"{TARGETS}:crash_once_job", {}, max_attempts=2)
+        job = runner.wait(job_id, timeout=60)
+
+        assert job.status == "succeeded" and job.result == {"attempt": 2}
+        messages = [e.message for e in runner.events(job_id)]
+        assert "attempt 1" in messages and "attempt 2" in messages
+        assert any(m.startswith("requeued (worker exited") for m in messages)
+
+    def test_crash_after_max_attempts_fails(self, runner):
+        job_id = runner.submit(f"{TARGETS}:crash_once_job", {}, max_attempts=1)
+        job = runner.wait(job_id, timeout=60)
+        assert job.status == "failed" and job.error == "Worker lost: worker exited"
+
+    def test_stale_heartbeat_with_live_worker_fails_instead_of_requeueing(self, tmp_path):
+        runner = JobRunner(tmp_path / "jobs.sqlite", max_workers=0, heartbeat_timeout=5)
+        job_id = runner.submit(f"{TARGETS}:sync_failing_job", {}, max_attempts=2)
+        # Simulate a hung worker: live pid (ours), heartbeat long ago
+        with runner._connection() as conn:
+            conn.execute("UPDATE jobs SET status = 'running', pid = ?, attempts = 1, heartbeat_at = ? WHERE id = ?",
+                         (os.getpid(), time.time() - 60, job_id))
+        assert runner.recover() == [job_id]
+        job = runner.get(job_id)
+        assert job.status == "failed" and job.error == "Worker lost: heartbeat timed out"
+        assert run_worker(runner.db_path) == 0  # Never handed to a second worker
+
+    def test_blocked_event_loop_keeps_heartbeating(self, tmp_path):
+        runner = JobRunner(tmp_path / "jobs.sqlite", max_workers=1, heartbeat_timeout=1, poll_interval=0.05)
+        job_id = runner.submit(f"{TARGETS}:blocking_job", {"seconds": 3}, max_attempts=2)
+        job = runner.wait(job_id, timeout=60)  # wait() runs recover() on every poll
+
+        assert job.status == "succeeded" and job.attempts == 1
+        assert [e.message for e in runner.events(job_id) if e.kind == "status"] == ["queued", "running", "succeeded"]
+
+    def test_worker_whose_job_was_taken_stops_writing(self, tmp_path):
+        runner = JobRunner(tmp_path / "jobs.sqlite", max_workers=0)
+        marker = tmp_path / "marker.txt"
+        job_id = runner.submit(f"{TARGETS}:taken_away_job", {"db": str(runner.db_path), "marker": str(marker)})
+
+        assert run_worker(runner.db_path, poll_interval=0.05) == 1
+        job = runner.get(job_id)
+        assert marker.read_text() == "True cancelled"  # Writes dropped, then the heartbeat cancelled it
+        assert job.status == "failed" and job.partial is None
+        assert [e.message for e in runner.events(job_id) if e.kind == "progress"] == []
+
+    def test_target_errors(self, tmp_path):
+        runner = JobRunner(tmp_path / "jobs.sqlite", max_workers=0)
+        job_id = runner.submit(f"{TARGETS}:sync_failing_job", {})
+
+        # Run in-process: a failing synchronous target records the exception
+        assert run_worker(runner.db_path, poll_interval=0.05) == 1
+        job = runner.get(job_id)
+        assert job.status == "failed" and job.error.startswith("ValueError: bad params")
+        assert [e.message for e in runner.events(job_id) if e.kind == "progress"] == ["about to fail"]
+
+    def test_invalid_target(self, runner):
+        with pytest.raises(ValueError):
+            runner.submit("tests.unit.test_job_runner.count_job")
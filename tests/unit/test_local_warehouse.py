@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the local USAspending/FEC warehouse.
+
+No network: downloads go through a fake shared session. Ingest/query tests
+need DuckDB and are skipped when it is not installed.
+"""
+
+import os
+import sys
+import time
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import core.local_warehouse as warehouse_module
+from core.local_warehouse import LocalWarehouse, execution_mode
+from integrations.government.usaspending_integration import USASpendingIntegration
+
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self.body), size):
+            yield self.body[i:i + size]
+
+
+class FakeResponse:
+    def __init__(self, status=200, body=b"", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.content = FakeContent(body)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append((url, headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    def install(*responses):
+        session = FakeSession(responses)
+
+        async def fake_shared_session():
+            return session
+
+        monkeypatch.setattr(warehouse_module, "get_shared_session", fake_shared_session)
+        return session
+    return install
+
+
+class TestExecutionMode:
+    def test_query_param_overrides_config(self, monkeypatch):
+        monkeypatch.setattr(warehouse_module.config, "get_database_config", lambda db_id: {"execution_mode": "local"})
+        assert execution_mode("fec", {}) == "local"
+        assert execution_mode("fec", {"execution_mode": "api"}) == "api"
+
+    def test_unknown_mode_falls_back_to_api(self, monkeypatch):
+        monkeypatch.setattr(warehouse_module.config, "get_database_config", lambda db_id: {"execution_mode": "turbo"})
+        assert execution_mode("usaspending", {}) == "api"
+
+
+class TestUsaspendingLocalFilters:
+    def test_or_within_filter_and_across_filters(self):
+        clauses, params = USASpendingIntegration._local_filters({
+            "keywords": ["drone", "uav"],
+            "award_type_codes": ["A", "B"],
+            "agencies": [{"type": "awarding", "tier": "toptier", "name": "Department of Defense"}],
+            "recipient_search_text": ["Anduril"],
+        })
+
+        assert len(clauses) == 4
+        assert clauses[0].count(") OR (") == 1 and clauses[1] == "award_type_code IN (?, ?)"
+        assert params == ["%drone%"] * 3 + ["%uav%"] * 3 + ["A", "B", "Department of Defense", "%Anduril%"]
+
+    def test_open_ended_time_period(self):
+        clauses, params = USASpendingIntegration._local_filters({"time_period": [{"start_date": "2020-10-01"}]})
+        assert clauses == ["(action_date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE))"]
+        assert params == ["2020-10-01", "2999-12-31"]
+
+
+class TestArchives:
+    def test_zip_prefers_top_level_members(self, tmp_path):
+        archive = tmp_path / "indiv24.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("itcont.txt", "a|b\n")
+            zf.writestr("by_date/itcont_2024_01.txt", "a|b\n")
+            zf.writestr("README.md", "notes")
+
+        files = LocalWarehouse._data_files(archive, tmp_path / "extract")
+        assert [f.name for f in files] == ["itcont.txt"]
+        assert files[0].exists()
+
+    def test_newer_full_archive_replaces_older(self, tmp_path):
+        warehouse = LocalWarehouse(root=tmp_path)
+        dataset_dir = warehouse.dataset_dir("usaspending_awards")
+        dataset_dir.mkdir(parents=True)
+        for stem in ("FY2024_All_Contracts_Full_20240906", "FY2024_All_Contracts_Full_20241008",
+                     "FY2023_All_Contracts_Full_20240906", "FY(All)_All_Contracts_Delta_20241008"):
+            (dataset_dir / f"{stem}.parquet").write_bytes(b"")
+            warehouse.manifest["files"][f"usaspending_awards/{stem}"] = {}
+
+        replaced = warehouse._replace_older_full_archives("usaspending_awards", "FY2024_All_Contracts_Full_20241008")
+
+        assert replaced == ["FY2024_All_Contracts_Full_20240906"]
+        assert sorted(p.stem for p in dataset_dir.glob("*.parquet")) == [
+            "FY(All)_All_Contracts_Delta_20241008",
+            "FY2023_All_Contracts_Full_20240906",
+            "FY2024_All_Contracts_Full_20241008",
+        ]
+        assert "usaspending_awards/FY2024_All_Contracts_Full_20240906" not in warehouse.manifest["files"]
+
+    def test_prune_raw_keeps_recent_and_failed_archives(self, tmp_path):
+        warehouse = LocalWarehouse(root=tmp_path)
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir()
+        for name in ("cm22.zip", "cm24.zip", "failed.zip", "stale.zip.part"):
+            (raw_dir / name).write_bytes(b"zip")
+        for name in ("cm22.zip", "cm24.zip"):
+            warehouse.manifest["files"][f"fec_committees/{name[:4]}"] = {"source": str(raw_dir / name)}
+        old = time.time() - 40 * 86400
+        for name in ("cm22.zip", "failed.zip", "stale.zip.part"):
+            os.utime(raw_dir / name, (old, old))
+
+        assert sorted(warehouse.prune_raw(30)) == ["cm22.zip", "stale.zip.part"]
+        assert sorted(p.name for p in raw_dir.iterdir()) == ["cm24.zip", "failed.zip"]
+
+
+class TestDownload:
+    URL = "https://www.fec.gov/files/bulk-downloads/2024/cm24.zip"
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_stored_validators(self, tmp_path, fake_session):
+        session = fake_session(
+            FakeResponse(body=b"zipbytes", headers={"ETag": '"v1"', "Last-Modified": "Tue, 01 Oct 2024 00:00:00 GMT"}),
+            FakeResponse(status=304),
+        )
+        warehouse = LocalWarehouse(root=tmp_path)
+
+        path = await warehouse._download({"url": self.URL, "dataset": "fec_committees"})
+        again = await warehouse._download({"url": self.URL, "dataset": "fec_committees"})
+
+        assert path.read_bytes() == b"zipbytes" and path.name == "cm24.zip"
+        assert again is None
+        assert session.requests[1][1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Tue, 01 Oct 2024 00:00:00 GMT"}
+        # Validators survive a restart via the manifest
+        assert LocalWarehouse(root=tmp_path).manifest["downloads"][self.URL]["etag"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_known_version_is_not_requested(self, tmp_path, fake_session):
+        session = fake_session(FakeResponse(body=b"month"))
+        warehouse = LocalWarehouse(root=tmp_path)
+        source = {"url": "https://files.usaspending.gov/FY2024_All_Contracts_Delta_20241008.zip",
+                  "dataset": "usaspending_awards", "version": "2024-10-08"}
+
+        assert await warehouse._download(source) is not None
+        assert await warehouse._download(source) is None
+        assert len(session.requests) == 1
+
+
+class TestIngestAndQuery:
+    @pytest.fixture(autouse=True)
+    def require_duckdb(self):
+        pytest.importorskip("duckdb")
+
+    def _write_awards(self, path, rows):
+        header = ("contract_transaction_unique_key,contract_award_unique_key,award_id_piid,"
+                  "federal_action_obligation,action_date,awarding_agency_name,recipient_name,"
+                  "transaction_description,correction_delete_ind\n")
+        path.write_text(header + "".join(",".join(row) + "\n" for row in rows))
+
+    def test_latest_archive_wins_and_deletes_hide_rows(self, tmp_path):
+        warehouse = LocalWarehouse(root=tmp_path)
+        full = tmp_path / "FY2024_All_Contracts_Full_20240906.csv"
+        delta = tmp_path / "FY(All)_All_Contracts_Delta_20241008.csv"
+        self._write_awards(full, [
+            ("T1", "A1", "P1", "100.0", "2024-01-15", "Department of Defense", "ACME", "drones", ""),
+            ("T2", "A2", "P2", "50.0", "2024-02-01", "Department of Energy", "Beta", "labs", ""),
+        ])
+        self._write_awards(delta, [
+            ("T1", "A1", "P1", "150.0", "2024-01-15", "Department of Defense", "ACME", "drones", ""),
+            ("T2", "A2", "P2", "", "", "", "", "", "D"),
+        ])
+
+        assert warehouse.ingest_file(full, "usaspending_awards").rows == 2
+        warehouse.ingest_file(delta, "usaspending_awards")
+
+        rows = warehouse.query("SELECT txn_key, amount, action_date FROM usaspending_awards")
+        assert rows == [{"txn_key": "T1", "amount": 150.0, "action_date": "2024-01-15"}]
+        assert warehouse.has_data("usaspending_awards")
+
+    def test_reingesting_an_older_archive_keeps_newer_rows(self, tmp_path):
+        warehouse = LocalWarehouse(root=tmp_path)
+        full = tmp_path / "FY2024_All_Contracts_Full_20240906.csv"
+        delta = tmp_path / "FY(All)_All_Contracts_Delta_20241008.csv"
+        self._write_awards(full, [("T1", "A1", "P1", "100.0", "2024-01-15", "DoD", "ACME", "drones", "")])
+        self._write_awards(delta, [("T1", "A1", "P1", "150.0", "2024-01-15", "DoD", "ACME", "drones", "")])
+
+        warehouse.ingest_file(delta, "usaspending_awards")
+        warehouse.ingest_file(full, "usaspending_awards")  # Older archive, ingested last
+
+        assert warehouse.query("SELECT amount FROM usaspending_awards") == [{"amount": 150.0}]
+
+    def test_row_modification_date_beats_archive_date(self, tmp_path):
+        warehouse = LocalWarehouse(root=tmp_path)
+        header = "contract_transaction_unique_key,federal_action_obligation,last_modified_date\n"
+        newer = tmp_path / "FY2024_All_Contracts_Full_20240906.csv"
+        older = tmp_path / "FY2024_All_Contracts_Delta_20241008.csv"
+        newer.write_text(header + "T1,300.0,2024-09-01 10:00:00.123+00\n")
+        older.write_text(header + "T1,200.0,2024-08-01 10:00:00.123+00\n")
+
+        warehouse.ingest_file(newer, "usaspending_awards")
+        warehouse.ingest_file(older, "usaspending_awards")
+
+        assert warehouse.query("SELECT amount FROM usaspending_awards") == [{"amount": 300.0}]
+
+    def test_headerless_fec_file_gets_cycle(self, tmp_path):
+        warehouse = LocalWarehouse(root=tmp_path)
+        itcont = tmp_path / "itcont.txt"
+        fields = ["C001", "N", "Q1", "P", "img", "15", "IND", "DOE, JANE", "AUSTIN", "TX", "78701",
+                  "ACME", "ENGINEER", "03152024", "2500", "", "TR1", "1", "", "", "4001"]
+        itcont.write_text("|".join(fields) + "\n")
+
+        warehouse.ingest_file(itcont, "fec_contributions", cycle=2024)
+        rows = warehouse.query("SELECT contributor_name, amount, date, cycle FROM fec_contributions")
+
+        assert rows == [{"contributor_name": "DOE, JANE", "amount": 2500.0, "date": "2024-03-15", "cycle": 2024}]
+        # Datasets with nothing ingested are empty, typed views
+        assert warehouse.query("SELECT COUNT(*) AS n FROM fec_committees") == [{"n": 0}]
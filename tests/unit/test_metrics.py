@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Unit tests for runtime metrics (core.metrics) and the /metrics endpoint.
+
+Fake LLM calls, integration requests, semaphore contention and monitor runs
+go through the real hooks (llm_utils.acompletion, log_request,
+MeteredSemaphore, BooleanMonitor.run); the test then scrapes the endpoint.
+Label values are unique per test because the registry is process-wide.
+"""
+
+import asyncio
+import re
+import sys
+import urllib.error
+import urllib.request
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import llm_utils
+from core import api_request_tracker, metrics
+from monitoring.boolean_monitor import BooleanMonitor
+
+SAMPLE = re.compile(r"^(?P<name>[a-zA-Z_:][a-zA-Z0-9_:]*)(?P<labels>\{.*\})? (?P<value>\S+)$")
+
+
+@pytest.fixture(scope="module")
+def endpoint():
+    server = metrics.start_metrics_server(port=0)
+    yield f"http://127.0.0.1:{server.server_address[1]}/metrics"
+    server.shutdown()
+
+
+def scrape(url, accept=None):
+    request = urllib.request.Request(url, headers={"Accept": accept} if accept else {})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode("utf-8")
+
+
+def samples(text):
+    """{'name{labels}': value} for every sample line."""
+    parsed = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            match = SAMPLE.match(line)
+            assert match, f"Malformed sample line: {line!r}"
+            parsed[match["name"] + (match["labels"] or "")] = float(match["value"])
+    return parsed
+
+
+def unique(prefix):
+    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+
+
+class TestEndpoint:
+    @pytest.mark.asyncio
+    async def test_llm_calls(self, endpoint, monkeypatch):
+        model = unique("fake-model")
+        calls = {"n": 0}
+
+        async def fake_unified(model, messages, **kwargs):
+            calls["n"] += 1
+            if calls["n"] == 3:
+                raise RuntimeError("provider down")
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="{}"))],
+                usage=SimpleNamespace(prompt_tokens=120, completion_tokens=30),
+            )
+
+        monkeypatch.setattr(llm_utils.UnifiedLLM, "acompletion", staticmethod(fake_unified))
+        monkeypatch.setattr(llm_utils.litellm, "completion_cost", lambda completion_response: 0.002)
+        monkeypatch.setitem(llm_utils.MODEL_ROLES, "synthesis", model)
+
+        messages = [{"role": "user", "content": "hi"}]
+        await llm_utils.acompletion_with_role("synthesis", messages, temporal_context=False)
+        await llm_utils.acompletion(model, messages, temporal_context=False)
+        with pytest.raises(RuntimeError):
+            await llm_utils.acompletion(model, messages, temporal_context=False)
+
+        content_type, text = await asyncio.to_thread(scrape, endpoint)
+        assert content_type.startswith("text/plain; version=0.0.4")
+        values = samples(text)
+        assert values[f'osint_llm_requests_total{{model="{model}",role="synthesis",status="success"}}'] == 1
+        assert values[f'osint_llm_requests_total{{model="{model}",role="default",status="success"}}'] == 1
+        assert values[f'osint_llm_requests_total{{model="{model}",role="default",status="error"}}'] == 1
+        assert values[f'osint_llm_tokens_total{{model="{model}",role="synthesis",kind="prompt"}}'] == 120
+        assert values[f'osint_llm_tokens_total{{model="{model}",role="default",kind="completion"}}'] == 30
+        assert values[f'osint_llm_cost_dollars_total{{model="{model}",role="synthesis"}}'] == pytest.approx(0.002)
+        assert values[f'osint_llm_request_duration_seconds_count{{model="{model}",role="default"}}'] == 2
+        assert values[f'osint_llm_request_duration_seconds_bucket{{model="{model}",role="synthesis",le="0.05"}}'] == 1
+
+    @pytest.mark.asyncio
+    async def test_integration_requests(self, endpoint, monkeypatch, tmp_path):
+        monkeypatch.setattr(api_request_tracker, "LOG_FILE", tmp_path / "api_requests.jsonl")
+        api = unique("SAM.gov")
+        for status, ms in [(200, 120), (200, 800), (429, 40), (503, 3000), (0, None)]:
+            api_request_tracker.log_request(api, "https://api.sam.gov/search", status, response_time_ms=ms)
+
+        values = samples((await asyncio.to_thread(scrape, endpoint))[1])
+        assert values[f'osint_integration_requests_total{{api="{api}",status_class="2xx"}}'] == 2
+        assert values[f'osint_integration_requests_total{{api="{api}",status_class="4xx"}}'] == 1
+        assert values[f'osint_integration_requests_total{{api="{api}",status_class="5xx"}}'] == 1
+        assert values[f'osint_integration_requests_total{{api="{api}",status_class="error"}}'] == 1
+        assert values[f'osint_integration_rate_limited_total{{api="{api}"}}'] == 1
+        assert values[f'osint_integration_request_duration_seconds_count{{api="{api}"}}'] == 4
+        assert values[f'osint_integration_request_duration_seconds_bucket{{api="{api}",le="0.25"}}'] == 2
+        assert values[f'osint_integration_request_duration_seconds_bucket{{api="{api}",le="+Inf"}}'] == 4
+        assert values[f'osint_integration_request_duration_seconds_sum{{api="{api}"}}'] == pytest.approx(3.96)
+
+    @pytest.mark.asyncio
+    async def test_semaphore_queue_depth(self, endpoint):
+        name = unique("sub_goals")
+        semaphore = metrics.MeteredSemaphore(1, name=name)
+        release = asyncio.Event()
+
+        async def worker():
+            async with semaphore:
+                await release.wait()
+
+        tasks = [asyncio.create_task(worker()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        busy = samples((await asyncio.to_thread(scrape, endpoint))[1])
+        release.set()
+        await asyncio.gather(*tasks)
+        idle = samples((await asyncio.to_thread(scrape, endpoint))[1])
+
+        assert busy[f'osint_semaphore_waiting{{name="{name}"}}'] == 2
+        assert busy[f'osint_semaphore_in_use{{name="{name}"}}'] == 1
+        assert idle[f'osint_semaphore_waiting{{name="{name}"}}'] == 0
+        assert idle[f'osint_semaphore_in_use{{name="{name}"}}'] == 0
+        assert idle[f'osint_semaphore_wait_seconds_count{{name="{name}"}}'] == 2
+
+    @pytest.mark.asyncio
+    async def test_monitor_runs(self, endpoint, tmp_path, monkeypatch):
+        name = unique("Palantir contracts")
+        path = tmp_path / "monitor.yaml"
+        path.write_text(yaml.safe_dump({
+            "name": name, "keywords": ["Palantir"], "sources": ["dvids"],
+            "schedule": "daily_6am", "alert_email": "alerts@example.com",
+        }))
+        monitor = BooleanMonitor(str(path))
+        monkeypatch.setattr(monitor, "_save_results", lambda results: None)
+
+        async def no_results(keywords):
+            return []
+
+        async def broken(keywords):
+            raise RuntimeError("source down")
+
+        monkeypatch.setattr(monitor, "execute_search", no_results)
+        await monitor.run()
+        monkeypatch.setattr(monitor, "execute_search", broken)
+        with pytest.raises(RuntimeError):
+            await monitor.run()
+
+        values = samples((await asyncio.to_thread(scrape, endpoint))[1])
+        labels = f'monitor="{name}"'
+        assert values[f'osint_monitor_runs_total{{{labels},status="success"}}'] == 1
+        assert values[f'osint_monitor_runs_total{{{labels},status="failed"}}'] == 1
+        assert values[f'osint_monitor_run_duration_seconds_count{{{labels},status="success"}}'] == 1
+        assert values[f'osint_monitor_last_run_timestamp_seconds{{{labels}}}'] > 0
+
+    def test_openmetrics_negotiation_and_404(self, endpoint):
+        metrics.record_integration_request(unique("dvids"), 200, 0.1)
+        content_type, text = scrape(endpoint, accept="application/openmetrics-text; version=1.0.0")
+        assert content_type.startswith("application/openmetrics-text")
+        assert text.endswith("# EOF\n")
+        assert "# TYPE osint_integration_requests counter" in text
+        samples(text.replace("# EOF\n", ""))
+
+        with pytest.raises(urllib.error.HTTPError) as error:
+            scrape(endpoint.replace("/metrics", "/other"))
+        assert error.value.code == 404
+
+
+class TestRegistry:
+    def test_label_values_are_escaped(self):
+        registry = metrics.MetricsRegistry()
+        counter = registry.counter("test_total", "Test.", ("query",))
+        counter.inc(query='say "hi"\\n')
+        assert 'test_total{query="say \\"hi\\"\\\\n"} 1' in registry.render()
+
+    def test_wrong_labels_and_negative_increments_raise(self):
+        registry = metrics.MetricsRegistry()
+        counter = registry.counter("test_total", "Test.", ("api",))
+        with pytest.raises(ValueError):
+            counter.inc(source="sam")
+        with pytest.raises(ValueError):
+            counter.inc(-1, api="sam")
+        with pytest.raises(ValueError):
+            registry.counter("test_total", "Duplicate.")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Unit tests for cross-monitor search coalescing and staggered window scheduling.
+
+No network: monitors search through a counting fake of _search_single_source.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.database_integration_base import QueryResult
+from monitoring.boolean_monitor import BooleanMonitor
+from monitoring.scheduler import MonitorScheduler
+from monitoring.search_coalescer import SearchCoalescer, normalize_keyword
+
+
+@pytest.fixture
+def make_monitor(tmp_path):
+    def make(name, keywords, sources=("dvids",), schedule="daily_6am"):
+        path = tmp_path / f"{name}.yaml"
+        path.write_text(yaml.safe_dump({
+            "name": name, "keywords": list(keywords), "sources": list(sources),
+            "schedule": schedule, "alert_email": "alerts@example.com",
+        }))
+        return BooleanMonitor(str(path))
+    return make
+
+
+class CountingSearch:
+    """Fake per-source search recording calls and peak concurrency per source."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = {}
+        self.peak = {}
+
+    async def __call__(self, source, keyword):
+        self.calls.append((source, keyword))
+        self.in_flight[source] = self.in_flight.get(source, 0) + 1
+        self.peak[source] = max(self.peak.get(source, 0), self.in_flight[source])
+        await asyncio.sleep(self.delay)
+        self.in_flight[source] -= 1
+        return [{"title": f"{source}:{keyword}", "url": f"https://example.gov/{source}/{len(self.calls)}", "keyword": keyword}]
+
+
+class TestSearchCoalescer:
+    def test_normalize_keyword(self):
+        assert normalize_keyword("  FISA   Section 702 ") == normalize_keyword("fisa section 702")
+
+    @pytest.mark.asyncio
+    async def test_identical_searches_run_once_and_fan_out(self):
+        coalescer = SearchCoalescer()
+        search = CountingSearch()
+
+        first, second = await asyncio.gather(
+            coalescer.search("dvids", "FISA 702", search),
+            coalescer.search("dvids", "fisa  702", search),
+        )
+        third = await coalescer.search("dvids", "FISA 702", search)
+
+        assert search.calls == [("dvids", "FISA 702")]
+        assert first[0]["keyword"] == "FISA 702" and second[0]["keyword"] == "fisa  702"
+        assert first[0]["url"] == second[0]["url"] == third[0]["url"]
+        assert coalescer.stats == {"executed": 1, "coalesced": 2}
+
+    @pytest.mark.asyncio
+    async def test_per_source_cap(self):
+        coalescer = SearchCoalescer(max_concurrent_per_source=2)
+        search = CountingSearch()
+
+        await asyncio.gather(*(coalescer.search("sam", f"kw{i}", search) for i in range(6)),
+                             *(coalescer.search("dvids", f"kw{i}", search) for i in range(3)))
+
+        assert search.peak == {"sam": 2, "dvids": 2}
+        assert len(search.calls) == 9
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_retried_and_expired_results_rerun(self):
+        coalescer = SearchCoalescer(ttl_seconds=0.05)
+        attempts = []
+
+        async def flaky(source, keyword):
+            attempts.append(keyword)
+            if len(attempts) == 1:
+                raise RuntimeError("source down")
+            return [{"title": "t", "url": "https://example.gov/1"}]
+
+        with pytest.raises(RuntimeError):
+            await coalescer.search("sam", "drones", flaky)
+        assert await coalescer.search("sam", "drones", flaky)
+        assert len(attempts) == 2
+
+        await asyncio.sleep(0.06)
+        await coalescer.search("sam", "drones", flaky)
+        assert len(attempts) == 3
+
+
+class FakeIntegration:
+    """Fake DatabaseIntegration whose execute_search() reports through a CountingSearch."""
+
+    def __init__(self, source, search, success=True):
+        self.source = source
+        self.search = search
+        self.success = success
+
+    async def execute_search(self, query_params, api_key=None, limit=10):
+        results = await self.search(self.source, query_params["q"])
+        return QueryResult(success=self.success, source=self.source, total=len(results), results=results,
+                           query_params=query_params)
+
+
+class TestAdaptiveSearchesShareSlots:
+    @pytest.mark.asyncio
+    async def test_throttled_integration_counts_against_the_source_cap(self):
+        coalescer = SearchCoalescer(max_concurrent_per_source=2)
+        search = CountingSearch()
+        sam = coalescer.throttle("sam", FakeIntegration("sam", search))
+
+        await asyncio.gather(*(coalescer.search("sam", f"kw{i}", search) for i in range(3)),
+                             *(sam.execute_search({"q": f"adaptive{i}"}) for i in range(3)))
+
+        assert search.peak == {"sam": 2}
+        assert len(search.calls) == 6
+        assert sam.source == "sam"
+
+    @pytest.mark.asyncio
+    async def test_identical_params_are_shared_unless_unsuccessful(self):
+        coalescer = SearchCoalescer()
+        search = CountingSearch()
+        sam = coalescer.throttle("sam", FakeIntegration("sam", search))
+
+        first, second = await asyncio.gather(sam.execute_search({"q": "drones"}),
+                                             sam.execute_search({"q": "drones"}))
+        first.results[0]["title"] = "annotated"
+        assert second.results[0]["title"] == "sam:drones"
+        assert len(search.calls) == 1
+
+        failing = coalescer.throttle("dvids", FakeIntegration("dvids", search, success=False))
+        await failing.execute_search({"q": "drones"})
+        await failing.execute_search({"q": "drones"})
+        assert len(search.calls) == 3
+
+
+class TestMonitorsShareSearches:
+    @pytest.mark.asyncio
+    async def test_overlapping_keywords_are_searched_once(self, make_monitor, monkeypatch):
+        search = CountingSearch()
+        monkeypatch.setattr(BooleanMonitor, "_search_single_source", lambda self, source, keyword: search(source, keyword))
+        coalescer = SearchCoalescer()
+        a = make_monitor("A", ["FISA 702", "surveillance"], sources=["dvids", "sam"])
+        b = make_monitor("B", ["fisa 702", "wiretap"], sources=["dvids"])
+        a.search_coalescer = b.search_coalescer = coalescer
+
+        results_a, results_b = await asyncio.gather(a.execute_search(a.config.keywords),
+                                                    b.execute_search(b.config.keywords))
+
+        assert sorted(search.calls) == sorted([
+            ("dvids", "FISA 702"), ("dvids", "surveillance"), ("sam", "FISA 702"),
+            ("sam", "surveillance"), ("dvids", "wiretap"),
+        ])
+        assert {r["keyword"] for r in results_b} == {"fisa 702", "wiretap"}
+        assert len(results_a) == 4 and len(results_b) == 2
+
+
+class TestStaggering:
+    def test_offsets_follow_new_search_load(self, make_monitor):
+        scheduler = MonitorScheduler()
+        monitors = [
+            make_monitor("A", ["k1", "k2", "k3"]),
+            make_monitor("B", ["K1", "k2"]),          # fully covered by A
+            make_monitor("C", ["k4"]),
+        ]
+
+        offsets = scheduler._stagger_offsets(monitors, window_seconds=400)
+
+        # A owns 3/4 of the window, C the last quarter; B piggybacks on A's searches
+        assert 0 <= offsets[0] <= 150
+        assert offsets[1] == pytest.approx(300)
+        assert 300 <= offsets[2] <= 350
+        assert scheduler._stagger_offsets(monitors, window_seconds=0) == [0.0, 0.0, 0.0]
+
+    def test_same_schedule_shares_one_window_job(self, make_monitor, tmp_path):
+        scheduler = MonitorScheduler()
+        for name, schedule in [("A", "daily_6am"), ("B", "daily_6am"), ("C", "hourly"), ("D", "manual")]:
+            make_monitor(name, ["k"], schedule=schedule)
+            scheduler.add_monitor(str(tmp_path / f"{name}.yaml"))
+
+        assert len(scheduler.monitors) == 4
+        assert {k: [m.config.name for m in v] for k, v in scheduler.windows.items()} == {
+            "daily_6am": ["A", "B"], "hourly": ["C"],
+        }
+        assert sorted(job.id for job in scheduler.scheduler.get_jobs()) == ["window_daily_6am", "window_hourly"]
+        assert all(m.search_coalescer is scheduler.coalescer for m in scheduler.monitors)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DatabaseIntegration.iter_results() and per-source page cursors.
+
+No network: a fake paginated integration serves pages from memory, and the
+government integrations' next_page_cursor() is checked against canned metadata.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.database_integration_base import (
+    DatabaseCategory,
+    DatabaseIntegration,
+    DatabaseMetadata,
+    PageFetchError,
+    QueryResult,
+)
+from integrations.government.govinfo_integration import GovInfoIntegration
+from integrations.government.sam_integration import SAMIntegration
+from integrations.government.usaspending_integration import USASpendingIntegration
+from integrations.nonprofit.propublica_integration import ProPublicaIntegration
+
+
+class FakePagedIntegration(DatabaseIntegration):
+    """Serves `total` numbered results in pages; optionally fails on one page."""
+
+    PAGINATION_PARAM = "page"
+
+    def __init__(self, total=10, delay=0.02, fail_page=None):
+        self.total = total
+        self.delay = delay
+        self.fail_page = fail_page
+        self.requested = []
+        self.events = []
+
+    @property
+    def metadata(self) -> DatabaseMetadata:
+        return DatabaseMetadata(
+            name="Fake", id="fake", category=DatabaseCategory.GENERAL,
+            requires_api_key=False, cost_per_query_estimate=0,
+            typical_response_time=0, rate_limit_daily=None, description="fake",
+        )
+
+    async def is_relevant(self, research_question):
+        return True
+
+    async def generate_query(self, research_question):
+        return {"q": research_question}
+
+    async def execute_search(self, query_params, api_key=None, limit=10):
+        page = query_params.get("page", 1)
+        self.requested.append(page)
+        self.events.append(("request", page))
+        await asyncio.sleep(self.delay)
+        if page == self.fail_page:
+            return QueryResult(False, "Fake", 0, [], query_params, error="HTTP 500")
+        start = (page - 1) * limit
+        items = [
+            {"title": f"r{i}", "url": f"https://example.gov/{i}", "snippet": ""}
+            for i in range(start, min(start + limit, self.total))
+        ]
+        return QueryResult(True, "Fake", self.total, items, query_params, metadata={"page": page, "limit": limit})
+
+    def next_page_cursor(self, result, query_params):
+        page = result.metadata["page"]
+        return page + 1 if page * result.metadata["limit"] < self.total else None
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+class TestIterResults:
+    @pytest.mark.asyncio
+    async def test_walks_all_pages_in_order(self):
+        source = FakePagedIntegration(total=10)
+        items = await _collect(source.iter_results({"q": "x"}, page_size=4))
+
+        assert [i["title"] for i in items] == [f"r{n}" for n in range(10)]
+        assert source.requested == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_next_page_is_fetched_while_consumer_works(self):
+        source = FakePagedIntegration(total=8, delay=0.1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        async for item in source.iter_results({}, page_size=4):
+            if item["title"] == "r0":
+                await asyncio.sleep(0.1)  # consumer processing page 1
+                assert source.requested == [1, 2]
+
+        # Page 2's request overlapped the consumer's work: ~0.2s, not ~0.3s
+        assert loop.time() - start < 0.28
+
+    @pytest.mark.asyncio
+    async def test_max_results_and_start_cursor(self):
+        source = FakePagedIntegration(total=20)
+        items = await _collect(source.iter_results({}, page_size=4, max_results=6, start_cursor=3))
+
+        assert [i["title"] for i in items] == ["r8", "r9", "r10", "r11", "r12", "r13"]
+        assert source.requested == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_max_pages_limits_requests(self):
+        source = FakePagedIntegration(total=20)
+        items = await _collect(source.iter_results({}, page_size=4, max_pages=2))
+
+        assert len(items) == 8 and source.requested == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failed_page_raises_after_earlier_results(self):
+        source = FakePagedIntegration(total=20, fail_page=2)
+        seen = []
+
+        with pytest.raises(PageFetchError) as excinfo:
+            async for item in source.iter_results({}, page_size=4):
+                seen.append(item)
+
+        assert len(seen) == 4
+        assert excinfo.value.result.error == "HTTP 500"
+
+    @pytest.mark.asyncio
+    async def test_early_close_cancels_prefetch(self):
+        source = FakePagedIntegration(total=20, delay=0.05)
+        completed = []
+        original = source.execute_search
+
+        async def tracking_search(query_params, api_key=None, limit=10):
+            result = await original(query_params, api_key, limit)
+            completed.append(query_params.get("page", 1))
+            return result
+
+        source.execute_search = tracking_search
+        pages = source.iter_results({}, page_size=4)
+
+        await pages.__anext__()
+        await asyncio.sleep(0.01)
+        await pages.aclose()
+        await asyncio.sleep(0.1)
+
+        assert source.requested == [1, 2]
+        assert completed == [1]
+
+
+class TestSourceCursors:
+    def _result(self, metadata, total=0, count=1):
+        items = [{"title": "t", "url": "https://example.gov", "snippet": ""}] * count
+        return QueryResult(True, "src", total, items, {}, metadata=metadata, validate=False)
+
+    def test_usaspending_follows_has_next(self):
+        source = USASpendingIntegration()
+        assert source.next_page_cursor(self._result({"page_metadata": {"page": 2, "hasNext": True}}), {"page": 2}) == 3
+        assert source.next_page_cursor(self._result({"page_metadata": {"page": 3, "hasNext": False}}), {"page": 3}) is None
+
+    def test_propublica_stops_at_last_page(self):
+        source = ProPublicaIntegration()
+        assert source.next_page_cursor(self._result({"page": 0, "num_pages": 2}), {}) == 1
+        assert source.next_page_cursor(self._result({"page": 1, "num_pages": 2}), {}) is None
+
+    def test_sam_pages_until_total_records(self):
+        source = SAMIntegration()
+        assert source.next_page_cursor(self._result({"offset": 0, "page_size": 10}, total=25), {}) == 1
+        assert source.next_page_cursor(self._result({"offset": 2, "page_size": 10}, total=25), {}) is None
+
+    def test_govinfo_offset_mark_from_next_page_link(self):
+        source = GovInfoIntegration()
+        mark = source._offset_mark_from_url("https://api.govinfo.gov/collections/GAOREPORTS/2020?offsetMark=AoJ%2Bx&pageSize=10")
+        assert mark == "AoJ+x"
+        assert source.next_page_cursor(self._result({"next_offset_mark": mark}), {"offset_mark": "*"}) == mark
+        # A repeated mark means the API has no further pages
+        assert source.next_page_cursor(self._result({"next_offset_mark": mark}), {"offset_mark": mark}) is None
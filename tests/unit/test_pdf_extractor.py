@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Unit tests for PDF download streaming, content-hash text cache and LRU eviction.
+
+PyMuPDF is not required: page extraction is replaced with a counting fake so
+the tests exercise caching and page-range logic only.
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import core.pdf_extractor as pdf_module
+from core.pdf_extractor import PDFExtractor
+
+TOTAL_PAGES = 6
+
+
+@pytest.fixture
+def extracted_calls(monkeypatch):
+    """Replace PyMuPDF page extraction; records every page list requested."""
+    calls = []
+
+    def fake_extract_pages(pdf_path, page_numbers):
+        calls.append(list(page_numbers))
+        return {p: f"text of page {p}" for p in page_numbers if 1 <= p <= TOTAL_PAGES}, TOTAL_PAGES
+
+    monkeypatch.setattr(pdf_module, "_extract_pages", fake_extract_pages)
+    return calls
+
+
+class FakeContent:
+    def __init__(self, body: bytes, chunk: int):
+        self.body = body
+        self.chunk = chunk
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self.body), self.chunk):
+            yield self.body[i:i + self.chunk]
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, headers=None):
+        self.status = 200
+        self.headers = headers or {"Content-Type": "application/pdf"}
+        self.content = FakeContent(body, 1024)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        return FakeResponse(self.body)
+
+
+class TestTextCache:
+    @pytest.mark.asyncio
+    async def test_same_content_is_extracted_once(self, tmp_path, extracted_calls):
+        extractor = PDFExtractor(cache_dir=tmp_path)
+        a, b = tmp_path / "a.pdf", tmp_path / "b.pdf"
+        a.write_bytes(b"%PDF-1.4 same bytes")
+        b.write_bytes(b"%PDF-1.4 same bytes")
+
+        text_a, info_a = await extractor.extract_pages(a)
+        text_b, info_b = await extractor.extract_pages(b)
+
+        assert len(extracted_calls) == 1
+        assert text_a == text_b
+        assert text_a.startswith("[Page 1]\ntext of page 1")
+        assert info_a["text_cached"] is False and info_b["text_cached"] is True
+        assert info_b["page_count"] == TOTAL_PAGES and info_b["total_pages"] == TOTAL_PAGES
+
+    @pytest.mark.asyncio
+    async def test_page_ranges_extract_only_missing_pages(self, tmp_path, extracted_calls):
+        extractor = PDFExtractor(cache_dir=tmp_path)
+        pdf = tmp_path / "doc.pdf"
+        pdf.write_bytes(b"%PDF-1.4 doc")
+
+        await extractor.extract_pages(pdf, pages=(1, 3))
+        text, info = await extractor.extract_pages(pdf, pages=(2, 5))
+
+        assert extracted_calls == [[1, 2, 3], [4, 5]]
+        assert text.startswith("[Page 2]") and "[Page 5]" in text and "[Page 1]" not in text
+        assert info["page_count"] == 4
+
+        # Range past the end is clamped to the document
+        _, info = await extractor.extract_pages(pdf, pages=(5, 50))
+        assert info["page_count"] == 2 and len(extracted_calls) == 3
+
+
+class TestStreamingDownload:
+    @pytest.mark.asyncio
+    async def test_download_streams_and_reuses_cache(self, tmp_path, monkeypatch, extracted_calls):
+        session = FakeSession(b"%PDF" + b"x" * 5000)
+
+        async def fake_shared_session():
+            return session
+
+        monkeypatch.setattr(pdf_module, "get_shared_session", fake_shared_session)
+        extractor = PDFExtractor(cache_dir=tmp_path)
+
+        text, meta = await extractor.extract_from_url("https://vault.fbi.gov/doc.pdf", pages=(1, 2))
+        _, meta_again = await extractor.extract_from_url("https://vault.fbi.gov/doc.pdf", pages=(1, 2))
+
+        assert meta["success"] and meta["page_range"] == [1, 2]
+        assert session.requests == 1
+        assert meta_again["cached"] and meta_again["text_cached"]
+
+    @pytest.mark.asyncio
+    async def test_oversized_body_is_abandoned(self, tmp_path, monkeypatch):
+        session = FakeSession(b"x" * 300_000)
+
+        async def fake_shared_session():
+            return session
+
+        monkeypatch.setattr(pdf_module, "get_shared_session", fake_shared_session)
+        extractor = PDFExtractor(cache_dir=tmp_path, max_size_mb=0.1)
+
+        assert await extractor.download_pdf("https://example.gov/big.pdf") is None
+        assert not list(tmp_path.glob("*.pdf")) and not list(tmp_path.glob("*.part"))
+
+
+class TestEviction:
+    def test_evicts_least_recently_used_until_under_limit(self, tmp_path):
+        extractor = PDFExtractor(cache_dir=tmp_path)
+        now = time.time()
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"{i}.pdf"
+            path.write_bytes(b"x" * 1000)
+            os.utime(path, (now - 100 + i, now - 100 + i))
+            paths.append(path)
+        os.utime(paths[0], (now, now))  # most recently used
+
+        stats = extractor.clear_cache(None, max_bytes=2500)
+
+        assert stats["deleted"] == 2
+        assert [p.exists() for p in paths] == [True, False, False, True]
+        assert stats["remaining_bytes"] == 2000
+
+    def test_positional_argument_is_age_in_days(self, tmp_path):
+        extractor = PDFExtractor(cache_dir=tmp_path)
+        old, fresh = tmp_path / "old.pdf", tmp_path / "fresh.pdf"
+        for path in (old, fresh):
+            path.write_bytes(b"x" * 1000)
+        ten_days_ago = time.time() - 10 * 24 * 60 * 60
+        os.utime(old, (ten_days_ago, ten_days_ago))
+
+        stats = extractor.clear_cache(7)
+
+        assert stats["deleted"] == 1 and not old.exists() and fresh.exists()
+
+    @pytest.mark.asyncio
+    async def test_downloads_scan_only_when_over_budget(self, tmp_path, monkeypatch):
+        session = FakeSession(b"%PDF" + b"x" * 1000)
+
+        async def fake_shared_session():
+            return session
+
+        monkeypatch.setattr(pdf_module, "get_shared_session", fake_shared_session)
+        extractor = PDFExtractor(cache_dir=tmp_path, max_cache_mb=2500 / 1024 / 1024)
+        scans = []
+        scan = extractor._cache_entries
+        monkeypatch.setattr(extractor, "_cache_entries", lambda: scans.append(1) or scan())
+
+        await extractor.download_pdf("https://example.gov/1.pdf")  # Seeds the tracked total
+        await extractor.download_pdf("https://example.gov/2.pdf")
+        assert len(scans) == 1 and extractor._cache_bytes == 2008
+
+        await extractor.download_pdf("https://example.gov/3.pdf")  # Over budget: evict LRU
+        assert len(scans) == 2 and extractor._cache_bytes == 2008
+        assert len(list(tmp_path.glob("*.pdf"))) == 2
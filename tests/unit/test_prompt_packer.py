@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Unit tests for token-budget prompt packing (core.prompt_packer) and its use
+in RecursiveResearchAgent synthesis, result filtering and decomposition.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import llm_utils
+from core import prompt_packer
+from core.database_integration_base import Evidence
+from core.prompt_packer import PackItem, PromptPacker, TokenCounter, count_tokens, prompt_budget
+from research.recursive_agent import Constraints, GoalContext, GoalResult, GoalStatus, RecursiveResearchAgent
+
+ADVERSARIAL = {
+    "huge_titles": [PackItem(title="Palantir " * 5000, body="award " * 200) for _ in range(5)],
+    "cjk": [PackItem(title=f"合同 {i}", body="国防部授予合同" * 400) for i in range(20)],
+    "whitespace_bombs": [PackItem(title="t" + " " * 20000, body="\n" * 50000 + "x" * 3) for _ in range(10)],
+    "symbol_noise": [PackItem(title="#$%^" * 100, body="".join(chr(33 + (i * 7) % 90) for i in range(9000)))],
+    "many_items": [PackItem(title=f"Result {i}", body="Contract award notice. " * 40, priority=i % 7)
+                   for i in range(2000)],
+    "empty_bodies": [PackItem(title=f"Source {i}") for i in range(300)],
+    "long_words": [PackItem(title="x", body="supercalifragilistic" * 3000)],
+}
+
+
+class TestPromptPacker:
+    @pytest.mark.parametrize("case", sorted(ADVERSARIAL))
+    @pytest.mark.parametrize("budget", [0, 1, 7, 50, 400, 3000])
+    def test_never_exceeds_budget(self, case, budget):
+        packed = PromptPacker(budget).pack(ADVERSARIAL[case])
+        assert packed.tokens == count_tokens(packed.text) <= budget
+        assert len(packed.included) + len(packed.dropped) == len(ADVERSARIAL[case])
+
+    def test_included_items_keep_their_titles(self):
+        items = [PackItem(title=f"[sam] Award {i}", body="Contract text. " * 300) for i in range(10)]
+        packed = PromptPacker(1000).pack(items)
+        assert len(packed.included) == 10
+        assert all(item.title in packed.text for item in packed.included)
+
+    def test_budget_is_spread_evenly_over_bodies(self):
+        items = [PackItem(title="short", body="tiny body")] + [
+            PackItem(title=f"long {i}", body="word " * 2000) for i in range(4)
+        ]
+        packed = PromptPacker(1200).pack(items)
+        sections = packed.text.split("\n\n")
+        assert sections[0] == "short\ntiny body"  # short bodies are kept whole
+        long_tokens = [count_tokens(s) for s in sections[1:]]
+        assert max(long_tokens) - min(long_tokens) <= 3
+        assert packed.tokens > 1100  # leftover from the short item went to the long ones
+
+    def test_low_priority_items_are_dropped_first(self):
+        items = [PackItem(title=f"item {i}", body="body " * 100, priority=i, key=i) for i in range(50)]
+        packed = PromptPacker(300).pack(items)
+        kept = [item.key for item in packed.included]
+        assert kept == sorted(kept, reverse=True) and kept[0] == 49
+        assert min(kept) > max(item.key for item in packed.dropped)
+
+    def test_keep_order_emits_input_order(self):
+        items = [PackItem(title=f"item {i}", priority=-i if i % 2 else i, key=i) for i in range(10)]
+        kept = [item.key for item in PromptPacker(1000, keep_order=True).pack(items).included]
+        assert kept == list(range(10))
+
+    def test_heuristic_counter_truncates_to_exact_budget(self):
+        counter = TokenCounter()
+        text = "Palantir Technologies won 12345 contracts " * 50
+        for n in (1, 10, 99):
+            cut = counter.truncate(text, n)
+            assert counter.count(cut) <= n < counter.count(text[:len(cut) + 1]) + 1
+            assert text.startswith(cut)
+
+
+class TestBudget:
+    def test_budget_is_capped_by_window_and_call_site(self, monkeypatch):
+        monkeypatch.setattr(prompt_packer, "_settings", lambda: {
+            "context_windows": {"small-model": 6000},
+            "reserve_output_tokens": 1000,
+            "max_content_tokens": {"synthesis": 24000, "filter": 2000},
+        })
+        overhead = "instructions " * 400
+        assert prompt_budget("synthesis", "small-model", overhead) == 5000 - count_tokens(overhead)
+        assert prompt_budget("filter", "provider/small-model") == 2000
+        assert prompt_budget("synthesis", "small-model", "x " * 10000) == 0
+
+
+def _evidence(i, size=4000):
+    return Evidence(source_id="sam", title=f"EV-{i:04d} contract award", url=f"https://x.gov/{i}",
+                    snippet=f"Award notice {i}. " * (size // 16), relevance_score=i / 100)
+
+
+class TestAgentCallSites:
+    """Evidence sections in the rendered prompts stay within their budget."""
+
+    BUDGETS = {"synthesis": 1500, "filter": 800, "decomposition": 300}
+
+    @pytest.fixture
+    def agent(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(prompt_packer, "_settings", lambda: {
+            "enabled": True, "max_content_tokens": self.BUDGETS,
+        })
+        self.prompts = []
+
+        async def fake_acompletion(model, messages, **kwargs):
+            prompt = messages[-1]["content"]
+            self.prompts.append(prompt)
+            content = {"synthesis": "final", "confidence": 0.9, "relevant_indices": [0, 1],
+                       "sub_goals": [], "reasoning": "done"}
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(content)))])
+
+        monkeypatch.setattr(llm_utils, "acompletion", fake_acompletion)
+        return RecursiveResearchAgent(constraints=Constraints(), output_dir=tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_synthesis_prompt_fits_budget(self, agent):
+        context = GoalContext(constraints=agent.constraints, original_objective="Palantir contracts")
+        items = [_evidence(i) for i in range(25)]
+        sub_results = [GoalResult(goal="sub", status=GoalStatus.COMPLETED, evidence=items)]
+
+        await agent._synthesize("Find Palantir contracts", sub_results, context)
+
+        prompt = self.prompts[-1]
+        tags = re.findall(r"EV-\d{4}", prompt)
+        assert tags and tags[0] == "EV-0024"  # most relevant first
+        section = prompt[prompt.index("[sam] EV-"):prompt.rindex("Award notice")]
+        assert count_tokens(section) <= self.BUDGETS["synthesis"]
+
+    @pytest.mark.asyncio
+    async def test_filter_keeps_results_it_could_not_show(self, agent):
+        context = GoalContext(constraints=agent.constraints, original_objective="Palantir contracts")
+        evidence = [_evidence(i) for i in range(60)]
+
+        filtered = await agent._filter_results("Find Palantir contracts", evidence, context)
+
+        shown = {int(i) for i in re.findall(r"Result #(\d+):", self.prompts[-1])}
+        assert 2 <= len(shown) < 60
+        assert len(filtered) == 2 + (60 - len(shown))
+        assert all(e.relevance_score == 1.0 for e in filtered[:2])
+
+    @pytest.mark.asyncio
+    async def test_fused_processing_packs_and_keeps_results_it_could_not_show(self, agent):
+        context = GoalContext(constraints=agent.constraints, original_objective="Palantir contracts")
+        evidence = [_evidence(i) for i in range(60)]
+
+        kept, _ = await agent._process_evidence_fused("Find Palantir contracts", evidence, context)
+
+        prompt = self.prompts[-1]
+        shown = {int(i) for i in re.findall(r"Result #(\d+)", prompt)}
+        assert 2 <= len(shown) < 60
+        section = prompt[prompt.index("Result #0"):prompt.rindex("Award notice")]
+        assert count_tokens(section) <= self.BUDGETS["filter"]
+        assert len(kept) == 2 + (60 - len(shown))
+        assert [e.relevance_score for e in kept[:2]] == [1.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_decomposition_sources_and_goals_fit_budget(self, agent):
+        sources = [{"name": f"source_{i}", "description": "Federal data " * 20} for i in range(40)]
+        context = GoalContext(constraints=agent.constraints, original_objective="Palantir contracts",
+                              available_sources=sources, all_goals=[f"goal number {i}" for i in range(100)])
+
+        await agent._decompose("Find Palantir contracts", context)
+
+        prompt = self.prompts[-1]
+        listed = "\n".join(line for line in prompt.splitlines()
+                           if line.startswith("- source_") or line.startswith("  - goal number"))
+        assert "- source_0:" in prompt
+        assert count_tokens(listed) <= self.BUDGETS["decomposition"]
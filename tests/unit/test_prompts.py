@@ -138,6 +138,15 @@ def mock_context():
             }
         ],
         "total_results_accepted": 10,
+        # synthesis_map.j2 / synthesis_reduce.j2 variables
+        "cluster_label": "Test sub-goal",
+        "part": 1,
+        "part_count": 2,
+        "evidence_count": 12,
+        "partials": [
+            {"label": "Test sub-goal", "evidence_count": 12, "confidence": 0.8,
+             "summary": "Test summary", "key_findings": ["Finding 1"]}
+        ],
     }
 
 
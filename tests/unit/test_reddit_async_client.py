@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the native async Reddit client.
+
+Uses an in-memory fake aiohttp session - no network or credentials needed.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.http_client import HttpClientError
+from integrations.social.reddit_async_client import (
+    AsyncRedditClient,
+    RedditRequestBudget,
+    normalize_post,
+)
+
+
+def _post(i: int) -> dict:
+    return {
+        "kind": "t3",
+        "data": {
+            "id": f"p{i}", "title": f"Post {i}", "selftext": "body", "author": "alice",
+            "score": i, "num_comments": 2, "upvote_ratio": 0.9, "subreddit": "OSINT",
+            "permalink": f"/r/OSINT/comments/p{i}/", "url": f"https://example.com/{i}",
+            "created_utc": 1700000000 + i, "is_self": True, "link_flair_text": None,
+        },
+    }
+
+
+def _comment(cid: str, replies=None) -> dict:
+    return {
+        "kind": "t1",
+        "data": {
+            "id": cid, "parent_id": "t3_x", "author": None, "score": 1,
+            "created_utc": 1700000000, "depth": 0, "body": f"comment {cid}",
+            "replies": replies or "",
+        },
+    }
+
+
+class FakeResponse:
+    def __init__(self, status: int, payload, headers=None, delay: float = 0.0):
+        self.status = status
+        self._payload = payload
+        self.headers = headers or {}
+        self._delay = delay
+
+    async def __aenter__(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Routes GET paths to canned payloads and records every call."""
+
+    def __init__(self, routes, delay: float = 0.0):
+        self.routes = routes
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def post(self, url, **kwargs):
+        self.calls.append(("POST", url, kwargs.get("data")))
+        return FakeResponse(200, {"access_token": "tok", "expires_in": 3600})
+
+    def get(self, url, params=None, headers=None):
+        self.calls.append(("GET", url, dict(params or {})))
+        path = url.split("oauth.reddit.com", 1)[1]
+        route = self.routes[path]
+        status, payload, resp_headers = route(params) if callable(route) else route
+        session = self
+
+        class _Tracked(FakeResponse):
+            async def __aenter__(inner):
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight, session.in_flight)
+                try:
+                    return await super().__aenter__()
+                finally:
+                    session.in_flight -= 1
+
+        return _Tracked(status, payload, resp_headers, self.delay)
+
+
+def _client(session, **kwargs) -> AsyncRedditClient:
+    return AsyncRedditClient("id", "secret", "user", "pw", session=session, **kwargs)
+
+
+class TestNormalizePost:
+    def test_fills_defaults(self):
+        post = normalize_post({"id": "a", "title": "t", "permalink": "/r/x/a", "author": None})
+        assert post["author"] == "[deleted]"
+        assert post["score"] == 0
+        assert post["is_self"] is False
+
+
+class TestSearch:
+    @pytest.mark.asyncio
+    async def test_paginates_until_limit(self):
+        pages = {
+            None: {"data": {"children": [_post(i) for i in range(100)], "after": "t3_p99"}},
+            "t3_p99": {"data": {"children": [_post(i) for i in range(100, 200)], "after": "t3_p199"}},
+        }
+        session = FakeSession({"/r/OSINT+natsec/search": lambda p: (200, pages[p.get("after")], {})})
+        client = _client(session)
+
+        posts = await client.search(["OSINT", "natsec"], "FISA 702", limit=150)
+
+        assert len(posts) == 150
+        assert posts[0]["id"] == "p0"
+        gets = [c for c in session.calls if c[0] == "GET"]
+        assert len(gets) == 2
+        assert gets[0][2]["q"] == "FISA 702"
+        assert gets[0][2]["restrict_sr"] == 1
+        assert gets[1][2]["limit"] == 50  # only asks for what is still needed
+
+    @pytest.mark.asyncio
+    async def test_token_is_reused(self):
+        session = FakeSession({"/r/all/search": (200, {"data": {"children": [], "after": None}}, {})})
+        client = _client(session)
+
+        await client.search([], "a")
+        await client.search([], "b")
+
+        assert sum(1 for c in session.calls if c[0] == "POST") == 1
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self):
+        session = FakeSession({"/r/all/search": (403, {}, {})})
+        with pytest.raises(HttpClientError) as exc:
+            await _client(session).search([], "a")
+        assert exc.value.status_code == 403
+
+
+class TestComments:
+    @pytest.mark.asyncio
+    async def test_flattens_nested_replies_and_skips_more(self):
+        nested = {"data": {"children": [_comment("c2")]}}
+        listing = [
+            {"data": {"children": [_post(1)]}},
+            {"data": {"children": [_comment("c1", nested), {"kind": "more", "data": {}}]}},
+        ]
+        session = FakeSession({"/comments/p1": (200, listing, {})})
+
+        comments = await _client(session).fetch_comments("p1")
+
+        assert [c["id"] for c in comments] == ["c1", "c2"]
+        assert comments[0]["author"] == "[deleted]"
+        assert comments[0]["post_id"] == "p1"
+
+    @pytest.mark.asyncio
+    async def test_expand_comments_runs_concurrently_and_bounded(self):
+        listing = [{"data": {"children": []}}, {"data": {"children": [_comment("c")]}}]
+        routes = {f"/comments/p{i}": (200, listing, {}) for i in range(12)}
+        session = FakeSession(routes, delay=0.02)
+
+        result = await _client(session, max_concurrent=4).expand_comments([f"p{i}" for i in range(12)])
+
+        assert set(result) == {f"p{i}" for i in range(12)}
+        assert all(len(v) == 1 for v in result.values())
+        assert 1 < session.max_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_expand_comments_isolates_failures(self):
+        listing = [{"data": {"children": []}}, {"data": {"children": [_comment("c")]}}]
+        session = FakeSession({"/comments/ok": (200, listing, {}), "/comments/bad": (500, {}, {})})
+
+        result = await _client(session).expand_comments(["ok", "bad"])
+
+        assert len(result["ok"]) == 1
+        assert result["bad"] == []
+
+
+class TestRequestBudget:
+    @pytest.mark.asyncio
+    async def test_blocks_when_window_is_full(self):
+        budget = RedditRequestBudget(max_requests=3, period_seconds=0.2)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(4):
+            await budget.acquire()
+        assert loop.time() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_server_headers_pause_requests(self):
+        budget = RedditRequestBudget()
+        budget.update_from_headers({"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "0.1"})
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await budget.acquire()
+        assert loop.time() - start >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_429_pauses_then_retries(self):
+        responses = iter([
+            (429, {}, {"X-Ratelimit-Reset": "0.05"}),
+            (200, {"data": {"children": [_post(1)], "after": None}}, {}),
+        ])
+        session = FakeSession({"/r/all/search": lambda p: next(responses)})
+
+        posts = await _client(session).search([], "a")
+
+        assert [p["id"] for p in posts] == ["p1"]
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the normalized, evidence-by-reference result.json format
+(research.result_format) and RecursiveResearchAgent._save_result().
+
+No LLM calls: report generation is replaced with a fake.
+"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.database_integration_base import Evidence
+from research.recursive_agent import Constraints, GoalResult, GoalStatus, RecursiveResearchAgent
+from research.result_format import (
+    RESULT_FORMAT_VERSION,
+    evidence_id,
+    goal_evidence,
+    load_result,
+    write_result,
+)
+
+
+def _deep_tree(depth, branching=2, leaf_evidence=4, prefix="g"):
+    """Goal tree whose parents merge their children's evidence, like the agent does."""
+    if depth == 0:
+        evidence = [
+            Evidence(
+                source_id="sam",
+                title=f"{prefix} award {i}",
+                url=f"https://sam.gov/opp/{prefix}-{i}",
+                snippet=f"Contract notice {prefix}-{i}",
+                raw_content=f"Full notice text for {prefix}-{i}. " * 60,
+                date="2024-05-01",
+                relevance_score=0.8,
+            )
+            for i in range(leaf_evidence)
+        ]
+        return GoalResult(goal=f"Leaf {prefix}", status=GoalStatus.COMPLETED, evidence=evidence, depth=0)
+
+    children = [_deep_tree(depth - 1, branching, leaf_evidence, f"{prefix}.{b}") for b in range(branching)]
+    return GoalResult(
+        goal=f"Goal {prefix}",
+        status=GoalStatus.COMPLETED,
+        evidence=[e for child in children for e in child.evidence],
+        sub_results=children,
+        synthesis=f"Synthesis for {prefix}",
+        confidence=0.7,
+    )
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    agent = RecursiveResearchAgent(
+        constraints=Constraints(max_evidence_in_saved_result=1000), output_dir=tmp_path
+    )
+
+    async def fake_report(result):
+        return "# Report"
+
+    monkeypatch.setattr(agent, "_generate_report", fake_report)
+    return agent
+
+
+class TestSaveResult:
+    @pytest.mark.asyncio
+    async def test_old_and_new_formats_describe_same_tree(self, agent, tmp_path):
+        tree = _deep_tree(depth=6)
+        legacy_path = tmp_path / "legacy.json"
+        with open(legacy_path, "w") as f:
+            json.dump(agent._result_to_dict(tree), f, indent=2, default=str)
+
+        await agent._save_result(tree)
+        new_path = tmp_path / "result.json"
+
+        legacy, new = load_result(legacy_path), load_result(new_path)
+        assert json.loads(new_path.read_text())["format_version"] == RESULT_FORMAT_VERSION
+        assert new["goal_tree"] == legacy["goal_tree"]
+        assert new["evidence"] == legacy["evidence"]
+        assert len(new["evidence"]) == 2 ** 6 * 4  # each leaf record stored once
+
+        ratio = legacy_path.stat().st_size / new_path.stat().st_size
+        print(f"\nlegacy {legacy_path.stat().st_size:,}B  normalized {new_path.stat().st_size:,}B  ({ratio:.1f}x)")
+        assert ratio >= 5
+
+    @pytest.mark.asyncio
+    async def test_goal_evidence_resolves_references(self, agent, tmp_path):
+        tree = _deep_tree(depth=2)
+        await agent._save_result(tree)
+
+        data = load_result(tmp_path / "result.json")
+        leaf = data["goal_tree"]["sub_results"][0]["sub_results"][1]
+        assert [r["title"] for r in goal_evidence(data, leaf)] == [e.title for e in tree.sub_results[0].sub_results[1].evidence]
+        assert "entity_graph" in data and data["rate_limited_sources"] == []
+
+
+class TestWriteResult:
+    def test_truncation_is_counted_per_goal(self):
+        tree = _deep_tree(depth=1, leaf_evidence=3)  # root has 6, leaves 3 each
+        buffer = io.StringIO()
+
+        stats = write_result(buffer, tree, lambda e: {"title": e.title}, max_evidence_per_goal=2)
+
+        data = json.loads(buffer.getvalue())
+        assert stats == {"evidence_records": 4, "evidence_truncated": 4 + 1 + 1}
+        assert data["goal_tree"]["evidence_count"] == 6
+        assert data["goal_tree"]["evidence_truncated"] == 4
+        assert len(data["goal_tree"]["evidence_ids"]) == 2
+
+    def test_identical_records_share_an_id(self):
+        a = {"title": "Same", "url": "https://x.gov/1"}
+        assert evidence_id(a) == evidence_id(dict(reversed(list(a.items()))))
+        assert evidence_id(a) != evidence_id({**a, "url": "https://x.gov/2"})
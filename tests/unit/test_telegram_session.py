@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Telegram client lifecycle, flood-wait scheduling and message cache.
+
+No Telethon install or credentials needed - clients and messages are fakes.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from integrations.social import telegram_session
+from integrations.social.telegram_integration import TelegramIntegration
+from integrations.social.telegram_session import (
+    FloodWaitScheduler,
+    TelegramMessageCache,
+    close_shared_clients,
+    get_shared_client,
+)
+
+
+class FakeFloodWait(Exception):
+    def __init__(self, seconds: float):
+        super().__init__(f"wait {seconds}")
+        self.seconds = seconds
+
+
+def _flood_seconds(exc):
+    return exc.seconds if isinstance(exc, FakeFloodWait) else None
+
+
+def _msg(i: int, text: str = "update") -> dict:
+    return {"id": i, "message": f"{text} {i}", "date": None, "channel": "bellingcat"}
+
+
+class TestFloodWaitScheduler:
+    @pytest.mark.asyncio
+    async def test_flood_wait_pauses_and_retries(self):
+        scheduler = FloodWaitScheduler(wait_seconds=_flood_seconds)
+        attempts = []
+
+        async def call():
+            attempts.append(time.monotonic())
+            if len(attempts) == 1:
+                raise FakeFloodWait(0.1)
+            return "ok"
+
+        assert await scheduler.run(call) == "ok"
+        assert scheduler.flood_waits == 1
+        assert attempts[1] - attempts[0] >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_long_wait_and_other_errors_raise(self):
+        scheduler = FloodWaitScheduler(max_flood_wait=5, wait_seconds=_flood_seconds)
+
+        async def too_long():
+            raise FakeFloodWait(600)
+
+        async def broken():
+            raise ValueError("channel private")
+
+        with pytest.raises(FakeFloodWait):
+            await scheduler.run(too_long)
+        with pytest.raises(ValueError):
+            await scheduler.run(broken)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        scheduler = FloodWaitScheduler(max_concurrent=2, wait_seconds=_flood_seconds)
+        in_flight = 0
+        peak = 0
+
+        async def call():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+
+        await asyncio.gather(*(scheduler.run(call) for _ in range(6)))
+        assert peak == 2
+
+
+class TestMessageCache:
+    def test_high_water_mark_per_channel_and_search(self):
+        cache = TelegramMessageCache()
+        cache.store("@Bellingcat", [_msg(5), _msg(9)], covered=(0, 9))
+        cache.store("bellingcat", [_msg(3, "ukraine")], search="Ukraine", covered=(0, 3))
+
+        assert cache.high_water_mark("bellingcat") == 9
+        assert cache.high_water_mark("bellingcat", "ukraine") == 3
+        assert cache.high_water_mark("other") == 0
+
+    def test_get_returns_newest_and_filters_search(self):
+        cache = TelegramMessageCache()
+        cache.store("bellingcat", [_msg(i) for i in range(1, 6)] + [_msg(6, "Ukraine")])
+
+        assert [m["id"] for m in cache.get("bellingcat", 3)] == [6, 5, 4]
+        assert [m["id"] for m in cache.get("bellingcat", 10, search="ukraine")] == [6]
+
+    def test_empty_store_does_not_move_mark(self):
+        cache = TelegramMessageCache()
+        cache.store("bellingcat", [_msg(4)], covered=(0, 4))
+        cache.store("bellingcat", [])
+        assert cache.high_water_mark("bellingcat") == 4
+
+    def test_disjoint_newer_range_hides_older_island(self):
+        cache = TelegramMessageCache()
+        cache.store("bellingcat", [_msg(i) for i in (8, 9, 10)], covered=(8, 10))
+        cache.store("bellingcat", [_msg(i) for i in (14, 15, 16)], covered=(14, 16))  # 11-13 skipped
+
+        assert cache.coverage("bellingcat") == (14, 16)
+        assert [m["id"] for m in cache.get("bellingcat", 10)] == [16, 15, 14]
+
+        cache.store("bellingcat", [_msg(i) for i in (11, 12, 13)], covered=(11, 14))
+        assert cache.coverage("bellingcat") == (11, 16)
+
+
+def _fake_channel(channel_ids, calls):
+    """Integration stand-in whose client pages through channel_ids like get_messages."""
+
+    class FakeClient:
+        async def get_messages(self, entity, limit, search=None, min_id=0, max_id=0):
+            calls.append((min_id, max_id))
+            return [
+                SimpleNamespace(id=i, message=f"post {i}", date=datetime(2025, 1, 1), views=1, forwards=0)
+                for i in sorted(channel_ids, reverse=True) if i > min_id and (not max_id or i < max_id)
+            ][:limit]
+
+    return SimpleNamespace(
+        client=FakeClient(),
+        scheduler=FloodWaitScheduler(wait_seconds=_flood_seconds),
+        message_cache=TelegramMessageCache(),
+        _message_to_dict=TelegramIntegration._message_to_dict,
+    )
+
+
+class TestIncrementalChannelFetch:
+    @pytest.mark.asyncio
+    async def test_repeat_fetch_requests_only_new_messages(self):
+        channel_ids = [1, 2, 3]
+        calls = []
+        integration = _fake_channel(channel_ids, calls)
+
+        first = await TelegramIntegration._fetch_channel_messages(integration, "bellingcat", "bellingcat", 10)
+        channel_ids.append(4)
+        second = await TelegramIntegration._fetch_channel_messages(integration, "bellingcat", "bellingcat", 10)
+
+        assert calls == [(0, 0), (3, 0)]
+        assert [m["id"] for m in first] == [3, 2, 1]
+        assert [m["id"] for m in second] == [4, 3, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_capped_fetches_leave_no_gap(self):
+        channel_ids = list(range(1, 11))
+        calls = []
+        integration = _fake_channel(channel_ids, calls)
+        fetch = TelegramIntegration._fetch_channel_messages
+
+        assert [m["id"] for m in await fetch(integration, "bellingcat", "bellingcat", 3)] == [10, 9, 8]
+        channel_ids.extend(range(11, 17))
+        assert [m["id"] for m in await fetch(integration, "bellingcat", "bellingcat", 3)] == [16, 15, 14]
+        # A larger limit backfills below the cached range instead of jumping from 14 to 10
+        larger = await fetch(integration, "bellingcat", "bellingcat", 10)
+
+        assert [m["id"] for m in larger] == list(range(16, 6, -1))
+        assert calls[-1] == (0, 14)
+
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_one_client_per_session_file(self, tmp_path):
+        created = []
+
+        class FakeClient:
+            def __init__(self, path):
+                self.connected = False
+                created.append(self)
+
+            async def start(self, phone=None):
+                self.connected = True
+
+            def is_connected(self):
+                return self.connected
+
+            async def disconnect(self):
+                self.connected = False
+
+        session = tmp_path / "research"
+        a, b = await asyncio.gather(
+            get_shared_client(session, FakeClient),
+            get_shared_client(session, FakeClient),
+        )
+        assert a is b and len(created) == 1
+
+        await close_shared_clients()
+        assert not a.is_connected()
+        assert telegram_session._shared_clients == {}
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the native async Twitter (RapidAPI) client.
+
+Uses an in-memory fake aiohttp session - no network or API key needed.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from integrations.social.twitter_async_client import AsyncTwitterClient
+from integrations.social.twitter_integration import TwitterIntegration
+
+
+class FakeResponse:
+    def __init__(self, status: int, payload, headers=None, delay: float = 0.0):
+        self.status = status
+        self._payload = payload
+        self.headers = headers or {}
+        self._delay = delay
+
+    async def __aenter__(self):
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self, content_type=None):
+        return self._payload
+
+    async def text(self):
+        return str(self._payload)
+
+
+class FakeSession:
+    """Routes endpoint names to canned (status, payload, headers) and records calls."""
+
+    def __init__(self, routes, delay: float = 0.0):
+        self.routes = routes
+        self.delay = delay
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        endpoint = url.rsplit("/", 1)[1]
+        self.calls.append((endpoint, dict(params or {}), time.monotonic()))
+        route = self.routes[endpoint]
+        status, payload, resp_headers = route(params) if callable(route) else route
+        return FakeResponse(status, payload, resp_headers, self.delay)
+
+
+def _tweets(start: int, n: int) -> list:
+    return [{"tweet_id": str(i), "text": f"tweet {i}", "user_info": {"screen_name": "bellingcat"}}
+            for i in range(start, start + n)]
+
+
+class TestFetch:
+    @pytest.mark.asyncio
+    async def test_follows_cursor_and_stops_at_limit(self):
+        pages = {
+            None: {"timeline": _tweets(0, 20), "next_cursor": "c1"},
+            "c1": {"timeline": _tweets(20, 20), "next_cursor": "c2"},
+            "c2": {"timeline": _tweets(40, 20), "next_cursor": "c3"},
+        }
+        session = FakeSession({"search.php": lambda p: (200, pages[p.get("cursor")], {})})
+        client = AsyncTwitterClient("key", session=session)
+
+        result = await client.fetch("search.php", {"query": "osint"}, max_pages=5, limit=30)
+
+        assert result["pages_fetched"] == 2  # third page not needed for 30 items
+        assert len(result["data"]["timeline"]) == 40
+        assert "next_cursor" not in result["data"]
+        assert [c[1].get("cursor") for c in session.calls] == [None, "c1"]
+
+    @pytest.mark.asyncio
+    async def test_single_object_endpoint(self):
+        profile = {"profile": "bellingcat", "name": "Bellingcat", "sub_count": 10}
+        session = FakeSession({"screenname.php": (200, profile, {})})
+
+        result = await AsyncTwitterClient("key", session=session).fetch("screenname.php", {"screenname": "bellingcat"})
+
+        assert result["data"] == profile
+
+    @pytest.mark.asyncio
+    async def test_http_error_shape(self):
+        session = FakeSession({"search.php": (403, {"message": "forbidden"}, {})})
+
+        result = await AsyncTwitterClient("key", session=session).fetch("search.php", {"query": "x"})
+
+        assert result["status_code"] == 403
+        assert "HTTP Error 403" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_429_pauses_using_headers_then_retries(self):
+        responses = iter([
+            (429, {}, {"x-ratelimit-requests-reset": "0.1"}),
+            (200, {"timeline": _tweets(0, 1)}, {}),
+        ])
+        session = FakeSession({"search.php": lambda p: next(responses)})
+
+        result = await AsyncTwitterClient("key", session=session).fetch("search.php", {"query": "x"})
+
+        assert len(result["data"]["timeline"]) == 1
+        assert session.calls[1][2] - session.calls[0][2] >= 0.08
+
+
+class TestConcurrentSteps:
+    @pytest.mark.asyncio
+    async def test_fetch_many_runs_endpoints_concurrently(self):
+        session = FakeSession({
+            "followers.php": (200, {"followers": [{"screen_name": "a"}]}, {}),
+            "following.php": (200, {"following": [{"screen_name": "b"}]}, {}),
+        }, delay=0.1)
+        client = AsyncTwitterClient("key", session=session)
+
+        start = time.monotonic()
+        results = await client.fetch_many([
+            {"endpoint": "followers.php", "params": {"screenname": "x"}},
+            {"endpoint": "following.php", "params": {"screenname": "x"}},
+        ])
+
+        assert time.monotonic() - start < 0.18
+        assert results[0]["data"]["followers"][0]["screen_name"] == "a"
+        assert results[1]["data"]["following"][0]["screen_name"] == "b"
+
+    @pytest.mark.asyncio
+    async def test_follower_network_pattern_merges_endpoints(self, monkeypatch):
+        monkeypatch.setattr("integrations.social.twitter_integration.log_request", lambda **kwargs: None)
+        session = FakeSession({
+            "followers.php": (200, {"followers": [{"screen_name": "a", "name": "A"}]}, {}),
+            "following.php": (403, {}, {}),
+        })
+        integration = TwitterIntegration()
+        integration._clients["key"] = AsyncTwitterClient("key", session=session)
+
+        result = await integration.execute_search(
+            {"pattern": "follower_network", "endpoint": "followers.php",
+             "params": {"screenname": "bellingcat"}, "max_pages": 1},
+            api_key="key"
+        )
+
+        assert result.success  # partial failure still returns the endpoint that worked
+        assert result.total == 1
+        assert result.results[0]["metadata"]["relationship_endpoint"] == "followers.php"
+        assert result.metadata["endpoints_called"] == ["followers.php", "following.php"]
+
+    def test_relationship_steps_skip_unsatisfied_endpoints(self):
+        steps = TwitterIntegration()._relationship_steps(
+            "author_deep_dive", {"screenname": "bellingcat", "query": "ignored"}, 2, 10
+        )
+
+        assert [s["endpoint"] for s in steps] == ["screenname.php", "timeline.php", "followers.php", "following.php"]
+        assert all(s["params"] == {"screenname": "bellingcat"} for s in steps)
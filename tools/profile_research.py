@@ -4,8 +4,14 @@ Profile deep research execution to identify bottlenecks.
 
 Usage:
     python3 tools/profile_research.py "research question"
+    python3 tools/profile_research.py --async "research question"   # event-loop stalls, per-task time
+
+--async uses core.async_profiler instead of cProfile: loop lag, per-task
+busy vs CPU time, slow callbacks with the blocking stack, semaphore waits,
+and a collapsed-stack file for flame graphs (flamegraph.pl, speedscope).
 """
 
+import argparse
 import asyncio
 import cProfile
 import pstats
@@ -18,32 +24,63 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from research.deep_research import SimpleDeepResearch
 from config_loader import config
+from core.async_profiler import AsyncProfiler
 
 
-def profile_research(question: str):
-    """Profile a research query."""
+async def run_research(question: str):
+    # Use minimal config for faster profiling
+    raw_config = config.get_raw_config()
+    deep_config = raw_config.get("research", {}).get("deep_research", {})
+
+    engine = SimpleDeepResearch(
+        max_tasks=3,  # Reduced for profiling
+        max_retries_per_task=1,
+        max_time_minutes=5,  # 5 min max for profiling
+        min_results_per_task=3,
+        max_concurrent_tasks=2
+    )
+
+    result = await engine.research(question)
+    return result
+
+
+def print_research_summary(result: dict):
+    print("\n" + "="*80)
+    print("RESEARCH SUMMARY")
+    print("="*80)
+    print(f"Tasks executed: {result.get('tasks_executed', 0)}")
+    print(f"Total results: {result.get('total_results', 0)}")
+    print(f"Time: {result.get('elapsed_minutes', 0):.2f} minutes")
+    print(f"Sources: {', '.join(result.get('sources_searched', []))}")
+
 
-    async def run_research():
-        # Use minimal config for faster profiling
-        raw_config = config.get_raw_config()
-        deep_config = raw_config.get("research", {}).get("deep_research", {})
+def profile_research_async(question: str, output: str, slow_ms: float):
+    """Profile a research query with the asyncio-aware profiler."""
 
-        engine = SimpleDeepResearch(
-            max_tasks=3,  # Reduced for profiling
-            max_retries_per_task=1,
-            max_time_minutes=5,  # 5 min max for profiling
-            min_results_per_task=3,
-            max_concurrent_tasks=2
-        )
+    async def run_profiled():
+        profiler = AsyncProfiler(slow_callback_duration=slow_ms / 1000)
+        async with profiler:
+            result = await run_research(question)
+        return profiler, result
 
-        result = await engine.research(question)
-        return result
+    profiler, result = asyncio.run(run_profiled())
+
+    print("\n" + "="*80)
+    print(profiler.summary_table(top=30))
+    path = profiler.write_collapsed(output)
+    print(f"\nCollapsed stacks: {path} (flamegraph.pl {path} > profile.svg, or load in speedscope)")
+
+    print_research_summary(result)
+
+
+def profile_research(question: str):
+    """Profile a research query."""
 
     # Run with profiling
     profiler = cProfile.Profile()
     profiler.enable()
 
-    result = asyncio.run(run_research())
+    result = asyncio.run(run_research(question))
 
     profiler.disable()
 
@@ -75,19 +112,21 @@ def profile_research(question: str):
     print(s.getvalue())
 
     # Print summary
-    print("\n" + "="*80)
-    print("RESEARCH SUMMARY")
-    print("="*80)
-    print(f"Tasks executed: {result.get('tasks_executed', 0)}")
-    print(f"Total results: {result.get('total_results', 0)}")
-    print(f"Time: {result.get('elapsed_minutes', 0):.2f} minutes")
-    print(f"Sources: {', '.join(result.get('sources_searched', []))}")
+    print_research_summary(result)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 tools/profile_research.py 'research question'")
-        sys.exit(1)
-
-    question = sys.argv[1]
-    profile_research(question)
+    parser = argparse.ArgumentParser(description="Profile deep research execution")
+    parser.add_argument("question", help="Research question")
+    parser.add_argument("--async", dest="async_mode", action="store_true",
+                        help="Asyncio-aware profiling (loop lag, per-task time, slow callbacks)")
+    parser.add_argument("--output", default="profile.folded",
+                        help="Collapsed-stack output for --async (default: profile.folded)")
+    parser.add_argument("--slow-ms", type=float, default=100,
+                        help="Report callbacks blocking the loop longer than this (default: 100)")
+    args = parser.parse_args()
+
+    if args.async_mode:
+        profile_research_async(args.question, args.output, args.slow_ms)
+    else:
+        profile_research(args.question)